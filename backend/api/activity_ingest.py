@@ -0,0 +1,337 @@
+"""REST API endpoint for streaming bulk ingest of activity events.
+
+First device syncs push weeks of minute data: instead of one huge
+syncActivityEvents mutation, the app can stream gzip-compressed NDJSON
+(one ActivityMinuteInput-like JSON object per line) to this endpoint.
+
+The body is decompressed, split into lines, validated and normalized
+incrementally; valid events are written in chunks through
+IActivityRepository.ingest_events (one unordered bulk write per chunk on
+MongoDB). Memory is bounded by the chunk size, the decompression window
+and the maximum line length, not by the payload size.
+"""
+
+import json
+import logging
+import zlib
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
+
+from fastapi import APIRouter, Header, HTTPException, Path, Query, Request
+from pydantic import BaseModel
+
+from domain.activity.model import (
+    INVALID_EVENT,
+    ActivityEvent,
+    ActivitySource,
+    validate_activity_event,
+)
+from domain.activity.repository import IActivityRepository
+from infrastructure.persistence.activity_repository_factory import create_activity_repository
+
+logger = logging.getLogger(__name__)
+
+# Events per ingest_events call (one bulk write)
+DEFAULT_CHUNK_SIZE = 1000
+MAX_CHUNK_SIZE = 10000
+
+# Longest accepted NDJSON line (a minute event is ~150 bytes)
+MAX_LINE_BYTES = 16 * 1024
+
+# Max decompressed bytes produced per input chunk step (gzip bomb guard)
+DECOMPRESS_WINDOW = 256 * 1024
+
+# Rejections listed in the response (the count is always exact)
+MAX_REPORTED_REJECTIONS = 1000
+
+_GZIP_MAGIC = b"\x1f\x8b"
+
+
+class RejectedLine(BaseModel):
+    """Rejected NDJSON line (0-based line index)."""
+
+    index: int
+    reason: str
+
+
+class BulkIngestResponse(BaseModel):
+    """Accounting of a streamed bulk ingest."""
+
+    lines: int
+    accepted: int
+    duplicates: int
+    rejected_count: int
+    rejected: List[RejectedLine]
+
+
+@dataclass
+class BulkIngestResult:
+    """Running totals of a streamed ingest."""
+
+    lines: int = 0
+    accepted: int = 0
+    duplicates: int = 0
+    rejected_count: int = 0
+    rejected: List[Tuple[int, str]] = field(default_factory=list)
+
+    def reject(self, index: int, reason: str) -> None:
+        """Count a rejected line, listing the first MAX_REPORTED_REJECTIONS."""
+        self.rejected_count += 1
+        if len(self.rejected) < MAX_REPORTED_REJECTIONS:
+            self.rejected.append((index, reason))
+
+    def to_response(self) -> BulkIngestResponse:
+        """Build the response model."""
+        return BulkIngestResponse(
+            lines=self.lines,
+            accepted=self.accepted,
+            duplicates=self.duplicates,
+            rejected_count=self.rejected_count,
+            rejected=[RejectedLine(index=i, reason=r) for i, r in self.rejected],
+        )
+
+
+async def decompressed(chunks: AsyncIterator[bytes], gzipped: bool) -> AsyncIterator[bytes]:
+    """Yield the body bytes, gunzipping incrementally when gzipped.
+
+    Each step produces at most DECOMPRESS_WINDOW bytes, so a small
+    compressed chunk expanding to gigabytes is never held in memory.
+    Concatenated gzip members are supported.
+
+    Raises:
+        HTTPException: 400 if the gzip stream is corrupted or truncated
+    """
+    if not gzipped:
+        async for chunk in chunks:
+            yield chunk
+        return
+
+    decompressor = zlib.decompressobj(wbits=16 + zlib.MAX_WBITS)
+    in_member = False
+    try:
+        async for chunk in chunks:
+            data = chunk
+            while data:
+                in_member = True
+                yield decompressor.decompress(data, DECOMPRESS_WINDOW)
+                data = decompressor.unconsumed_tail
+                if decompressor.eof:
+                    # Next gzip member (if any) starts in unused_data
+                    data = decompressor.unused_data + data
+                    decompressor = zlib.decompressobj(wbits=16 + zlib.MAX_WBITS)
+                    in_member = False
+    except zlib.error as e:
+        raise HTTPException(status_code=400, detail=f"Invalid gzip body: {e}") from e
+    if in_member:
+        raise HTTPException(status_code=400, detail="Invalid gzip body: truncated stream")
+
+
+async def ndjson_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[Optional[bytes]]:
+    """Yield NDJSON lines (without newline); None for a line over MAX_LINE_BYTES.
+
+    Blank lines are yielded too (as b""), so line indexes match the payload.
+    Each chunk is split once; the start of a line spanning chunks is kept
+    as a list of pieces, so no byte is copied more than twice.
+    """
+    pending: List[bytes] = []
+    pending_bytes = 0
+    oversized = False
+    async for chunk in chunks:
+        *lines, tail = chunk.split(b"\n")
+        for line in lines:
+            if pending:
+                pending.append(line)
+                line = b"".join(pending)
+                pending, pending_bytes = [], 0
+            yield None if oversized or len(line) > MAX_LINE_BYTES else line
+            oversized = False
+        if tail:
+            pending.append(tail)
+            pending_bytes += len(tail)
+        if pending_bytes > MAX_LINE_BYTES:
+            # Drop the rest of the line, keep the index
+            pending, pending_bytes = [], 0
+            oversized = True
+    if pending or oversized:
+        yield None if oversized else b"".join(pending)
+
+
+def _optional_number(payload: Dict[str, Any], key: str) -> Optional[float]:
+    """Numeric field or None; ValueError for other types (bool included)."""
+    value = payload.get(key)
+    if value is None:
+        return None
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValueError(key)
+    return value
+
+
+def parse_event(line: bytes, user_id: str) -> Union[ActivityEvent, str]:
+    """Validate and normalize one NDJSON line.
+
+    Fields mirror ActivityMinuteInput: ts (required), steps (default 0),
+    calories_out/caloriesOut, hr_avg/hrAvg, source (default MANUAL).
+
+    Returns:
+        Normalized ActivityEvent, or the rejection reason code
+    """
+    try:
+        payload = json.loads(line)
+    except (ValueError, UnicodeDecodeError):
+        return INVALID_EVENT
+    if not isinstance(payload, dict) or not isinstance(payload.get("ts"), str):
+        return INVALID_EVENT
+
+    try:
+        steps = _optional_number(payload, "steps")
+        calories_out = _optional_number(
+            payload, "calories_out" if "calories_out" in payload else "caloriesOut"
+        )
+        hr_avg = _optional_number(payload, "hr_avg" if "hr_avg" in payload else "hrAvg")
+        source = ActivitySource(payload.get("source") or ActivitySource.MANUAL.value)
+    except ValueError:
+        return INVALID_EVENT
+    if isinstance(steps, float) and not steps.is_integer():
+        return INVALID_EVENT
+
+    return validate_activity_event(
+        ActivityEvent(
+            user_id=user_id,
+            ts=payload["ts"],
+            steps=int(steps) if steps is not None else 0,
+            calories_out=float(calories_out) if calories_out is not None else None,
+            hr_avg=hr_avg,
+            source=source,
+        )
+    )
+
+
+async def ingest_ndjson_stream(
+    repository: IActivityRepository,
+    user_id: str,
+    lines: AsyncIterator[Optional[bytes]],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    idempotency_key: Optional[str] = None,
+) -> BulkIngestResult:
+    """Validate NDJSON lines and ingest valid events in chunks.
+
+    Rejections reported by the repository are mapped back to line indexes.
+    Events repeated across chunks are duplicates of the stored minute,
+    as with separate syncActivityEvents calls. With an idempotency_key,
+    chunk n is ingested with key "<idempotency_key>:<n>": chunks are
+    deterministic for the same payload and chunk_size, so a retried
+    upload replays them without rewriting events.
+    """
+    result = BulkIngestResult()
+    pending: List[ActivityEvent] = []
+    pending_lines: List[int] = []
+    flushed = 0
+
+    async def flush() -> None:
+        nonlocal flushed
+        key = f"{idempotency_key}:{flushed}" if idempotency_key else None
+        flushed += 1
+        accepted, duplicates, rejected = await repository.ingest_events(pending, key)
+        result.accepted += accepted
+        result.duplicates += duplicates
+        for index, reason in rejected:
+            result.reject(pending_lines[index], reason)
+        pending.clear()
+        pending_lines.clear()
+
+    async for line in lines:
+        index = result.lines
+        result.lines += 1
+        if line is None:
+            result.reject(index, INVALID_EVENT)
+            continue
+        if not line.strip():
+            # Blank lines are neither events nor errors
+            continue
+        parsed = parse_event(line, user_id)
+        if isinstance(parsed, str):
+            result.reject(index, parsed)
+            continue
+        pending.append(parsed)
+        pending_lines.append(index)
+        if len(pending) >= chunk_size:
+            await flush()
+
+    if pending:
+        await flush()
+    return result
+
+
+router = APIRouter(prefix="/api/v1", tags=["activity"])
+
+
+@router.post("/activity-events/{user_id}/ndjson", response_model=BulkIngestResponse)
+async def ingest_activity_ndjson(
+    request: Request,
+    user_id: str = Path(..., description="User owning the events"),
+    chunk_size: int = Query(
+        DEFAULT_CHUNK_SIZE, ge=1, le=MAX_CHUNK_SIZE, description="Events per bulk write"
+    ),
+    idempotency_key: Optional[str] = Header(
+        None, alias="Idempotency-Key", description="Retry key of the upload"
+    ),
+) -> BulkIngestResponse:
+    """Stream-ingest minute activity events from (gzip-compressed) NDJSON.
+
+    Each line is one event, e.g.
+    ``{"ts": "2025-10-28T10:00:00Z", "steps": 50, "caloriesOut": 5.2, "hrAvg": 80}``.
+    The body is gzip when sent with ``Content-Encoding: gzip`` (or when it
+    starts with the gzip magic bytes), plain NDJSON otherwise.
+
+    Same accounting as syncActivityEvents: accepted, duplicates (minute
+    already stored or repeated) and rejected lines with reason codes.
+    Lines are 0-based; only the first 1000 rejections are listed, while
+    rejected_count is exact. Chunks are written as the body is read: a
+    corrupted gzip stream returns 400 after the previous chunks were
+    stored, and re-sending the payload counts them as duplicates. With an
+    ``Idempotency-Key`` header, a retried upload (same payload and
+    chunk_size) returns the stored chunk results without rewriting
+    events; the same key with a different payload rejects the affected
+    lines with IDEMPOTENCY_CONFLICT.
+
+    Example:
+        ```bash
+        gzip -c events.ndjson | curl -X POST \\
+          http://localhost:8080/api/v1/activity-events/user123/ndjson \\
+          -H "Content-Type: application/x-ndjson" -H "Content-Encoding: gzip" \\
+          --data-binary @-
+        ```
+    """
+    body = request.stream()
+    first = b""
+    async for first in body:
+        if first:
+            break
+    gzipped = "gzip" in request.headers.get("content-encoding", "").lower() or first.startswith(
+        _GZIP_MAGIC
+    )
+
+    async def chunks() -> AsyncIterator[bytes]:
+        yield first
+        async for chunk in body:
+            yield chunk
+
+    result = await ingest_ndjson_stream(
+        create_activity_repository(),
+        user_id,
+        ndjson_lines(decompressed(chunks(), gzipped)),
+        chunk_size=chunk_size,
+        idempotency_key=idempotency_key,
+    )
+
+    logger.info(
+        "Activity NDJSON ingest",
+        extra={
+            "user_id": user_id,
+            "lines": result.lines,
+            "accepted": result.accepted,
+            "duplicates": result.duplicates,
+            "rejected": result.rejected_count,
+        },
+    )
+    return result.to_response()
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 # Standard library
+import asyncio
 import os
 import datetime
 import dataclasses
 import logging as _logging
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from typing import Final, Any, Optional
 
 # Third-party
@@ -51,6 +52,16 @@ from application.meal.orchestrators.photo_orchestrator import (
     MealAnalysisOrchestrator,
 )
 from application.meal.orchestrators.barcode_orchestrator import BarcodeOrchestrator
+from application.meal.queries.daily_summary_cache import DailySummaryCache
+from infrastructure.config import (
+    get_daily_summary_cache_max_entries,
+    get_daily_summary_cache_ttl_seconds,
+    get_health_totals_idempotency_ttl_seconds,
+    get_health_totals_max_idempotency_keys,
+    get_health_totals_retention_days,
+    get_health_totals_sweep_interval_seconds,
+    get_nutrition_provider_concurrency,
+)
 from domain.meal.core.factories.meal_factory import MealFactory
 from infrastructure.meal.providers.factory import (
     create_vision_provider,
@@ -616,6 +627,7 @@ async def lifespan(_: FastAPI) -> Any:  # pragma: no cover osservabilità
     ║  ✅ OpenAI Vision Client (async with)                                    ║
     ║  ✅ USDA Nutrition Client (async with)                                   ║
     ║  ✅ OpenFoodFacts Barcode Client (async with)                            ║
+    ║  ✅ Sweeper stato in-memory syncHealthTotals (asyncio task)              ║
     ║                                                                           ║
     ║  TODO (Phase 7.1+):                                                      ║
     ║  ⚪ MongoDB connection pool (async with motor.AsyncIOMotorClient)        ║
@@ -681,6 +693,9 @@ async def lifespan(_: FastAPI) -> Any:  # pragma: no cover osservabilità
             usda_provider=_nutrition_provider,
             category_provider=_nutrition_provider,
             fallback_provider=_nutrition_provider,
+            usda_concurrency=get_nutrition_provider_concurrency("usda"),
+            category_concurrency=get_nutrition_provider_concurrency("category"),
+            fallback_concurrency=get_nutrition_provider_concurrency("fallback"),
         )
         _barcode_service = BarcodeService(_barcode_provider)
 
@@ -716,15 +731,33 @@ async def lifespan(_: FastAPI) -> Any:  # pragma: no cover osservabilità
         #     logger.info("lifespan.mongodb_ready", ...)
 
         # ═══════════════════════════════════════════════════════════════════════
-        # RUNTIME: Application serves requests
+        # PHASE 4: BACKGROUND TASKS
         # ═══════════════════════════════════════════════════════════════════════
-        logger.info("lifespan.ready", extra={"status": "serving"})
-        yield
+        # Sweep stato in-memory syncHealthTotals (firme scadute, giorni vecchi)
+        sweep_interval = get_health_totals_sweep_interval_seconds()
+        health_totals_sweeper: Optional[asyncio.Task[None]] = None
+        if sweep_interval > 0:
+            health_totals_sweeper = asyncio.create_task(
+                health_totals_repo.run_sweeper(sweep_interval)
+            )
 
         # ═══════════════════════════════════════════════════════════════════════
-        # SHUTDOWN: Cleanup automatico (context manager close sessions)
+        # RUNTIME: Application serves requests
         # ═══════════════════════════════════════════════════════════════════════
-        logger.info("lifespan.shutdown", extra={"status": "cleanup"})
+        logger.info("lifespan.ready", extra={"status": "serving"})
+        try:
+            yield
+        finally:
+            # ═══════════════════════════════════════════════════════════════════
+            # SHUTDOWN: Cleanup automatico (context manager close sessions)
+            # ═══════════════════════════════════════════════════════════════════
+            # finally: il task viene cancellato anche se il serving termina
+            # con un'eccezione
+            logger.info("lifespan.shutdown", extra={"status": "cleanup"})
+            if health_totals_sweeper is not None:
+                health_totals_sweeper.cancel()
+                with suppress(asyncio.CancelledError):
+                    await health_totals_sweeper
 
 
 app = FastAPI(
@@ -760,6 +793,24 @@ _profile_repository = get_profile_repository()
 
 _event_bus = InMemoryEventBus()
 _idempotency_cache = InMemoryIdempotencyCache()
+
+# dailySummary read-through cache, invalidated by meal events of this process
+# only: assumes a single worker (other workers serve stale days up to the TTL)
+# - DAILY_SUMMARY_CACHE_TTL_SECONDS: 0 (default) disables it
+_daily_summary_cache: Optional[DailySummaryCache] = None
+if get_daily_summary_cache_ttl_seconds() > 0:
+    _daily_summary_cache = DailySummaryCache(
+        ttl_seconds=get_daily_summary_cache_ttl_seconds(),
+        max_entries=get_daily_summary_cache_max_entries(),
+    )
+    _daily_summary_cache.subscribe(_event_bus)
+
+# syncHealthTotals in-memory: limiti firme idempotenza e retention dei delta
+health_totals_repo.configure(
+    idempotency_ttl_seconds=get_health_totals_idempotency_ttl_seconds(),
+    max_idempotency_keys=get_health_totals_max_idempotency_keys(),
+    retention_days=get_health_totals_retention_days(),
+)
 _meal_factory = MealFactory()
 
 # Nutritional Profile adapters (Hexagonal Architecture)
@@ -770,7 +821,7 @@ _macro_calculator = MacroCalculatorAdapter()
 # Create providers (environment-based selection via factory)
 # Environment variables control provider selection:
 # - VISION_PROVIDER: "openai" | "stub" (default: stub)
-# - NUTRITION_PROVIDER: "usda" | "stub" (default: stub)
+# - NUTRITION_PROVIDER: "usda" | "usda_local" | "stub" (default: stub)
 # - BARCODE_PROVIDER: "openfoodfacts" | "stub" (default: stub)
 _vision_provider = get_vision_provider()
 _nutrition_provider = get_nutrition_provider()
@@ -782,6 +833,9 @@ _nutrition_service = NutritionEnrichmentService(
     usda_provider=_nutrition_provider,
     category_provider=_nutrition_provider,
     fallback_provider=_nutrition_provider,
+    usda_concurrency=get_nutrition_provider_concurrency("usda"),
+    category_concurrency=get_nutrition_provider_concurrency("category"),
+    fallback_concurrency=get_nutrition_provider_concurrency("fallback"),
 )
 _barcode_service = BarcodeService(_barcode_provider)
 
@@ -829,6 +883,7 @@ def get_graphql_context() -> Any:
         recognition_service=_recognition_service,
         enrichment_service=_nutrition_service,
         barcode_service=_barcode_service,
+        daily_summary_cache=_daily_summary_cache,
     )
 
 
@@ -869,6 +924,11 @@ from api.upload import router as upload_router  # noqa: E402
 
 app.include_router(upload_router)
 
+# REST API: Activity events streaming ingest (NDJSON backfill)
+from api.activity_ingest import router as activity_ingest_router  # noqa: E402
+
+app.include_router(activity_ingest_router)
+
 
 # ============================================
 # API Documentation Endpoints
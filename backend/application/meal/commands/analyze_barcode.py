@@ -164,6 +164,7 @@ class AnalyzeMealBarcodeCommandHandler:
             source="BARCODE",
             item_count=1,  # Barcode = single product
             average_confidence=1.0,  # Barcode = 100% confidence
+            meal_timestamps=[meal.timestamp],
         )
 
         await self._event_bus.publish(event)
@@ -162,6 +162,7 @@ class AnalyzeMealPhotoCommandHandler:
             source="PHOTO",
             item_count=len(meal.entries),
             average_confidence=meal.average_confidence(),
+            meal_timestamps=[meal.timestamp],
         )
 
         await self._event_bus.publish(event)
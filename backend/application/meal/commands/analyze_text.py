@@ -158,6 +158,7 @@ class AnalyzeMealTextCommandHandler:
             source="DESCRIPTION",
             item_count=len(meal.entries),
             average_confidence=meal.average_confidence(),
+            meal_timestamps=[meal.timestamp],
         )
 
         await self._event_bus.publish(event)
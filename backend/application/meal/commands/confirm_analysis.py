@@ -139,6 +139,7 @@ class ConfirmAnalysisCommandHandler:
             user_id=command.user_id,
             confirmed_entry_count=confirmed_count,
             rejected_entry_count=rejected_count,
+            meal_timestamps=[meal.timestamp],
         )
 
         await self._event_bus.publish(event)
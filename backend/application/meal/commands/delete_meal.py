@@ -102,6 +102,7 @@ class DeleteMealCommandHandler:
             event = MealDeleted.create(
                 meal_id=command.meal_id,
                 user_id=command.user_id,
+                meal_timestamps=[meal.timestamp],
             )
 
             await self._event_bus.publish(event)
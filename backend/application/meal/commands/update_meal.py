@@ -101,6 +101,7 @@ class UpdateMealCommandHandler:
 
         # 3. Apply updates to allowed fields
         updated_fields: List[str] = []
+        previous_timestamp = meal.timestamp
 
         # Allowed mutable fields
         allowed_fields = {"meal_type", "timestamp", "notes"}
@@ -153,6 +154,7 @@ class UpdateMealCommandHandler:
                 meal_id=meal.id,
                 user_id=command.user_id,
                 updated_fields=updated_fields,
+                meal_timestamps=[previous_timestamp, meal.timestamp],
             )
 
             await self._event_bus.publish(event)
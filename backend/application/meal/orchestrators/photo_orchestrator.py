@@ -2,18 +2,25 @@
 
 Coordinates food recognition and nutrition enrichment for meal analysis
 from multiple sources (photo, text, barcode).
+
+Metrics (metrics.core.registry, tag source: PHOTO | DESCRIPTION):
+    meal_analysis_latency_ms (recognition + enrichment + meal creation)
+    meal_enrichment_latency_ms (enrichment of all recognized items)
 """
 
 from datetime import datetime, timezone
 from typing import Optional, List, Tuple, Dict, Any
 from uuid import uuid4
+import asyncio
 import logging
+import time
 
 from domain.meal.core.entities.meal import Meal
 from domain.meal.core.factories.meal_factory import MealFactory
 from domain.meal.recognition.services.recognition_service import FoodRecognitionService
 from domain.meal.recognition.entities.recognized_food import FoodRecognitionResult
 from domain.meal.nutrition.services.enrichment_service import NutritionEnrichmentService
+from metrics.core import registry
 
 logger = logging.getLogger(__name__)
 
@@ -27,7 +34,7 @@ class MealAnalysisOrchestrator:
 
     Flow:
     1. Recognize foods from source (photo or text via Recognition Service)
-    2. Enrich each food with nutrients (Nutrition Service)
+    2. Enrich each food with nutrients (Nutrition Service, items concurrently)
     3. Create Meal aggregate (Meal Factory)
 
     Strategy Pattern:
@@ -117,6 +124,8 @@ class MealAnalysisOrchestrator:
             },
         )
 
+        started = time.perf_counter()
+
         # 1. Recognize foods from photo
         recognition_result = await self._recognition.recognize_from_photo(
             photo_url=photo_url, dish_hint=dish_hint
@@ -130,6 +139,7 @@ class MealAnalysisOrchestrator:
             meal_type=meal_type,
             timestamp=timestamp,
             photo_url=photo_url,
+            started=started,
         )
 
     async def analyze_from_text(
@@ -173,6 +183,8 @@ class MealAnalysisOrchestrator:
             },
         )
 
+        started = time.perf_counter()
+
         # 1. Recognize foods from text
         recognition_result = await self._recognition.recognize_from_text(
             description=text_description
@@ -185,6 +197,7 @@ class MealAnalysisOrchestrator:
             source="DESCRIPTION",
             meal_type=meal_type,
             timestamp=timestamp,
+            started=started,
         )
 
     async def _complete_analysis(
@@ -195,6 +208,7 @@ class MealAnalysisOrchestrator:
         meal_type: str,
         timestamp: Optional[datetime],
         photo_url: Optional[str] = None,
+        started: Optional[float] = None,
     ) -> Meal:
         """
         Complete analysis workflow (shared by photo and text).
@@ -206,6 +220,7 @@ class MealAnalysisOrchestrator:
             meal_type: Meal type
             timestamp: Meal timestamp
             photo_url: Optional photo URL (for photo source)
+            started: perf_counter() at analysis start (end-to-end latency metric)
 
         Returns:
             Analyzed Meal aggregate
@@ -221,25 +236,24 @@ class MealAnalysisOrchestrator:
             },
         )
 
-        # 2. Enrich each food with nutrients
-        enriched_items: List[Tuple[Dict[str, Any], Dict[str, Any]]] = []
-
-        for food in recognition_result.items:
-            logger.debug(
-                "Enriching food item",
-                extra={
-                    "label": food.label,
-                    "quantity_g": food.quantity_g,
-                },
-            )
-
-            # Get nutrients for this food
-            nutrients = await self._nutrition.enrich(
-                label=food.label,
-                quantity_g=food.quantity_g,
-                category=food.category,
+        # 2. Enrich each food with nutrients (concurrently, order preserved;
+        # provider concurrency is bounded by the nutrition service)
+        enrichment_started = time.perf_counter()
+        profiles = await asyncio.gather(
+            *(
+                self._nutrition.enrich(
+                    label=food.label,
+                    quantity_g=food.quantity_g,
+                    category=food.category,
+                )
+                for food in recognition_result.items
             )
+        )
+        enrichment_ms = (time.perf_counter() - enrichment_started) * 1000
+        registry.histogram("meal_enrichment_latency_ms", source=source).observe(enrichment_ms)
 
+        enriched_items: List[Tuple[Dict[str, Any], Dict[str, Any]]] = []
+        for food, nutrients in zip(recognition_result.items, profiles):
             # Convert to dicts for factory
             food_dict = {
                 "label": food.label,
@@ -263,7 +277,10 @@ class MealAnalysisOrchestrator:
 
         logger.info(
             "Enrichment complete",
-            extra={"enriched_item_count": len(enriched_items)},
+            extra={
+                "enriched_item_count": len(enriched_items),
+                "enrichment_ms": round(enrichment_ms, 1),
+            },
         )
 
         # 3. Create Meal aggregate using factory
@@ -279,6 +296,11 @@ class MealAnalysisOrchestrator:
             dish_name=recognition_result.dish_name,
         )
 
+        if started is not None:
+            registry.histogram("meal_analysis_latency_ms", source=source).observe(
+                (time.perf_counter() - started) * 1000
+            )
+
         logger.info(
             f"{source} analysis complete",
             extra={
@@ -8,6 +8,7 @@ from application.meal.queries.get_meal import (
 from application.meal.queries.get_meal_history import (
     GetMealHistoryQuery,
     GetMealHistoryQueryHandler,
+    MealHistoryPage,
 )
 from application.meal.queries.search_meals import (
     SearchMealsQuery,
@@ -18,6 +19,7 @@ from application.meal.queries.get_daily_summary import (
     GetDailySummaryQueryHandler,
     DailySummary,
 )
+from application.meal.queries.daily_summary_cache import DailySummaryCache
 
 # Atomic Queries (Utility)
 from application.meal.queries.recognize_food import (
@@ -39,11 +41,13 @@ __all__ = [
     "GetMealQueryHandler",
     "GetMealHistoryQuery",
     "GetMealHistoryQueryHandler",
+    "MealHistoryPage",
     "SearchMealsQuery",
     "SearchMealsQueryHandler",
     "GetDailySummaryQuery",
     "GetDailySummaryQueryHandler",
     "DailySummary",
+    "DailySummaryCache",
     # Atomic Queries
     "RecognizeFoodQuery",
     "RecognizeFoodQueryHandler",
@@ -0,0 +1,236 @@
+"""Read-through cache of daily summaries.
+
+Sits in front of GetDailySummaryQueryHandler: summaries are cached per
+(user_id, day) with a TTL and a bounded size (least recently used first
+out). Meal events published by the meal commands invalidate exactly the
+cached days containing the affected meal timestamps.
+
+The cache is per process: with several workers, a write invalidates only
+the worker that handled it and the TTL bounds staleness on the others.
+That is why it is off by default (DAILY_SUMMARY_CACHE_TTL_SECONDS=0):
+enable it for single-worker deployments, or where a TTL of stale reads
+is acceptable.
+"""
+
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass, replace
+from datetime import datetime
+import logging
+import time
+from typing import Callable, Dict, Iterable, Optional, Set, Tuple, Union
+
+from application.meal.queries.get_daily_summary import DailySummary
+from domain.meal.core.events import MealAnalyzed, MealConfirmed, MealDeleted, MealUpdated
+from domain.shared.ports.event_bus import IEventBus
+from metrics.core import registry
+
+logger = logging.getLogger(__name__)
+
+MealEvent = Union[MealAnalyzed, MealConfirmed, MealDeleted, MealUpdated]
+
+# (user_id, ISO start of day: keeps the query timezone distinct)
+CacheKey = Tuple[str, str]
+
+
+@dataclass(frozen=True)
+class _Entry:
+    """Cached summary with its day window and expiry."""
+
+    summary: DailySummary
+    start: datetime
+    end: datetime
+    expires_at: float
+
+    def contains(self, timestamp: datetime) -> bool:
+        """
+        Check if a meal timestamp falls within the cached day.
+
+        Compared both as instants and as naive wall-clock times, since
+        repositories differ in how they match timestamps to a day.
+        """
+        if self.start <= timestamp <= self.end:
+            return True
+        naive = timestamp.replace(tzinfo=None)
+        return self.start.replace(tzinfo=None) <= naive <= self.end.replace(tzinfo=None)
+
+
+class DailySummaryCache:
+    """
+    Bounded TTL cache of DailySummary results keyed by (user_id, day).
+
+    Metrics (metrics.core.registry counters):
+        daily_summary_cache_hits
+        daily_summary_cache_misses
+        daily_summary_cache_evictions (tag reason: expired | capacity | invalidated)
+
+    Example:
+        >>> cache = DailySummaryCache(ttl_seconds=60, max_entries=10_000)
+        >>> cache.subscribe(event_bus)
+        >>> handler = GetDailySummaryQueryHandler(repository, cache=cache)
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 60.0,
+        max_entries: int = 10_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize cache.
+
+        Args:
+            ttl_seconds: Lifetime of a cached summary
+            max_entries: Maximum number of cached summaries
+            clock: Monotonic time source in seconds (injectable for tests)
+        """
+        if ttl_seconds <= 0:
+            raise ValueError(f"ttl_seconds must be positive, got {ttl_seconds}")
+        if max_entries <= 0:
+            raise ValueError(f"max_entries must be positive, got {max_entries}")
+
+        self._ttl = ttl_seconds
+        self._max_entries = max_entries
+        self._clock = clock
+        self._entries: "OrderedDict[CacheKey, _Entry]" = OrderedDict()
+        # Cached keys of each user: invalidation never scans other users
+        self._keys_by_user: Dict[str, Set[CacheKey]] = defaultdict(set)
+        # Bumped on every invalidation: summaries computed across one are
+        # not stored (they may predate the write)
+        self._generation = 0
+
+    @staticmethod
+    def _key(user_id: str, day: datetime) -> CacheKey:
+        return (user_id, day.isoformat())
+
+    @property
+    def generation(self) -> int:
+        """Invalidation counter, read before computing a summary."""
+        return self._generation
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, user_id: str, day: datetime) -> Optional[DailySummary]:
+        """
+        Get a cached summary.
+
+        Args:
+            user_id: User identifier
+            day: Start of the day (timezone-aware, as in DailySummary.date)
+
+        Returns:
+            Copy of the cached summary, None on miss or expiry
+        """
+        key = self._key(user_id, day)
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at <= self._clock():
+            self._remove(key)
+            self._evicted("expired")
+            entry = None
+
+        if entry is None:
+            registry.counter("daily_summary_cache_misses").inc()
+            return None
+
+        self._entries.move_to_end(key)
+        registry.counter("daily_summary_cache_hits").inc()
+        return replace(entry.summary, breakdown_by_type=dict(entry.summary.breakdown_by_type))
+
+    def put(
+        self,
+        user_id: str,
+        start: datetime,
+        end: datetime,
+        summary: DailySummary,
+        generation: int,
+    ) -> bool:
+        """
+        Store a summary computed for the day [start, end].
+
+        Args:
+            user_id: User identifier
+            start: Start of the day (cache key)
+            end: End of the day (inclusive)
+            summary: Computed summary
+            generation: Value of `generation` read before computing it
+
+        Returns:
+            True if stored, False if an invalidation happened meanwhile
+        """
+        if generation != self._generation:
+            return False
+
+        key = self._key(user_id, start)
+        self._entries[key] = _Entry(
+            summary=replace(summary, breakdown_by_type=dict(summary.breakdown_by_type)),
+            start=start,
+            end=end,
+            expires_at=self._clock() + self._ttl,
+        )
+        self._entries.move_to_end(key)
+        self._keys_by_user[user_id].add(key)
+
+        while len(self._entries) > self._max_entries:
+            self._remove(next(iter(self._entries)))
+            self._evicted("capacity")
+        return True
+
+    def invalidate(self, user_id: str, timestamps: Iterable[datetime] = ()) -> int:
+        """
+        Drop the cached days of a user containing any of the timestamps.
+
+        Args:
+            user_id: User identifier
+            timestamps: Affected meal timestamps (empty: every day of the user)
+
+        Returns:
+            Number of summaries dropped
+        """
+        self._generation += 1
+        timestamps = list(timestamps)
+        stale = [
+            key
+            for key in self._keys_by_user.get(user_id, ())
+            if not timestamps or any(self._entries[key].contains(ts) for ts in timestamps)
+        ]
+        for key in stale:
+            self._remove(key)
+            self._evicted("invalidated")
+        return len(stale)
+
+    def clear(self) -> None:
+        """Drop every cached summary."""
+        self._generation += 1
+        self._entries.clear()
+        self._keys_by_user.clear()
+
+    def subscribe(self, event_bus: IEventBus) -> None:
+        """Invalidate on every meal event published on the bus."""
+        event_bus.subscribe(MealAnalyzed, self.on_meal_event)
+        event_bus.subscribe(MealConfirmed, self.on_meal_event)
+        event_bus.subscribe(MealDeleted, self.on_meal_event)
+        event_bus.subscribe(MealUpdated, self.on_meal_event)
+
+    async def on_meal_event(self, event: MealEvent) -> None:
+        """Event handler: invalidate the days touched by a meal change."""
+        dropped = self.invalidate(event.user_id, event.meal_timestamps)
+        logger.debug(
+            "Daily summary cache invalidated",
+            extra={
+                "event_type": type(event).__name__,
+                "user_id": event.user_id,
+                "dropped": dropped,
+            },
+        )
+
+    def _remove(self, key: CacheKey) -> None:
+        """Drop a cached summary and its user index entry."""
+        del self._entries[key]
+        keys = self._keys_by_user[key[0]]
+        keys.discard(key)
+        if not keys:
+            del self._keys_by_user[key[0]]
+
+    @staticmethod
+    def _evicted(reason: str) -> None:
+        registry.counter("daily_summary_cache_evictions", reason=reason).inc()
@@ -2,10 +2,18 @@
 
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 import logging
 
-from domain.shared.ports.meal_repository import IMealRepository
+from domain.meal.core.entities.meal import Meal
+from domain.shared.ports.meal_repository import (
+    IMealRepository,
+    MealPeriodTotals,
+    whole_utc_days,
+)
+
+if TYPE_CHECKING:
+    from application.meal.queries.daily_summary_cache import DailySummaryCache
 
 logger = logging.getLogger(__name__)
 
@@ -61,14 +69,20 @@ class GetDailySummaryQuery:
 class GetDailySummaryQueryHandler:
     """Handler for GetDailySummaryQuery."""
 
-    def __init__(self, repository: IMealRepository):
+    def __init__(
+        self,
+        repository: IMealRepository,
+        cache: Optional["DailySummaryCache"] = None,
+    ):
         """
         Initialize handler.
 
         Args:
             repository: Meal repository port
+            cache: Read-through summary cache (optional)
         """
         self._repository = repository
+        self._cache = cache
 
     async def handle(self, query: GetDailySummaryQuery) -> DailySummary:
         """
@@ -94,19 +108,30 @@ class GetDailySummaryQueryHandler:
         start = date
         end = date.replace(hour=23, minute=59, second=59, microsecond=999999)
 
-        # Fetch all meals for the day
-        meals = await self._repository.get_by_user_and_date_range(
-            user_id=query.user_id, start_date=start, end_date=end
-        )
-
-        # Aggregate totals
-        total_calories = sum(m.total_calories for m in meals)
-        total_protein = sum(m.total_protein for m in meals)
-        total_carbs = sum(m.total_carbs for m in meals)
-        total_fat = sum(m.total_fat for m in meals)
-        total_fiber = sum(m.total_fiber for m in meals)
-        total_sugar = sum(m.total_sugar for m in meals)
-        total_sodium = sum(m.total_sodium for m in meals)
+        generation = 0
+        if self._cache is not None:
+            cached = self._cache.get(query.user_id, date)
+            if cached is not None:
+                return cached
+            generation = self._cache.generation
+
+        # UTC days are read from the daily rollup (one small record)
+        totals: Optional[MealPeriodTotals] = None
+        days = whole_utc_days(start, end)
+        if days is not None:
+            rollups = await self._repository.get_daily_totals(
+                user_id=query.user_id, start_day=days[0], end_day=days[1]
+            )
+            if rollups is not None:
+                totals = rollups.get(days[0]) or MealPeriodTotals()
+
+        from_rollup = totals is not None
+        if totals is None:
+            # Other timezones (or rollups unavailable): aggregate the meals
+            meals = await self._repository.get_by_user_and_date_range(
+                user_id=query.user_id, start_date=start, end_date=end
+            )
+            totals = self._sum_meals(meals)
 
         # Breakdown by meal type
         breakdown: Dict[str, float] = {
@@ -116,20 +141,20 @@ class GetDailySummaryQueryHandler:
             "SNACK": 0.0,
         }
 
-        for meal in meals:
-            if meal.meal_type in breakdown:
-                breakdown[meal.meal_type] += meal.total_calories
+        for meal_type, calories in totals.breakdown_by_type.items():
+            if meal_type in breakdown:
+                breakdown[meal_type] += calories
 
         summary = DailySummary(
             date=date,
-            total_calories=total_calories,
-            total_protein=total_protein,
-            total_carbs=total_carbs,
-            total_fat=total_fat,
-            total_fiber=total_fiber,
-            total_sugar=total_sugar,
-            total_sodium=total_sodium,
-            meal_count=len(meals),
+            total_calories=totals.total_calories,
+            total_protein=totals.total_protein,
+            total_carbs=totals.total_carbs,
+            total_fat=totals.total_fat,
+            total_fiber=totals.total_fiber,
+            total_sugar=totals.total_sugar,
+            total_sodium=totals.total_sodium,
+            meal_count=totals.meal_count,
             breakdown_by_type=breakdown,
         )
 
@@ -138,9 +163,21 @@ class GetDailySummaryQueryHandler:
             extra={
                 "user_id": query.user_id,
                 "date": date.date().isoformat(),
-                "total_calories": total_calories,
-                "meal_count": len(meals),
+                "total_calories": totals.total_calories,
+                "meal_count": totals.meal_count,
+                "from_rollup": from_rollup,
             },
         )
 
+        if self._cache is not None:
+            self._cache.put(query.user_id, start, end, summary, generation)
+
         return summary
+
+    @staticmethod
+    def _sum_meals(meals: List[Meal]) -> MealPeriodTotals:
+        """Aggregate the totals of the meals of a day."""
+        totals = MealPeriodTotals()
+        for meal in meals:
+            totals.add(MealPeriodTotals.from_meal(meal))
+        return totals
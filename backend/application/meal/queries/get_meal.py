@@ -6,7 +6,7 @@ from uuid import UUID
 import logging
 
 from domain.meal.core.entities.meal import Meal
-from domain.shared.ports.meal_repository import IMealRepository
+from domain.shared.ports.meal_repository import IMealRepository, MealProjection
 
 logger = logging.getLogger(__name__)
 
@@ -21,10 +21,12 @@ class GetMealQuery:
     Attributes:
         meal_id: Meal ID to retrieve
         user_id: User ID for authorization
+        projection: Fields to load (default: full meal)
     """
 
     meal_id: UUID
     user_id: str
+    projection: Optional[MealProjection] = None
 
 
 class GetMealQueryHandler:
@@ -56,7 +58,9 @@ class GetMealQueryHandler:
             >>> meal.user_id == "user123"
             True
         """
-        meal = await self._repository.get_by_id(query.meal_id, query.user_id)
+        meal = await self._repository.get_by_id(
+            query.meal_id, query.user_id, projection=query.projection
+        )
 
         if meal:
             logger.debug(
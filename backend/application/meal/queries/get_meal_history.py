@@ -6,7 +6,7 @@ from typing import List, Optional
 import logging
 
 from domain.meal.core.entities.meal import Meal
-from domain.shared.ports.meal_repository import IMealRepository
+from domain.shared.ports.meal_repository import IMealRepository, MealCursor, MealProjection
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +17,8 @@ class GetMealHistoryQuery:
     Query: Get meal history for user with optional filters.
 
     Returns paginated list of meals ordered by timestamp desc (newest first).
+    All filters are applied by the repository before paging, so pages are
+    always full except the last one.
 
     Attributes:
         user_id: User ID to filter meals
@@ -25,6 +27,9 @@ class GetMealHistoryQuery:
         meal_type: Optional meal type filter (BREAKFAST, LUNCH, DINNER, SNACK)
         limit: Max number of results (default: 100)
         offset: Pagination offset (default: 0)
+        after: Keyset cursor from the previous page (preferred over offset)
+        include_total: Also count all matching meals (default: False)
+        projection: Fields to load (default: full meals)
     """
 
     user_id: str
@@ -33,6 +38,27 @@ class GetMealHistoryQuery:
     meal_type: Optional[str] = None
     limit: int = 100
     offset: int = 0
+    after: Optional[MealCursor] = None
+    include_total: bool = False
+    projection: Optional[MealProjection] = None
+
+
+@dataclass(frozen=True)
+class MealHistoryPage:
+    """
+    One page of meal history.
+
+    Attributes:
+        meals: Meals of the page, newest first
+        has_more: True if more meals follow this page
+        next_cursor: Cursor for the next page (None on the last page)
+        total_count: Number of matching meals (only if include_total)
+    """
+
+    meals: List[Meal]
+    has_more: bool
+    next_cursor: Optional[MealCursor] = None
+    total_count: Optional[int] = None
 
 
 class GetMealHistoryQueryHandler:
@@ -47,15 +73,18 @@ class GetMealHistoryQueryHandler:
         """
         self._repository = repository
 
-    async def handle(self, query: GetMealHistoryQuery) -> List[Meal]:
+    async def handle(self, query: GetMealHistoryQuery) -> MealHistoryPage:
         """
-        Execute query and return filtered meal list.
+        Execute query and return one page of filtered meals.
+
+        One extra meal is fetched to know whether another page follows,
+        so no count is needed for has_more.
 
         Args:
             query: GetMealHistoryQuery
 
         Returns:
-            List of meals matching filters, ordered by timestamp desc
+            MealHistoryPage with meals ordered by timestamp desc
 
         Example:
             >>> handler = GetMealHistoryQueryHandler(repository)
@@ -64,25 +93,33 @@ class GetMealHistoryQueryHandler:
             ...     meal_type="LUNCH",
             ...     limit=10
             ... )
-            >>> meals = await handler.handle(query)
-            >>> all(m.meal_type == "LUNCH" for m in meals)
+            >>> page = await handler.handle(query)
+            >>> all(m.meal_type == "LUNCH" for m in page.meals)
             True
         """
-        # Get meals with date range filter
-        if query.start_date and query.end_date:
-            meals = await self._repository.get_by_user_and_date_range(
-                user_id=query.user_id, start_date=query.start_date, end_date=query.end_date
-            )
-            # Apply pagination manually since get_by_user_and_date_range doesn't support it
-            meals = meals[query.offset : query.offset + query.limit]
-        else:
-            meals = await self._repository.get_by_user(
-                user_id=query.user_id, limit=query.limit, offset=query.offset
-            )
+        meals = await self._repository.get_history_page(
+            user_id=query.user_id,
+            limit=query.limit + 1,
+            start_date=query.start_date,
+            end_date=query.end_date,
+            meal_type=query.meal_type,
+            after=query.after,
+            offset=query.offset,
+            projection=query.projection,
+        )
 
-        # Apply meal_type filter if specified
-        if query.meal_type:
-            meals = [m for m in meals if m.meal_type == query.meal_type]
+        has_more = len(meals) > query.limit
+        meals = meals[: query.limit]
+        next_cursor = MealCursor.from_meal(meals[-1]) if has_more and meals else None
+
+        total_count = None
+        if query.include_total:
+            total_count = await self._repository.count_history(
+                user_id=query.user_id,
+                start_date=query.start_date,
+                end_date=query.end_date,
+                meal_type=query.meal_type,
+            )
 
         logger.info(
             "Meal history retrieved",
@@ -96,7 +133,13 @@ class GetMealHistoryQueryHandler:
                 },
                 "limit": query.limit,
                 "offset": query.offset,
+                "keyset": query.after is not None,
             },
         )
 
-        return meals
+        return MealHistoryPage(
+            meals=meals,
+            has_more=has_more,
+            next_cursor=next_cursor,
+            total_count=total_count,
+        )
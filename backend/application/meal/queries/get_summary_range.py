@@ -3,14 +3,18 @@
 Supports grouping by day, week, or month for efficient dashboard queries.
 """
 
+from bisect import bisect_right
 from dataclasses import dataclass
-from datetime import datetime, timedelta
-from typing import List
-
-from domain.shared.ports.meal_repository import IMealRepository
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from domain.shared.ports.meal_repository import (
+    IMealRepository,
+    MealPeriodTotals,
+    whole_utc_days,
+)
 from domain.shared.types import GroupByPeriod
 
-
 __all__ = [
     "GroupByPeriod",
     "GetSummaryRangeQuery",
@@ -76,8 +80,10 @@ class GetSummaryRangeQueryHandler:
 
         Algorithm:
             1. Split date range into periods based on group_by
-            2. For each period, calculate summary using existing logic
-            3. Return aggregated results
+            2. Sum the daily rollups of each period if periods are whole
+               UTC days, else aggregate all periods with a single
+               repository call
+            3. Zero-fill periods without meals
         """
         # Split range into periods
         periods = self._split_range_into_periods(
@@ -85,20 +91,68 @@ class GetSummaryRangeQueryHandler:
             end_date=query.end_date,
             group_by=query.group_by,
         )
+        if not periods:
+            return []
+
+        totals_by_period = await self._totals_from_rollups(query.user_id, periods)
+        if totals_by_period is None:
+            # One round trip for the whole range (grouping pushed to repository)
+            totals_by_period = await self.repository.aggregate_by_period(
+                user_id=query.user_id, periods=periods
+            )
 
-        # Calculate summary for each period
         summaries: List[PeriodSummaryData] = []
-        for period_start, period_end in periods:
-            summary = await self._calculate_period_summary(
-                user_id=query.user_id,
-                start_date=period_start,
-                end_date=period_end,
-                group_by=query.group_by,
+        for index, (period_start, period_end) in enumerate(periods):
+            totals = totals_by_period.get(index) or MealPeriodTotals()
+            summaries.append(
+                self._build_period_summary(
+                    totals=totals,
+                    start_date=period_start,
+                    end_date=period_end,
+                    group_by=query.group_by,
+                )
             )
-            summaries.append(summary)
 
         return summaries
 
+    async def _totals_from_rollups(
+        self, user_id: str, periods: List[Tuple[datetime, datetime]]
+    ) -> Optional[Dict[int, MealPeriodTotals]]:
+        """Sum the daily rollups into periods (O(days) reads, no meal scanned).
+
+        Returns:
+            Mapping period index -> totals, or None if a period is not made
+            of whole UTC days or rollups are unavailable
+        """
+        period_days: List[Tuple[date, date]] = []
+        for period_start, period_end in periods:
+            days = whole_utc_days(period_start, period_end)
+            if days is None:
+                return None
+            period_days.append(days)
+
+        # Periods by first day: each day is matched with one bisect
+        order = sorted(range(len(period_days)), key=lambda index: period_days[index][0])
+        first_days = [period_days[index][0] for index in order]
+
+        daily_totals = await self.repository.get_daily_totals(
+            user_id=user_id,
+            start_day=first_days[0],
+            end_day=max(last_day for _, last_day in period_days),
+        )
+        if daily_totals is None:
+            return None
+
+        results: Dict[int, MealPeriodTotals] = {}
+        for day, totals in daily_totals.items():
+            position = bisect_right(first_days, day) - 1
+            if position < 0:
+                continue
+            index = order[position]
+            if day <= period_days[index][1]:
+                results.setdefault(index, MealPeriodTotals()).add(totals)
+        return results
+
     def _split_range_into_periods(
         self, start_date: datetime, end_date: datetime, group_by: GroupByPeriod
     ) -> List[tuple[datetime, datetime]]:
@@ -165,17 +219,17 @@ class GetSummaryRangeQueryHandler:
 
         return periods
 
-    async def _calculate_period_summary(
+    def _build_period_summary(
         self,
-        user_id: str,
+        totals: MealPeriodTotals,
         start_date: datetime,
         end_date: datetime,
         group_by: GroupByPeriod,
     ) -> PeriodSummaryData:
-        """Calculate summary for a single period.
+        """Build summary for a single period from aggregated totals.
 
         Args:
-            user_id: User ID
+            totals: Aggregated totals for the period
             start_date: Period start
             end_date: Period end
             group_by: Grouping period (for label formatting)
@@ -183,45 +237,19 @@ class GetSummaryRangeQueryHandler:
         Returns:
             PeriodSummaryData with aggregated values
         """
-        # Get all meals in period
-        meals = await self.repository.get_by_user_and_date_range(
-            user_id=user_id, start_date=start_date, end_date=end_date
-        )
-
-        # Aggregate nutrition values
-        total_calories = sum(meal.total_calories for meal in meals)
-        total_protein = sum(meal.total_protein for meal in meals)
-        total_carbs = sum(meal.total_carbs for meal in meals)
-        total_fat = sum(meal.total_fat for meal in meals)
-        total_fiber = sum(meal.total_fiber for meal in meals)
-        total_sugar = sum(meal.total_sugar for meal in meals)
-        total_sodium = sum(meal.total_sodium for meal in meals)
-        meal_count = len(meals)
-
-        # Calculate breakdown by meal type
-        breakdown: dict[str, float] = {}
-        for meal in meals:
-            meal_type = meal.meal_type
-            if meal_type not in breakdown:
-                breakdown[meal_type] = 0.0
-            breakdown[meal_type] += float(meal.total_calories)
-
-        # Format period label
-        period_label = self._format_period_label(start_date, group_by)
-
         return PeriodSummaryData(
-            period=period_label,
+            period=self._format_period_label(start_date, group_by),
             start_date=start_date,
             end_date=end_date,
-            total_calories=total_calories,
-            total_protein=total_protein,
-            total_carbs=total_carbs,
-            total_fat=total_fat,
-            total_fiber=total_fiber,
-            total_sugar=total_sugar,
-            total_sodium=total_sodium,
-            meal_count=meal_count,
-            breakdown_by_type=breakdown,
+            total_calories=totals.total_calories,
+            total_protein=totals.total_protein,
+            total_carbs=totals.total_carbs,
+            total_fat=totals.total_fat,
+            total_fiber=totals.total_fiber,
+            total_sugar=totals.total_sugar,
+            total_sodium=totals.total_sodium,
+            meal_count=totals.meal_count,
+            breakdown_by_type=dict(totals.breakdown_by_type),
         )
 
     def _format_period_label(self, date: datetime, group_by: GroupByPeriod) -> str:
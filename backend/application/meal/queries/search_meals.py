@@ -1,11 +1,12 @@
 """Search meals query - full-text search."""
 
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional
 import logging
 
 from domain.meal.core.entities.meal import Meal
-from domain.shared.ports.meal_repository import IMealRepository
+from domain.shared.ports.meal_repository import MealProjection
+from domain.shared.ports.meal_search import IMealSearch
 
 logger = logging.getLogger(__name__)
 
@@ -15,31 +16,33 @@ class SearchMealsQuery:
     """
     Query: Search meals by text query.
 
-    Searches in meal entry names, display names, and notes.
-    Returns paginated results ordered by timestamp desc.
+    Searches in dish name, meal entry names, display names, and notes.
+    Returns paginated results ordered by relevance, then timestamp desc.
 
     Attributes:
         user_id: User ID to filter meals
         query_text: Text to search for
         limit: Max number of results (default: 50)
         offset: Pagination offset (default: 0)
+        projection: Fields to load (default: full meals)
     """
 
     user_id: str
     query_text: str
     limit: int = 50
     offset: int = 0
+    projection: Optional[MealProjection] = None
 
 
 class SearchMealsQueryHandler:
     """Handler for SearchMealsQuery."""
 
-    def __init__(self, repository: IMealRepository):
+    def __init__(self, repository: IMealSearch):
         """
         Initialize handler.
 
         Args:
-            repository: Meal repository port
+            repository: Meal search port (implemented by meal repositories)
         """
         self._repository = repository
 
@@ -47,11 +50,11 @@ class SearchMealsQueryHandler:
         """
         Execute search query and return matching meals.
 
-        Search logic:
-        - Searches in meal entry names and display names
-        - Searches in meal notes
-        - Case-insensitive matching
-        - Returns meals ordered by timestamp desc
+        Search logic (see domain.meal.core.services.search_text):
+        - Searches in dish name, entry names/display names and notes
+        - Case and accent insensitive, every term matches as a word prefix
+        - Returns meals ordered by relevance, then timestamp desc
+        - Searches the whole history (index-backed, paginated by the port)
 
         Args:
             query: SearchMealsQuery
@@ -70,41 +73,23 @@ class SearchMealsQueryHandler:
             >>> any("pasta" in m.entries[0].display_name.lower() for m in meals)
             True
         """
-        # Get all user meals (in production, this would use a search index)
-        all_meals = await self._repository.get_by_user(
-            user_id=query.user_id, limit=1000, offset=0  # High limit to search across all meals
+        meals = await self._repository.search(
+            user_id=query.user_id,
+            query_text=query.query_text,
+            limit=query.limit,
+            offset=query.offset,
+            projection=query.projection,
         )
 
-        # Filter by search query (case-insensitive)
-        search_term = query.query_text.lower().strip()
-        matching_meals = []
-
-        for meal in all_meals:
-            # Search in dish name
-            dish_match = search_term in meal.dish_name.lower()
-
-            # Search in entry names
-            entry_match = any(search_term in entry.name.lower() for entry in meal.entries)
-
-            # Search in meal notes
-            notes_match = meal.notes and search_term in meal.notes.lower()
-
-            if dish_match or entry_match or notes_match:
-                matching_meals.append(meal)
-
-        # Apply pagination
-        paginated_meals = matching_meals[query.offset : query.offset + query.limit]
-
         logger.info(
             "Meal search executed",
             extra={
                 "user_id": query.user_id,
                 "query_text": query.query_text,
-                "total_matches": len(matching_meals),
-                "returned_count": len(paginated_meals),
+                "returned_count": len(meals),
                 "limit": query.limit,
                 "offset": query.offset,
             },
         )
 
-        return paginated_meals
+        return meals
@@ -1,7 +1,8 @@
 """Get activity aggregate range query handler.
 
 Handles date range queries with flexible grouping (DAY, WEEK, MONTH) for
-efficient dashboard queries without expensive loops.
+efficient dashboard queries without expensive loops: every period is
+aggregated by a single IActivityRepository.aggregate_by_period call.
 """
 
 from __future__ import annotations
@@ -10,7 +11,7 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import List
 
-from repository.activities import activity_repo
+from domain.activity.repository import ActivityPeriodTotals, IActivityRepository
 from domain.shared.types import GroupByPeriod
 
 
@@ -44,12 +45,21 @@ class ActivityPeriodData:
     total_active_minutes: int
     avg_heart_rate: float | None
     event_count: int
+    heart_rate_samples: int = 0  # events with hr_avg (weights avg_heart_rate)
 
 
 class GetAggregateRangeQueryHandler:
     """Handler for activity aggregate range queries."""
 
-    def handle(self, query: GetAggregateRangeQuery) -> List[ActivityPeriodData]:
+    def __init__(self, repository: IActivityRepository):
+        """Initialize handler.
+
+        Args:
+            repository: Activity repository port
+        """
+        self._repository = repository
+
+    async def handle(self, query: GetAggregateRangeQuery) -> List[ActivityPeriodData]:
         """Execute query and return aggregated periods.
 
         Args:
@@ -59,31 +69,22 @@ class GetAggregateRangeQueryHandler:
             List of period summaries with activity data
         """
         periods = self._split_range_into_periods(query.start_date, query.end_date, query.group_by)
+        totals_by_period = await self._repository.aggregate_by_period(query.user_id, periods)
 
         results: List[ActivityPeriodData] = []
-        for period_start, period_end in periods:
-            period_data = self._calculate_period_aggregate(query.user_id, period_start, period_end)
-            period_label = self._format_period_label(period_start, query.group_by)
-            # Type assertions for mypy
-            total_steps = period_data["total_steps"]
-            total_calories = period_data["total_calories_out"]
-            total_minutes = period_data["total_active_minutes"]
-            event_cnt = period_data["event_count"]
-            assert isinstance(total_steps, int)
-            assert isinstance(total_calories, (int, float))
-            assert isinstance(total_minutes, int)
-            assert isinstance(event_cnt, int)
-
+        for index, (period_start, period_end) in enumerate(periods):
+            totals = totals_by_period.get(index, ActivityPeriodTotals())
             results.append(
                 ActivityPeriodData(
-                    period=period_label,
+                    period=self._format_period_label(period_start, query.group_by),
                     start_date=period_start,
                     end_date=period_end,
-                    total_steps=total_steps,
-                    total_calories_out=float(total_calories),
-                    total_active_minutes=total_minutes,
-                    avg_heart_rate=period_data["avg_heart_rate"],
-                    event_count=event_cnt,
+                    total_steps=totals.total_steps,
+                    total_calories_out=float(totals.total_calories_out),
+                    total_active_minutes=totals.active_minutes,
+                    avg_heart_rate=totals.avg_heart_rate,
+                    event_count=totals.event_count,
+                    heart_rate_samples=totals.heart_rate_samples,
                 )
             )
 
@@ -117,7 +118,8 @@ class GetAggregateRangeQueryHandler:
                 actual_start = max(day_start, start_date)
                 actual_end = min(day_end, end_date)
                 periods.append((actual_start, actual_end))
-                current += timedelta(days=1)
+                # Next midnight (keeping the time could skip the last day)
+                current = day_start + timedelta(days=1)
 
         elif group_by == GroupByPeriod.WEEK:
             # Split by ISO week (Monday-Sunday)
@@ -133,8 +135,8 @@ class GetAggregateRangeQueryHandler:
                 actual_start = max(week_start, start_date)
                 actual_end = min(week_end, end_date)
                 periods.append((actual_start, actual_end))
-                # Move to next Monday
-                current = week_end + timedelta(days=1)
+                # Move to next Monday (midnight)
+                current = week_start + timedelta(days=7)
 
         elif group_by == GroupByPeriod.MONTH:
             # Split by calendar month
@@ -154,63 +156,11 @@ class GetAggregateRangeQueryHandler:
                 actual_start = max(month_start, start_date)
                 actual_end = min(month_end, end_date)
                 periods.append((actual_start, actual_end))
-                # Move to next month
-                current = next_month
+                # Move to next month (midnight)
+                current = next_month.replace(hour=0, minute=0, second=0, microsecond=0)
 
         return periods
 
-    def _calculate_period_aggregate(
-        self, user_id: str, start_date: datetime, end_date: datetime
-    ) -> dict[str, int | float | None]:
-        """Calculate activity aggregates for a period.
-
-        Args:
-            user_id: User ID
-            start_date: Period start
-            end_date: Period end
-
-        Returns:
-            Dict with activity totals
-        """
-        # Aggregate activity events
-        start_iso = start_date.isoformat()
-        end_iso = end_date.isoformat()
-
-        events = activity_repo.list_events(
-            user_id=user_id,
-            start_ts=start_iso,
-            end_ts=end_iso,
-            limit=10000,  # Large limit for aggregation
-        )
-
-        total_steps = 0
-        total_calories = 0.0
-        total_hr_sum = 0.0
-        hr_count = 0
-        active_minutes = 0
-
-        for event in events:
-            if event.steps is not None:
-                total_steps += event.steps
-            if event.calories_out is not None:
-                total_calories += event.calories_out
-            if event.hr_avg is not None:
-                total_hr_sum += event.hr_avg
-                hr_count += 1
-            # Each event represents 1 minute
-            if event.steps and event.steps > 0:
-                active_minutes += 1
-
-        avg_hr = total_hr_sum / hr_count if hr_count > 0 else None
-
-        return {
-            "total_steps": total_steps,
-            "total_calories_out": total_calories,
-            "total_active_minutes": active_minutes,
-            "avg_heart_rate": avg_hr,
-            "event_count": len(events),
-        }
-
     def _format_period_label(self, period_start: datetime, group_by: GroupByPeriod) -> str:
         """Format period label for display.
 
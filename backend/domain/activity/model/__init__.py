@@ -19,10 +19,26 @@ qui solo invariants leggeri e helper di normalizzazione.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from enum import Enum
-from typing import Optional
+from typing import List, Optional, Union
 import datetime as _dt
+import hashlib
+import json
+import math
+
+# Reason code dei rejected di ingest (stessi del repository legacy)
+INVALID_EVENT = "INVALID_EVENT"
+NEGATIVE_VALUE = "NEGATIVE_VALUE"
+OUT_OF_RANGE_HR = "OUT_OF_RANGE_HR"
+NORMALIZATION_FAILED = "NORMALIZATION_FAILED"
+# Chiave di idempotenza riusata con un payload diverso
+IDEMPOTENCY_CONFLICT = "IDEMPOTENCY_CONFLICT"
+# Scrittura fallita nello storage (dettaglio solo nei log)
+WRITE_FAILED = "WRITE_FAILED"
+
+# Steps massimi accettati in ingest (stesso limite del repository legacy)
+MAX_STEPS = 2**53
 
 
 class ActivitySource(str, Enum):
@@ -38,11 +54,33 @@ class ActivitySource(str, Enum):
     MANUAL = "MANUAL"
 
 
+def _is_minute_canonical(ts: str) -> bool:
+    """True se ts ha la forma ASCII ``YYYY-MM-DDTHH:MM:00Z``."""
+    return (
+        len(ts) == 20
+        and ts.endswith(":00Z")
+        and ts[4] == "-"
+        and ts[7] == "-"
+        and ts[10] == "T"
+        and ts[13] == ":"
+        and ts.isascii()
+        and ts[:4].isdigit()
+        and ts[5:7].isdigit()
+        and ts[8:10].isdigit()
+        and ts[11:13].isdigit()
+        and ts[14:16].isdigit()
+    )
+
+
 def _normalize_minute_iso(ts: str) -> str:
     """Normalizza una stringa ISO8601 alla precisione minuto UTC.
 
     Se parsing fallisce ritorna la stringa originale (decisione fail-soft; la
     validazione formale avverrà nei servizi o adapter)."""
+    if _is_minute_canonical(ts):
+        # Già nella forma normalizzata: se valido il parsing restituirebbe lo
+        # stesso testo, se non valido (fail-soft) pure
+        return ts
     try:
         # Supporta suffisso Z oppure offset esplicito
         if ts.endswith("Z"):
@@ -58,6 +96,17 @@ def _normalize_minute_iso(ts: str) -> str:
         return ts  # fail-soft
 
 
+def format_ts_bound(value: _dt.datetime) -> str:
+    """Formatta un datetime come timestamp ISO8601 UTC con suffisso Z.
+
+    Il risultato è confrontabile (come stringa) con i ``ts`` normalizzati
+    degli eventi; datetime naive sono intesi UTC.
+    """
+    if value.tzinfo is not None:
+        value = value.astimezone(_dt.timezone.utc).replace(tzinfo=None)
+    return value.isoformat() + "Z"
+
+
 @dataclass(slots=True, frozen=True)
 class ActivityEvent:
     """Evento activity minuto (o granularità coerente >= minuto).
@@ -92,6 +141,58 @@ class ActivityEvent:
         )
 
 
+def validate_activity_event(event: ActivityEvent) -> Union[ActivityEvent, str]:
+    """Valida un evento prima dell'ingest tramite IActivityRepository.
+
+    Stessi controlli e reason code di InMemoryActivityRepository.ingest_batch
+    (legacy), così che ogni backend rifiuti gli stessi eventi.
+
+    Returns:
+        Evento normalizzato (ts al minuto UTC, hr_avg arrotondato) oppure
+        il reason code del primo controllo fallito
+    """
+    if event.steps is not None:
+        if event.steps < 0:
+            return NEGATIVE_VALUE
+        if event.steps > MAX_STEPS:
+            return INVALID_EVENT
+    if event.calories_out is not None:
+        if not math.isfinite(event.calories_out):
+            return INVALID_EVENT
+        if event.calories_out < 0:
+            return NEGATIVE_VALUE
+    hr_avg = event.hr_avg
+    if hr_avg is not None:
+        if not math.isfinite(hr_avg):
+            return INVALID_EVENT
+        hr_avg = float(round(hr_avg))
+        if hr_avg < 25 or hr_avg > 240:
+            return OUT_OF_RANGE_HR
+    if not event.user_id or not event.ts:
+        return INVALID_EVENT
+
+    normalized = replace(event, hr_avg=hr_avg).normalized()
+    try:
+        # normalized() è fail-soft: un ts non parsabile resta invariato
+        _dt.datetime.fromisoformat(normalized.ts.replace("Z", "+00:00"))
+    except ValueError:
+        return NORMALIZATION_FAILED
+    return normalized
+
+
+def batch_signature(events: List[ActivityEvent]) -> str:
+    """SHA-256 degli eventi normalizzati (ordine incluso).
+
+    Lega una chiave di idempotenza al payload del batch: un replay esatto
+    (anche con secondi diversi nello stesso minuto) ha la stessa signature.
+    """
+    payload = [
+        [e.user_id, e.ts, e.steps, e.calories_out, e.hr_avg, e.source.value]
+        for e in (event.normalized() for event in events)
+    ]
+    return hashlib.sha256(json.dumps(payload, separators=(",", ":")).encode()).hexdigest()
+
+
 @dataclass(slots=True, frozen=True)
 class HealthSnapshot:
     """Snapshot cumulativo (steps/calories_out) per un determinato giorno.
@@ -154,4 +255,14 @@ __all__ = [
     "HealthSnapshot",
     "ActivityDelta",
     "DailyActivitySummary",
+    "format_ts_bound",
+    "validate_activity_event",
+    "batch_signature",
+    "INVALID_EVENT",
+    "NEGATIVE_VALUE",
+    "OUT_OF_RANGE_HR",
+    "NORMALIZATION_FAILED",
+    "IDEMPOTENCY_CONFLICT",
+    "WRITE_FAILED",
+    "MAX_STEPS",
 ]
@@ -8,6 +8,8 @@ per coerenza architetturale.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
 from typing import List, Optional, Tuple, Dict, Any
 
 from domain.activity.model import (
@@ -17,6 +19,55 @@ from domain.activity.model import (
 )
 
 
+@dataclass
+class ActivityPeriodTotals:
+    """Totali degli eventi activity che cadono in un periodo.
+
+    Restituiti da IActivityRepository.aggregate_by_period, così che
+    aggregateRange non debba caricare gli eventi periodo per periodo.
+
+    Attributes:
+        total_steps: Somma steps
+        total_calories_out: Somma calorie bruciate
+        active_minutes: Eventi (minuti) con steps > 0
+        heart_rate_sum: Somma hr_avg degli eventi che lo riportano
+        heart_rate_samples: Numero di eventi con hr_avg
+        event_count: Numero di eventi nel periodo
+    """
+
+    total_steps: int = 0
+    total_calories_out: float = 0.0
+    active_minutes: int = 0
+    heart_rate_sum: float = 0.0
+    heart_rate_samples: int = 0
+    event_count: int = 0
+
+    def add(
+        self,
+        steps: Optional[int],
+        calories_out: Optional[float],
+        hr_avg: Optional[float],
+    ) -> None:
+        """Aggiunge un evento (un minuto) ai totali."""
+        if steps is not None:
+            self.total_steps += steps
+            if steps > 0:
+                self.active_minutes += 1
+        if calories_out is not None:
+            self.total_calories_out += calories_out
+        if hr_avg is not None:
+            self.heart_rate_sum += hr_avg
+            self.heart_rate_samples += 1
+        self.event_count += 1
+
+    @property
+    def avg_heart_rate(self) -> Optional[float]:
+        """Media hr_avg pesata sui campioni (None se nessun campione)."""
+        if not self.heart_rate_samples:
+            return None
+        return self.heart_rate_sum / self.heart_rate_samples
+
+
 class IActivityRepository(ABC):
     """Repository interface per il dominio Activity.
 
@@ -64,6 +115,28 @@ class IActivityRepository(ABC):
             Lista di ActivityEvent ordinati per timestamp
         """
 
+    @abstractmethod
+    async def aggregate_by_period(
+        self,
+        user_id: str,
+        periods: List[Tuple[datetime, datetime]],
+    ) -> Dict[int, ActivityPeriodTotals]:
+        """Aggrega gli eventi activity per periodi consecutivi in un solo passaggio.
+
+        I periodi devono essere ordinati e contigui: il periodo i copre
+        [start_i, start_{i+1}) e l'ultimo [start_n, end_n) (end escluso,
+        come in list_events). Datetime naive sono intesi UTC. Nessun
+        limite sul numero di eventi aggregati.
+
+        Args:
+            user_id: ID utente
+            periods: Lista di tuple (period_start, period_end)
+
+        Returns:
+            Mappa indice periodo -> totali. I periodi senza eventi sono
+            omessi (il chiamante li riempie con zero).
+        """
+
     @abstractmethod
     async def get_daily_events_count(self, user_id: str, date: str) -> int:
         """Conta eventi per diagnostica.
@@ -135,4 +208,4 @@ class IActivityRepository(ABC):
         """
 
 
-__all__ = ["IActivityRepository"]
+__all__ = ["ActivityPeriodTotals", "IActivityRepository"]
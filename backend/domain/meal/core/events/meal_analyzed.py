@@ -6,6 +6,7 @@ Event raised when a meal has been analyzed from a source
 
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from typing import Sequence, Tuple
 from uuid import UUID, uuid4
 
 from .base import DomainEvent
@@ -24,6 +25,8 @@ class MealAnalyzed(DomainEvent):
         source: Source of analysis (PHOTO | BARCODE | DESCRIPTION).
         item_count: Number of food items identified.
         average_confidence: Average confidence score across all items.
+        meal_timestamps: Timestamps of the meal affected by the event, used
+            to invalidate per-day read models (empty: unknown).
 
     Examples:
         >>> event = MealAnalyzed.create(
@@ -42,6 +45,7 @@ class MealAnalyzed(DomainEvent):
     source: str  # PHOTO | BARCODE | DESCRIPTION
     item_count: int
     average_confidence: float
+    meal_timestamps: Tuple[datetime, ...] = ()
 
     @classmethod
     def create(
@@ -51,6 +55,7 @@ class MealAnalyzed(DomainEvent):
         source: str,
         item_count: int,
         average_confidence: float,
+        meal_timestamps: Sequence[datetime] = (),
     ) -> "MealAnalyzed":
         """Create new MealAnalyzed event.
 
@@ -60,6 +65,7 @@ class MealAnalyzed(DomainEvent):
             source: Source of analysis (PHOTO, BARCODE, or DESCRIPTION).
             item_count: Number of food items identified (must be > 0).
             average_confidence: Average confidence score (0.0 - 1.0).
+            meal_timestamps: Timestamp of the meal.
 
         Returns:
             New MealAnalyzed event with generated event_id and current timestamp.
@@ -86,4 +92,5 @@ class MealAnalyzed(DomainEvent):
             source=source,
             item_count=item_count,
             average_confidence=average_confidence,
+            meal_timestamps=tuple(meal_timestamps),
         )
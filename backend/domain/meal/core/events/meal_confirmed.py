@@ -5,6 +5,7 @@ Event raised when a user confirms or rejects analyzed meal entries.
 
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from typing import Sequence, Tuple
 from uuid import UUID, uuid4
 
 from .base import DomainEvent
@@ -23,6 +24,8 @@ class MealConfirmed(DomainEvent):
         user_id: ID of the user who confirmed the meal.
         confirmed_entry_count: Number of entries user confirmed/kept.
         rejected_entry_count: Number of entries user rejected/removed.
+        meal_timestamps: Timestamps of the meal affected by the event, used
+            to invalidate per-day read models (empty: unknown).
 
     Examples:
         >>> event = MealConfirmed.create(
@@ -39,6 +42,7 @@ class MealConfirmed(DomainEvent):
     user_id: str
     confirmed_entry_count: int
     rejected_entry_count: int
+    meal_timestamps: Tuple[datetime, ...] = ()
 
     @classmethod
     def create(
@@ -47,6 +51,7 @@ class MealConfirmed(DomainEvent):
         user_id: str,
         confirmed_entry_count: int,
         rejected_entry_count: int,
+        meal_timestamps: Sequence[datetime] = (),
     ) -> "MealConfirmed":
         """Create new MealConfirmed event.
 
@@ -55,6 +60,7 @@ class MealConfirmed(DomainEvent):
             user_id: ID of the user who confirmed the meal.
             confirmed_entry_count: Number of entries confirmed (>= 0).
             rejected_entry_count: Number of entries rejected (>= 0).
+            meal_timestamps: Timestamp of the meal.
 
         Returns:
             New MealConfirmed event with generated event_id and current timestamp.
@@ -77,4 +83,5 @@ class MealConfirmed(DomainEvent):
             user_id=user_id,
             confirmed_entry_count=confirmed_entry_count,
             rejected_entry_count=rejected_entry_count,
+            meal_timestamps=tuple(meal_timestamps),
         )
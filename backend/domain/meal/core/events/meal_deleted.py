@@ -5,6 +5,7 @@ Event raised when a meal is deleted by the user.
 
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from typing import Sequence, Tuple
 from uuid import UUID, uuid4
 
 from .base import DomainEvent
@@ -20,6 +21,8 @@ class MealDeleted(DomainEvent):
     Attributes:
         meal_id: ID of the deleted meal.
         user_id: ID of the user who deleted the meal.
+        meal_timestamps: Timestamps of the meal affected by the event, used
+            to invalidate per-day read models (empty: unknown).
 
     Examples:
         >>> event = MealDeleted.create(
@@ -32,18 +35,21 @@ class MealDeleted(DomainEvent):
 
     meal_id: UUID
     user_id: str
+    meal_timestamps: Tuple[datetime, ...] = ()
 
     @classmethod
     def create(
         cls,
         meal_id: UUID,
         user_id: str,
+        meal_timestamps: Sequence[datetime] = (),
     ) -> "MealDeleted":
         """Create new MealDeleted event.
 
         Args:
             meal_id: ID of the deleted meal.
             user_id: ID of the user who deleted the meal.
+            meal_timestamps: Timestamp of the meal.
 
         Returns:
             New MealDeleted event with generated event_id and current timestamp.
@@ -53,4 +59,5 @@ class MealDeleted(DomainEvent):
             occurred_at=datetime.now(timezone.utc),
             meal_id=meal_id,
             user_id=user_id,
+            meal_timestamps=tuple(meal_timestamps),
         )
@@ -5,7 +5,7 @@ Event raised when a meal or its entries have been updated.
 
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import List
+from typing import List, Sequence, Tuple
 from uuid import UUID, uuid4
 
 from .base import DomainEvent
@@ -22,6 +22,8 @@ class MealUpdated(DomainEvent):
         meal_id: ID of the updated meal.
         user_id: ID of the user who updated the meal.
         updated_fields: List of field names that were updated.
+        meal_timestamps: Timestamps of the meal affected by the event, used
+            to invalidate per-day read models (empty: unknown).
 
     Examples:
         >>> event = MealUpdated.create(
@@ -36,6 +38,7 @@ class MealUpdated(DomainEvent):
     meal_id: UUID
     user_id: str
     updated_fields: List[str]
+    meal_timestamps: Tuple[datetime, ...] = ()
 
     @classmethod
     def create(
@@ -43,6 +46,7 @@ class MealUpdated(DomainEvent):
         meal_id: UUID,
         user_id: str,
         updated_fields: List[str],
+        meal_timestamps: Sequence[datetime] = (),
     ) -> "MealUpdated":
         """Create new MealUpdated event.
 
@@ -50,6 +54,8 @@ class MealUpdated(DomainEvent):
             meal_id: ID of the updated meal.
             user_id: ID of the user who updated the meal.
             updated_fields: List of field names that were updated (non-empty).
+            meal_timestamps: Meal timestamps whose days changed (old and new
+                timestamp when the meal moved).
 
         Returns:
             New MealUpdated event with generated event_id and current timestamp.
@@ -66,4 +72,5 @@ class MealUpdated(DomainEvent):
             meal_id=meal_id,
             user_id=user_id,
             updated_fields=list(updated_fields),  # Copy to ensure immutability
+            meal_timestamps=tuple(meal_timestamps),
         )
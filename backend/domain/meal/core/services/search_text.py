@@ -0,0 +1,99 @@
+"""Meal search text normalization.
+
+Shared by every IMealSearch implementation so that matching rules are
+identical across backends:
+
+- case and accent insensitive ("Caffè" matches "caffe")
+- apostrophes and punctuation split words ("dell'orto" -> "dell", "orto")
+- every query term must match a meal token, as a prefix ("spag" matches
+  "spaghetti")
+- fields are weighted: dish name > entry names > notes
+"""
+
+import re
+import unicodedata
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from domain.meal.core.entities.meal import Meal
+
+# Tokens shorter than this are ignored (articles, "e", "d'")
+MIN_TOKEN_LENGTH = 2
+
+# Longer tokens are truncated (bounds prefix expansion)
+MAX_TOKEN_LENGTH = 24
+
+# Relevance weight of each searchable field
+DISH_NAME_WEIGHT = 10.0
+ENTRY_NAME_WEIGHT = 5.0
+NOTES_WEIGHT = 2.0
+
+# Score factor of a prefix-only match over an exact token match
+PREFIX_MATCH_FACTOR = 0.5
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase text and strip accents (NFKD, combining marks removed)."""
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Split text into normalized search tokens (order kept, duplicates removed).
+
+    Example:
+        >>> tokenize("Pasta all'Amatriciana, caffè")
+        ['pasta', 'all', 'amatriciana', 'caffe']
+    """
+    if not text:
+        return []
+    tokens: List[str] = []
+    for token in _NON_ALNUM.split(normalize_text(text)):
+        token = token[:MAX_TOKEN_LENGTH]
+        if len(token) >= MIN_TOKEN_LENGTH and token not in tokens:
+            tokens.append(token)
+    return tokens
+
+
+def token_prefixes(tokens: Iterable[str]) -> List[str]:
+    """Expand tokens into all their prefixes (edge n-grams), tokens included.
+
+    Used by backends without native prefix search (MongoDB $text).
+
+    Example:
+        >>> token_prefixes(["riso"])
+        ['ri', 'ris', 'riso']
+    """
+    prefixes: Dict[str, None] = {}
+    for token in tokens:
+        for end in range(MIN_TOKEN_LENGTH, len(token) + 1):
+            prefixes[token[:end]] = None
+    return list(prefixes)
+
+
+def weighted_tokens(fields: Iterable[Tuple[float, Optional[str]]]) -> Dict[str, float]:
+    """Map each token to the highest weight of the fields containing it.
+
+    Args:
+        fields: (weight, text) pairs
+
+    Returns:
+        Mapping token -> weight
+    """
+    weights: Dict[str, float] = {}
+    for weight, text in fields:
+        for token in tokenize(text):
+            if weight > weights.get(token, 0.0):
+                weights[token] = weight
+    return weights
+
+
+def meal_search_fields(meal: Meal) -> List[Tuple[float, Optional[str]]]:
+    """Return the searchable (weight, text) fields of a meal."""
+    fields: List[Tuple[float, Optional[str]]] = [(DISH_NAME_WEIGHT, meal.dish_name)]
+    for entry in meal.entries:
+        fields.append((ENTRY_NAME_WEIGHT, entry.name))
+        fields.append((ENTRY_NAME_WEIGHT, entry.display_name))
+    fields.append((NOTES_WEIGHT, meal.notes))
+    return fields
@@ -2,16 +2,50 @@
 
 This service implements a cascade strategy to find the best available
 nutritional data for a given food item.
+
+Items of a meal are enriched concurrently. Each provider tier has its own
+concurrency bound, so a slow USDA lookup cannot exhaust the quota of the
+(local) category and fallback tiers, and a single meal cannot flood the
+upstream API.
 """
 
+import asyncio
 import logging
-from typing import Optional
+from typing import Dict, Optional
 
 from domain.meal.nutrition.entities.nutrient_profile import NutrientProfile
 from domain.meal.nutrition.ports.nutrition_provider import INutritionProvider
 
 logger = logging.getLogger(__name__)
 
+# Concurrent get_nutrients calls per provider tier
+DEFAULT_PROVIDER_CONCURRENCY = 4
+
+
+class _ProviderLimiter:
+    """
+    Bound concurrent calls to one provider.
+
+    asyncio.Semaphore binds to the event loop of its first contended use;
+    the service is created at import time and may serve several loops
+    (tests, reloads), so one semaphore is kept per running loop.
+    """
+
+    def __init__(self, limit: int):
+        if limit <= 0:
+            raise ValueError(f"Provider concurrency must be positive, got {limit}")
+        self.limit = limit
+        self._semaphores: Dict[asyncio.AbstractEventLoop, asyncio.Semaphore] = {}
+
+    def semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            # Drop semaphores of closed loops
+            self._semaphores = {k: v for k, v in self._semaphores.items() if not k.is_closed()}
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.limit)
+        return semaphore
+
 
 class NutritionEnrichmentService:
     """
@@ -32,6 +66,10 @@ class NutritionEnrichmentService:
         usda_provider: INutritionProvider,
         category_provider: INutritionProvider,
         fallback_provider: INutritionProvider,
+        *,
+        usda_concurrency: int = DEFAULT_PROVIDER_CONCURRENCY,
+        category_concurrency: int = DEFAULT_PROVIDER_CONCURRENCY,
+        fallback_concurrency: int = DEFAULT_PROVIDER_CONCURRENCY,
     ):
         """
         Initialize enrichment service with cascade providers.
@@ -40,10 +78,19 @@ class NutritionEnrichmentService:
             usda_provider: Primary provider (USDA API)
             category_provider: Secondary provider (category averages)
             fallback_provider: Tertiary provider (generic estimates)
+            usda_concurrency: Max concurrent calls to the primary provider
+            category_concurrency: Max concurrent calls to the secondary provider
+            fallback_concurrency: Max concurrent calls to the tertiary provider
+
+        Raises:
+            ValueError: If a concurrency bound is not positive
         """
         self._usda = usda_provider
         self._category = category_provider
         self._fallback = fallback_provider
+        self._usda_limit = _ProviderLimiter(usda_concurrency)
+        self._category_limit = _ProviderLimiter(category_concurrency)
+        self._fallback_limit = _ProviderLimiter(fallback_concurrency)
 
     async def enrich(
         self,
@@ -59,6 +106,10 @@ class NutritionEnrichmentService:
         2. Category (if category provided and available)
         3. Fallback (always succeeds with generic data)
 
+        Provider errors never propagate: a failing tier falls through to
+        the next one, down to a minimal estimate, so one item cannot fail
+        a concurrent batch.
+
         Args:
             label: Food label (e.g., "chicken breast", "banana")
             quantity_g: Quantity in grams
@@ -81,7 +132,8 @@ class NutritionEnrichmentService:
 
         # Strategy 1: Try USDA first (highest quality)
         try:
-            profile = await self._usda.get_nutrients(label, 100.0)
+            async with self._usda_limit.semaphore():
+                profile = await self._usda.get_nutrients(label, 100.0)
             if profile:
                 logger.info(
                     "USDA enrichment success",
@@ -97,7 +149,8 @@ class NutritionEnrichmentService:
         # Strategy 2: Try category profile (medium quality)
         if category:
             try:
-                profile = await self._category.get_nutrients(category, 100.0)
+                async with self._category_limit.semaphore():
+                    profile = await self._category.get_nutrients(category, 100.0)
                 if profile:
                     logger.info(
                         "Category enrichment success",
@@ -115,7 +168,15 @@ class NutritionEnrichmentService:
             "Fallback enrichment",
             extra={"label": label, "reason": "USDA and category unavailable"},
         )
-        profile = await self._fallback.get_nutrients("generic", 100.0)
+        try:
+            async with self._fallback_limit.semaphore():
+                profile = await self._fallback.get_nutrients("generic", 100.0)
+        except Exception as e:
+            logger.error(
+                "Fallback enrichment failed",
+                extra={"label": label, "error": str(e)},
+            )
+            profile = None
 
         # Fallback should always return a profile
         if profile is None:
@@ -140,7 +201,8 @@ class NutritionEnrichmentService:
         """
         Enrich multiple food items in batch.
 
-        Useful for enriching all items in a meal at once.
+        Useful for enriching all items in a meal at once. Items are
+        enriched concurrently, within the per-provider bounds.
 
         Args:
             items: List of (label, quantity_g, category) tuples
@@ -158,11 +220,9 @@ class NutritionEnrichmentService:
             >>> for profile in profiles:
             ...     print(f"{profile.calories} kcal")
         """
-        # Process items sequentially for now
-        # TODO: Could be optimized with asyncio.gather() for parallel requests
-        profiles = []
-        for label, quantity_g, category in items:
-            profile = await self.enrich(label, quantity_g, category)
-            profiles.append(profile)
-
-        return profiles
+        # gather preserves input order
+        return list(
+            await asyncio.gather(
+                *(self.enrich(label, quantity_g, category) for label, quantity_g, category in items)
+            )
+        )
@@ -1,7 +1,7 @@
 """IProfileRepository port - repository interface."""
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Optional, Sequence
 
 from ..entities.nutritional_profile import NutritionalProfile
 from ..value_objects.profile_id import ProfileId
@@ -48,6 +48,30 @@ class IProfileRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def find_by_ids(self, profile_ids: Sequence[ProfileId]) -> List[NutritionalProfile]:
+        """Find several profiles by ID in one round trip.
+
+        Args:
+            profile_ids: Profile identifiers
+
+        Returns:
+            List[NutritionalProfile]: Profiles found, in no particular order
+        """
+        pass
+
+    @abstractmethod
+    async def find_by_user_ids(self, user_ids: Sequence[str]) -> List[NutritionalProfile]:
+        """Find the profiles of several users in one round trip.
+
+        Args:
+            user_ids: User identifiers
+
+        Returns:
+            List[NutritionalProfile]: Profiles found, in no particular order
+        """
+        pass
+
     @abstractmethod
     async def delete(self, profile_id: ProfileId) -> None:
         """Delete profile (soft delete).
@@ -1,11 +1,21 @@
 """Domain ports (interfaces for infrastructure adapters)."""
 
-from domain.shared.ports.meal_repository import IMealRepository
+from domain.shared.ports.meal_repository import (
+    IMealRepository,
+    MealCursor,
+    MealPeriodTotals,
+    MealProjection,
+)
+from domain.shared.ports.meal_search import IMealSearch
 from domain.shared.ports.event_bus import IEventBus
 from domain.shared.ports.idempotency_cache import IIdempotencyCache
 
 __all__ = [
     "IMealRepository",
+    "MealCursor",
+    "MealPeriodTotals",
+    "MealProjection",
+    "IMealSearch",
     "IEventBus",
     "IIdempotencyCache",
 ]
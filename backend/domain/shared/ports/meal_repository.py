@@ -5,13 +5,174 @@ Follows the Dependency Inversion Principle: domain defines the port,
 infrastructure provides the implementation.
 """
 
-from typing import Optional, Protocol, List
-from datetime import datetime
+from dataclasses import dataclass, field, fields
+from typing import Dict, FrozenSet, Optional, Protocol, List, Sequence, Tuple
+from datetime import date, datetime, time, timezone
 from uuid import UUID
 
 from domain.meal.core.entities.meal import Meal
 
 
+@dataclass
+class MealPeriodTotals:
+    """
+    Nutrition totals of the meals falling into one period.
+
+    Returned by IMealRepository.aggregate_by_period so that summaries can be
+    computed without hydrating full Meal aggregates.
+
+    Attributes:
+        total_calories: Sum of meal calories
+        total_protein: Sum of protein (g)
+        total_carbs: Sum of carbohydrates (g)
+        total_fat: Sum of fat (g)
+        total_fiber: Sum of fiber (g)
+        total_sugar: Sum of sugar (g)
+        total_sodium: Sum of sodium (mg)
+        meal_count: Number of meals in period
+        breakdown_by_type: Calories by meal type (only types present)
+    """
+
+    total_calories: float = 0.0
+    total_protein: float = 0.0
+    total_carbs: float = 0.0
+    total_fat: float = 0.0
+    total_fiber: float = 0.0
+    total_sugar: float = 0.0
+    total_sodium: float = 0.0
+    meal_count: int = 0
+    breakdown_by_type: Dict[str, float] = field(default_factory=dict)
+
+    @classmethod
+    def from_meal(cls, meal: Meal, sign: int = 1) -> "MealPeriodTotals":
+        """Totals of a single meal (sign=-1 gives the totals to subtract)."""
+        return cls(
+            total_calories=sign * meal.total_calories,
+            total_protein=sign * meal.total_protein,
+            total_carbs=sign * meal.total_carbs,
+            total_fat=sign * meal.total_fat,
+            total_fiber=sign * meal.total_fiber,
+            total_sugar=sign * meal.total_sugar,
+            total_sodium=sign * meal.total_sodium,
+            meal_count=sign,
+            breakdown_by_type={meal.meal_type: float(sign * meal.total_calories)},
+        )
+
+    def add(self, other: "MealPeriodTotals") -> None:
+        """Accumulate the totals of another period into this one."""
+        self.total_calories += other.total_calories
+        self.total_protein += other.total_protein
+        self.total_carbs += other.total_carbs
+        self.total_fat += other.total_fat
+        self.total_fiber += other.total_fiber
+        self.total_sugar += other.total_sugar
+        self.total_sodium += other.total_sodium
+        self.meal_count += other.meal_count
+        for meal_type, calories in other.breakdown_by_type.items():
+            self.breakdown_by_type[meal_type] = (
+                self.breakdown_by_type.get(meal_type, 0.0) + calories
+            )
+
+
+def rollup_day(timestamp: datetime) -> date:
+    """
+    Return the day a meal is rolled up into (UTC calendar day).
+
+    Args:
+        timestamp: Meal timestamp (naive timestamps are taken as UTC)
+    """
+    if timestamp.tzinfo is None:
+        return timestamp.date()
+    return timestamp.astimezone(timezone.utc).date()
+
+
+def whole_utc_days(start: datetime, end: datetime) -> Optional[Tuple[date, date]]:
+    """
+    Return the UTC days exactly covered by a [start, end] range.
+
+    Daily rollups can only answer ranges made of whole UTC days, i.e.
+    starting at 00:00 UTC and ending at 23:59:59 UTC.
+
+    Args:
+        start: Range start (inclusive, timezone-aware)
+        end: Range end (inclusive, timezone-aware)
+
+    Returns:
+        (first day, last day), or None if the range is not day-aligned
+    """
+    if start.tzinfo is None or end.tzinfo is None:
+        return None
+    start_utc = start.astimezone(timezone.utc)
+    end_utc = end.astimezone(timezone.utc)
+    if start_utc.time() != time.min or end_utc.time() < time(23, 59, 59):
+        return None
+    if end_utc.date() < start_utc.date():
+        return None
+    return start_utc.date(), end_utc.date()
+
+
+# Meal attributes always loaded: required to build a valid Meal entity
+MEAL_REQUIRED_FIELDS: FrozenSet[str] = frozenset(
+    {"id", "user_id", "timestamp", "meal_type", "created_at", "updated_at"}
+)
+
+
+@dataclass(frozen=True)
+class MealProjection:
+    """
+    Subset of Meal attributes to load on read.
+
+    Lets read paths (e.g. GraphQL lists selecting only id, timestamp and
+    totalCalories) skip the embedded entries and other unused fields.
+    Attributes not loaded keep their dataclass defaults (entries: []),
+    so partially hydrated meals are read models: never save them.
+
+    Attributes:
+        fields: Meal attribute names to load (required ones are implied)
+    """
+
+    fields: FrozenSet[str]
+
+    def __post_init__(self) -> None:
+        """Validate attribute names."""
+        unknown = self.fields - {f.name for f in fields(Meal)}
+        if unknown:
+            raise ValueError(f"Unknown Meal fields in projection: {sorted(unknown)}")
+
+    @property
+    def loaded_fields(self) -> FrozenSet[str]:
+        """Requested fields plus the required ones."""
+        return self.fields | MEAL_REQUIRED_FIELDS
+
+    @property
+    def includes_entries(self) -> bool:
+        """True if meal entries are loaded."""
+        return "entries" in self.fields
+
+
+@dataclass(frozen=True)
+class MealCursor:
+    """
+    Keyset position in a user's meal history.
+
+    History pages are ordered by (timestamp, id) descending; a cursor
+    points at the last meal of a page and the next page starts strictly
+    after it, so pagination never skips over documents.
+
+    Attributes:
+        timestamp: Timestamp of the last meal returned
+        meal_id: ID of the last meal returned (tie-breaker)
+    """
+
+    timestamp: datetime
+    meal_id: UUID
+
+    @classmethod
+    def from_meal(cls, meal: Meal) -> "MealCursor":
+        """Build cursor pointing at a meal."""
+        return cls(timestamp=meal.timestamp, meal_id=meal.id)
+
+
 class IMealRepository(Protocol):
     """
     Interface for meal persistence operations.
@@ -59,13 +220,16 @@ class IMealRepository(Protocol):
         """
         ...
 
-    async def get_by_id(self, meal_id: UUID, user_id: str) -> Optional[Meal]:
+    async def get_by_id(
+        self, meal_id: UUID, user_id: str, projection: Optional[MealProjection] = None
+    ) -> Optional[Meal]:
         """
         Retrieve meal by ID for a specific user.
 
         Args:
             meal_id: Unique meal identifier
             user_id: User identifier (for authorization)
+            projection: Fields to load (default: full meal)
 
         Returns:
             Meal if found and belongs to user, None otherwise
@@ -80,11 +244,36 @@ class IMealRepository(Protocol):
         """
         ...
 
+    async def get_by_ids(
+        self,
+        meal_ids: Sequence[UUID],
+        user_id: str,
+        projection: Optional[MealProjection] = None,
+    ) -> List[Meal]:
+        """
+        Retrieve several meals of a user in one round trip.
+
+        Args:
+            meal_ids: Meal identifiers (duplicates allowed)
+            user_id: User identifier (for authorization)
+            projection: Fields to load (default: full meal)
+
+        Returns:
+            Meals found and belonging to user, in no particular order
+            (missing or foreign ids are simply absent)
+
+        Example:
+            >>> meals = await repository.get_by_ids([id1, id2], "user123")
+            >>> by_id = {meal.id: meal for meal in meals}
+        """
+        ...
+
     async def get_by_user(
         self,
         user_id: str,
         limit: int = 100,
         offset: int = 0,
+        projection: Optional[MealProjection] = None,
     ) -> List[Meal]:
         """
         Get meals for a user with pagination.
@@ -93,6 +282,7 @@ class IMealRepository(Protocol):
             user_id: User identifier
             limit: Maximum number of meals to return (default: 100)
             offset: Number of meals to skip (default: 0)
+            projection: Fields to load (default: full meals)
 
         Returns:
             List of meals ordered by timestamp descending (newest first)
@@ -136,6 +326,126 @@ class IMealRepository(Protocol):
         """
         ...
 
+    async def get_history_page(
+        self,
+        user_id: str,
+        limit: int,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        meal_type: Optional[str] = None,
+        after: Optional[MealCursor] = None,
+        offset: int = 0,
+        projection: Optional[MealProjection] = None,
+    ) -> List[Meal]:
+        """
+        Get one page of meal history with all filters applied in the query.
+
+        Args:
+            user_id: User identifier
+            limit: Maximum number of meals to return
+            start_date: Start of date range (inclusive, optional)
+            end_date: End of date range (inclusive, optional)
+            meal_type: Only meals of this type (optional)
+            after: Keyset cursor, return meals strictly after it (optional)
+            offset: Number of meals to skip (after the cursor, if any)
+            projection: Fields to load (default: full meals)
+
+        Returns:
+            List of meals ordered by (timestamp, id) descending
+
+        Example:
+            >>> page = await repository.get_history_page("user123", limit=21)
+            >>> has_more = len(page) > 20
+            >>> next_page = await repository.get_history_page(
+            ...     "user123", limit=21, after=MealCursor.from_meal(page[19])
+            ... )
+        """
+        ...
+
+    async def count_history(
+        self,
+        user_id: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        meal_type: Optional[str] = None,
+    ) -> int:
+        """
+        Count meals matching history filters without loading them.
+
+        Args:
+            user_id: User identifier
+            start_date: Start of date range (inclusive, optional)
+            end_date: End of date range (inclusive, optional)
+            meal_type: Only meals of this type (optional)
+
+        Returns:
+            Number of matching meals
+
+        Example:
+            >>> lunches = await repository.count_history("user123", meal_type="LUNCH")
+        """
+        ...
+
+    async def aggregate_by_period(
+        self,
+        user_id: str,
+        periods: List[Tuple[datetime, datetime]],
+    ) -> Dict[int, MealPeriodTotals]:
+        """
+        Aggregate meal totals for consecutive periods in a single pass.
+
+        Periods must be sorted and contiguous: period i covers
+        [start_i, start_{i+1}) and the last one covers [start_n, end_n].
+
+        Args:
+            user_id: User identifier
+            periods: List of (period_start, period_end) tuples
+
+        Returns:
+            Mapping period index -> totals. Periods without meals are
+            omitted (callers zero-fill them).
+
+        Example:
+            >>> totals = await repository.aggregate_by_period(
+            ...     user_id="user123",
+            ...     periods=[(monday, monday_end), (tuesday, tuesday_end)],
+            ... )
+            >>> totals.get(0, MealPeriodTotals()).meal_count
+            3
+        """
+        ...
+
+    async def get_daily_totals(
+        self,
+        user_id: str,
+        start_day: date,
+        end_day: date,
+    ) -> Optional[Dict[date, MealPeriodTotals]]:
+        """
+        Read materialized per-day totals (daily nutrition rollups).
+
+        Rollups are maintained incrementally on save and delete, keyed by
+        (user_id, UTC day, see rollup_day), so summaries read one small
+        record per day instead of every meal.
+
+        Args:
+            user_id: User identifier
+            start_day: First UTC day (inclusive)
+            end_day: Last UTC day (inclusive)
+
+        Returns:
+            Mapping day -> totals (only days with meals), or None if
+            rollups cannot be read (callers fall back to aggregating meals)
+
+        Example:
+            >>> totals = await repository.get_daily_totals(
+            ...     "user123", start_day=date(2025, 11, 1), end_day=date(2025, 11, 7)
+            ... )
+            >>> totals[date(2025, 11, 3)].meal_count
+            3
+        """
+        ...
+
     async def delete(self, meal_id: UUID, user_id: str) -> bool:
         """
         Delete a meal (soft delete recommended in implementation).
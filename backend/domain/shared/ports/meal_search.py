@@ -0,0 +1,52 @@
+"""Meal search port (interface).
+
+Full-text search over a user's meals, implemented by the meal
+repositories so that the search index is maintained on save and delete.
+Matching rules live in domain.meal.core.services.search_text.
+"""
+
+from typing import List, Optional, Protocol
+
+from domain.meal.core.entities.meal import Meal
+from domain.shared.ports.meal_repository import MealProjection
+
+
+class IMealSearch(Protocol):
+    """
+    Interface for full-text meal search.
+
+    Searches dish name, entry names/display names and notes. Matching is
+    case and accent insensitive, every query term must match (as a word
+    prefix), and results are ordered by relevance then timestamp desc.
+
+    Implementations:
+    - InMemoryMealRepository: per-user inverted index
+    - MongoMealRepository: MongoDB text index
+    """
+
+    async def search(
+        self,
+        user_id: str,
+        query_text: str,
+        limit: int = 50,
+        offset: int = 0,
+        projection: Optional[MealProjection] = None,
+    ) -> List[Meal]:
+        """
+        Search meals of a user.
+
+        Args:
+            user_id: User identifier
+            query_text: Free text (e.g. "spag carbonara")
+            limit: Maximum number of meals to return
+            offset: Number of ranked meals to skip
+            projection: Fields to load (default: full meals)
+
+        Returns:
+            Matching meals, most relevant first (newest first on ties).
+            Empty if the query has no searchable term.
+
+        Example:
+            >>> meals = await search.search("user123", "caffe")  # matches "Caffè"
+        """
+        ...
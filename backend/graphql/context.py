@@ -14,6 +14,8 @@ from strawberry.fastapi import BaseContext
 from domain.shared.ports.meal_repository import IMealRepository
 from domain.shared.ports.event_bus import IEventBus
 from domain.shared.ports.idempotency_cache import IIdempotencyCache
+from application.meal.queries.daily_summary_cache import DailySummaryCache
+from graphql.loaders import GraphQLLoaders
 from domain.nutritional_profile.core.ports.repository import (
     IProfileRepository,
 )
@@ -52,6 +54,8 @@ class GraphQLContext(BaseContext):
         recognition_service: Vision provider (OpenAI GPT-4V)
         enrichment_service: Nutrition enrichment service (wraps USDA)
         barcode_service: Barcode lookup service
+        daily_summary_cache: Read-through cache of daily summaries (optional)
+        loaders: Request-scoped DataLoaders batching meal/profile lookups
     """
 
     def __init__(
@@ -67,6 +71,7 @@ class GraphQLContext(BaseContext):
         enrichment_service: NutritionEnrichmentService,
         barcode_service: BarcodeService,
         meal_orchestrator: "MealAnalysisOrchestrator | None" = None,
+        daily_summary_cache: "DailySummaryCache | None" = None,
     ):
         """Initialize GraphQL context with all dependencies."""
         super().__init__()
@@ -81,6 +86,9 @@ class GraphQLContext(BaseContext):
         self.recognition_service = recognition_service
         self.enrichment_service = enrichment_service
         self.barcode_service = barcode_service
+        self.daily_summary_cache = daily_summary_cache
+        # One context per request: loader memoization is request-scoped
+        self.loaders = GraphQLLoaders(meal_repository, profile_repository)
 
     def get(self, key: str) -> Any:
         """Get dependency by name (for resolver compatibility).
@@ -110,6 +118,7 @@ def create_context(
     enrichment_service: NutritionEnrichmentService,
     barcode_service: BarcodeService,
     meal_orchestrator: "MealAnalysisOrchestrator | None" = None,
+    daily_summary_cache: "DailySummaryCache | None" = None,
 ) -> GraphQLContext:
     """Create GraphQL context with all dependencies.
 
@@ -125,6 +134,7 @@ def create_context(
         enrichment_service: Nutrition enrichment service (domain service)
         barcode_service: Barcode service implementation
         meal_orchestrator: Meal analysis orchestrator (supports photo/text)
+        daily_summary_cache: Read-through cache of daily summaries (optional)
 
     Returns:
         GraphQLContext with all dependencies
@@ -155,5 +165,6 @@ def create_context(
         recognition_service=recognition_service,
         enrichment_service=enrichment_service,
         barcode_service=barcode_service,
+        daily_summary_cache=daily_summary_cache,
     )
     return ctx
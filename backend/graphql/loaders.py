@@ -0,0 +1,132 @@
+"""Request-scoped DataLoaders for GraphQL resolvers.
+
+Lookups issued by sibling fields in the same event loop tick (aliased
+``meal`` fields, ``nutritionalProfile`` + ``progressScore`` +
+``forecastWeight``) are coalesced into one batched ``$in`` repository
+query, and results are memoized for the rest of the request.
+
+A new GraphQLLoaders is built with every GraphQLContext, so memoized
+entities never outlive the request that loaded them.
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from strawberry.dataloader import DataLoader
+
+from domain.meal.core.entities.meal import Meal
+from domain.nutritional_profile.core.ports.repository import IProfileRepository
+from domain.nutritional_profile.core.value_objects.profile_id import ProfileId
+from domain.shared.ports.meal_repository import IMealRepository, MealProjection
+
+if TYPE_CHECKING:
+    from domain.nutritional_profile.core.entities.nutritional_profile import (
+        NutritionalProfile,
+    )
+
+
+@dataclass(frozen=True)
+class MealKey:
+    """Meal lookup key: meals are read per user, with a field projection."""
+
+    meal_id: UUID
+    user_id: str
+    projection: Optional[MealProjection] = None
+
+
+class GraphQLLoaders:
+    """
+    DataLoaders for meal and profile lookups of one GraphQL request.
+
+    Example:
+        >>> loaders = GraphQLLoaders(meal_repository, profile_repository)
+        >>> meal, other = await asyncio.gather(
+        ...     loaders.load_meal(meal_id, "user123"),
+        ...     loaders.load_meal(other_id, "user123"),
+        ... )  # one get_by_ids round trip
+    """
+
+    def __init__(
+        self,
+        meal_repository: Optional[IMealRepository],
+        profile_repository: Optional[IProfileRepository],
+    ) -> None:
+        """
+        Initialize loaders.
+
+        Args:
+            meal_repository: Meal repository port
+            profile_repository: Profile repository port
+        """
+        self._meal_repository = meal_repository
+        self._profile_repository = profile_repository
+        self.meals: DataLoader[MealKey, Optional[Meal]] = DataLoader(load_fn=self._batch_meals)
+        self.profiles_by_id: DataLoader[str, Optional["NutritionalProfile"]] = DataLoader(
+            load_fn=self._batch_profiles_by_id
+        )
+        self.profiles_by_user: DataLoader[str, Optional["NutritionalProfile"]] = DataLoader(
+            load_fn=self._batch_profiles_by_user
+        )
+
+    async def load_meal(
+        self, meal_id: UUID, user_id: str, projection: Optional[MealProjection] = None
+    ) -> Optional[Meal]:
+        """Load a meal of a user (None if missing or not owned by user)."""
+        return await self.meals.load(MealKey(meal_id, user_id, projection))
+
+    async def load_profile(self, profile_id: ProfileId) -> Optional["NutritionalProfile"]:
+        """Load a profile by ID."""
+        return await self.profiles_by_id.load(str(profile_id))
+
+    async def load_profile_for_user(self, user_id: str) -> Optional["NutritionalProfile"]:
+        """Load the profile of a user."""
+        return await self.profiles_by_user.load(user_id)
+
+    async def _batch_meals(self, keys: List[MealKey]) -> List[Optional[Meal]]:
+        """Fetch meals with one get_by_ids per (user, projection) group."""
+        if self._meal_repository is None:
+            raise ValueError("MealRepository not available in context")
+
+        groups: Dict[Tuple[str, Optional[MealProjection]], List[UUID]] = defaultdict(list)
+        for key in keys:
+            groups[(key.user_id, key.projection)].append(key.meal_id)
+
+        found: Dict[MealKey, Meal] = {}
+        for (user_id, projection), meal_ids in groups.items():
+            meals = await self._meal_repository.get_by_ids(meal_ids, user_id, projection)
+            for meal in meals:
+                found[MealKey(meal.id, user_id, projection)] = meal
+
+        return [found.get(key) for key in keys]
+
+    async def _batch_profiles_by_id(
+        self, profile_ids: List[str]
+    ) -> Sequence[Optional["NutritionalProfile"]]:
+        """Fetch profiles by ID with one find_by_ids."""
+        profiles = await self._profile_repo().find_by_ids(
+            [ProfileId.from_string(profile_id) for profile_id in profile_ids]
+        )
+        found = {str(profile.profile_id): profile for profile in profiles}
+        for profile in profiles:
+            self.profiles_by_user.prime(profile.user_id, profile)
+        return [found.get(profile_id) for profile_id in profile_ids]
+
+    async def _batch_profiles_by_user(
+        self, user_ids: List[str]
+    ) -> Sequence[Optional["NutritionalProfile"]]:
+        """Fetch the profiles of several users with one find_by_user_ids."""
+        profiles = await self._profile_repo().find_by_user_ids(user_ids)
+        found: Dict[str, "NutritionalProfile"] = {}
+        for profile in profiles:
+            # Same profile find_by_user_id would return: the first one
+            found.setdefault(profile.user_id, profile)
+        for profile in found.values():
+            self.profiles_by_id.prime(str(profile.profile_id), profile)
+        return [found.get(user_id) for user_id in user_ids]
+
+    def _profile_repo(self) -> IProfileRepository:
+        if self._profile_repository is None:
+            raise Exception("Missing profile_repository in GraphQL context")
+        return self._profile_repository
@@ -4,9 +4,7 @@ Groups activity-related mutations:
 - syncActivityEvents: Sync batch activity events (was ingestActivityEvents)
 """
 
-from typing import List, Optional, Any
-import json as _json
-import hashlib as _hashlib
+from typing import List, Optional, Any, Tuple
 import strawberry
 from strawberry.types import Info
 from graphql import GraphQLError
@@ -15,39 +13,33 @@ from graphql.types_activity_health import (
     ActivityMinuteInput,
     IngestActivityResult,
     RejectedActivityEvent,
-    ActivitySource as GraphQLActivitySource,
 )
-from repository.activities import (
-    activity_repo,
-    ActivitySource as RepoActivitySource,
-    ActivityEventRecord,
+from domain.activity.model import (
+    ActivityEvent,
+    ActivitySource,
+    IDEMPOTENCY_CONFLICT,
+    batch_signature,
+    validate_activity_event,
+)
+from infrastructure.persistence.activity_repository_factory import (
+    create_activity_repository,
 )
 
 DEFAULT_USER_ID = "default"
 
 
-def _normalize_activity_event(e: ActivityMinuteInput, user_id: str) -> ActivityEventRecord:
-    """Convert GraphQL input to repository format."""
-    return ActivityEventRecord(
+def _to_domain_event(e: ActivityMinuteInput, user_id: str) -> ActivityEvent:
+    """Convert GraphQL input to domain format."""
+    return ActivityEvent(
         user_id=user_id,
         ts=e.ts,
         steps=e.steps or 0,
         calories_out=e.calories_out,
         hr_avg=e.hr_avg,
-        source=_map_source_to_repo(e.source),
+        source=ActivitySource(e.source.value),
     )
 
 
-def _map_source_to_repo(source: GraphQLActivitySource) -> RepoActivitySource:
-    """Map GraphQL ActivitySource to repository ActivitySource."""
-    mapping = {
-        GraphQLActivitySource.APPLE_HEALTH: RepoActivitySource.APPLE_HEALTH,
-        GraphQLActivitySource.GOOGLE_FIT: RepoActivitySource.GOOGLE_FIT,
-        GraphQLActivitySource.MANUAL: RepoActivitySource.MANUAL,
-    }
-    return mapping[source]
-
-
 @strawberry.type
 class ActivityMutations:
     """Activity domain mutations."""
@@ -55,7 +47,7 @@ class ActivityMutations:
     @strawberry.mutation(  # type: ignore[misc]
         description="Sync batch minute activity events (idempotent)"
     )
-    def sync_activity_events(
+    async def sync_activity_events(
         self,
         info: Info[Any, Any],  # noqa: ARG002
         input: List[ActivityMinuteInput],
@@ -93,78 +85,35 @@ class ActivityMutations:
             }
         """
         uid = user_id or DEFAULT_USER_ID
-        sig: Optional[str] = None
+        events = [_to_domain_event(e, uid) for e in input]
 
         # Auto-generate idempotency key if not provided
         if not idempotency_key:
-            # Generate deterministic key based on payload (excluding timestamps)
-            sig_payload = {
-                "userId": uid,
-                "input": [
-                    {
-                        "steps": e.steps,
-                        "caloriesOut": e.calories_out,
-                        "hrAvg": e.hr_avg,
-                        "source": e.source.value,
-                    }
-                    for e in input
-                ],
-            }
-            canonical = _json.dumps(sig_payload, sort_keys=True)
-            sig = _hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
-            idempotency_key = f"auto-{sig}"
-
-        # Idempotency check
-        if idempotency_key:
-            # Calculate signature of input payload (exclude timestamp)
-            if sig is None:
-                sig_payload = {
-                    "userId": uid,
-                    "input": [
-                        {
-                            "steps": e.steps,
-                            "caloriesOut": e.calories_out,
-                            "hrAvg": e.hr_avg,
-                            "source": e.source.value,
-                        }
-                        for e in input
-                    ],
-                }
-                canonical = _json.dumps(sig_payload, sort_keys=True)
-                sig = _hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
-
-            # Check if we have cached result for this key
-            cached_sig = activity_repo.get_idempotency(idempotency_key)
-            if cached_sig is not None:
-                # Key exists - check if payload matches
-                if cached_sig != sig:
-                    raise GraphQLError(
-                        f"IdempotencyConflict: key '{idempotency_key}' "
-                        f"used with different payload"
-                    )
-                # Same key, same payload → return cached result
-                # For simplicity, we return the same result structure
-                # In production, you'd cache the actual result
-                return IngestActivityResult(
-                    accepted=len(input),
-                    duplicates=0,
-                    rejected=[],
-                    idempotency_key_used=idempotency_key,
-                )
-
-        # Normalize events
-        norm_events = [_normalize_activity_event(e, uid) for e in input]
-
-        # Ingest batch
-        (
-            accepted,
-            duplicates,
-            rejected,
-        ) = activity_repo.ingest_batch(norm_events)
-
-        # Cache success result if idempotency_key provided
-        if idempotency_key and sig is not None and not rejected:
-            activity_repo.store_idempotency(idempotency_key, sig, ttl_seconds=3600 * 24)
+            # Deterministic key based on the normalized payload
+            idempotency_key = f"auto-{batch_signature(events)[:16]}"
+
+        rejected: List[Tuple[int, str]] = []
+        valid: List[ActivityEvent] = []
+        valid_indexes: List[int] = []
+        for index, event in enumerate(events):
+            result = validate_activity_event(event)
+            if isinstance(result, str):
+                rejected.append((index, result))
+            else:
+                valid.append(result)
+                valid_indexes.append(index)
+
+        # The key is bound to the whole payload: only a fully valid batch
+        # is replayable
+        accepted, duplicates, repo_rejected = await create_activity_repository().ingest_events(
+            valid, idempotency_key if not rejected else None
+        )
+        if any(reason == IDEMPOTENCY_CONFLICT for _, reason in repo_rejected):
+            raise GraphQLError(
+                f"IdempotencyConflict: key '{idempotency_key}' used with different payload"
+            )
+        rejected.extend((valid_indexes[i], reason) for i, reason in repo_rejected)
+        rejected.sort()
 
         return IngestActivityResult(
             accepted=accepted,
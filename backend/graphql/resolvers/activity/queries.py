@@ -18,7 +18,7 @@ from graphql.types_activity_health import (
     ActivityRangeResult,
     GroupByPeriod,
 )
-from repository.activities import activity_repo
+from repository.activities import ActivitySource as _RepoActivitySource
 from repository.health_totals import health_totals_repo
 from domain.activity.application.get_aggregate_range import (
     GetAggregateRangeQuery,
@@ -26,6 +26,9 @@ from domain.activity.application.get_aggregate_range import (
     GroupByPeriod as QueryGroupByPeriod,
 )
 from graphql.utils.datetime_helpers import parse_datetime_to_naive_utc
+from infrastructure.persistence.activity_repository_factory import (
+    create_activity_repository,
+)
 
 DEFAULT_USER_ID = "default"
 
@@ -35,7 +38,7 @@ class ActivityQueries:
     """Activity data queries."""
 
     @strawberry.field(description="Lista eventi attività con paginazione")  # type: ignore[misc]
-    def entries(
+    async def entries(
         self,
         info: Info[Any, Any],  # noqa: ARG002
         limit: int = 100,
@@ -68,13 +71,23 @@ class ActivityQueries:
         if limit > 500:
             limit = 500
         uid = user_id or DEFAULT_USER_ID
-        events = activity_repo.list(
+        events = await create_activity_repository().list_events(
             uid,
             start_ts=after,
             end_ts=before,
             limit=limit,
         )
-        return [ActivityEvent(**dataclasses.asdict(e)) for e in events]
+        return [
+            ActivityEvent(
+                user_id=e.user_id,
+                ts=e.ts,
+                steps=e.steps,
+                calories_out=e.calories_out,
+                hr_avg=e.hr_avg,
+                source=_RepoActivitySource(e.source.value),
+            )
+            for e in events
+        ]
 
     @strawberry.field(description="Lista delta sync health totals per giorno")  # type: ignore[misc]
     def sync_entries(
@@ -118,7 +131,7 @@ class ActivityQueries:
     @strawberry.field(  # type: ignore[misc]
         description="Aggrega attività per range con raggruppamento"
     )
-    def aggregate_range(
+    async def aggregate_range(
         self,
         info: Info[Any, Any],  # noqa: ARG002
         user_id: str,
@@ -190,8 +203,8 @@ class ActivityQueries:
             group_by=query_group_by,
         )
 
-        handler = GetAggregateRangeQueryHandler()
-        results = handler.handle(query)
+        handler = GetAggregateRangeQueryHandler(create_activity_repository())
+        results = await handler.handle(query)
 
         # Convert to GraphQL types - construct manually
         graphql_results: List[ActivityPeriodSummary] = []
@@ -214,12 +227,12 @@ class ActivityQueries:
         total_minutes = sum(r.total_active_minutes for r in results)
         total_events = sum(r.event_count for r in results)
 
-        # Average heart rate (weighted by event count)
+        # Average heart rate (weighted by heart rate samples)
         hr_sum = sum(
-            r.avg_heart_rate * r.event_count for r in results if r.avg_heart_rate is not None
+            r.avg_heart_rate * r.heart_rate_samples for r in results if r.avg_heart_rate is not None
         )
-        hr_events = sum(r.event_count for r in results if r.avg_heart_rate is not None)
-        avg_hr = hr_sum / hr_events if hr_events > 0 else None
+        hr_samples = sum(r.heart_rate_samples for r in results)
+        avg_hr = hr_sum / hr_samples if hr_samples > 0 else None
 
         total_summary = object.__new__(ActivityPeriodSummary)
         total_summary.period = "TOTAL"
@@ -58,7 +58,9 @@ async def resolve_daily_summary(
     query = GetDailySummaryQuery(user_id=user_id, date=date)
 
     # Execute via handler
-    handler = GetDailySummaryQueryHandler(repository=repository)
+    handler = GetDailySummaryQueryHandler(
+        repository=repository, cache=context.get("daily_summary_cache")
+    )
     summary = await handler.handle(query)
 
     # Map domain entity → GraphQL type
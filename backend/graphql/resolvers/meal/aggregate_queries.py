@@ -6,12 +6,17 @@ These resolvers operate on meal data using CQRS query handlers:
 - search: Full-text search in meals
 - dailySummary: Daily nutrition summary
 - summaryRange: Nutrition summaries for date ranges with grouping
+
+With the MongoDB repository, mealHistory and search are read-only lists:
+stored documents map straight to GraphQL types, no Meal aggregate is built.
 """
 
-from typing import Optional, Any
+from typing import Optional, Any, Dict, List, Set
 from datetime import datetime
 from uuid import UUID
+import base64
 import json
+import re
 import strawberry
 
 from application.meal.queries.get_meal import (
@@ -35,6 +40,9 @@ from application.meal.queries.get_summary_range import (
     GetSummaryRangeQueryHandler,
     GroupByPeriod as QueryGroupByPeriod,
 )
+from domain.shared.ports.meal_repository import MealCursor, MealProjection
+from graphql.utils.selection import is_field_selected, selected_field_names
+from infrastructure.persistence.mongodb.meal_repository import MongoMealRepository
 from graphql.types_meal_aggregate import (
     MealType,
     GroupByPeriod,
@@ -47,6 +55,8 @@ from graphql.types_meal_aggregate import (
     RangeSummaryResult,
 )
 
+_MEAL_TYPES = {meal_type.value: meal_type for meal_type in MealType}
+
 
 def map_meal_to_graphql(meal: Any) -> Meal:
     """Map domain Meal entity to GraphQL Meal type."""
@@ -71,13 +81,7 @@ def map_meal_to_graphql(meal: Any) -> Meal:
     ]
 
     # Map meal type enum
-    meal_type_map = {
-        "BREAKFAST": MealType.BREAKFAST,
-        "LUNCH": MealType.LUNCH,
-        "DINNER": MealType.DINNER,
-        "SNACK": MealType.SNACK,
-    }
-    meal_type = meal_type_map.get(meal.meal_type, MealType.LUNCH)
+    meal_type = _MEAL_TYPES.get(meal.meal_type, MealType.LUNCH)
 
     return Meal(
         id=str(meal.id),
@@ -107,6 +111,149 @@ def map_meal_to_graphql(meal: Any) -> Meal:
     )
 
 
+def map_meal_document_to_graphql(doc: Dict[str, Any]) -> Meal:
+    """Map a (possibly projected) MongoDB meal document to GraphQL Meal type.
+
+    Read-only path: produces the same Meal as
+    map_meal_to_graphql(MongoMealRepository().from_document(doc)) without
+    building the domain aggregate, so no UUID parsing, no entry dates and
+    no invariant checks. Only the meal dates (always projected) are decoded.
+    """
+    entries = [
+        MealEntry(
+            id=entry["id"],
+            name=entry["name"],
+            display_name=entry["display_name"],
+            quantity_g=entry["quantity_g"],
+            calories=entry["calories"],
+            protein=entry["protein"],
+            carbs=entry["carbs"],
+            fat=entry["fat"],
+            fiber=entry.get("fiber"),
+            sugar=entry.get("sugar"),
+            sodium=entry.get("sodium"),
+            confidence=entry.get("confidence", 1.0),
+            barcode=entry.get("barcode"),
+        )
+        for entry in doc.get("entries", [])
+    ]
+
+    to_datetime = MongoMealRepository.bson_to_datetime
+    return Meal(
+        id=doc["_id"],
+        user_id=doc["user_id"],
+        timestamp=to_datetime(doc["timestamp"], doc.get("timestamp_offset")),
+        meal_type=_MEAL_TYPES.get(doc["meal_type"], MealType.LUNCH),
+        # Recognition metadata
+        dish_name=doc.get("dish_name", "Meal"),
+        image_url=doc.get("image_url"),
+        source=doc.get("source", "manual"),
+        confidence=doc.get("confidence", 1.0),
+        # Content
+        entries=entries,
+        notes=doc.get("notes"),
+        analysis_id=doc.get("analysis_id"),
+        # Totals
+        total_calories=doc.get("total_calories", 0),
+        total_protein=doc.get("total_protein", 0.0),
+        total_carbs=doc.get("total_carbs", 0.0),
+        total_fat=doc.get("total_fat", 0.0),
+        total_fiber=doc.get("total_fiber", 0.0),
+        total_sugar=doc.get("total_sugar", 0.0),
+        total_sodium=doc.get("total_sodium", 0.0),
+        # Timestamps
+        created_at=to_datetime(doc["created_at"]),
+        updated_at=to_datetime(doc["updated_at"]),
+    )
+
+
+# GraphQL Meal fields computed from domain fields
+_COMPUTED_MEAL_FIELDS = {"entryCount": "entries", "averageConfidence": "entries"}
+
+_CAMEL_BOUNDARY = re.compile(r"(?<!^)(?=[A-Z])")
+
+
+def meal_projection_from_selection(names: Set[str]) -> Optional[MealProjection]:
+    """Build the repository projection for the selected GraphQL Meal fields.
+
+    Args:
+        names: camelCase field names selected on Meal
+
+    Returns:
+        MealProjection, or None (full load) if nothing or an unknown field
+        is selected
+    """
+    fields = set()
+    for name in names - {"__typename"}:
+        fields.add(_COMPUTED_MEAL_FIELDS.get(name) or _CAMEL_BOUNDARY.sub("_", name).lower())
+    if not fields:
+        return None
+    try:
+        return MealProjection(fields=frozenset(fields))
+    except ValueError:
+        return None
+
+
+def encode_meal_cursor(cursor: MealCursor) -> str:
+    """Encode a meal history cursor as an opaque GraphQL string."""
+    payload = json.dumps({"ts": cursor.timestamp.isoformat(), "id": str(cursor.meal_id)})
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_meal_cursor(value: str) -> MealCursor:
+    """Decode an opaque cursor returned by mealHistory.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(value.encode()))
+        return MealCursor(
+            timestamp=datetime.fromisoformat(payload["ts"]),
+            meal_id=UUID(payload["id"]),
+        )
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError(f"Invalid mealHistory cursor: {value}") from e
+
+
+async def _meal_history_from_documents(
+    repository: MongoMealRepository, query: GetMealHistoryQuery
+) -> MealHistoryResult:
+    """Serve a mealHistory page from raw documents (same paging as the handler)."""
+    docs = await repository.get_history_page_documents(
+        user_id=query.user_id,
+        limit=query.limit + 1,
+        start_date=query.start_date,
+        end_date=query.end_date,
+        meal_type=query.meal_type,
+        after=query.after,
+        offset=query.offset,
+        projection=query.projection,
+    )
+    meals = [map_meal_document_to_graphql(doc) for doc in docs[: query.limit]]
+    has_more = len(docs) > query.limit
+
+    next_cursor = None
+    if has_more and meals:
+        last = meals[-1]
+        next_cursor = encode_meal_cursor(
+            MealCursor(timestamp=last.timestamp, meal_id=UUID(last.id))
+        )
+
+    total_count = 0
+    if query.include_total:
+        total_count = await repository.count_history(
+            user_id=query.user_id,
+            start_date=query.start_date,
+            end_date=query.end_date,
+            meal_type=query.meal_type,
+        )
+
+    return MealHistoryResult(
+        meals=meals, total_count=total_count, has_more=has_more, next_cursor=next_cursor
+    )
+
+
 @strawberry.type
 class AggregateQueries:
     """Aggregate queries for meal data operations."""
@@ -138,12 +285,20 @@ class AggregateQueries:
         if not repository:
             raise ValueError("MealRepository not available in context")
 
-        # Create query
-        query = GetMealQuery(meal_id=UUID(meal_id), user_id=user_id)
+        # Create query (only the selected fields are loaded)
+        query = GetMealQuery(
+            meal_id=UUID(meal_id),
+            user_id=user_id,
+            projection=meal_projection_from_selection(selected_field_names(info)),
+        )
 
-        # Execute via handler
-        handler = GetMealQueryHandler(repository=repository)
-        meal = await handler.handle(query)
+        # Sibling meal fields are batched into one get_by_ids per request
+        loaders = context.get("loaders")
+        if loaders is not None:
+            meal = await loaders.load_meal(query.meal_id, query.user_id, query.projection)
+        else:
+            handler = GetMealQueryHandler(repository=repository)
+            meal = await handler.handle(query)
 
         if not meal:
             return None
@@ -161,9 +316,13 @@ class AggregateQueries:
         meal_type: Optional[str] = None,
         limit: int = 20,
         offset: int = 0,
+        after: Optional[str] = None,
     ) -> MealHistoryResult:
         """Get meal history with filters and pagination.
 
+        Prefer keyset pagination: pass the nextCursor of the previous page
+        as ``after``. totalCount is computed only when selected.
+
         Args:
             info: Strawberry field info (injected)
             user_id: User ID
@@ -171,17 +330,18 @@ class AggregateQueries:
             end_date: Filter by end date (optional)
             meal_type: Filter by meal type (optional)
             limit: Results per page
-            offset: Pagination offset
+            offset: Pagination offset (applied after the cursor, if any)
+            after: Cursor of the previous page (optional)
 
         Returns:
             MealHistoryResult with meals and pagination info
 
         Example:
             query {
-              mealHistory(userId: "user123", limit: 10) {
+              mealHistory(userId: "user123", limit: 10, after: "eyJ0cyI6...") {
                 meals { id, timestamp, totalCalories }
-                totalCount
                 hasMore
+                nextCursor
               }
             }
         """
@@ -199,47 +359,28 @@ class AggregateQueries:
             meal_type=meal_type,
             limit=limit,
             offset=offset,
+            after=decode_meal_cursor(after) if after else None,
+            include_total=is_field_selected(info, "totalCount"),
+            projection=meal_projection_from_selection(selected_field_names(info, "meals")),
         )
 
+        # Read-only page: Mongo documents map straight to GraphQL types
+        if isinstance(repository, MongoMealRepository):
+            return await _meal_history_from_documents(repository, query)
+
         # Execute via handler
         handler = GetMealHistoryQueryHandler(repository=repository)
-        meals = await handler.handle(query)
+        page = await handler.handle(query)
 
         # Map domain entities → GraphQL types
-        graphql_meals = [map_meal_to_graphql(meal) for meal in meals]
-
-        # Calculate total count and pagination
-        # For date range queries, we need full count (optimization needed)
-        # For simple queries, use repository count method
-        if start_date and end_date:
-            # Full count requires fetching all results
-            count_query = GetMealHistoryQuery(
-                user_id=user_id,
-                start_date=start_date,
-                end_date=end_date,
-                meal_type=meal_type,
-                limit=10000,  # High limit for counting
-                offset=0,
-            )
-            all_meals = await handler.handle(count_query)
-            total_count = len(all_meals)
-        else:
-            # Use repository count method (optimized)
-            total_count = await repository.count_by_user(user_id=user_id)
-            # Apply meal_type filter to count if present
-            if meal_type:
-                all_meals_query = GetMealHistoryQuery(
-                    user_id=user_id,
-                    meal_type=meal_type,
-                    limit=10000,
-                    offset=0,
-                )
-                all_meals = await handler.handle(all_meals_query)
-                total_count = len(all_meals)
-
-        has_more = offset + len(graphql_meals) < total_count
-
-        return MealHistoryResult(meals=graphql_meals, total_count=total_count, has_more=has_more)
+        graphql_meals = [map_meal_to_graphql(meal) for meal in page.meals]
+
+        return MealHistoryResult(
+            meals=graphql_meals,
+            total_count=page.total_count or 0,
+            has_more=page.has_more,
+            next_cursor=encode_meal_cursor(page.next_cursor) if page.next_cursor else None,
+        )
 
     @strawberry.field
     async def search(
@@ -250,7 +391,7 @@ class AggregateQueries:
         limit: int = 20,
         offset: int = 0,
     ) -> MealSearchResult:
-        """Search meals by text (full-text search in entries and notes).
+        """Search meals by text (dish name, entries and notes; prefix and accent insensitive).
 
         Args:
             info: Strawberry field info (injected)
@@ -284,14 +425,27 @@ class AggregateQueries:
             query_text=query_text,
             limit=limit,
             offset=offset,
+            projection=meal_projection_from_selection(selected_field_names(info, "meals")),
         )
 
-        # Execute via handler
-        handler = SearchMealsQueryHandler(repository=repository)
-        meals = await handler.handle(query)
+        graphql_meals: List[Meal]
+        if isinstance(repository, MongoMealRepository):
+            # Read-only results: Mongo documents map straight to GraphQL types
+            docs = await repository.search_documents(
+                user_id=query.user_id,
+                query_text=query.query_text,
+                limit=query.limit,
+                offset=query.offset,
+                projection=query.projection,
+            )
+            graphql_meals = [map_meal_document_to_graphql(doc) for doc in docs]
+        else:
+            # Execute via handler
+            handler = SearchMealsQueryHandler(repository=repository)
+            meals = await handler.handle(query)
 
-        # Map domain entities → GraphQL types
-        graphql_meals = [map_meal_to_graphql(meal) for meal in meals]
+            # Map domain entities → GraphQL types
+            graphql_meals = [map_meal_to_graphql(meal) for meal in meals]
 
         return MealSearchResult(meals=graphql_meals, total_count=len(graphql_meals))
 
@@ -336,7 +490,9 @@ class AggregateQueries:
         query = GetDailySummaryQuery(user_id=user_id, date=date)
 
         # Execute via handler
-        handler = GetDailySummaryQueryHandler(repository=repository)
+        handler = GetDailySummaryQueryHandler(
+            repository=repository, cache=context.get("daily_summary_cache")
+        )
         summary = await handler.handle(query)
 
         # Map domain entity → GraphQL type
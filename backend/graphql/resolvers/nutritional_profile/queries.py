@@ -6,7 +6,7 @@ These resolvers retrieve profile data and statistics:
 """
 
 from datetime import date as date_type
-from typing import Optional, TYPE_CHECKING
+from typing import Any, Optional, TYPE_CHECKING
 import strawberry
 
 from graphql.types_nutritional_profile import (
@@ -26,6 +26,8 @@ from graphql.types_nutritional_profile import (
 from domain.nutritional_profile.core.value_objects.profile_id import ProfileId
 
 if TYPE_CHECKING:
+    from graphql.loaders import GraphQLLoaders
+    from domain.nutritional_profile.core.ports.repository import IProfileRepository
     from domain.nutritional_profile.core.entities.nutritional_profile import (  # noqa: E501
         NutritionalProfile,
     )
@@ -120,6 +122,24 @@ def map_domain_profile_to_graphql(
     )
 
 
+async def _load_profile(context: Any, profile_id: ProfileId) -> Optional["NutritionalProfile"]:
+    """Find profile by ID through the request loaders (repository fallback)."""
+    loaders: Optional["GraphQLLoaders"] = context.get("loaders")
+    if loaders is not None:
+        return await loaders.load_profile(profile_id)
+    repository: "IProfileRepository" = context.get("profile_repository")
+    return await repository.find_by_id(profile_id)
+
+
+async def _load_profile_for_user(context: Any, user_id: str) -> Optional["NutritionalProfile"]:
+    """Find profile by user ID through the request loaders (repository fallback)."""
+    loaders: Optional["GraphQLLoaders"] = context.get("loaders")
+    if loaders is not None:
+        return await loaders.load_profile_for_user(user_id)
+    repository: "IProfileRepository" = context.get("profile_repository")
+    return await repository.find_by_user_id(user_id)
+
+
 # ============================================
 # QUERY RESOLVERS
 # ============================================
@@ -178,12 +198,12 @@ class NutritionalProfileQueries:
         if not profile_id and not user_id:
             raise Exception("Must provide either profile_id or user_id")
 
-        # Query by ID or user ID
+        # Query by ID or user ID (batched with sibling profile fields)
         profile = None
         if profile_id:
-            profile = await repository.find_by_id(ProfileId.from_string(profile_id))
+            profile = await _load_profile(context, ProfileId.from_string(profile_id))
         elif user_id:
-            profile = await repository.find_by_user_id(user_id)
+            profile = await _load_profile_for_user(context, user_id)
 
         if profile:
             return map_domain_profile_to_graphql(profile)
@@ -234,7 +254,7 @@ class NutritionalProfileQueries:
             raise Exception("Missing profile_repository in GraphQL context")
 
         # Get profile by user ID
-        profile = await repository.find_by_user_id(user_id)
+        profile = await _load_profile_for_user(context, user_id)
 
         if not profile:
             raise Exception(f"Profile for user {user_id} not found")
@@ -332,7 +352,7 @@ class NutritionalProfileQueries:
             raise ValueError("confidence_level must be between 0 and 1")
 
         # Get profile
-        profile = await repository.find_by_id(ProfileId.from_string(profile_id))
+        profile = await _load_profile(context, ProfileId.from_string(profile_id))
         if not profile:
             raise Exception(f"Profile {profile_id} not found")
 
@@ -15,7 +15,6 @@ from enum import Enum
 import strawberry
 from domain.shared.types import GroupByPeriod as _SharedGroupByPeriod
 
-
 __all__ = [
     "MealType",
     "GroupByPeriod",
@@ -77,7 +76,7 @@ class Meal:
 
     id: str
     user_id: str
-    timestamp: datetime
+    timestamp: datetime  # Client UTC offset kept, millisecond precision
     meal_type: MealType
 
     # Recognition metadata (from AI analysis)
@@ -125,11 +124,16 @@ class Meal:
 
 @strawberry.type
 class MealHistoryResult:
-    """Result of meal history query with pagination."""
+    """Result of meal history query with pagination.
+
+    total_count is only computed when selected; next_cursor is the
+    ``after`` argument for the next page (null on the last page).
+    """
 
     meals: List[Meal]
     total_count: int
     has_more: bool
+    next_cursor: Optional[str] = None
 
 
 @strawberry.type
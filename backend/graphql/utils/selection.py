@@ -0,0 +1,62 @@
+"""Selection set helpers for GraphQL resolvers.
+
+Let resolvers skip work (counts, joins, heavy fields) that the client
+did not ask for.
+"""
+
+from typing import Any, Iterable, Iterator, List, Set
+
+
+def _iter_fields(selections: Iterable[Any]) -> Iterator[Any]:
+    """Yield selected fields, flattening fragment spreads and inline fragments."""
+    for selection in selections:
+        # SelectedField has a name; fragments only carry nested selections
+        if getattr(selection, "name", None) is not None and not hasattr(
+            selection, "type_condition"
+        ):
+            yield selection
+        else:
+            yield from _iter_fields(getattr(selection, "selections", []))
+
+
+def selected_field_names(info: Any, *path: str) -> Set[str]:
+    """Return names of the fields selected on the current field's result.
+
+    Args:
+        info: Strawberry Info of the resolver
+        path: camelCase names of nested fields to descend into first
+
+    Returns:
+        Set of camelCase field names (as written in the query)
+
+    Example:
+        >>> # mealHistory(userId: "u1") { meals { id } totalCount }
+        >>> selected_field_names(info)
+        {'meals', 'totalCount'}
+        >>> selected_field_names(info, "meals")
+        {'id'}
+    """
+    selections: List[Any] = []
+    for field in info.selected_fields:
+        selections.extend(field.selections)
+    for name in path:
+        selections = [
+            nested
+            for field in _iter_fields(selections)
+            if field.name == name
+            for nested in field.selections
+        ]
+    return {field.name for field in _iter_fields(selections)}
+
+
+def is_field_selected(info: Any, name: str) -> bool:
+    """Check if a field is selected on the current field's result.
+
+    Args:
+        info: Strawberry Info of the resolver
+        name: camelCase field name (e.g. "totalCount")
+
+    Returns:
+        True if the client asked for the field
+    """
+    return name in selected_field_names(info)
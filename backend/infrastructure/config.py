@@ -42,3 +42,206 @@ def get_mongodb_database() -> str:
         Database name from MONGODB_DATABASE env var, defaults to "nutrifit"
     """
     return os.getenv("MONGODB_DATABASE", "nutrifit")
+
+
+def is_meal_dates_legacy_read_enabled() -> bool:
+    """
+    Check whether meal queries must still match legacy ISO string dates.
+
+    Meal datetimes are written as native BSON dates. Until
+    scripts/migrate_meal_dates.py has backfilled every document, range
+    queries also match the legacy ISO string representation (dual-read).
+    Set MONGODB_MEAL_DATES_LEGACY_READ=0 once the backfill is complete.
+
+    Returns:
+        True unless MONGODB_MEAL_DATES_LEGACY_READ is "0"
+    """
+    return os.getenv("MONGODB_MEAL_DATES_LEGACY_READ", "1") != "0"
+
+
+def is_meal_daily_rollups_read_enabled() -> bool:
+    """
+    Check whether meal summaries may read the daily nutrition rollups.
+
+    Rollups (daily_nutrition_rollups) are always maintained on meal writes,
+    but days written before they existed are only filled by
+    scripts/rebuild_daily_rollups.py. Set MONGODB_MEAL_DAILY_ROLLUPS_READ=1
+    once the rebuild has run and its check reports no mismatch.
+
+    Returns:
+        True if MONGODB_MEAL_DAILY_ROLLUPS_READ is "1"
+    """
+    return os.getenv("MONGODB_MEAL_DAILY_ROLLUPS_READ", "0") == "1"
+
+
+def is_activity_timeseries_enabled() -> bool:
+    """
+    Check whether activity events use the MongoDB time-series collection.
+
+    With MONGODB_ACTIVITY_TIMESERIES=1 the mongodb backend stores minute
+    events in activity_events_ts (user_id metaField, BSON date timeField)
+    instead of one document per minute in activity_events. Run
+    scripts/migrate_activity_timeseries.py before switching.
+
+    Returns:
+        True if MONGODB_ACTIVITY_TIMESERIES is "1"
+    """
+    return os.getenv("MONGODB_ACTIVITY_TIMESERIES", "0") == "1"
+
+
+def get_daily_summary_cache_ttl_seconds() -> float:
+    """
+    Get the lifetime of cached daily summaries.
+
+    Meal events invalidate cached days only in the process that handled
+    the write, so other workers serve stale summaries for up to the TTL:
+    enable it for single-worker deployments. 0 disables the cache.
+
+    Returns:
+        Seconds from DAILY_SUMMARY_CACHE_TTL_SECONDS, defaults to 0 (off)
+    """
+    return float(os.getenv("DAILY_SUMMARY_CACHE_TTL_SECONDS", "0"))
+
+
+def get_daily_summary_cache_max_entries() -> int:
+    """
+    Get the maximum number of cached daily summaries.
+
+    Returns:
+        Count from DAILY_SUMMARY_CACHE_MAX_ENTRIES, defaults to 10000
+    """
+    return int(os.getenv("DAILY_SUMMARY_CACHE_MAX_ENTRIES", "10000"))
+
+
+def get_health_totals_idempotency_ttl_seconds() -> float:
+    """
+    Get the lifetime of in-memory syncHealthTotals idempotency signatures.
+
+    Returns:
+        Seconds from HEALTH_TOTALS_IDEMPOTENCY_TTL_SECONDS, defaults to 86400
+    """
+    return float(os.getenv("HEALTH_TOTALS_IDEMPOTENCY_TTL_SECONDS", "86400"))
+
+
+def get_health_totals_max_idempotency_keys() -> int:
+    """
+    Get the maximum number of in-memory syncHealthTotals idempotency signatures.
+
+    Returns:
+        Count from HEALTH_TOTALS_MAX_IDEMPOTENCY_KEYS, defaults to 100000
+    """
+    return int(os.getenv("HEALTH_TOTALS_MAX_IDEMPOTENCY_KEYS", "100000"))
+
+
+def get_health_totals_retention_days() -> int:
+    """
+    Get how many past days of in-memory health deltas are kept.
+
+    Returns:
+        Days from HEALTH_TOTALS_RETENTION_DAYS, defaults to 7
+    """
+    return int(os.getenv("HEALTH_TOTALS_RETENTION_DAYS", "7"))
+
+
+def get_health_totals_sweep_interval_seconds() -> float:
+    """
+    Get the interval of the in-memory health totals sweeper task.
+
+    The sweeper (started by the FastAPI lifespan) drops expired idempotency
+    signatures and days past the retention. 0 disables it.
+
+    Returns:
+        Seconds from HEALTH_TOTALS_SWEEP_INTERVAL_SECONDS, defaults to 60
+    """
+    return float(os.getenv("HEALTH_TOTALS_SWEEP_INTERVAL_SECONDS", "60"))
+
+
+def is_usda_cache_enabled() -> bool:
+    """
+    Check whether USDAClient caches label selections and nutrients.
+
+    Returns:
+        True unless USDA_CACHE_ENABLED is "0"
+    """
+    return os.getenv("USDA_CACHE_ENABLED", "1") != "0"
+
+
+def get_usda_cache_path() -> Optional[str]:
+    """
+    Get the SQLite file of the USDA cache (disk tier, survives restarts).
+
+    Returns:
+        Path from USDA_CACHE_PATH, defaults to .cache/usda_nutrients.sqlite3;
+        None if set to an empty string (in-process tier only)
+    """
+    path = os.getenv("USDA_CACHE_PATH", ".cache/usda_nutrients.sqlite3")
+    return path or None
+
+
+def get_usda_cache_ttl_seconds() -> float:
+    """
+    Get the lifetime of cached USDA label selections and nutrients.
+
+    Returns:
+        Seconds from USDA_CACHE_TTL_SECONDS, defaults to 30 days
+    """
+    return float(os.getenv("USDA_CACHE_TTL_SECONDS", str(30 * 86400)))
+
+
+def get_usda_cache_negative_ttl_seconds() -> float:
+    """
+    Get the lifetime of cached "no valid USDA result" labels.
+
+    Returns:
+        Seconds from USDA_CACHE_NEGATIVE_TTL_SECONDS, defaults to 86400
+    """
+    return float(os.getenv("USDA_CACHE_NEGATIVE_TTL_SECONDS", "86400"))
+
+
+def get_usda_cache_max_memory_entries() -> int:
+    """
+    Get the size of the in-process USDA cache tier.
+
+    Returns:
+        Count from USDA_CACHE_MAX_MEMORY_ENTRIES, defaults to 4096
+    """
+    return int(os.getenv("USDA_CACHE_MAX_MEMORY_ENTRIES", "4096"))
+
+
+def get_nutrition_provider_concurrency(tier: str) -> int:
+    """
+    Get the max concurrent calls of NutritionEnrichmentService to a provider tier.
+
+    Args:
+        tier: "usda", "category" or "fallback"
+
+    Returns:
+        Count from NUTRITION_<TIER>_CONCURRENCY, defaults to 4
+    """
+    return int(os.getenv(f"NUTRITION_{tier.upper()}_CONCURRENCY", "4"))
+
+
+def is_provider_single_flight_enabled() -> bool:
+    """
+    Check whether the provider factory coalesces concurrent identical lookups.
+
+    Real nutrition and barcode providers are wrapped in a single-flight
+    layer: concurrent calls with the same label/barcode share one upstream
+    request.
+
+    Returns:
+        True unless PROVIDER_SINGLE_FLIGHT_ENABLED is "0"
+    """
+    return os.getenv("PROVIDER_SINGLE_FLIGHT_ENABLED", "1") != "0"
+
+
+def get_usda_local_index_path() -> str:
+    """
+    Get the directory of the local FoodData Central index.
+
+    Used by NUTRITION_PROVIDER=usda_local; built by scripts/import_fdc_local.py.
+
+    Returns:
+        Path from USDA_LOCAL_INDEX_PATH, defaults to .cache/fdc_local
+    """
+    return os.getenv("USDA_LOCAL_INDEX_PATH", ".cache/fdc_local")
@@ -1,8 +1,25 @@
 """USDA FoodData Central API client."""
 
-from infrastructure.external_apis.usda.client import USDAClient, normalize_food_label
+from infrastructure.external_apis.usda.cache import LabelEntry, USDANutrientCache
+from infrastructure.external_apis.usda.client import (
+    USDAClient,
+    build_search_label,
+    extract_nutrients,
+    normalize_food_label,
+    score_food_naturalness,
+)
+from infrastructure.external_apis.usda.local_index import FDCLocalIndex, write_local_index
+from infrastructure.external_apis.usda.local_provider import USDALocalProvider
 
 __all__ = [
+    "FDCLocalIndex",
+    "LabelEntry",
+    "USDALocalProvider",
+    "USDANutrientCache",
     "USDAClient",
+    "build_search_label",
+    "extract_nutrients",
     "normalize_food_label",
+    "score_food_naturalness",
+    "write_local_index",
 ]
@@ -0,0 +1,305 @@
+"""Two-tier cache of USDA lookups (in-process LRU + SQLite on disk).
+
+USDAClient.get_nutrients resolves a label with one /foods/search call and
+up to eight /food/{fdcId} calls. The same few hundred foods account for
+most lookups, so both steps are cached:
+
+- label -> selected fdcId (or "no valid result", negative entry)
+- fdcId -> per-100g nutrients
+
+Entries expire after a TTL (shorter for negative entries). Lookups go to
+the in-process LRU first, then to the SQLite file, which survives
+restarts and is shared by the workers of a host (WAL mode). Memory hits
+are served on the event loop; SQLite reads and writes run in a worker
+thread (asyncio.to_thread), one query or transaction per batch of keys.
+
+Metrics (metrics.core.registry):
+    usda_cache_lookups (tags kind: label | food, tier: memory | disk | miss)
+    usda_cache_hit_ratio (gauge, tag kind)
+"""
+
+import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass
+import json
+import logging
+import os
+import sqlite3
+from threading import Lock
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from metrics.core import registry
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 30 * 86400.0
+DEFAULT_NEGATIVE_TTL_SECONDS = 86400.0
+DEFAULT_MAX_MEMORY_ENTRIES = 4096
+
+LABEL = "label"
+FOOD = "food"
+
+# Keys per SELECT ... IN (SQLite caps bound parameters at 999)
+_MAX_SQL_PARAMS = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS usda_cache (
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    expires_at REAL NOT NULL,
+    PRIMARY KEY (kind, key)
+)
+"""
+
+# (kind, key)
+CacheKey = Tuple[str, str]
+
+
+@dataclass(frozen=True)
+class LabelEntry:
+    """Cached label resolution; fdc_id None means no valid USDA result."""
+
+    fdc_id: Optional[int]
+
+
+class USDANutrientCache:
+    """
+    Label and nutrient cache for USDAClient.
+
+    Example:
+        >>> cache = USDANutrientCache(path=".cache/usda_nutrients.sqlite3")
+        >>> async with USDAClient(api_key=key, cache=cache) as client:
+        ...     profile = await client.get_nutrients("pasta", 100.0)
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        negative_ttl_seconds: float = DEFAULT_NEGATIVE_TTL_SECONDS,
+        max_memory_entries: int = DEFAULT_MAX_MEMORY_ENTRIES,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Initialize cache.
+
+        Args:
+            path: SQLite file (created if missing); None keeps the memory tier only
+            ttl_seconds: Lifetime of label selections and nutrients
+            negative_ttl_seconds: Lifetime of "no valid result" labels
+            max_memory_entries: Entries of the in-process LRU (both kinds)
+            clock: Wall-clock time source in seconds (shared with the disk tier)
+        """
+        if ttl_seconds <= 0 or negative_ttl_seconds <= 0:
+            raise ValueError("USDA cache TTLs must be positive")
+        if max_memory_entries <= 0:
+            raise ValueError(f"max_memory_entries must be positive, got {max_memory_entries}")
+
+        self._path = path
+        self._ttl = ttl_seconds
+        self._negative_ttl = negative_ttl_seconds
+        self._max_memory_entries = max_memory_entries
+        self._clock = clock
+        self._memory: "OrderedDict[CacheKey, Tuple[Any, float]]" = OrderedDict()
+        self._db: Optional[sqlite3.Connection] = None
+        # Memory tier and counters; the SQLite connection has its own lock,
+        # held only in worker threads
+        self._lock = Lock()
+        self._db_lock = Lock()
+        self._hits: Dict[str, int] = {LABEL: 0, FOOD: 0}
+        self._lookups: Dict[str, int] = {LABEL: 0, FOOD: 0}
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    async def get_label(self, label: str) -> Optional[LabelEntry]:
+        """Cached resolution of a search label, None on miss."""
+        value = (await self._get_many(LABEL, [label])).get(label)
+        if value is None:
+            return None
+        return LabelEntry(fdc_id=value["fdc_id"])
+
+    async def put_label(self, label: str, fdc_id: Optional[int]) -> None:
+        """Store the selected fdcId of a label (None: no valid result)."""
+        ttl = self._ttl if fdc_id is not None else self._negative_ttl
+        await self._put_many(LABEL, [(label, {"fdc_id": fdc_id}, self._clock() + ttl)])
+
+    async def get_food(self, fdc_id: int) -> Optional[Dict[str, float]]:
+        """Cached per-100g nutrients of a food, None on miss."""
+        return (await self.get_foods([fdc_id])).get(fdc_id)
+
+    async def get_foods(self, fdc_ids: Sequence[int]) -> Dict[int, Dict[str, float]]:
+        """Cached per-100g nutrients of several foods (one disk read for the misses)."""
+        found = await self._get_many(FOOD, [str(fdc_id) for fdc_id in fdc_ids])
+        return {int(key): dict(value) for key, value in found.items()}
+
+    async def put_food(self, fdc_id: int, nutrients: Dict[str, float]) -> None:
+        """Store the per-100g nutrients of a food."""
+        await self.put_foods({fdc_id: nutrients})
+
+    async def put_foods(self, foods: Dict[int, Dict[str, float]]) -> None:
+        """Store the per-100g nutrients of several foods (one disk transaction)."""
+        expires_at = self._clock() + self._ttl
+        entries = [
+            (str(fdc_id), dict(nutrients), expires_at) for fdc_id, nutrients in foods.items()
+        ]
+        await self._put_many(FOOD, entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """Lookups, hits and hit ratio per kind since creation."""
+        return {
+            kind: {
+                "lookups": self._lookups[kind],
+                "hits": self._hits[kind],
+                "hit_ratio": self._hit_ratio(kind),
+            }
+            for kind in (LABEL, FOOD)
+        }
+
+    def purge_expired(self) -> int:
+        """Delete expired entries from both tiers; returns disk rows deleted.
+
+        Blocking (one DELETE on the SQLite file): call it from a script or
+        a worker thread, not from the event loop.
+        """
+        now = self._clock()
+        with self._lock:
+            for key in [k for k, (_, exp) in self._memory.items() if exp <= now]:
+                del self._memory[key]
+        with self._db_lock:
+            db = self._connection()
+            if db is None:
+                return 0
+            with db:
+                cursor = db.execute("DELETE FROM usda_cache WHERE expires_at <= ?", (now,))
+            return cursor.rowcount
+
+    def close(self) -> None:
+        """Close the SQLite connection (reopened on next use)."""
+        with self._db_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    # ------------------------------------------------------------------
+    # Tiers
+    # ------------------------------------------------------------------
+
+    async def _get_many(self, kind: str, keys: List[str]) -> Dict[str, Any]:
+        """Look keys up in memory, then the misses on disk in a worker thread."""
+        now = self._clock()
+        found: Dict[str, Any] = {}
+        with self._lock:
+            for key in keys:
+                entry = self._memory.get((kind, key))
+                if entry is not None and entry[1] > now:
+                    self._memory.move_to_end((kind, key))
+                    found[key] = entry[0]
+                elif entry is not None:
+                    del self._memory[(kind, key)]
+        tiers = {key: "memory" for key in found}
+
+        missing = [key for key in keys if key not in found]
+        if missing and self._path is not None:
+            rows = await asyncio.to_thread(self._read_disk, kind, missing, now)
+            with self._lock:
+                for key, (value, expires_at) in rows.items():
+                    self._remember((kind, key), value, expires_at)
+            for key, (value, _) in rows.items():
+                found[key] = value
+                tiers[key] = "disk"
+
+        with self._lock:
+            self._lookups[kind] += len(keys)
+            self._hits[kind] += len(found)
+            hit_ratio = self._hit_ratio(kind)
+
+        for key in keys:
+            registry.counter("usda_cache_lookups", kind=kind, tier=tiers.get(key, "miss")).inc()
+        registry.gauge("usda_cache_hit_ratio", kind=kind).set(hit_ratio)
+        return found
+
+    async def _put_many(self, kind: str, entries: List[Tuple[str, Any, float]]) -> None:
+        """Store (key, value, expires_at) entries in memory, then on disk in a worker thread."""
+        if not entries:
+            return
+        with self._lock:
+            for key, value, expires_at in entries:
+                self._remember((kind, key), value, expires_at)
+        if self._path is not None:
+            await asyncio.to_thread(self._write_disk, kind, entries)
+
+    def _remember(self, key: CacheKey, value: Any, expires_at: float) -> None:
+        self._memory[key] = (value, expires_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def _read_disk(self, kind: str, keys: List[str], now: float) -> Dict[str, Tuple[Any, float]]:
+        """Unexpired disk rows of the keys (blocking, runs in a worker thread)."""
+        rows: List[Tuple[str, str, float]] = []
+        with self._db_lock:
+            db = self._connection()
+            if db is None:
+                return {}
+            try:
+                for start in range(0, len(keys), _MAX_SQL_PARAMS):
+                    chunk = keys[start : start + _MAX_SQL_PARAMS]
+                    rows.extend(
+                        db.execute(
+                            "SELECT key, value, expires_at FROM usda_cache "
+                            f"WHERE kind = ? AND key IN ({', '.join('?' * len(chunk))})",
+                            (kind, *chunk),
+                        ).fetchall()
+                    )
+            except sqlite3.Error as e:
+                logger.warning("USDA cache read failed", extra={"kind": kind, "error": str(e)})
+                return {}
+        return {
+            key: (json.loads(value), expires_at)
+            for key, value, expires_at in rows
+            if expires_at > now
+        }
+
+    def _write_disk(self, kind: str, entries: List[Tuple[str, Any, float]]) -> None:
+        """Upsert entries in one transaction (blocking, runs in a worker thread)."""
+        with self._db_lock:
+            db = self._connection()
+            if db is None:
+                return
+            try:
+                with db:
+                    db.executemany(
+                        "INSERT OR REPLACE INTO usda_cache (kind, key, value, expires_at) "
+                        "VALUES (?, ?, ?, ?)",
+                        [
+                            (kind, key, json.dumps(value), expires_at)
+                            for key, value, expires_at in entries
+                        ],
+                    )
+            except sqlite3.Error as e:
+                # The memory tier still serves the entries
+                logger.warning("USDA cache write failed", extra={"kind": kind, "error": str(e)})
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        """Open the SQLite file on first use (None without a path; call with _db_lock)."""
+        if self._path is None:
+            return None
+        if self._db is None:
+            directory = os.path.dirname(self._path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            db = sqlite3.connect(self._path, timeout=5.0, check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(_SCHEMA)
+            db.commit()
+            self._db = db
+            logger.info("USDA cache opened", extra={"path": self._path})
+        return self._db
+
+    def _hit_ratio(self, kind: str) -> float:
+        lookups = self._lookups[kind]
+        return self._hits[kind] / lookups if lookups else 0.0
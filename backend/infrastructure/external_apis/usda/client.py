@@ -10,6 +10,9 @@ Key Features:
 - Retry logic (exponential backoff)
 - Nutrient extraction and mapping
 - Label normalization
+- Optional two-tier cache (label -> fdcId, fdcId -> nutrients, see cache.py)
+- At most two round trips per label: search, then one multi-id /foods
+  request for the candidates whose nutrients are not already known
 """
 
 # mypy: warn-unused-ignores=False
@@ -30,6 +33,7 @@ from tenacity import (
 )
 
 from domain.meal.nutrition.entities.nutrient_profile import NutrientProfile
+from infrastructure.external_apis.usda.cache import USDANutrientCache
 
 logger = logging.getLogger(__name__)
 
@@ -54,7 +58,7 @@ class USDAClient:
 
     BASE_URL = "https://api.nal.usda.gov/fdc/v1"
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, cache: Optional[USDANutrientCache] = None):
         """
         Initialize USDA client.
 
@@ -63,12 +67,14 @@ class USDAClient:
         Args:
             api_key: USDA FoodData Central API key (optional)
                     Falls back to AI_USDA_API_KEY env var or default key
+            cache: Optional label/nutrient cache; warm lookups skip the network
         """
         # Set API key from parameter or environment with fallback
         env_key = os.getenv("AI_USDA_API_KEY")
         default_key = "zqOnb4hdPJlvU1f9WBmMS8wRgphfPng9ja02KIpy"
         self.api_key = api_key or env_key or default_key
         self._session: Optional[aiohttp.ClientSession] = None
+        self._cache = cache
 
     async def __aenter__(self) -> "USDAClient":
         """Async context manager entry."""
@@ -79,13 +85,9 @@ class USDAClient:
         """Async context manager exit."""
         if self._session:
             await self._session.close()
+        if self._cache:
+            self._cache.close()
 
-    @circuit(failure_threshold=5, recovery_timeout=60, name="usda_search")  # type: ignore[misc]
-    @retry(  # type: ignore[misc]
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((asyncio.TimeoutError, ConnectionError)),
-    )
     async def search_food(self, query: str, limit: int = 5) -> List[Dict[str, Any]]:
         """
         Search for foods in USDA database.
@@ -95,13 +97,23 @@ class USDAClient:
             limit: Maximum number of results
 
         Returns:
-            List of found foods
+            List of found foods (empty on API errors)
 
         Example:
             >>> foods = await client.search_food("chicken breast")
             >>> if foods:
             ...     fdc_id = foods[0]["fdcId"]
         """
+        return await self._search_foods(query, limit) or []
+
+    @circuit(failure_threshold=5, recovery_timeout=60, name="usda_search")  # type: ignore[misc]
+    @retry(  # type: ignore[misc]
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=10),
+        retry=retry_if_exception_type((asyncio.TimeoutError, ConnectionError)),
+    )
+    async def _search_foods(self, query: str, limit: int) -> Optional[List[Dict[str, Any]]]:
+        """Search for foods; None on API errors (not a "no results" answer)."""
         if not self._session:
             raise RuntimeError("Client not initialized. Use async context manager.")
 
@@ -142,17 +154,17 @@ class USDAClient:
                         "USDA API warning",
                         extra={"status": response.status, "query": query},
                     )
-                    return []
+                    return None
 
         except asyncio.TimeoutError:
             logger.error("USDA API timeout", extra={"query": query})
-            return []
+            return None
         except Exception as e:
             logger.error(
                 "USDA API error",
                 extra={"query": query, "error": str(e)},
             )
-            return []
+            return None
 
     @circuit(failure_threshold=5, recovery_timeout=60, name="usda_nutrients")  # type: ignore[misc]
     @retry(  # type: ignore[misc]
@@ -198,6 +210,63 @@ class USDAClient:
             )
             return None
 
+    @circuit(failure_threshold=5, recovery_timeout=60, name="usda_foods")  # type: ignore[misc]
+    @retry(  # type: ignore[misc]
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=10),
+        retry=retry_if_exception_type((asyncio.TimeoutError, ConnectionError)),
+    )
+    async def get_nutrients_by_ids(
+        self, fdc_ids: List[int]
+    ) -> Optional[Dict[int, Dict[str, float]]]:
+        """
+        Get nutrients for several foods in one request (multi-id /foods endpoint).
+
+        Args:
+            fdc_ids: FoodData Central IDs (at most 20, the endpoint limit)
+
+        Returns:
+            Nutrient values per FDC ID (IDs unknown to USDA are missing),
+            or None if error
+        """
+        if not self._session:
+            raise RuntimeError("Client not initialized. Use async context manager.")
+        if not fdc_ids:
+            return {}
+
+        params: Dict[str, str] = {}
+        if self.api_key:
+            params["api_key"] = self.api_key
+
+        try:
+            async with self._session.post(
+                f"{self.BASE_URL}/foods",
+                params=params,
+                json={"fdcIds": list(fdc_ids), "format": "full"},
+            ) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    if not isinstance(data, list):
+                        return None
+                    return {
+                        int(food["fdcId"]): self._extract_nutrients(food)
+                        for food in data
+                        if isinstance(food, dict) and food.get("fdcId")
+                    }
+                else:
+                    logger.warning(
+                        "USDA foods detail failed",
+                        extra={"fdc_ids": fdc_ids, "status": response.status},
+                    )
+                    return None
+
+        except Exception as e:
+            logger.error(
+                "USDA foods detail error",
+                extra={"fdc_ids": fdc_ids, "error": str(e)},
+            )
+            return None
+
     async def get_nutrients(self, identifier: str, quantity_g: float) -> Optional[NutrientProfile]:
         """
         Get nutrient profile for a food identifier.
@@ -225,105 +294,39 @@ class USDAClient:
         normalized_label = normalize_food_label(identifier)
 
         # For generic simple foods, prefer raw/fresh versions
-        # Only add "raw" if not already specified (fried, boiled, etc.)
-        simple_foods_prefer_raw = [
-            "potato",
-            "potatoes",
-            "tomato",
-            "tomatoes",
-            "onion",
-            "onions",
-            "carrot",
-            "carrots",
-            "spinach",
-            "broccoli",
-            "zucchini",
-            "eggplant",
-            "bell pepper",
-            "cucumber",
-        ]
-
-        # Eggs need special handling: "whole raw" to avoid egg whites
-        eggs_variants = ["eggs", "egg"]
-
-        # Check if label is generic (no preparation method specified)
-        has_preparation = any(
-            prep in normalized_label.lower()
-            for prep in [
-                "raw",
-                "fried",
-                "boiled",
-                "baked",
-                "grilled",
-                "roasted",
-                "steamed",
-                "cooked",
-                "dried",
-                "canned",
-                "whole",
-                "white",
-                "yolk",
-            ]
-        )
+        search_label = build_search_label(normalized_label)
+        if search_label != normalized_label:
+            logger.debug(
+                "Adding preparation to generic food query",
+                extra={"original": normalized_label, "modified": search_label},
+            )
 
-        # Add "raw" or "whole raw" for simple foods without preparation
-        search_label = normalized_label
-        if not has_preparation:
-            if normalized_label.lower() in eggs_variants:
-                # Eggs: add "whole raw" to get whole eggs not whites
-                search_label = f"{normalized_label} whole raw"
-                logger.debug(
-                    "Adding 'whole raw' to eggs query",
-                    extra={"original": normalized_label, "modified": search_label},
-                )
-            elif normalized_label.lower() in simple_foods_prefer_raw:
-                # Other simple foods: just add "raw"
-                search_label = f"{normalized_label} raw"
-                logger.debug(
-                    "Adding 'raw' to generic food query",
-                    extra={"original": normalized_label, "modified": search_label},
+        # Warm lookup: cached label selection and nutrients, no network
+        cached = await self._cache.get_label(search_label) if self._cache else None
+        if cached is not None:
+            if cached.fdc_id is None:
+                logger.info(
+                    "No USDA results (cached)",
+                    extra={"identifier": identifier},
                 )
+                return None
+            nutrients_dict = await self._fetch_nutrients(cached.fdc_id)
+            if nutrients_dict and nutrients_dict.get("calories", 0) > 0:
+                return self._to_profile(identifier, cached.fdc_id, nutrients_dict)
 
         # Search for food in USDA with higher limit for better selection
-        foods = await self.search_food(search_label, limit=8)
+        foods = await self._search_foods(search_label, limit=SEARCH_PAGE_SIZE)
 
         if not foods:
             logger.info(
                 "No USDA results",
                 extra={"identifier": identifier},
             )
+            if foods is not None and self._cache:
+                await self._cache.put_label(search_label, None)
             return None
 
         # Filter and rank results to prefer natural/raw foods over processed
-        def score_food_naturalness(description: str) -> int:
-            """Score food by naturalness (higher = more natural/raw)."""
-            desc_lower = description.lower()
-
-            # Heavily penalize processed/dried/powdered foods
-            processed_keywords = [
-                "dehydrated",
-                "powder",
-                "dried",
-                "canned",
-                "crackers",
-                "cakes",
-                "juice",
-                "croissant",
-                "strudel",
-                "snacks",
-                "bars",
-                "cereal",
-            ]
-            if any(kw in desc_lower for kw in processed_keywords):
-                return -100
-
-            # Favor fresh/raw forms
-            if any(kw in desc_lower for kw in ["raw", "fresh"]):
-                return 50
-
-            # Neutral for normal preparations (fried, boiled, etc.)
-            return 0
-
         # Sort by naturalness score (highest first)
         foods_with_scores = [
             (food, score_food_naturalness(food.get("description", ""))) for food in foods
@@ -339,14 +342,32 @@ class USDAClient:
             },
         )
 
-        # Try results in order of preference (best score first)
-        for food, score in foods_sorted:
-            fdc_id = food.get("fdcId")
-            if not fdc_id:
-                continue
+        candidates = [(food, score) for food, score in foods_sorted if food.get("fdcId")]
+
+        # Nutrients known without a request: cache, or complete search hits
+        known = await self._known_nutrients([food for food, _ in candidates])
+
+        # One multi-id request for the candidates ranked before the first
+        # known valid one; selection then happens locally
+        missing: List[int] = []
+        for food, _ in candidates:
+            fdc_id = food["fdcId"]
+            if fdc_id not in known:
+                missing.append(fdc_id)
+            elif known[fdc_id].get("calories", 0) > 0:
+                break
 
-            # Get detailed nutrients
-            nutrients_dict = await self.get_nutrients_by_id(fdc_id)
+        # A failed detail fetch makes "no valid result" uncertain (not cached)
+        fetch_failed = False
+        if missing:
+            fetched = await self._fetch_nutrients_batch(missing)
+            fetch_failed = fetched is None
+            known.update(fetched or {})
+
+        # Try results in order of preference (best score first)
+        for food, score in candidates:
+            fdc_id = food["fdcId"]
+            nutrients_dict = known.get(fdc_id)
 
             if nutrients_dict and nutrients_dict.get("calories", 0) > 0:
                 # Found valid result with calories > 0
@@ -357,6 +378,7 @@ class USDAClient:
                         "fdc_id": fdc_id,
                         "description": food.get("description"),
                         "score": score,
+                        "detail_requests": 1 if missing else 0,
                     },
                 )
                 break
@@ -366,9 +388,60 @@ class USDAClient:
                 "No valid USDA nutrients found",
                 extra={"identifier": identifier},
             )
+            if self._cache and not fetch_failed:
+                await self._cache.put_label(search_label, None)
             return None
 
+        if self._cache:
+            await self._cache.put_label(search_label, fdc_id)
+
         # nutrients_dict is now set from the loop above
+        return self._to_profile(identifier, fdc_id, nutrients_dict)
+
+    async def _fetch_nutrients(self, fdc_id: int) -> Optional[Dict[str, float]]:
+        """Nutrients of a food from the cache, else from the API (then cached)."""
+        if self._cache:
+            cached = await self._cache.get_food(fdc_id)
+            if cached is not None:
+                return cached
+
+        nutrients_dict: Optional[Dict[str, float]] = await self.get_nutrients_by_id(fdc_id)
+        if nutrients_dict is not None and self._cache:
+            await self._cache.put_food(fdc_id, nutrients_dict)
+        return nutrients_dict
+
+    async def _known_nutrients(self, foods: List[Dict[str, Any]]) -> Dict[int, Dict[str, float]]:
+        """Nutrients of search hits from the cache, else from the hits themselves (then cached)."""
+        known: Dict[int, Dict[str, float]] = {}
+        if self._cache:
+            known = await self._cache.get_foods([food["fdcId"] for food in foods])
+
+        from_hits: Dict[int, Dict[str, float]] = {}
+        for food in foods:
+            if food["fdcId"] in known:
+                continue
+            nutrients_dict = search_hit_nutrients(food)
+            if nutrients_dict is not None:
+                from_hits[food["fdcId"]] = nutrients_dict
+
+        if from_hits and self._cache:
+            await self._cache.put_foods(from_hits)
+        known.update(from_hits)
+        return known
+
+    async def _fetch_nutrients_batch(
+        self, fdc_ids: List[int]
+    ) -> Optional[Dict[int, Dict[str, float]]]:
+        """Nutrients of several foods from the API in one request (then cached)."""
+        fetched: Optional[Dict[int, Dict[str, float]]] = await self.get_nutrients_by_ids(fdc_ids)
+        if fetched and self._cache:
+            await self._cache.put_foods(fetched)
+        return fetched
+
+    def _to_profile(
+        self, identifier: str, fdc_id: int, nutrients_dict: Dict[str, float]
+    ) -> NutrientProfile:
+        """Build the per-100g NutrientProfile of the selected food."""
         # Convert to NutrientProfile domain entity
         # USDA nutrients are ALWAYS per 100g - NO SCALING here
         # The service layer (enrichment_service.py) calls with quantity_g=100.0
@@ -399,96 +472,226 @@ class USDAClient:
         return profile
 
     def _extract_nutrients(self, food_data: Dict[str, Any]) -> Dict[str, float]:
-        """
-        Extract base nutrients from USDA data.
+        """Extract base nutrients from USDA data (see extract_nutrients)."""
+        return extract_nutrients(food_data)
+
+
+# Search results considered per label (ranked by naturalness)
+SEARCH_PAGE_SIZE = 8
+
+# Mapping USDA nutrient IDs → our values
+NUTRIENT_MAPPING = {
+    1003: "protein",  # Protein
+    1005: "carbs",  # Carbohydrate, by difference
+    1004: "fat",  # Total lipid (fat)
+    1079: "fiber",  # Fiber, total dietary
+    1063: "sugar",  # Sugars, total including NLEA
+    1093: "sodium",  # Sodium, Na (mg)
+    1087: "calcium",  # Calcium, Ca (mg)
+    1008: "calories",  # Energy (kcal)
+}
+
+# Nutrients of a NutrientProfile: a search hit listing all of them needs
+# no detail request
+PROFILE_NUTRIENT_IDS = frozenset(
+    nutrient_id for nutrient_id, name in NUTRIENT_MAPPING.items() if name != "calcium"
+)
 
-        CRITICAL: USDA nutrients are ALWAYS per 100g for FoodData Central.
-        The API documentation states all nutrient values are normalized to 100g.
+# Generic simple foods: prefer raw/fresh versions
+SIMPLE_FOODS_PREFER_RAW = frozenset(
+    [
+        "potato",
+        "potatoes",
+        "tomato",
+        "tomatoes",
+        "onion",
+        "onions",
+        "carrot",
+        "carrots",
+        "spinach",
+        "broccoli",
+        "zucchini",
+        "eggplant",
+        "bell pepper",
+        "cucumber",
+    ]
+)
 
-        Args:
-            food_data: Complete USDA food data
+# Eggs need special handling: "whole raw" to avoid egg whites
+EGG_VARIANTS = frozenset(["eggs", "egg"])
+
+# Labels mentioning one of these already specify a preparation
+PREPARATION_KEYWORDS = (
+    "raw",
+    "fried",
+    "boiled",
+    "baked",
+    "grilled",
+    "roasted",
+    "steamed",
+    "cooked",
+    "dried",
+    "canned",
+    "whole",
+    "white",
+    "yolk",
+)
 
-        Returns:
-            Dictionary with nutrient values (per 100g base)
-        """
-        nutrients: Dict[str, float] = {
-            "calories": 0.0,
-            "protein": 0.0,
-            "carbs": 0.0,
-            "fat": 0.0,
-            "fiber": 0.0,
-            "sugar": 0.0,
-            "sodium": 0.0,
-            "calcium": 0.0,
-        }
+# Heavily penalized descriptions (processed/dried/powdered foods)
+PROCESSED_KEYWORDS = (
+    "dehydrated",
+    "powder",
+    "dried",
+    "canned",
+    "crackers",
+    "cakes",
+    "juice",
+    "croissant",
+    "strudel",
+    "snacks",
+    "bars",
+    "cereal",
+)
 
-        # Mapping USDA nutrient IDs → our values
-        nutrient_mapping = {
-            1003: "protein",  # Protein
-            1005: "carbs",  # Carbohydrate, by difference
-            1004: "fat",  # Total lipid (fat)
-            1079: "fiber",  # Fiber, total dietary
-            1063: "sugar",  # Sugars, total including NLEA
-            1093: "sodium",  # Sodium, Na (mg)
-            1087: "calcium",  # Calcium, Ca (mg)
-            1008: "calories",  # Energy (kcal)
-        }
 
-        food_nutrients = food_data.get("foodNutrients", [])
+def build_search_label(normalized_label: str) -> str:
+    """
+    Search query for a normalized label, preferring raw foods.
 
-        # Debug logging
-        food_desc = food_data.get("description", "unknown")
-        serving_size = food_data.get("servingSize")
-        serving_unit = food_data.get("servingSizeUnit")
+    Only generic labels (no preparation method specified) are changed:
+    eggs get "whole raw" (whole eggs, not whites), other simple foods "raw".
 
-        logger.debug(
-            "Extracting USDA nutrients",
-            extra={
-                "description": food_desc,
-                "servingSize": serving_size,
-                "servingSizeUnit": serving_unit,
-                "nutrient_count": len(food_nutrients),
-            },
-        )
+    Example:
+        >>> build_search_label("potatoes")
+        'potatoes raw'
+        >>> build_search_label("potatoes fried")
+        'potatoes fried'
+    """
+    lowered = normalized_label.lower()
+    if any(prep in lowered for prep in PREPARATION_KEYWORDS):
+        return normalized_label
+    if lowered in EGG_VARIANTS:
+        return f"{normalized_label} whole raw"
+    if lowered in SIMPLE_FOODS_PREFER_RAW:
+        return f"{normalized_label} raw"
+    return normalized_label
 
-        for nutrient in food_nutrients:
-            # USDA API can return two different structures:
-            # 1. Search API: nutrientId + value (direct)
-            # 2. Detail API: nutrient.id + amount (nested)
-            # We support both
-
-            # Method 1: Search API (new)
-            nutrient_id = nutrient.get("nutrientId")
-            amount = nutrient.get("value")
-
-            # Method 2: Detail API (original) - fallback if method 1 fails
-            if nutrient_id is None or amount is None:
-                nutrient_info = nutrient.get("nutrient", {})
-                nutrient_id = nutrient_info.get("id")
-                amount = nutrient.get("amount")
-
-            if nutrient_id in nutrient_mapping and amount is not None:
-                field_name = nutrient_mapping[nutrient_id]
-                nutrients[field_name] = float(amount)
-
-                # Debug: log first few nutrients to verify data
-                if field_name in ["calories", "protein", "carbs"]:
-                    logger.debug(
-                        f"USDA nutrient {field_name}",
-                        extra={"nutrient_id": nutrient_id, "value": float(amount)},
-                    )
 
-        logger.debug(
-            "USDA nutrients extracted (per 100g base)",
-            extra={
-                "calories": nutrients["calories"],
-                "protein": nutrients["protein"],
-                "carbs": nutrients["carbs"],
-                "fat": nutrients["fat"],
-            },
-        )
+def score_food_naturalness(description: str) -> int:
+    """Score food by naturalness (higher = more natural/raw)."""
+    desc_lower = description.lower()
+
+    # Heavily penalize processed/dried/powdered foods
+    if any(kw in desc_lower for kw in PROCESSED_KEYWORDS):
+        return -100
+
+    # Favor fresh/raw forms
+    if any(kw in desc_lower for kw in ["raw", "fresh"]):
+        return 50
+
+    # Neutral for normal preparations (fried, boiled, etc.)
+    return 0
+
+
+def search_hit_nutrients(food: Dict[str, Any]) -> Optional[Dict[str, float]]:
+    """
+    Nutrients of a /foods/search hit, when the hit lists all profile nutrients.
+
+    Returns:
+        Per-100g nutrients, or None when a detail request is needed
+    """
+    listed = {
+        nutrient.get("nutrientId")
+        for nutrient in food.get("foodNutrients", [])
+        if nutrient.get("value") is not None
+    }
+    if not PROFILE_NUTRIENT_IDS <= listed:
+        return None
+    return extract_nutrients(food)
+
+
+def extract_nutrients(food_data: Dict[str, Any]) -> Dict[str, float]:
+    """
+    Extract base nutrients from USDA data.
+
+    CRITICAL: USDA nutrients are ALWAYS per 100g for FoodData Central.
+    The API documentation states all nutrient values are normalized to 100g.
+
+    Shared by USDAClient (search and detail API) and the local FoodData
+    Central import (same JSON structure as the detail API).
+
+    Args:
+        food_data: Complete USDA food data
+
+    Returns:
+        Dictionary with nutrient values (per 100g base)
+    """
+    nutrients: Dict[str, float] = {
+        "calories": 0.0,
+        "protein": 0.0,
+        "carbs": 0.0,
+        "fat": 0.0,
+        "fiber": 0.0,
+        "sugar": 0.0,
+        "sodium": 0.0,
+        "calcium": 0.0,
+    }
+
+    food_nutrients = food_data.get("foodNutrients", [])
+
+    # Debug logging
+    food_desc = food_data.get("description", "unknown")
+    serving_size = food_data.get("servingSize")
+    serving_unit = food_data.get("servingSizeUnit")
+
+    logger.debug(
+        "Extracting USDA nutrients",
+        extra={
+            "description": food_desc,
+            "servingSize": serving_size,
+            "servingSizeUnit": serving_unit,
+            "nutrient_count": len(food_nutrients),
+        },
+    )
+
+    for nutrient in food_nutrients:
+        # USDA API can return two different structures:
+        # 1. Search API: nutrientId + value (direct)
+        # 2. Detail API: nutrient.id + amount (nested)
+        # We support both
+
+        # Method 1: Search API (new)
+        nutrient_id = nutrient.get("nutrientId")
+        amount = nutrient.get("value")
+
+        # Method 2: Detail API (original) - fallback if method 1 fails
+        if nutrient_id is None or amount is None:
+            nutrient_info = nutrient.get("nutrient", {})
+            nutrient_id = nutrient_info.get("id")
+            amount = nutrient.get("amount")
+
+        if nutrient_id in NUTRIENT_MAPPING and amount is not None:
+            field_name = NUTRIENT_MAPPING[nutrient_id]
+            nutrients[field_name] = float(amount)
+
+            # Debug: log first few nutrients to verify data
+            if field_name in ["calories", "protein", "carbs"]:
+                logger.debug(
+                    f"USDA nutrient {field_name}",
+                    extra={"nutrient_id": nutrient_id, "value": float(amount)},
+                )
+
+    logger.debug(
+        "USDA nutrients extracted (per 100g base)",
+        extra={
+            "calories": nutrients["calories"],
+            "protein": nutrients["protein"],
+            "carbs": nutrients["carbs"],
+            "fat": nutrients["fat"],
+        },
+    )
 
-        return nutrients
+    return nutrients
 
 
 @lru_cache(maxsize=64)
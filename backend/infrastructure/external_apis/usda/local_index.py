@@ -0,0 +1,320 @@
+"""Local FoodData Central index (memory-mapped numpy arrays).
+
+Built once from the FoodData Central Foundation / SR Legacy JSON downloads
+(scripts/import_fdc_local.py) and opened read-only with np.load(mmap_mode="r"):
+the arrays are never copied into the process, so the uvicorn workers of a
+host share the same page-cache pages.
+
+Layout (one directory):
+    meta.json                  format version, food count, import sources
+    fdc_ids.npy                int64[N], rows sorted by fdcId
+    nutrients.npy              float64[N, 7] per 100g, NUTRIENT_FIELDS order
+    desc_offsets.npy           int64[N + 1] offsets into desc_bytes
+    desc_bytes.npy             uint8 UTF-8 descriptions (as published)
+    doc_tokens.npy             int32[N] description token count
+    token_{keys,offsets,docs}  inverted index of description tokens
+    trigram_{keys,offsets,docs} inverted index of token trigrams
+
+Inverted indexes are CSR arrays: keys (sorted crc32 of the term), offsets
+and the rows containing each term. Search ranks rows by query tokens
+matched (exactly, or fuzzily through trigrams: "potato" matches
+"potatoes"), then by match strength, then shorter descriptions first,
+like the generic-first ordering of the FoodData Central search.
+"""
+
+from dataclasses import dataclass
+import json
+import os
+import re
+import shutil
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Tuple
+import zlib
+
+import numpy as np
+
+from infrastructure.external_apis.usda.client import extract_nutrients
+
+FORMAT_VERSION = 1
+
+NUTRIENT_FIELDS = ("calories", "protein", "carbs", "fat", "fiber", "sugar", "sodium")
+
+# Share of a query token's trigrams a row must contain to match fuzzily
+FUZZY_MIN_SIMILARITY = 0.6
+
+# Top-level keys of the FoodData Central JSON downloads
+FDC_JSON_KEYS = ("FoundationFoods", "SRLegacyFoods")
+
+_TOKEN_RE = re.compile(r"[^\W_]+")
+_ARRAYS = (
+    "fdc_ids",
+    "nutrients",
+    "desc_offsets",
+    "desc_bytes",
+    "doc_tokens",
+    "token_keys",
+    "token_offsets",
+    "token_docs",
+    "trigram_keys",
+    "trigram_offsets",
+    "trigram_docs",
+)
+
+
+class FDCFood(NamedTuple):
+    """Food of the import: fdcId, description, per-100g nutrients."""
+
+    fdc_id: int
+    description: str
+    nutrients: Dict[str, float]
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase alphanumeric tokens of a description or query."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+def trigrams(token: str) -> List[str]:
+    """Distinct trigrams of a token padded with spaces ("egg" -> " eg", "egg", "gg ")."""
+    padded = f" {token} "
+    return list(dict.fromkeys(padded[i : i + 3] for i in range(len(padded) - 2)))
+
+
+def _term_key(term: str) -> int:
+    return zlib.crc32(term.encode("utf-8"))
+
+
+def iter_fdc_json_foods(path: str) -> Iterator[FDCFood]:
+    """
+    Foods of a FoodData Central JSON download (Foundation or SR Legacy).
+
+    Args:
+        path: JSON file, e.g. FoodData_Central_sr_legacy_food_json_2018-04.json
+
+    Raises:
+        ValueError: If the file has none of the FDC_JSON_KEYS
+    """
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    sections = [data[key] for key in FDC_JSON_KEYS if key in data]
+    if not sections:
+        raise ValueError(f"{path}: expected one of {', '.join(FDC_JSON_KEYS)}")
+    for foods in sections:
+        for food in foods:
+            fdc_id = food.get("fdcId")
+            if not fdc_id:
+                continue
+            yield FDCFood(int(fdc_id), food.get("description", ""), extract_nutrients(food))
+
+
+def _csr(postings: Dict[int, List[int]]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    keys = np.array(sorted(postings), dtype=np.uint32)
+    lengths = [len(postings[int(key)]) for key in keys]
+    offsets = np.zeros(len(keys) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    docs = np.fromiter(
+        (row for key in keys for row in postings[int(key)]),
+        dtype=np.int32,
+        count=int(offsets[-1]),
+    )
+    return keys, offsets, docs
+
+
+def write_local_index(path: str, foods: Iterable[FDCFood], sources: Iterable[str] = ()) -> int:
+    """
+    Build the index directory at path, replacing any previous index.
+
+    The new index is written next to path and swapped in with a rename:
+    processes that mapped the previous files keep reading them.
+
+    Args:
+        path: Index directory
+        foods: Foods to index (a repeated fdcId keeps the last one)
+        sources: Import file names, recorded in meta.json
+
+    Returns:
+        Number of indexed foods
+    """
+    by_id = {food.fdc_id: food for food in foods}
+    rows = [by_id[fdc_id] for fdc_id in sorted(by_id)]
+
+    token_postings: Dict[int, List[int]] = {}
+    trigram_postings: Dict[int, List[int]] = {}
+    doc_tokens = np.zeros(len(rows), dtype=np.int32)
+    encoded = [food.description.encode("utf-8") for food in rows]
+    for row, food in enumerate(rows):
+        tokens = tokenize(food.description)
+        doc_tokens[row] = len(tokens)
+        grams = {gram for token in tokens for gram in trigrams(token)}
+        for key in {_term_key(token) for token in tokens}:
+            token_postings.setdefault(key, []).append(row)
+        for key in {_term_key(gram) for gram in grams}:
+            trigram_postings.setdefault(key, []).append(row)
+
+    desc_offsets = np.zeros(len(rows) + 1, dtype=np.int64)
+    np.cumsum([len(desc) for desc in encoded], out=desc_offsets[1:])
+    arrays: Dict[str, np.ndarray] = {
+        "fdc_ids": np.array([food.fdc_id for food in rows], dtype=np.int64),
+        "nutrients": np.array(
+            [[food.nutrients.get(name, 0.0) for name in NUTRIENT_FIELDS] for food in rows],
+            dtype=np.float64,
+        ).reshape(len(rows), len(NUTRIENT_FIELDS)),
+        "desc_offsets": desc_offsets,
+        "desc_bytes": np.frombuffer(b"".join(encoded), dtype=np.uint8),
+        "doc_tokens": doc_tokens,
+    }
+    for name, postings in (("token", token_postings), ("trigram", trigram_postings)):
+        keys, offsets, docs = _csr(postings)
+        arrays[f"{name}_keys"] = keys
+        arrays[f"{name}_offsets"] = offsets
+        arrays[f"{name}_docs"] = docs
+
+    path = os.path.abspath(path)
+    staging = f"{path}.tmp"
+    shutil.rmtree(staging, ignore_errors=True)
+    os.makedirs(staging)
+    for name, array in arrays.items():
+        np.save(os.path.join(staging, f"{name}.npy"), array)
+    with open(os.path.join(staging, "meta.json"), "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "version": FORMAT_VERSION,
+                "count": len(rows),
+                "nutrient_fields": list(NUTRIENT_FIELDS),
+                "sources": list(sources),
+            },
+            f,
+        )
+
+    previous = f"{path}.old"
+    shutil.rmtree(previous, ignore_errors=True)
+    if os.path.exists(path):
+        os.rename(path, previous)
+    os.rename(staging, path)
+    shutil.rmtree(previous, ignore_errors=True)
+    return len(rows)
+
+
+@dataclass(frozen=True)
+class _Postings:
+    keys: np.ndarray
+    offsets: np.ndarray
+    docs: np.ndarray
+
+    def rows(self, term: str) -> np.ndarray:
+        key = _term_key(term)
+        i = int(np.searchsorted(self.keys, key))
+        if i == len(self.keys) or int(self.keys[i]) != key:
+            return self.docs[:0]
+        return self.docs[self.offsets[i] : self.offsets[i + 1]]
+
+
+class FDCLocalIndex:
+    """
+    Read-only, memory-mapped local FoodData Central index.
+
+    Example:
+        >>> index = FDCLocalIndex(".cache/fdc_local")
+        >>> rows = index.search("potatoes raw", limit=8)
+        >>> index.description(rows[0]), index.nutrients(rows[0])["calories"]
+    """
+
+    def __init__(self, path: str):
+        """
+        Open index (arrays are memory-mapped, not read).
+
+        Args:
+            path: Index directory written by write_local_index
+
+        Raises:
+            FileNotFoundError: If path holds no index
+            ValueError: If the index format version is not supported
+        """
+        with open(os.path.join(path, "meta.json"), encoding="utf-8") as f:
+            self.meta: Dict[str, Any] = json.load(f)
+        if self.meta.get("version") != FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported local FDC index version {self.meta.get('version')} at {path}: "
+                "re-run scripts/import_fdc_local.py"
+            )
+        # np.asarray: plain ndarray views of the mappings (no np.memmap
+        # overhead on the small slices taken per query, still no copy)
+        arrays = {
+            name: np.asarray(np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r"))
+            for name in _ARRAYS
+        }
+        self._fdc_ids = arrays["fdc_ids"]
+        self._nutrients = arrays["nutrients"]
+        self._desc_offsets = arrays["desc_offsets"]
+        self._desc_bytes = arrays["desc_bytes"]
+        self._doc_tokens = arrays["doc_tokens"]
+        self._tokens = _Postings(
+            arrays["token_keys"], arrays["token_offsets"], arrays["token_docs"]
+        )
+        self._trigrams = _Postings(
+            arrays["trigram_keys"], arrays["trigram_offsets"], arrays["trigram_docs"]
+        )
+
+    @staticmethod
+    def exists(path: str) -> bool:
+        """Whether path holds an index."""
+        return os.path.isfile(os.path.join(path, "meta.json"))
+
+    def __len__(self) -> int:
+        return len(self._fdc_ids)
+
+    def fdc_id(self, row: int) -> int:
+        """fdcId of a row."""
+        return int(self._fdc_ids[row])
+
+    def description(self, row: int) -> str:
+        """Published description of a row."""
+        start, end = self._desc_offsets[row], self._desc_offsets[row + 1]
+        return bytes(self._desc_bytes[start:end]).decode("utf-8")
+
+    def nutrients(self, row: int) -> Dict[str, float]:
+        """Per-100g nutrients of a row (same keys as USDAClient)."""
+        return {name: float(v) for name, v in zip(NUTRIENT_FIELDS, self._nutrients[row])}
+
+    def search(self, query: str, limit: int) -> List[int]:
+        """
+        Rows best matching query, best first.
+
+        Args:
+            query: Search text (e.g. a build_search_label result)
+            limit: Max rows returned
+
+        Returns:
+            Row numbers (empty when no query token matches)
+        """
+        tokens = list(dict.fromkeys(tokenize(query)))
+        size = len(self)
+        if not tokens or not size:
+            return []
+
+        matched = np.zeros(size, dtype=np.int32)
+        relevance = np.zeros(size, dtype=np.float64)
+        for token in tokens:
+            grams = trigrams(token)
+            # Rows of each trigram are distinct: bincount = trigrams per row
+            counts = np.bincount(
+                np.concatenate([self._trigrams.rows(gram) for gram in grams]), minlength=size
+            )
+            score = counts / len(grams)
+            score[score < FUZZY_MIN_SIMILARITY] = 0.0
+            score[self._tokens.rows(token)] = 1.0
+            matched += score > 0
+            relevance += score
+
+        candidates = np.flatnonzero(matched)
+        if not candidates.size:
+            return []
+        # lexsort: last key is the primary one
+        order = np.lexsort(
+            (
+                self._fdc_ids[candidates],
+                self._doc_tokens[candidates],
+                -relevance[candidates],
+                -matched[candidates],
+            )
+        )
+        return [int(row) for row in candidates[order[:limit]]]
@@ -0,0 +1,110 @@
+"""Offline USDA nutrition provider backed by the local FoodData Central index.
+
+Implements INutritionProvider with the same selection as USDAClient
+(label normalization, raw preference, the first SEARCH_PAGE_SIZE results
+ranked by naturalness, first food with calories > 0), but reads the
+memory-mapped index built by scripts/import_fdc_local.py: no network,
+no API key, no rate limit.
+"""
+
+import logging
+from typing import Any, Optional
+
+from domain.meal.nutrition.entities.nutrient_profile import NutrientProfile
+from infrastructure.external_apis.usda.client import (
+    SEARCH_PAGE_SIZE,
+    build_search_label,
+    normalize_food_label,
+    score_food_naturalness,
+)
+from infrastructure.external_apis.usda.local_index import FDCLocalIndex
+
+logger = logging.getLogger(__name__)
+
+
+class USDALocalProvider:
+    """
+    Local FoodData Central nutrition provider implementing INutritionProvider port.
+
+    Example:
+        >>> async with USDALocalProvider(".cache/fdc_local") as provider:
+        ...     profile = await provider.get_nutrients("chicken breast", 100.0)
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize provider (the index is opened on first use).
+
+        Args:
+            path: Index directory written by scripts/import_fdc_local.py
+        """
+        self._path = path
+        self._index: Optional[FDCLocalIndex] = None
+
+    @property
+    def index(self) -> FDCLocalIndex:
+        """Opened index."""
+        if self._index is None:
+            self._index = FDCLocalIndex(self._path)
+            logger.info(
+                "Local FDC index opened",
+                extra={"path": self._path, "foods": len(self._index)},
+            )
+        return self._index
+
+    async def __aenter__(self) -> "USDALocalProvider":
+        """Async context manager entry (opens the index, failing fast if missing)."""
+        _ = self.index
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Async context manager exit (mappings are released with the index)."""
+
+    async def get_nutrients(self, identifier: str, quantity_g: float) -> Optional[NutrientProfile]:
+        """
+        Get per-100g nutrient profile for a food identifier.
+
+        Implements INutritionProvider.get_nutrients() port.
+
+        Args:
+            identifier: Food label/name (e.g., "chicken breast", "banana")
+            quantity_g: Reference quantity in grams (typically 100.0)
+
+        Returns:
+            NutrientProfile if found, None if not available
+        """
+        index = self.index
+        search_label = build_search_label(normalize_food_label(identifier))
+        rows = index.search(search_label, limit=SEARCH_PAGE_SIZE)
+
+        # Stable sort: search order breaks naturalness ties, as in USDAClient
+        ranked = sorted(
+            rows, key=lambda row: score_food_naturalness(index.description(row)), reverse=True
+        )
+        for row in ranked:
+            nutrients = index.nutrients(row)
+            if nutrients["calories"] > 0:
+                logger.debug(
+                    "Local FDC food selected",
+                    extra={
+                        "identifier": identifier,
+                        "fdc_id": index.fdc_id(row),
+                        "description": index.description(row),
+                    },
+                )
+                # Per 100g, scaled by the enrichment service
+                return NutrientProfile(
+                    calories=int(nutrients["calories"]),
+                    protein=nutrients["protein"],
+                    carbs=nutrients["carbs"],
+                    fat=nutrients["fat"],
+                    fiber=nutrients["fiber"],
+                    sugar=nutrients["sugar"],
+                    sodium=nutrients["sodium"],
+                    quantity_g=100.0,
+                    source="USDA",
+                    confidence=0.95,
+                )
+
+        logger.info("No local FDC results", extra={"identifier": identifier})
+        return None
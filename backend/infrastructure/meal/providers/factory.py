@@ -16,6 +16,10 @@ Usage:
     vision = create_vision_provider()  # Returns stub or real based on env
     nutrition = create_nutrition_provider()
     barcode = create_barcode_provider()
+
+Real nutrition and barcode providers are wrapped in a single-flight layer
+(concurrent identical lookups share one upstream request) unless
+PROVIDER_SINGLE_FLIGHT_ENABLED=0.
 """
 
 import os
@@ -30,10 +34,27 @@ from domain.meal.barcode.ports.barcode_provider import IBarcodeProvider
 from infrastructure.meal.providers.stub_vision_provider import StubVisionProvider
 from infrastructure.meal.providers.stub_nutrition_provider import StubNutritionProvider
 from infrastructure.meal.providers.stub_barcode_provider import StubBarcodeProvider
+from infrastructure.meal.providers.single_flight import (
+    SingleFlightBarcodeProvider,
+    SingleFlightNutritionProvider,
+)
+
+from infrastructure.config import (
+    get_usda_cache_max_memory_entries,
+    get_usda_cache_negative_ttl_seconds,
+    get_usda_cache_path,
+    get_usda_cache_ttl_seconds,
+    get_usda_local_index_path,
+    is_provider_single_flight_enabled,
+    is_usda_cache_enabled,
+)
 
 # Real providers (require API keys)
 from infrastructure.ai.openai.client import OpenAIVisionClient
+from infrastructure.external_apis.usda.cache import USDANutrientCache
 from infrastructure.external_apis.usda.client import USDAClient
+from infrastructure.external_apis.usda.local_index import FDCLocalIndex
+from infrastructure.external_apis.usda.local_provider import USDALocalProvider
 from infrastructure.external_apis.openfoodfacts.client import OpenFoodFactsClient
 
 
@@ -76,7 +97,11 @@ def create_nutrition_provider() -> INutritionProvider:
 
     Environment variable: NUTRITION_PROVIDER
     Values:
-        - "usda": USDA FoodData Central API (requires USDA_API_KEY)
+        - "usda": USDA FoodData Central API (requires USDA_API_KEY), with the
+          label/nutrient cache unless USDA_CACHE_ENABLED=0, in a
+          SingleFlightNutritionProvider unless PROVIDER_SINGLE_FLIGHT_ENABLED=0
+        - "usda_local": Offline FoodData Central index at USDA_LOCAL_INDEX_PATH
+          (built by scripts/import_fdc_local.py, no network)
         - "stub": Stub provider (default)
 
     Returns:
@@ -99,7 +124,27 @@ def create_nutrition_provider() -> INutritionProvider:
                 "NUTRITION_PROVIDER=usda but AI_USDA_API_KEY not set. "
                 "Set AI_USDA_API_KEY in .env or use NUTRITION_PROVIDER=stub"
             )
-        return USDAClient(api_key=api_key)
+        cache = None
+        if is_usda_cache_enabled():
+            cache = USDANutrientCache(
+                path=get_usda_cache_path(),
+                ttl_seconds=get_usda_cache_ttl_seconds(),
+                negative_ttl_seconds=get_usda_cache_negative_ttl_seconds(),
+                max_memory_entries=get_usda_cache_max_memory_entries(),
+            )
+        client = USDAClient(api_key=api_key, cache=cache)
+        if is_provider_single_flight_enabled():
+            return SingleFlightNutritionProvider(client, name="usda")
+        return client
+
+    if mode == "usda_local":
+        path = get_usda_local_index_path()
+        if not FDCLocalIndex.exists(path):
+            raise ValueError(
+                f"NUTRITION_PROVIDER=usda_local but no index at {path}. "
+                "Run scripts/import_fdc_local.py or set USDA_LOCAL_INDEX_PATH"
+            )
+        return USDALocalProvider(path)
 
     # Default: stub (safe fallback)
     return StubNutritionProvider()
@@ -110,7 +155,8 @@ def create_barcode_provider() -> IBarcodeProvider:
 
     Environment variable: BARCODE_PROVIDER
     Values:
-        - "openfoodfacts": OpenFoodFacts API (public, no key required)
+        - "openfoodfacts": OpenFoodFacts API (public, no key required), in a
+          SingleFlightBarcodeProvider unless PROVIDER_SINGLE_FLIGHT_ENABLED=0
         - "stub": Stub provider (default)
 
     Returns:
@@ -126,6 +172,8 @@ def create_barcode_provider() -> IBarcodeProvider:
     mode = os.getenv("BARCODE_PROVIDER", "stub").lower()
 
     if mode == "openfoodfacts":
+        if is_provider_single_flight_enabled():
+            return SingleFlightBarcodeProvider(OpenFoodFactsClient(), name="openfoodfacts")
         return OpenFoodFactsClient()
 
     # Default: stub (safe fallback)
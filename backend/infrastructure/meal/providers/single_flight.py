@@ -0,0 +1,205 @@
+"""Single-flight coalescing of identical provider lookups.
+
+When several requests look up the same label or barcode at the same time,
+each would fire its own identical upstream call (USDA search + details,
+OpenFoodFacts product). SingleFlight runs one call per key: concurrent
+callers with the same key await the same in-flight task and receive its
+result, or its exception. The key is released as soon as the call
+completes, so nothing is cached here (caching is the client's job).
+
+The shared call runs in its own task: a caller that is cancelled (client
+disconnect, timeout) stops waiting without cancelling the lookup for the
+other callers.
+
+Metrics (metrics.core.registry, tag provider):
+    provider_single_flight_calls (tag outcome: leader | coalesced)
+    provider_single_flight_coalescing_rate (gauge, coalesced / calls)
+"""
+
+import asyncio
+import dataclasses
+from threading import Lock
+from typing import Any, Awaitable, Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+from domain.meal.barcode.entities.barcode_product import BarcodeProduct
+from domain.meal.barcode.ports.barcode_provider import IBarcodeProvider
+from domain.meal.nutrition.entities.nutrient_profile import NutrientProfile
+from domain.meal.nutrition.ports.nutrition_provider import INutritionProvider
+from metrics.core import registry
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """
+    Coalesce concurrent calls with the same key into one execution.
+
+    Example:
+        >>> flight: SingleFlight[Optional[BarcodeProduct]] = SingleFlight("barcode")
+        >>> product = await flight.do(barcode, lambda: client.lookup_barcode(barcode))
+    """
+
+    def __init__(self, name: str):
+        """
+        Initialize single-flight group.
+
+        Args:
+            name: Provider name, used as metric tag
+        """
+        self._name = name
+        # In-flight tasks per (event loop, key): tasks cannot be awaited
+        # from another loop (the factory singletons may serve several)
+        self._in_flight: Dict[Tuple[asyncio.AbstractEventLoop, Hashable], "asyncio.Task[T]"] = {}
+        self._lock = Lock()
+        self._calls = 0
+        self._coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run fn, or join the in-flight call with the same key.
+
+        Args:
+            key: Lookup identity (callers with equal keys share the result)
+            fn: Coroutine factory, called only by the first caller
+
+        Returns:
+            Result of the shared call
+
+        Raises:
+            Exception: Whatever the shared call raised, to every caller
+        """
+        loop = asyncio.get_running_loop()
+        flight_key = (loop, key)
+        task = self._in_flight.get(flight_key)
+        coalesced = task is not None
+        if task is None:
+            task = loop.create_task(self._run(fn))
+            self._in_flight[flight_key] = task
+            task.add_done_callback(lambda done: self._release(flight_key, done))
+        self._record(coalesced)
+        # shield: a cancelled caller does not cancel the call of the others
+        return await asyncio.shield(task)
+
+    def stats(self) -> Dict[str, Any]:
+        """Calls, coalesced calls, coalescing rate and in-flight keys."""
+        with self._lock:
+            return {
+                "calls": self._calls,
+                "coalesced": self._coalesced,
+                "coalescing_rate": self._rate(),
+                "in_flight": len(self._in_flight),
+            }
+
+    @staticmethod
+    async def _run(fn: Callable[[], Awaitable[T]]) -> T:
+        return await fn()
+
+    def _release(self, flight_key: Tuple[asyncio.AbstractEventLoop, Hashable], task: Any) -> None:
+        if self._in_flight.get(flight_key) is task:
+            del self._in_flight[flight_key]
+        if not task.cancelled():
+            # Mark the exception retrieved: callers may all have been cancelled
+            task.exception()
+
+    def _record(self, coalesced: bool) -> None:
+        with self._lock:
+            self._calls += 1
+            if coalesced:
+                self._coalesced += 1
+            rate = self._rate()
+        outcome = "coalesced" if coalesced else "leader"
+        registry.counter("provider_single_flight_calls", provider=self._name, outcome=outcome).inc()
+        registry.gauge("provider_single_flight_coalescing_rate", provider=self._name).set(rate)
+
+    def _rate(self) -> float:
+        return self._coalesced / self._calls if self._calls else 0.0
+
+
+class _SingleFlightProvider:
+    """Provider wrapper: lifecycle and other attributes go to the inner provider."""
+
+    def __init__(self, inner: Any, name: str):
+        self._inner = inner
+        self._flight: SingleFlight[Any] = SingleFlight(name)
+
+    @property
+    def inner(self) -> Any:
+        """Wrapped provider."""
+        return self._inner
+
+    @property
+    def flight(self) -> SingleFlight[Any]:
+        """Single-flight group (stats)."""
+        return self._flight
+
+    async def __aenter__(self) -> Any:
+        if hasattr(self._inner, "__aenter__"):
+            await self._inner.__aenter__()
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        if hasattr(self._inner, "__aexit__"):
+            await self._inner.__aexit__(exc_type, exc_val, exc_tb)
+
+    def __getattr__(self, name: str) -> Any:
+        # Provider-specific API (e.g. USDAClient.search_food) is not coalesced
+        return getattr(self._inner, name)
+
+
+class SingleFlightNutritionProvider(_SingleFlightProvider):
+    """
+    INutritionProvider coalescing concurrent identical get_nutrients calls.
+
+    Example:
+        >>> provider = SingleFlightNutritionProvider(USDAClient(api_key=key))
+        >>> async with provider:
+        ...     profile = await provider.get_nutrients("pasta", 100.0)
+    """
+
+    def __init__(self, inner: INutritionProvider, name: str = "nutrition"):
+        """
+        Initialize wrapper.
+
+        Args:
+            inner: Provider performing the lookups
+            name: Metric tag
+        """
+        super().__init__(inner, name)
+
+    async def get_nutrients(self, identifier: str, quantity_g: float) -> Optional[NutrientProfile]:
+        """Nutrients of identifier; one upstream lookup per concurrent key."""
+        profile: Optional[NutrientProfile] = await self._flight.do(
+            ("nutrients", identifier, quantity_g),
+            lambda: self._inner.get_nutrients(identifier, quantity_g),
+        )
+        # NutrientProfile is mutable: every caller gets its own copy
+        return dataclasses.replace(profile) if profile is not None else None
+
+
+class SingleFlightBarcodeProvider(_SingleFlightProvider):
+    """
+    IBarcodeProvider coalescing concurrent lookups of the same barcode.
+
+    Example:
+        >>> provider = SingleFlightBarcodeProvider(OpenFoodFactsClient())
+        >>> async with provider:
+        ...     product = await provider.lookup_barcode("8001505005707")
+    """
+
+    def __init__(self, inner: IBarcodeProvider, name: str = "barcode"):
+        """
+        Initialize wrapper.
+
+        Args:
+            inner: Provider performing the lookups
+            name: Metric tag
+        """
+        super().__init__(inner, name)
+
+    async def lookup_barcode(self, barcode: str) -> Optional[BarcodeProduct]:
+        """Product of barcode; one upstream lookup per concurrent barcode."""
+        product: Optional[BarcodeProduct] = await self._flight.do(
+            ("barcode", barcode),
+            lambda: self._inner.lookup_barcode(barcode),
+        )
+        return product
@@ -18,7 +18,8 @@ def create_activity_repository() -> IActivityRepository:
 
     Uses global REPOSITORY_BACKEND variable for consistency across domains:
     - inmemory: InMemoryActivityRepository (wraps legacy repos)
-    - mongodb: MongoActivityRepository (future implementation)
+    - mongodb: MongoActivityRepository, or MongoActivityTimeSeriesRepository
+      when MONGODB_ACTIVITY_TIMESERIES=1
 
     Returns:
         IActivityRepository: Repository instance (singleton pattern)
@@ -29,6 +30,8 @@ def create_activity_repository() -> IActivityRepository:
     Environment Variables:
         REPOSITORY_BACKEND: Repository type (inmemory | mongodb)
             Default: inmemory
+        MONGODB_ACTIVITY_TIMESERIES: 1 = time-series collection for events
+            Default: 0
 
     Examples:
         >>> # .env
@@ -53,9 +56,16 @@ def create_activity_repository() -> IActivityRepository:
         return _repository_instance
 
     if mode == "mongodb":
-        from infrastructure.persistence.mongodb import MongoActivityRepository
+        from infrastructure.config import is_activity_timeseries_enabled
+        from infrastructure.persistence.mongodb import (
+            MongoActivityRepository,
+            MongoActivityTimeSeriesRepository,
+        )
 
-        _repository_instance = MongoActivityRepository()
+        if is_activity_timeseries_enabled():
+            _repository_instance = MongoActivityTimeSeriesRepository()
+        else:
+            _repository_instance = MongoActivityRepository()
         return _repository_instance
 
     raise ValueError(
@@ -1,15 +1,32 @@
 """In-memory meal repository implementation.
 
-Provides an in-memory implementation of IMealRepository port for testing.
-Uses a dictionary for storage with no external dependencies.
+Provides an in-memory implementation of IMealRepository and IMealSearch
+ports for testing and single-node deployments. Uses a dictionary for
+storage, per-user timestamp-sorted key lists for listing and range
+queries (bisection instead of full scans), a per-user inverted index for
+search and per-user daily rollups, with no external dependencies.
 """
 
-from typing import Optional, Dict, List
-from datetime import datetime, timezone
+from bisect import bisect_left, bisect_right, insort
+from typing import Optional, Dict, List, Sequence, Tuple
+from datetime import date, datetime, timezone
 from uuid import UUID
-from copy import deepcopy
+from copy import copy
+from dataclasses import replace
 
 from domain.meal.core.entities.meal import Meal
+from domain.meal.core.services.search_text import (
+    PREFIX_MATCH_FACTOR,
+    meal_search_fields,
+    tokenize,
+    weighted_tokens,
+)
+from domain.shared.ports.meal_repository import (
+    MealCursor,
+    MealPeriodTotals,
+    MealProjection,
+    rollup_day,
+)
 
 
 class InMemoryMealRepository:
@@ -21,6 +38,8 @@ class InMemoryMealRepository:
 
     Thread safety: NOT thread-safe (use locks if needed in production)
     Persistence: Data lost on process restart (in-memory only)
+    Complexity: listing, range and count queries bisect the user's sorted
+    keys, so they cost O(log n + returned meals) instead of a full scan.
 
     Example:
         >>> repository = InMemoryMealRepository()
@@ -32,6 +51,14 @@ class InMemoryMealRepository:
     def __init__(self) -> None:
         """Initialize repository with empty storage."""
         self._storage: Dict[UUID, Meal] = {}
+        # Per-user keys sorted ascending: (naive timestamp, id string)
+        self._user_keys: Dict[str, List[Tuple[datetime, str]]] = {}
+        # Search index: user_id -> token -> meal_id -> field weight
+        self._search_index: Dict[str, Dict[str, Dict[UUID, float]]] = {}
+        # Sorted tokens per user, for prefix lookups by bisection
+        self._search_tokens: Dict[str, List[str]] = {}
+        # Daily rollups: user_id -> UTC day -> (totals, meal count by type)
+        self._daily_rollups: Dict[str, Dict[date, Tuple[MealPeriodTotals, Dict[str, int]]]] = {}
 
     async def save(self, meal: Meal) -> None:
         """
@@ -41,25 +68,63 @@ class InMemoryMealRepository:
             meal: Meal entity to save
 
         Note:
-            - Stores a deep copy to prevent external modifications
+            - Stores a snapshot to prevent external modifications
             - Updates meal.updated_at to current UTC time
         """
         # Update timestamp
         meal.updated_at = datetime.now(timezone.utc)
 
-        # Store deep copy to prevent external modifications
-        self._storage[meal.id] = deepcopy(meal)
+        # Store snapshot to prevent external modifications
+        previous = self._storage.get(meal.id)
+        if previous is not None:
+            self._rollup(previous, -1)
+            self._remove_key(previous)
+        self._unindex(meal.id)
+        self._storage[meal.id] = self._snapshot(meal)
+        insort(self._user_keys.setdefault(meal.user_id, []), self._history_key(meal))
+        self._index(meal)
+        self._rollup(meal, 1)
+
+    @staticmethod
+    def _snapshot(meal: Meal) -> Meal:
+        """
+        Copy a meal and its entries, sharing their field values.
+
+        Every field of Meal and MealEntry other than Meal.entries holds an
+        immutable value (str, number, UUID, datetime), so copying the two
+        dataclass levels isolates the copy like deepcopy does, at a
+        fraction of the cost.
+        """
+        snapshot = copy(meal)
+        snapshot.entries = [copy(entry) for entry in meal.entries]
+        return snapshot
+
+    @classmethod
+    def _copy(cls, meal: Meal, projection: Optional[MealProjection] = None) -> Meal:
+        """
+        Copy a stored meal for the caller.
+
+        Full meals are snapshots. When the projection leaves out entries,
+        a shallow copy without entries is enough, mirroring MongoDB
+        partial hydration.
+        """
+        if projection is not None and not projection.includes_entries:
+            return replace(meal, entries=[])
+        return cls._snapshot(meal)
 
-    async def get_by_id(self, meal_id: UUID, user_id: str) -> Optional[Meal]:
+    async def get_by_id(
+        self, meal_id: UUID, user_id: str, projection: Optional[MealProjection] = None
+    ) -> Optional[Meal]:
         """
         Retrieve meal by ID for a specific user.
 
         Args:
             meal_id: Unique meal identifier
             user_id: User identifier (for authorization)
+            projection: Fields to load (default: full meal)
 
         Returns:
-            Deep copy of Meal if found and belongs to user, None otherwise
+            Copy of Meal if found and belongs to user, None otherwise
         """
         meal = self._storage.get(meal_id)
 
@@ -67,14 +132,39 @@ class InMemoryMealRepository:
         if meal is None or meal.user_id != user_id:
             return None
 
-        # Return deep copy to prevent external modifications
-        return deepcopy(meal)
+        # Return copy to prevent external modifications
+        return self._copy(meal, projection)
+
+    async def get_by_ids(
+        self,
+        meal_ids: Sequence[UUID],
+        user_id: str,
+        projection: Optional[MealProjection] = None,
+    ) -> List[Meal]:
+        """
+        Retrieve several meals of a user.
+
+        Args:
+            meal_ids: Meal identifiers (duplicates allowed)
+            user_id: User identifier (for authorization)
+            projection: Fields to load (default: full meal)
+
+        Returns:
+            Copies of the meals found and belonging to user
+        """
+        meals = (self._storage.get(meal_id) for meal_id in dict.fromkeys(meal_ids))
+        return [
+            self._copy(meal, projection)
+            for meal in meals
+            if meal is not None and meal.user_id == user_id
+        ]
 
     async def get_by_user(
         self,
         user_id: str,
         limit: int = 100,
         offset: int = 0,
+        projection: Optional[MealProjection] = None,
     ) -> List[Meal]:
         """
         Get meals for a user with pagination.
@@ -83,21 +173,20 @@ class InMemoryMealRepository:
             user_id: User identifier
             limit: Maximum number of meals to return
             offset: Number of meals to skip
+            projection: Fields to load (default: full meals)
 
         Returns:
-            List of meal deep copies ordered by timestamp descending
+            List of meal copies ordered by timestamp descending
         """
-        # Filter by user
-        user_meals = [meal for meal in self._storage.values() if meal.user_id == user_id]
-
-        # Sort by timestamp descending (newest first)
-        user_meals.sort(key=lambda m: m.timestamp, reverse=True)
+        keys = self._user_keys.get(user_id, [])
 
-        # Apply pagination
-        paginated = user_meals[offset : offset + limit]
+        # Newest first: walk the ascending keys backwards
+        stop = len(keys) - offset
+        start = max(stop - limit, 0)
+        if stop <= 0 or limit <= 0:
+            return []
 
-        # Return deep copies
-        return [deepcopy(meal) for meal in paginated]
+        return [self._copy(meal, projection) for meal in reversed(self._meals(keys[start:stop]))]
 
     async def get_by_user_and_date_range(
         self,
@@ -114,30 +203,296 @@ class InMemoryMealRepository:
             end_date: End of date range (inclusive)
 
         Returns:
-            List of meal deep copies ordered by timestamp ascending
-        """
-        # Normalize dates to naive UTC for comparison
-        if start_date.tzinfo is not None:
-            start_date = start_date.replace(tzinfo=None)
-        if end_date.tzinfo is not None:
-            end_date = end_date.replace(tzinfo=None)
-
-        # Filter by user and date range
-        # Note: meal.timestamp is timezone-aware, normalize it
-        filtered_meals = [
-            meal
-            for meal in self._storage.values()
-            if (
-                meal.user_id == user_id
-                and start_date <= meal.timestamp.replace(tzinfo=None) <= end_date
-            )
-        ]
+            List of meal copies ordered by timestamp ascending
+        """
+        keys = self._user_keys.get(user_id, [])
+        low, high = self._key_range(keys, start_date, end_date)
+        return [self._copy(meal) for meal in self._meals(keys[low:high])]
+
+    @staticmethod
+    def _history_key(meal: Meal) -> Tuple[datetime, str]:
+        """Sort key of a meal: (timestamp, id as stored by MongoDB)."""
+        return (meal.timestamp.replace(tzinfo=None), str(meal.id))
+
+    @staticmethod
+    def _key_range(
+        keys: List[Tuple[datetime, str]],
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+    ) -> Tuple[int, int]:
+        """
+        Bisect the slice of sorted keys within an inclusive date range.
+
+        Timestamps are compared naive (tzinfo dropped), on both sides.
+        """
+        low = 0
+        high = len(keys)
+        if start_date is not None:
+            low = bisect_left(keys, start_date.replace(tzinfo=None), key=lambda k: k[0])
+        if end_date is not None:
+            high = bisect_right(keys, end_date.replace(tzinfo=None), key=lambda k: k[0])
+        return low, max(low, high)
+
+    def _meals(self, keys: List[Tuple[datetime, str]]) -> List[Meal]:
+        """Resolve keys to stored meals (not copied)."""
+        return [self._storage[UUID(meal_id)] for _, meal_id in keys]
+
+    def _remove_key(self, meal: Meal) -> None:
+        """Remove a stored meal from its user's sorted keys."""
+        keys = self._user_keys[meal.user_id]
+        del keys[bisect_left(keys, self._history_key(meal))]
+        if not keys:
+            del self._user_keys[meal.user_id]
+
+    def _filter_history(
+        self,
+        user_id: str,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        meal_type: Optional[str],
+        after: Optional[MealCursor] = None,
+    ) -> List[Tuple[datetime, str]]:
+        """Return sorted keys of meals matching history filters (ascending)."""
+        keys = self._user_keys.get(user_id, [])
+        low, high = self._key_range(keys, start_date, end_date)
+        if after is not None:
+            cursor_key = (after.timestamp.replace(tzinfo=None), str(after.meal_id))
+            high = max(low, min(high, bisect_left(keys, cursor_key)))
+
+        selected = keys[low:high]
+        if meal_type is not None:
+            selected = [
+                key for key in selected if self._storage[UUID(key[1])].meal_type == meal_type
+            ]
+        return selected
+
+    async def get_history_page(
+        self,
+        user_id: str,
+        limit: int,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        meal_type: Optional[str] = None,
+        after: Optional[MealCursor] = None,
+        offset: int = 0,
+        projection: Optional[MealProjection] = None,
+    ) -> List[Meal]:
+        """
+        Get one page of meal history with filters applied before paging.
+
+        Args:
+            user_id: User identifier
+            limit: Maximum number of meals to return
+            start_date: Start of date range (inclusive, optional)
+            end_date: End of date range (inclusive, optional)
+            meal_type: Only meals of this type (optional)
+            after: Keyset cursor, return meals strictly after it (optional)
+            offset: Number of meals to skip (after the cursor, if any)
+            projection: Fields to load (default: full meals)
+
+        Returns:
+            List of meal copies ordered by (timestamp, id) descending
+        """
+        keys = self._filter_history(user_id, start_date, end_date, meal_type, after)
+
+        # Newest first: walk the ascending keys backwards
+        stop = len(keys) - offset
+        start = max(stop - limit, 0)
+        if stop <= 0 or limit <= 0:
+            return []
+
+        return [self._copy(meal, projection) for meal in reversed(self._meals(keys[start:stop]))]
+
+    async def count_history(
+        self,
+        user_id: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        meal_type: Optional[str] = None,
+    ) -> int:
+        """
+        Count meals matching history filters.
 
-        # Sort by timestamp ascending (oldest first)
-        filtered_meals.sort(key=lambda m: m.timestamp)
+        Args:
+            user_id: User identifier
+            start_date: Start of date range (inclusive, optional)
+            end_date: End of date range (inclusive, optional)
+            meal_type: Only meals of this type (optional)
+
+        Returns:
+            Number of matching meals
+        """
+        if meal_type is None:
+            low, high = self._key_range(self._user_keys.get(user_id, []), start_date, end_date)
+            return high - low
+        return len(self._filter_history(user_id, start_date, end_date, meal_type))
+
+    async def aggregate_by_period(
+        self,
+        user_id: str,
+        periods: List[Tuple[datetime, datetime]],
+    ) -> Dict[int, MealPeriodTotals]:
+        """
+        Aggregate meal totals per period in a single pass.
 
-        # Return deep copies
-        return [deepcopy(meal) for meal in filtered_meals]
+        Only the user's meals within the whole range are visited (bisected
+        from the sorted keys); each is assigned to its period by bisecting
+        the sorted period starts, so the cost is
+        O(meals in range * log(periods)) with no copies.
+
+        Args:
+            user_id: User identifier
+            periods: Sorted, contiguous (period_start, period_end) tuples
+
+        Returns:
+            Mapping period index -> totals (only periods with meals)
+        """
+        if not periods:
+            return {}
+
+        # Same naive comparison as get_by_user_and_date_range
+        starts = [start.replace(tzinfo=None) for start, _ in periods]
+        range_end = periods[-1][1].replace(tzinfo=None)
+
+        keys = self._user_keys.get(user_id, [])
+        low, high = self._key_range(keys, starts[0], range_end)
+
+        results: Dict[int, MealPeriodTotals] = {}
+        for ts, meal_id in keys[low:high]:
+            meal = self._storage[UUID(meal_id)]
+            index = bisect_right(starts, ts) - 1
+            results.setdefault(index, MealPeriodTotals()).add(MealPeriodTotals.from_meal(meal))
+
+        return results
+
+    async def get_daily_totals(
+        self,
+        user_id: str,
+        start_day: date,
+        end_day: date,
+    ) -> Optional[Dict[date, MealPeriodTotals]]:
+        """
+        Read per-day totals maintained on save and delete.
+
+        Args:
+            user_id: User identifier
+            start_day: First UTC day (inclusive)
+            end_day: Last UTC day (inclusive)
+
+        Returns:
+            Mapping day -> totals (only days with meals)
+        """
+        results: Dict[date, MealPeriodTotals] = {}
+        for day, (totals, _) in self._daily_rollups.get(user_id, {}).items():
+            if start_day <= day <= end_day:
+                results[day] = replace(totals, breakdown_by_type=dict(totals.breakdown_by_type))
+        return results
+
+    def _rollup(self, meal: Meal, sign: int) -> None:
+        """Add (sign=1) or subtract (sign=-1) a meal to its daily rollup."""
+        days = self._daily_rollups.setdefault(meal.user_id, {})
+        day = rollup_day(meal.timestamp)
+        totals, type_counts = days.setdefault(day, (MealPeriodTotals(), {}))
+        totals.add(MealPeriodTotals.from_meal(meal, sign))
+        type_counts[meal.meal_type] = type_counts.get(meal.meal_type, 0) + sign
+
+        # Drop emptied days and meal types (no float residue left behind)
+        if totals.meal_count <= 0:
+            del days[day]
+        elif type_counts[meal.meal_type] <= 0:
+            del type_counts[meal.meal_type]
+            totals.breakdown_by_type.pop(meal.meal_type, None)
+
+    async def search(
+        self,
+        user_id: str,
+        query_text: str,
+        limit: int = 50,
+        offset: int = 0,
+        projection: Optional[MealProjection] = None,
+    ) -> List[Meal]:
+        """
+        Search meals of a user through the inverted index.
+
+        Each query term is looked up as a prefix in the user's sorted
+        token list; a meal matches when every term matches one of its
+        tokens. Score is the sum over terms of the best field weight
+        (halved for prefix-only matches).
+
+        Args:
+            user_id: User identifier
+            query_text: Free text
+            limit: Maximum number of meals to return
+            offset: Number of ranked meals to skip
+            projection: Fields to load (default: full meals)
+
+        Returns:
+            Copies of matching meals, most relevant first
+        """
+        terms = tokenize(query_text)
+        user_index = self._search_index.get(user_id)
+        if not terms or not user_index:
+            return []
+        tokens = self._search_tokens[user_id]
+
+        scores: Optional[Dict[UUID, float]] = None
+        for term in terms:
+            term_scores: Dict[UUID, float] = {}
+            i = bisect_left(tokens, term)
+            while i < len(tokens) and tokens[i].startswith(term):
+                factor = 1.0 if tokens[i] == term else PREFIX_MATCH_FACTOR
+                for meal_id, weight in user_index[tokens[i]].items():
+                    term_scores[meal_id] = max(term_scores.get(meal_id, 0.0), weight * factor)
+                i += 1
+
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {
+                    meal_id: scores[meal_id] + score
+                    for meal_id, score in term_scores.items()
+                    if meal_id in scores
+                }
+            if not scores:
+                return []
+
+        assert scores is not None  # For mypy
+        ranked = sorted(
+            scores,
+            key=lambda meal_id: (scores[meal_id], self._storage[meal_id].timestamp),
+            reverse=True,
+        )
+        return [
+            self._copy(self._storage[meal_id], projection)
+            for meal_id in ranked[offset : offset + limit]
+        ]
+
+    def _index(self, meal: Meal) -> None:
+        """Add a meal to its user's search index."""
+        user_index = self._search_index.setdefault(meal.user_id, {})
+        user_tokens = self._search_tokens.setdefault(meal.user_id, [])
+        for token, weight in weighted_tokens(meal_search_fields(meal)).items():
+            postings = user_index.get(token)
+            if postings is None:
+                postings = user_index[token] = {}
+                insort(user_tokens, token)
+            postings[meal.id] = weight
+
+    def _unindex(self, meal_id: UUID) -> None:
+        """Remove a stored meal from its user's search index."""
+        meal = self._storage.get(meal_id)
+        if meal is None:
+            return
+        user_index = self._search_index.get(meal.user_id, {})
+        user_tokens = self._search_tokens.get(meal.user_id, [])
+        for token in weighted_tokens(meal_search_fields(meal)):
+            postings = user_index.get(token)
+            if postings is None:
+                continue
+            postings.pop(meal_id, None)
+            if not postings:
+                del user_index[token]
+                del user_tokens[bisect_left(user_tokens, token)]
 
     async def delete(self, meal_id: UUID, user_id: str) -> bool:
         """
@@ -157,6 +512,9 @@ class InMemoryMealRepository:
             return False
 
         # Delete from storage
+        self._unindex(meal_id)
+        self._rollup(meal, -1)
+        self._remove_key(meal)
         del self._storage[meal_id]
         return True
 
@@ -184,7 +542,7 @@ class InMemoryMealRepository:
         Returns:
             Total number of meals for user
         """
-        return sum(1 for meal in self._storage.values() if meal.user_id == user_id)
+        return len(self._user_keys.get(user_id, []))
 
     def clear(self) -> None:
         """
@@ -193,3 +551,7 @@ class InMemoryMealRepository:
         Note: Utility method for testing - not part of IMealRepository port
         """
         self._storage.clear()
+        self._user_keys.clear()
+        self._search_index.clear()
+        self._search_tokens.clear()
+        self._daily_rollups.clear()
@@ -1,7 +1,7 @@
 """In-memory implementation of IProfileRepository for testing."""
 
 from copy import deepcopy
-from typing import Optional
+from typing import List, Optional, Sequence
 
 from domain.nutritional_profile.core.entities.nutritional_profile import (
     NutritionalProfile,
@@ -62,6 +62,34 @@ class InMemoryProfileRepository(IProfileRepository):
                 return deepcopy(profile)
         return None
 
+    async def find_by_ids(self, profile_ids: Sequence[ProfileId]) -> List[NutritionalProfile]:
+        """
+        Find several profiles by ID.
+
+        Args:
+            profile_ids: Profile IDs to search for
+
+        Returns:
+            Deep copies of the profiles found
+        """
+        keys = dict.fromkeys(str(profile_id) for profile_id in profile_ids)
+        return [deepcopy(self._profiles[key]) for key in keys if key in self._profiles]
+
+    async def find_by_user_ids(self, user_ids: Sequence[str]) -> List[NutritionalProfile]:
+        """
+        Find the profiles of several users.
+
+        Args:
+            user_ids: User IDs to search for
+
+        Returns:
+            Deep copies of the profiles found
+        """
+        wanted = set(user_ids)
+        return [
+            deepcopy(profile) for profile in self._profiles.values() if profile.user_id in wanted
+        ]
+
     async def delete(self, profile_id: ProfileId) -> None:
         """
         Delete profile by ID (soft delete).
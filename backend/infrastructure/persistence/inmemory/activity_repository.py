@@ -6,14 +6,18 @@ mantenendo piena backward compatibility mentre uniforma l'interfaccia.
 
 from __future__ import annotations
 
+from datetime import datetime
 from typing import List, Optional, Tuple, Dict, Any
 
-from domain.activity.repository import IActivityRepository
+from domain.activity.repository import ActivityPeriodTotals, IActivityRepository
 from domain.activity.model import (
     ActivityEvent,
     HealthSnapshot,
     ActivityDelta,
     ActivitySource as DomainActivitySource,
+    IDEMPOTENCY_CONFLICT,
+    batch_signature,
+    format_ts_bound,
 )
 
 
@@ -47,7 +51,38 @@ class InMemoryActivityRepository(IActivityRepository):
         events: List[ActivityEvent],
         idempotency_key: Optional[str] = None,
     ) -> Tuple[int, int, List[Tuple[int, str]]]:
-        """Ingest batch eventi con conversione domain → legacy format."""
+        """Ingest batch eventi con conversione domain → legacy format.
+
+        Con idempotency_key stessa semantica del backend MongoDB: un replay
+        esatto ritorna il risultato del primo ingest, la stessa chiave con
+        payload diverso rifiuta ogni evento con IDEMPOTENCY_CONFLICT; i batch
+        con eventi rifiutati non vengono memorizzati.
+        """
+        if not events:
+            return (0, 0, [])
+        if idempotency_key is None:
+            return self._ingest(events)
+
+        user_id = events[0].user_id
+        signature = batch_signature(events)
+        stored = self._activity_repo.get_batch(user_id, idempotency_key)
+        if stored is not None:
+            stored_signature, stored_result = stored
+            if stored_signature != signature:
+                return (0, 0, [(i, IDEMPOTENCY_CONFLICT) for i in range(len(events))])
+            return (stored_result["accepted"], stored_result["duplicates"], [])
+
+        accepted, duplicates, rejected = self._ingest(events)
+        if not rejected:
+            self._activity_repo.store_batch(
+                user_id,
+                idempotency_key,
+                signature,
+                {"accepted": accepted, "duplicates": duplicates},
+            )
+        return (accepted, duplicates, rejected)
+
+    def _ingest(self, events: List[ActivityEvent]) -> Tuple[int, int, List[Tuple[int, str]]]:
         repo_events = []
 
         for event in events:
@@ -96,6 +131,31 @@ class InMemoryActivityRepository(IActivityRepository):
 
         return domain_events
 
+    async def aggregate_by_period(
+        self,
+        user_id: str,
+        periods: List[Tuple[datetime, datetime]],
+    ) -> Dict[int, ActivityPeriodTotals]:
+        """Aggrega per periodo con riduzioni vettoriali sullo storage colonnare."""
+        if not periods:
+            return {}
+
+        starts = [format_ts_bound(start) for start, _ in periods]
+        buckets = self._activity_repo.aggregate_periods(
+            user_id, starts, format_ts_bound(periods[-1][1])
+        )
+        return {
+            index: ActivityPeriodTotals(
+                total_steps=int(totals["total_steps"]),
+                total_calories_out=totals["total_calories_out"],
+                active_minutes=int(totals["active_minutes"]),
+                heart_rate_sum=totals["heart_rate_sum"],
+                heart_rate_samples=int(totals["heart_rate_samples"]),
+                event_count=int(totals["event_count"]),
+            )
+            for index, totals in buckets.items()
+        }
+
     async def get_daily_events_count(self, user_id: str, date: str) -> int:
         """Conta eventi per diagnosi."""
         timestamp = date + "T00:00:00Z"
@@ -4,10 +4,12 @@ from .base import MongoBaseRepository
 from .meal_repository import MongoMealRepository
 from .profile_repository import MongoProfileRepository
 from .activity_repository import MongoActivityRepository
+from .activity_timeseries_repository import MongoActivityTimeSeriesRepository
 
 __all__ = [
     "MongoBaseRepository",
     "MongoMealRepository",
     "MongoProfileRepository",
     "MongoActivityRepository",
+    "MongoActivityTimeSeriesRepository",
 ]
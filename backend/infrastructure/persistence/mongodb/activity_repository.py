@@ -3,19 +3,28 @@
 Dual-collection architecture:
   - activity_events: minute-level ActivityEvent documents
   - health_snapshots: cumulative HealthSnapshot documents
+  - health_daily_totals: last totals per (user_id, date)
 
 Design decisions:
   * ActivityEvent: indexed by (user_id, ts), idempotency via unique compound key
   * HealthSnapshot: indexed by (user_id, date, timestamp), idempotency via unique key
-  * ActivityDelta: computed on-the-fly from consecutive snapshots (no storage)
+  * ActivityDelta: computed at write time against the last totals document
+    (read and advanced with one find_one_and_update) and stored on the
+    snapshot document (a late snapshot also rewrites the delta of the next
+    one); syncEntries reads them back with a range query
   * Batch operations: bulk_write with ordered=False for parallel execution
   * Deduplication: MongoDB unique indexes + error handling
+  * Batch idempotency: ingest_events with an idempotency_key stores
+    (user_id, key) -> payload signature + result in activity_ingest_batches
+    (TTL 24h); an exact replay returns the stored result without touching
+    activity_events, a different payload under the same key is rejected
+    with IDEMPOTENCY_CONFLICT
 """
 
 from typing import Dict, Any, List, Optional, Tuple, TYPE_CHECKING
 from motor.motor_asyncio import AsyncIOMotorClient
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 
 if TYPE_CHECKING:
     from motor.motor_asyncio import AsyncIOMotorCollection
@@ -25,13 +34,24 @@ from domain.activity.model import (
     HealthSnapshot,
     ActivityDelta,
     ActivitySource,
+    IDEMPOTENCY_CONFLICT,
+    batch_signature,
+    format_ts_bound,
 )
-from domain.activity.repository import IActivityRepository
+from domain.activity.repository import ActivityPeriodTotals, IActivityRepository
 from infrastructure.persistence.mongodb.base import MongoBaseRepository
 
-
 logger = logging.getLogger(__name__)
 
+INGEST_BATCHES_COLLECTION = "activity_ingest_batches"
+# Same retention as the in-memory store_idempotency default
+INGEST_BATCH_TTL_SECONDS = 86400
+INGEST_BATCH_TTL_INDEX_NAME = "idx_created_at_ttl"
+
+# Last snapshot totals per (user_id, date), _id = "<user_id>_<date>"
+DAILY_TOTALS_COLLECTION = "health_daily_totals"
+_TOTALS_FIELDS = ("timestamp", "steps_total", "calories_out_total", "hr_avg_session")
+
 
 class MongoActivityRepository(MongoBaseRepository[ActivityEvent], IActivityRepository):
     """MongoDB implementation for Activity domain with dual collections."""
@@ -44,6 +64,7 @@ class MongoActivityRepository(MongoBaseRepository[ActivityEvent], IActivityRepos
         """
         super().__init__(client)
         self._snapshots_collection_name = "health_snapshots"
+        self._batches_ready = False
         logger.info(
             "MongoActivityRepository initialized with collections: "
             f"{self.collection_name}, {self._snapshots_collection_name}"
@@ -61,6 +82,20 @@ class MongoActivityRepository(MongoBaseRepository[ActivityEvent], IActivityRepos
         """Access health_snapshots collection."""
         return self._db[self._snapshots_collection_name]
 
+    @property
+    def batches_collection(
+        self,
+    ) -> "AsyncIOMotorCollection[Dict[str, Any]]":
+        """Access activity_ingest_batches collection (batch idempotency records)."""
+        return self._db[INGEST_BATCHES_COLLECTION]
+
+    @property
+    def totals_collection(
+        self,
+    ) -> "AsyncIOMotorCollection[Dict[str, Any]]":
+        """Access health_daily_totals collection (last totals per user and day)."""
+        return self._db[DAILY_TOTALS_COLLECTION]
+
     # ========================================================================
     # Document Mapping - ActivityEvent
     # ========================================================================
@@ -132,8 +167,18 @@ class MongoActivityRepository(MongoBaseRepository[ActivityEvent], IActivityRepos
                 "timestamp": "2024-01-15T23:59:00Z",
                 "steps_total": 10000,
                 "calories_out_total": 450.0,
-                "hr_avg_session": 75.0
+                "hr_avg_session": 75.0,
+                "steps_delta": 500,
+                "calories_out_delta": 20.5,
+                "reset": false,
+                "duplicate": false,
+                "delta_base": "2024-01-15T23:30:00Z"
             }
+
+        The delta fields are added by record_snapshot (documents written
+        before write-time deltas do not have them). delta_base is the
+        timestamp of the snapshot the delta was computed from (None for
+        the first snapshot of the day).
         """
         # Unique _id = user_id + date + timestamp
         doc_id = f"{snapshot.user_id}_{snapshot.date}_{snapshot.timestamp}"
@@ -170,6 +215,27 @@ class MongoActivityRepository(MongoBaseRepository[ActivityEvent], IActivityRepos
             hr_avg_session=doc.get("hr_avg_session"),
         )
 
+    def document_to_delta(self, doc: Dict[str, Any]) -> Optional[ActivityDelta]:
+        """Convert a snapshot document to its stored ActivityDelta.
+
+        Returns:
+            ActivityDelta, or None for documents without stored delta
+        """
+        if "steps_delta" not in doc:
+            return None
+        return ActivityDelta(
+            user_id=doc["user_id"],
+            date=doc["date"],
+            timestamp=doc["timestamp"],
+            steps_delta=doc["steps_delta"],
+            calories_out_delta=doc["calories_out_delta"],
+            steps_total=doc["steps_total"],
+            calories_out_total=doc["calories_out_total"],
+            hr_avg_session=doc.get("hr_avg_session"),
+            reset=doc["reset"],
+            duplicate=doc["duplicate"],
+        )
+
     # ========================================================================
     # ActivityEvent Operations
     # ========================================================================
@@ -181,21 +247,100 @@ class MongoActivityRepository(MongoBaseRepository[ActivityEvent], IActivityRepos
 
         Args:
             events: List of ActivityEvent objects to ingest
-            idempotency_key: Optional key for request deduplication (currently unused,
-                            deduplication handled by unique _id)
+            idempotency_key: Optional key for request deduplication. The
+                            (user_id of the first event, key) pair is bound to
+                            the payload signature for INGEST_BATCH_TTL_SECONDS
 
         Returns:
             Tuple of (accepted_count, duplicate_count, rejected_list)
             where rejected_list contains (index, reason) tuples
 
+        Idempotency:
+            An exact replay (same key, same normalized events) returns the
+            result of the first ingest with a single _id lookup. The same
+            key with a different payload rejects every event with
+            IDEMPOTENCY_CONFLICT. Results with rejected events are not
+            stored, so a retry re-ingests the batch.
+        """
+        if not events:
+            return (0, 0, [])
+        if idempotency_key is None:
+            return await self._insert_events(events)
+
+        batch_id = f"{events[0].user_id}:{idempotency_key}"
+        signature = self._batch_signature(events)
+        record = await self.batches_collection.find_one({"_id": batch_id})
+        if record is not None:
+            if record["signature"] != signature:
+                logger.warning(
+                    f"Idempotency key '{idempotency_key}' reused with a different payload "
+                    f"(user {events[0].user_id})"
+                )
+                return (0, 0, [(i, IDEMPOTENCY_CONFLICT) for i in range(len(events))])
+            logger.info(f"Batch replay for key '{idempotency_key}': stored result returned")
+            return (record["accepted"], record["duplicates"], [])
+
+        result = await self._insert_events(events)
+        if not result[2]:
+            await self._store_batch(batch_id, events[0].user_id, idempotency_key, signature, result)
+        return result
+
+    @staticmethod
+    def _batch_signature(events: List[ActivityEvent]) -> str:
+        """SHA-256 of the normalized events (order included)."""
+        return batch_signature(events)
+
+    async def _store_batch(
+        self,
+        batch_id: str,
+        user_id: str,
+        idempotency_key: str,
+        signature: str,
+        result: Tuple[int, int, List[Tuple[int, str]]],
+    ) -> None:
+        """Store the batch record, creating the TTL index on first use.
+
+        A concurrent ingest with the same key may store it first: the
+        DuplicateKeyError is ignored (its events were deduplicated anyway).
+        """
+        from pymongo.errors import DuplicateKeyError
+
+        if not self._batches_ready:
+            await self.batches_collection.create_index(
+                [("created_at", 1)],
+                name=INGEST_BATCH_TTL_INDEX_NAME,
+                expireAfterSeconds=INGEST_BATCH_TTL_SECONDS,
+            )
+            self._batches_ready = True
+
+        try:
+            await self.batches_collection.insert_one(
+                {
+                    "_id": batch_id,
+                    "user_id": user_id,
+                    "key": idempotency_key,
+                    "signature": signature,
+                    "accepted": result[0],
+                    "duplicates": result[1],
+                    "created_at": datetime.now(timezone.utc),
+                }
+            )
+        except DuplicateKeyError:
+            pass
+        except Exception as e:
+            # The events are stored: a missing record only disables the short-circuit
+            logger.warning(f"Could not store ingest batch record {batch_id}: {e}")
+
+    async def _insert_events(
+        self, events: List[ActivityEvent]
+    ) -> Tuple[int, int, List[Tuple[int, str]]]:
+        """Insert events, counting E11000 duplicate key errors as duplicates.
+
         Implementation:
             Uses MongoDB bulk_write with ordered=False for parallel execution.
             Duplicate key errors (E11000) are caught and counted.
             Other errors are logged and added to rejected list.
         """
-        if not events:
-            return (0, 0, [])
-
         # Normalize events to minute precision
         normalized_events = [e.normalized() for e in events]
 
@@ -279,6 +424,85 @@ class MongoActivityRepository(MongoBaseRepository[ActivityEvent], IActivityRepos
         )
         return events
 
+    async def aggregate_by_period(
+        self, user_id: str, periods: List[Tuple[datetime, datetime]]
+    ) -> Dict[int, ActivityPeriodTotals]:
+        """Aggregate activity totals per period with a single $group.
+
+        The period index of each event is the number of period starts
+        lower than or equal to its ts, minus one (ISO strings compare in
+        time order), so any grouping (day, ISO week, month) is one
+        pipeline over the (user_id, ts) index, with no event limit.
+
+        Args:
+            user_id: User identifier
+            periods: Sorted, contiguous (period_start, period_end) tuples
+
+        Returns:
+            Mapping period index -> totals (only periods with events)
+        """
+        if not periods:
+            return {}
+
+        starts = [format_ts_bound(start) for start, _ in periods]
+        pipeline = self._period_pipeline(user_id, starts, format_ts_bound(periods[-1][1]))
+        return self._period_totals(await self._aggregate(pipeline))
+
+    @staticmethod
+    def _period_pipeline(user_id: str, starts: List[Any], end: Any) -> List[Dict[str, Any]]:
+        """Build the $match/$group pipeline of aggregate_by_period.
+
+        Args:
+            user_id: User identifier
+            starts: Sorted period starts, comparable with the stored ts
+            end: Exclusive end of the last period
+
+        Returns:
+            Aggregation pipeline grouping events by period index
+        """
+        return [
+            {"$match": {"user_id": user_id, "ts": {"$gte": starts[0], "$lt": end}}},
+            {
+                "$group": {
+                    "_id": {
+                        "$subtract": [
+                            {
+                                "$size": {
+                                    "$filter": {
+                                        "input": starts,
+                                        "as": "start",
+                                        "cond": {"$lte": ["$$start", "$ts"]},
+                                    }
+                                }
+                            },
+                            1,
+                        ]
+                    },
+                    "total_steps": {"$sum": "$steps"},
+                    "total_calories_out": {"$sum": "$calories_out"},
+                    "active_minutes": {"$sum": {"$cond": [{"$gt": ["$steps", 0]}, 1, 0]}},
+                    "heart_rate_sum": {"$sum": "$hr_avg"},
+                    "heart_rate_samples": {"$sum": {"$cond": [{"$isNumber": "$hr_avg"}, 1, 0]}},
+                    "event_count": {"$sum": 1},
+                }
+            },
+        ]
+
+    @staticmethod
+    def _period_totals(rows: List[Dict[str, Any]]) -> Dict[int, ActivityPeriodTotals]:
+        """Map $group rows of _period_pipeline to period totals."""
+        return {
+            int(row["_id"]): ActivityPeriodTotals(
+                total_steps=int(row.get("total_steps") or 0),
+                total_calories_out=float(row.get("total_calories_out") or 0.0),
+                active_minutes=int(row.get("active_minutes", 0)),
+                heart_rate_sum=float(row.get("heart_rate_sum") or 0.0),
+                heart_rate_samples=int(row.get("heart_rate_samples", 0)),
+                event_count=int(row.get("event_count", 0)),
+            )
+            for row in rows
+        }
+
     async def get_daily_events_count(self, user_id: str, date: str) -> int:
         """Count activity events for a specific date.
 
@@ -333,46 +557,188 @@ class MongoActivityRepository(MongoBaseRepository[ActivityEvent], IActivityRepos
                 - snapshot: HealthSnapshot object (echo back)
 
         Logic:
-            1. Attempt to insert snapshot (duplicate check via unique _id)
-            2. If new, fetch previous snapshot for delta calculation
-            3. Calculate delta with reset/duplicate detection
+            1. Look up the previous snapshot and calculate the delta with
+               reset/duplicate detection
+            2. Insert snapshot with the delta (duplicate check via unique _id)
+            3. Advance the (user_id, date) last totals in one
+               find_one_and_update (only a later timestamp replaces them);
+               if that fails the snapshot is deleted again, so a retry
+               records it from scratch
             4. Return result dict
+
+        Concurrent writers of the same day are reconciled without a
+        transaction: every stored delta carries its delta_base, and
+        _store_delta only replaces it with a later base. The last totals
+        returned by step 3 are the true previous snapshot when they are
+        earlier; when they are later, the snapshot is late: its previous
+        snapshot is looked up again and the delta of the next snapshot of
+        the day is rewritten, so the deltas keep summing to the last
+        totals. In-order snapshots cost three round trips.
         """
         from pymongo.errors import DuplicateKeyError
 
+        previous = await self._get_previous_snapshot(
+            snapshot.user_id, snapshot.date, snapshot.timestamp
+        )
+        delta = self._calculate_delta(snapshot, previous)
         doc = self.snapshot_to_document(snapshot)
+        doc.update(self._delta_fields(delta, previous))
 
         try:
-            # Attempt insert
             await self.snapshots_collection.insert_one(doc)
+        except DuplicateKeyError:
+            logger.info(
+                f"Duplicate snapshot for user {snapshot.user_id} "
+                f"on {snapshot.date} at {snapshot.timestamp}"
+            )
+            return {
+                "status": "duplicate",
+                "snapshot": snapshot,
+            }
 
-            # Fetch previous snapshot for delta calculation
-            previous = await self._get_previous_snapshot(
+        try:
+            last = await self._advance_daily_totals(snapshot)
+        except Exception:
+            await self._delete_snapshot(doc["_id"])
+            raise
+
+        late = last is not None and last.timestamp > snapshot.timestamp
+        base = last
+        if late:
+            base = await self._get_previous_snapshot(
                 snapshot.user_id, snapshot.date, snapshot.timestamp
             )
+        if base is not None and (previous is None or base.timestamp > previous.timestamp):
+            # A previous snapshot was inserted concurrently
+            delta = self._calculate_delta(snapshot, base)
+            await self._store_delta(doc["_id"], delta, base)
 
-            delta = self._calculate_delta(snapshot, previous)
+        if late:
+            await self._rewrite_next_delta(snapshot)
 
-            logger.info(
-                f"Recorded new snapshot for user {snapshot.user_id} "
-                f"on {snapshot.date} (delta: {delta.steps_delta} steps)"
-            )
+        logger.info(
+            f"Recorded new snapshot for user {snapshot.user_id} "
+            f"on {snapshot.date} (delta: {delta.steps_delta} steps)"
+        )
 
-            return {
-                "status": "new",
-                "delta": delta,
-                "snapshot": snapshot,
+        return {
+            "status": "new",
+            "delta": delta,
+            "snapshot": snapshot,
+        }
+
+    async def _advance_daily_totals(self, snapshot: HealthSnapshot) -> Optional[HealthSnapshot]:
+        """Store snapshot totals as the last of its day, if later.
+
+        One atomic find_one_and_update (upsert, pipeline update): the
+        totals are replaced only when the stored timestamp is earlier.
+
+        Args:
+            snapshot: HealthSnapshot being recorded
+
+        Returns:
+            Last totals before the update, or None if the day had none
+        """
+        from pymongo import ReturnDocument
+
+        later = {"$lt": ["$timestamp", {"$literal": snapshot.timestamp}]}
+        values: Dict[str, Any] = {
+            "timestamp": snapshot.timestamp,
+            "steps_total": snapshot.steps_total,
+            "calories_out_total": snapshot.calories_out_total,
+            "hr_avg_session": snapshot.hr_avg_session,
+        }
+        update = [
+            {
+                "$set": {
+                    "user_id": {"$literal": snapshot.user_id},
+                    "date": {"$literal": snapshot.date},
+                    **{
+                        name: {"$cond": [later, {"$literal": values[name]}, f"${name}"]}
+                        for name in _TOTALS_FIELDS
+                    },
+                }
             }
+        ]
 
-        except DuplicateKeyError:
+        doc = await self.totals_collection.find_one_and_update(
+            {"_id": f"{snapshot.user_id}_{snapshot.date}"},
+            update,
+            upsert=True,
+            return_document=ReturnDocument.BEFORE,
+        )
+
+        if doc:
+            return self.document_to_snapshot(doc)
+        return None
+
+    async def _delete_snapshot(self, doc_id: str) -> None:
+        """Undo a snapshot insert whose last totals could not be advanced.
+
+        Args:
+            doc_id: _id of the inserted snapshot document
+        """
+        try:
+            await self.snapshots_collection.delete_one({"_id": doc_id})
+        except Exception as e:
+            logger.error(f"Error deleting snapshot {doc_id} after failed totals update: {e}")
+
+    @staticmethod
+    def _delta_fields(delta: ActivityDelta, base: Optional[HealthSnapshot]) -> Dict[str, Any]:
+        """Delta fields stored on a snapshot document."""
+        return {
+            "steps_delta": delta.steps_delta,
+            "calories_out_delta": delta.calories_out_delta,
+            "reset": delta.reset,
+            "duplicate": delta.duplicate,
+            "delta_base": base.timestamp if base is not None else None,
+        }
+
+    async def _store_delta(self, doc_id: str, delta: ActivityDelta, base: HealthSnapshot) -> bool:
+        """Replace the stored delta of a snapshot if base is later than its delta_base.
+
+        The previous snapshot of a snapshot is the latest one before it,
+        so among concurrent writers the latest base wins whatever the
+        order of the updates.
+
+        Args:
+            doc_id: _id of the snapshot document
+            delta: Delta of the snapshot computed from base
+            base: Previous snapshot the delta was computed from
+
+        Returns:
+            True if the stored delta was replaced
+        """
+        result = await self.snapshots_collection.update_one(
+            {
+                "_id": doc_id,
+                "$or": [{"delta_base": None}, {"delta_base": {"$lt": base.timestamp}}],
+            },
+            {"$set": self._delta_fields(delta, base)},
+        )
+        return bool(result.modified_count)
+
+    async def _rewrite_next_delta(self, snapshot: HealthSnapshot) -> None:
+        """Recompute the stored delta of the snapshot following a late one.
+
+        Args:
+            snapshot: Late HealthSnapshot just inserted
+        """
+        query = {
+            "user_id": snapshot.user_id,
+            "date": snapshot.date,
+            "timestamp": {"$gt": snapshot.timestamp},
+        }
+        doc = await self.snapshots_collection.find_one(query, sort=[("timestamp", 1)])
+        if doc is None:
+            return
+
+        delta = self._calculate_delta(self.document_to_snapshot(doc), snapshot)
+        if await self._store_delta(doc["_id"], delta, snapshot):
             logger.info(
-                f"Duplicate snapshot for user {snapshot.user_id} "
-                f"on {snapshot.date} at {snapshot.timestamp}"
+                f"Late snapshot for user {snapshot.user_id} at {snapshot.timestamp}: "
+                f"delta of {doc['timestamp']} recomputed ({delta.steps_delta} steps)"
             )
-            return {
-                "status": "duplicate",
-                "snapshot": snapshot,
-            }
 
     async def _get_previous_snapshot(
         self, user_id: str, date_str: str, timestamp: str
@@ -491,11 +857,13 @@ class MongoActivityRepository(MongoBaseRepository[ActivityEvent], IActivityRepos
             limit: Maximum number of deltas to return
 
         Returns:
-            List of ActivityDelta objects computed from consecutive snapshots
+            List of ActivityDelta objects in chronological order
 
         Implementation:
-            Fetches snapshots in chronological order and computes deltas
-            by comparing each snapshot with its predecessor.
+            Range read of the snapshots in chronological order, returning
+            the deltas stored by record_snapshot. Snapshots recorded before
+            write-time deltas, or whose delta_base is not the snapshot read
+            before them, are compared with their predecessor.
         """
         query: Dict[str, Any] = {
             "user_id": user_id,
@@ -505,24 +873,27 @@ class MongoActivityRepository(MongoBaseRepository[ActivityEvent], IActivityRepos
         if after_ts:
             query["timestamp"] = {"$gt": after_ts}
 
-        # Fetch snapshots sorted by timestamp
-        cursor = self.snapshots_collection.find(query).sort("timestamp", 1).limit(limit + 1)
-        docs = await cursor.to_list(length=limit + 1)
-
-        if not docs:
-            return []
-
-        snapshots = [self.document_to_snapshot(doc) for doc in docs]
+        cursor = self.snapshots_collection.find(query).sort("timestamp", 1).limit(limit)
+        docs = await cursor.to_list(length=limit)
 
-        # Compute deltas between consecutive snapshots
         deltas: List[ActivityDelta] = []
-        for i, current in enumerate(snapshots):
-            previous = snapshots[i - 1] if i > 0 else None
-            delta = self._calculate_delta(current, previous)
+        previous: Optional[HealthSnapshot] = None
+        for doc in docs:
+            current = self.document_to_snapshot(doc)
+            delta = self.document_to_delta(doc)
+            base = doc.get("delta_base")
+            if previous is not None and "delta_base" in doc and base != previous.timestamp:
+                # Computed from another snapshot (concurrent write not reconciled)
+                delta = None
+            if delta is None:
+                if previous is None and after_ts:
+                    previous = await self._get_previous_snapshot(user_id, date, current.timestamp)
+                delta = self._calculate_delta(current, previous)
             deltas.append(delta)
+            previous = current
 
-        logger.debug(f"Computed {len(deltas)} deltas for user {user_id} on {date}")
-        return deltas[:limit]  # Respect limit
+        logger.debug(f"Listed {len(deltas)} deltas for user {user_id} on {date}")
+        return deltas
 
     async def get_daily_totals(self, user_id: str, date: str) -> Tuple[int, float]:
         """Get daily totals (steps, calories) from latest snapshot.
@@ -535,16 +906,20 @@ class MongoActivityRepository(MongoBaseRepository[ActivityEvent], IActivityRepos
             Tuple of (total_steps, total_calories_out)
 
         Implementation:
-            Returns the latest snapshot's cumulative totals for the day.
-            If no snapshots exist, returns (0, 0.0).
+            Returns the last totals document of the day (lookup by _id),
+            falling back to the latest snapshot for days recorded before
+            the totals documents existed. If no snapshots exist, returns
+            (0, 0.0).
         """
-        query = {
-            "user_id": user_id,
-            "date": date,
-        }
+        doc = await self.totals_collection.find_one({"_id": f"{user_id}_{date}"})
 
-        # Get most recent snapshot
-        doc = await self.snapshots_collection.find_one(query, sort=[("timestamp", -1)])
+        if doc is None:
+            query = {
+                "user_id": user_id,
+                "date": date,
+            }
+            # Get most recent snapshot
+            doc = await self.snapshots_collection.find_one(query, sort=[("timestamp", -1)])
 
         if doc:
             snapshot = self.document_to_snapshot(doc)
@@ -559,4 +934,11 @@ class MongoActivityRepository(MongoBaseRepository[ActivityEvent], IActivityRepos
         return (0, 0.0)
 
 
-__all__ = ["MongoActivityRepository"]
+__all__ = [
+    "DAILY_TOTALS_COLLECTION",
+    "IDEMPOTENCY_CONFLICT",
+    "INGEST_BATCHES_COLLECTION",
+    "INGEST_BATCH_TTL_INDEX_NAME",
+    "INGEST_BATCH_TTL_SECONDS",
+    "MongoActivityRepository",
+]
@@ -0,0 +1,311 @@
+"""MongoDB time-series backend for minute-level activity events.
+
+Alternative to MongoActivityRepository for activity_events: events live in
+a time-series collection (activity_events_ts) with user_id as metaField and
+a BSON date as timeField. MongoDB buckets consecutive minutes of a user
+into compressed documents, so storage and index size grow with buckets
+instead of one document (and one _id entry) per minute.
+
+Design decisions:
+  * Snapshots (health_snapshots) are unchanged and inherited
+  * Time-series collections do not support unique indexes: ingest_events
+    reads the minutes already stored for the batch and skips them, so a
+    replayed event is still counted as duplicate (first write wins, as
+    with the unique _id of the regular collection)
+  * Concurrent ingests of the same minute are not serialized by the
+    server; the sync clients send each device minute once per request
+  * Reads keep the ISO8601 "Z" ts of the domain model: bounds are
+    converted to BSON dates and stored dates back to strings
+
+Migration from the regular collection: scripts/migrate_activity_timeseries.py
+"""
+
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from domain.activity.model import (
+    NORMALIZATION_FAILED,
+    WRITE_FAILED,
+    ActivityEvent,
+    ActivitySource,
+    format_ts_bound,
+)
+from domain.activity.repository import ActivityPeriodTotals
+from infrastructure.persistence.mongodb.activity_repository import MongoActivityRepository
+
+logger = logging.getLogger(__name__)
+
+TIMESERIES_COLLECTION = "activity_events_ts"
+TIMESERIES_OPTIONS: Dict[str, Any] = {
+    "timeField": "ts",
+    "metaField": "user_id",
+    "granularity": "minutes",
+}
+# Secondary index on (meta, time): created automatically from MongoDB 6.3
+TIMESERIES_INDEX_KEYS: List[Tuple[str, Any]] = [("user_id", 1), ("ts", 1)]
+TIMESERIES_INDEX_NAME = "idx_user_ts"
+
+
+class MongoActivityTimeSeriesRepository(MongoActivityRepository):
+    """Activity repository storing events in a MongoDB time-series collection."""
+
+    def __init__(self, client: Optional[AsyncIOMotorClient[Dict[str, Any]]] = None):
+        """Initialize repository with optional MongoDB client.
+
+        Args:
+            client: Optional motor client. If None, creates from MONGODB_URI.
+        """
+        super().__init__(client)
+        self._collection_ready = False
+
+    @property
+    def collection_name(self) -> str:
+        """Time-series collection for ActivityEvent documents."""
+        return TIMESERIES_COLLECTION
+
+    async def ensure_collection(self) -> None:
+        """Create the time-series collection and its (meta, time) index if missing.
+
+        Inserting into a missing collection would create a regular one,
+        so ingest_events calls this once before the first write.
+        """
+        if self._collection_ready:
+            return
+
+        names = await self._db.list_collection_names(filter={"name": self.collection_name})
+        if not names:
+            await self._db.create_collection(self.collection_name, timeseries=TIMESERIES_OPTIONS)
+            logger.info(f"Created time-series collection '{self.collection_name}'")
+
+        indexes = await self.collection.list_indexes().to_list(length=None)
+        if not any(list(idx.get("key", {}).items()) == TIMESERIES_INDEX_KEYS for idx in indexes):
+            await self.collection.create_index(TIMESERIES_INDEX_KEYS, name=TIMESERIES_INDEX_NAME)
+
+        self._collection_ready = True
+
+    # ========================================================================
+    # Document Mapping - ActivityEvent
+    # ========================================================================
+
+    def to_document(self, entity: ActivityEvent) -> Dict[str, Any]:
+        """Convert ActivityEvent to a time-series measurement.
+
+        Schema:
+            {
+                "user_id": "user123",
+                "ts": ISODate("2024-01-15T10:30:00Z"),
+                "steps": 120,
+                "calories_out": 5.4,
+                "hr_avg": 85.0,
+                "source": "APPLE_HEALTH"
+            }
+
+        The _id is generated by the server (no synthetic user_id + ts key).
+        """
+        doc: Dict[str, Any] = {
+            "user_id": entity.user_id,
+            "ts": self._ts_to_date(entity.ts),
+            "source": entity.source.value,
+        }
+
+        if entity.steps is not None:
+            doc["steps"] = entity.steps
+        if entity.calories_out is not None:
+            doc["calories_out"] = entity.calories_out
+        if entity.hr_avg is not None:
+            doc["hr_avg"] = entity.hr_avg
+
+        return doc
+
+    def from_document(self, doc: Dict[str, Any]) -> ActivityEvent:
+        """Convert a time-series measurement to ActivityEvent (ts as ISO "Z")."""
+        return ActivityEvent(
+            user_id=doc["user_id"],
+            ts=format_ts_bound(self.bson_to_datetime(doc["ts"])),
+            steps=doc.get("steps"),
+            calories_out=doc.get("calories_out"),
+            hr_avg=doc.get("hr_avg"),
+            source=ActivitySource(doc.get("source", "MANUAL")),
+        )
+
+    def _ts_to_date(self, ts: str) -> datetime:
+        """ISO8601 timestamp (Z, offset or naive UTC) -> UTC datetime."""
+        return self.datetime_to_bson(self.iso_to_datetime(ts))
+
+    # ========================================================================
+    # ActivityEvent Operations
+    # ========================================================================
+
+    async def _insert_events(
+        self, events: List[ActivityEvent]
+    ) -> Tuple[int, int, List[Tuple[int, str]]]:
+        """Insert events, skipping minutes already stored.
+
+        Same result contract as MongoActivityRepository._insert_events
+        (batch idempotency is inherited from ingest_events): events whose
+        (user_id, minute) is already stored, or appears earlier in the
+        batch, are counted as duplicates.
+
+        Implementation:
+            One find per user in the batch ($in on the batch minutes,
+            served by the (user_id, ts) index), then insert_many with
+            ordered=False for the new events only.
+
+        Rejection reasons are codes: NORMALIZATION_FAILED for a ts that
+        is not a date, WRITE_FAILED for storage errors (details are
+        logged, never returned to the client).
+        """
+        from pymongo.errors import BulkWriteError
+
+        await self.ensure_collection()
+
+        accepted = 0
+        duplicates = 0
+        rejected: List[Tuple[int, str]] = []
+
+        # Minutes of the batch per user (first occurrence wins)
+        documents: Dict[int, Dict[str, Any]] = {}
+        first_index: Dict[Tuple[str, datetime], int] = {}
+        minutes_by_user: Dict[str, List[datetime]] = {}
+        for index, event in enumerate(events):
+            try:
+                doc = self.to_document(event.normalized())
+            except ValueError as e:
+                # ts not parseable as a date (the regular collection stores it as is)
+                logger.warning(f"Event {index} rejected: {e}")
+                rejected.append((index, NORMALIZATION_FAILED))
+                continue
+            key = (doc["user_id"], doc["ts"])
+            if key in first_index:
+                duplicates += 1
+                continue
+            documents[index] = doc
+            first_index[key] = index
+            minutes_by_user.setdefault(doc["user_id"], []).append(doc["ts"])
+
+        try:
+            stored = await self._stored_minutes(minutes_by_user)
+            new_indexes = [index for key, index in first_index.items() if key not in stored]
+            duplicates += len(first_index) - len(new_indexes)
+
+            if new_indexes:
+                try:
+                    result = await self.collection.insert_many(
+                        [documents[index] for index in new_indexes], ordered=False
+                    )
+                    accepted = len(result.inserted_ids)
+                except BulkWriteError as bwe:
+                    accepted = bwe.details.get("nInserted", 0)
+                    for error in bwe.details.get("writeErrors", []):
+                        # Error index refers to the inserted subset
+                        index = new_indexes[error.get("index", 0)]
+                        msg = error.get("errmsg", "Unknown error")
+                        rejected.append((index, WRITE_FAILED))
+                        logger.warning(f"Event {index} rejected: {msg[:100]}")
+
+            logger.info(
+                f"Batch ingest: {accepted} accepted, {duplicates} duplicates, "
+                f"{len(rejected)} rejected"
+            )
+
+        except Exception as e:
+            logger.error(f"Unexpected error during batch ingest: {e}")
+            # Mark all as rejected on catastrophic failure
+            accepted, duplicates = 0, 0
+            rejected = [(i, WRITE_FAILED) for i in range(len(events))]
+
+        return (accepted, duplicates, rejected)
+
+    async def _stored_minutes(
+        self, minutes_by_user: Dict[str, List[datetime]]
+    ) -> Set[Tuple[str, datetime]]:
+        """(user_id, ts) pairs of the given minutes already stored."""
+        stored: Set[Tuple[str, datetime]] = set()
+        for user_id, minutes in minutes_by_user.items():
+            docs = await self._find_many(
+                {"user_id": user_id, "ts": {"$in": minutes}},
+                projection={"_id": 0, "ts": 1},
+            )
+            stored.update((user_id, self.bson_to_datetime(doc["ts"])) for doc in docs)
+        return stored
+
+    async def list_events(
+        self,
+        user_id: str,
+        start_ts: Optional[str] = None,
+        end_ts: Optional[str] = None,
+        limit: int = 1000,
+    ) -> List[ActivityEvent]:
+        """List activity events with optional timestamp filtering.
+
+        Args:
+            user_id: User identifier
+            start_ts: Optional start timestamp (ISO8601, inclusive)
+            end_ts: Optional end timestamp (ISO8601, exclusive)
+            limit: Maximum number of events to return
+
+        Returns:
+            List of ActivityEvent objects sorted by timestamp ascending
+        """
+        query: Dict[str, Any] = {"user_id": user_id}
+
+        if start_ts or end_ts:
+            ts_filter: Dict[str, Any] = {}
+            if start_ts:
+                ts_filter["$gte"] = self._ts_to_date(start_ts)
+            if end_ts:
+                ts_filter["$lt"] = self._ts_to_date(end_ts)
+            query["ts"] = ts_filter
+
+        docs = await self._find_many(query, sort=[("ts", 1)], limit=limit)
+        return [self.from_document(doc) for doc in docs]
+
+    async def aggregate_by_period(
+        self, user_id: str, periods: List[Tuple[datetime, datetime]]
+    ) -> Dict[int, ActivityPeriodTotals]:
+        """Aggregate activity totals per period with a single $group.
+
+        Same pipeline as the regular collection, with BSON date bounds
+        (naive datetimes are UTC).
+        """
+        if not periods:
+            return {}
+
+        starts = [self._bound_to_date(start) for start, _ in periods]
+        pipeline = self._period_pipeline(user_id, starts, self._bound_to_date(periods[-1][1]))
+        return self._period_totals(await self._aggregate(pipeline))
+
+    def _bound_to_date(self, value: datetime) -> datetime:
+        """Period bound -> UTC datetime (naive datetimes are UTC)."""
+        return self._ts_to_date(format_ts_bound(value))
+
+    async def get_daily_events_count(self, user_id: str, date: str) -> int:
+        """Count activity events for a specific date.
+
+        Args:
+            user_id: User identifier
+            date: Date in YYYY-MM-DD format
+
+        Returns:
+            Number of events for the specified date
+        """
+        try:
+            start = self._ts_to_date(f"{date}T00:00:00Z")
+        except ValueError as e:
+            logger.error(f"Invalid date format {date}: {e}")
+            return 0
+
+        query = {"user_id": user_id, "ts": {"$gte": start, "$lt": start + timedelta(days=1)}}
+        return await self._count(query)
+
+
+__all__ = [
+    "MongoActivityTimeSeriesRepository",
+    "TIMESERIES_COLLECTION",
+    "TIMESERIES_INDEX_KEYS",
+    "TIMESERIES_INDEX_NAME",
+    "TIMESERIES_OPTIONS",
+]
@@ -11,15 +11,15 @@ All concrete MongoDB repositories should inherit from MongoBaseRepository.
 """
 
 from abc import ABC, abstractmethod
-from typing import TypeVar, Generic, Optional, Dict, Any, List, Tuple
+from typing import TypeVar, Generic, Optional, Dict, Any, List, Tuple, Union
 from uuid import UUID
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 import logging
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorCollection
+from pymongo import ReturnDocument
 
 from infrastructure.config import get_mongodb_uri, get_mongodb_database
 
-
 # Type variables for generics
 TEntity = TypeVar("TEntity")  # Domain entity type
 TDocument = TypeVar("TDocument", bound=Dict[str, Any])  # MongoDB document type
@@ -158,6 +158,65 @@ class MongoBaseRepository(ABC, Generic[TEntity]):
             raise ValueError("Datetime must be timezone-aware")
         return dt.isoformat()
 
+    @staticmethod
+    def datetime_to_bson(dt: datetime) -> datetime:
+        """
+        Convert datetime for native BSON Date storage.
+
+        Args:
+            dt: Timezone-aware datetime
+
+        Returns:
+            Same instant in UTC (BSON dates are UTC, millisecond precision:
+            store utc_offset_minutes(dt) next to it to keep the offset)
+        """
+        if dt.tzinfo is None:
+            raise ValueError("Datetime must be timezone-aware")
+        return dt.astimezone(timezone.utc)
+
+    @staticmethod
+    def utc_offset_minutes(dt: datetime) -> int:
+        """
+        UTC offset of a datetime, stored next to its BSON date.
+
+        Args:
+            dt: Timezone-aware datetime
+
+        Returns:
+            Offset in minutes (e.g. 60 for +01:00)
+        """
+        offset = dt.utcoffset()
+        if offset is None:
+            raise ValueError("Datetime must be timezone-aware")
+        return int(offset.total_seconds() // 60)
+
+    @staticmethod
+    def bson_to_datetime(
+        value: Union[datetime, str], offset_minutes: Optional[int] = None
+    ) -> datetime:
+        """
+        Convert stored datetime to timezone-aware datetime (dual-read).
+
+        Accepts both native BSON dates (returned by the driver as naive
+        UTC datetimes unless the client is tz_aware) and legacy ISO 8601
+        strings written before the BSON date migration.
+
+        Args:
+            value: BSON date or ISO 8601 string
+            offset_minutes: Stored UTC offset (utc_offset_minutes) to
+                restore; None keeps UTC (or the offset of an ISO string)
+
+        Returns:
+            Timezone-aware datetime
+        """
+        if isinstance(value, datetime):
+            dt = value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+        else:
+            dt = MongoBaseRepository.iso_to_datetime(value)
+        if offset_minutes is None:
+            return dt
+        return dt.astimezone(timezone(timedelta(minutes=offset_minutes)))
+
     @staticmethod
     def iso_to_datetime(iso_str: str) -> datetime:
         """
@@ -172,8 +231,6 @@ class MongoBaseRepository(ABC, Generic[TEntity]):
         dt = datetime.fromisoformat(iso_str)
         if dt.tzinfo is None:
             # If no timezone, assume UTC
-            from datetime import timezone
-
             dt = dt.replace(tzinfo=timezone.utc)
         return dt
 
@@ -208,20 +265,20 @@ class MongoBaseRepository(ABC, Generic[TEntity]):
     async def _find_many(
         self,
         filter_dict: Dict[str, Any],
-        sort: Optional[List[Tuple[str, int]]] = None,
+        sort: Optional[List[Tuple[str, Any]]] = None,
         limit: Optional[int] = None,
         skip: Optional[int] = None,
-        projection: Optional[Dict[str, int]] = None,
+        projection: Optional[Dict[str, Any]] = None,
     ) -> List[Dict[str, Any]]:
         """
         Find multiple documents with error handling.
 
         Args:
             filter_dict: MongoDB filter
-            sort: Sort specification [(field, direction), ...]
+            sort: Sort specification [(field, direction or $meta), ...]
             limit: Max documents to return
             skip: Documents to skip
-            projection: Optional projection
+            projection: Optional projection (may include $meta fields)
 
         Returns:
             List of document dicts
@@ -294,6 +351,76 @@ class MongoBaseRepository(ABC, Generic[TEntity]):
             )
             raise
 
+    async def _find_one_and_update(
+        self,
+        filter_dict: Dict[str, Any],
+        update_dict: Dict[str, Any],
+        upsert: bool = False,
+        projection: Optional[Dict[str, Any]] = None,
+        return_after: bool = False,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Atomically update single document and return it, with error handling.
+
+        Args:
+            filter_dict: MongoDB filter
+            update_dict: Update operations (e.g., {"$set": {...}})
+            upsert: Create document if not found
+            projection: Optional projection of the returned document
+            return_after: Return the updated document instead of the original
+
+        Returns:
+            Original (or updated) document, None if no original existed
+
+        Raises:
+            Exception: If MongoDB operation fails (logged and re-raised)
+        """
+        try:
+            doc: Optional[Dict[str, Any]] = await self._collection.find_one_and_update(
+                filter_dict,
+                update_dict,
+                projection=projection,
+                upsert=upsert,
+                return_document=ReturnDocument.AFTER if return_after else ReturnDocument.BEFORE,
+            )
+            return doc
+        except Exception as e:
+            logger.error(
+                f"Error in find_one_and_update: collection={self.collection_name}, "
+                f"filter={filter_dict}, error={e}"
+            )
+            raise
+
+    async def _find_one_and_delete(
+        self,
+        filter_dict: Dict[str, Any],
+        projection: Optional[Dict[str, Any]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Atomically delete single document and return it, with error handling.
+
+        Args:
+            filter_dict: MongoDB filter
+            projection: Optional projection of the returned document
+
+        Returns:
+            Deleted document, None if not found
+
+        Raises:
+            Exception: If MongoDB operation fails (logged and re-raised)
+        """
+        try:
+            doc: Optional[Dict[str, Any]] = await self._collection.find_one_and_delete(
+                filter_dict, projection=projection
+            )
+            return doc
+        except Exception as e:
+            logger.error(
+                f"Error in find_one_and_delete: collection={self.collection_name}, "
+                f"filter={filter_dict}, error={e}"
+            )
+            raise
+
     async def _delete_one(self, filter_dict: Dict[str, Any]) -> int:
         """
         Delete single document with error handling.
@@ -340,6 +467,30 @@ class MongoBaseRepository(ABC, Generic[TEntity]):
             )
             raise
 
+    async def _aggregate(self, pipeline: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Run aggregation pipeline with error handling.
+
+        Args:
+            pipeline: MongoDB aggregation pipeline stages
+
+        Returns:
+            List of result documents
+
+        Raises:
+            Exception: If MongoDB operation fails (logged and re-raised)
+        """
+        try:
+            cursor = self._collection.aggregate(pipeline)
+            documents: List[Dict[str, Any]] = await cursor.to_list(length=None)
+            return documents
+        except Exception as e:
+            logger.error(
+                f"Error in aggregate: collection={self.collection_name}, "
+                f"pipeline={pipeline}, error={e}"
+            )
+            raise
+
     async def close(self) -> None:
         """Close MongoDB connection."""
         self._client.close()
@@ -0,0 +1,688 @@
+"""Index coverage verification for MongoDB repositories.
+
+Replays every query shape issued by the Mongo repositories through
+``explain`` (executionStats verbosity) and reports:
+
+- COLLSCAN stages (no usable index)
+- blocking in-memory SORT stages (index does not provide the order)
+- docs examined / returned ratio (index not selective enough)
+
+Each shape declares the index that serves it, so missing indexes can be
+created from the same definitions (see scripts/verify_mongodb_indexes.py).
+
+Keep build_query_shapes() in sync with the repositories: every public
+query method of a Mongo repository must be listed in some shape
+``sources`` (enforced by unit tests).
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from infrastructure.persistence.mongodb.activity_repository import (
+    DAILY_TOTALS_COLLECTION,
+    INGEST_BATCHES_COLLECTION,
+)
+from infrastructure.persistence.mongodb.activity_timeseries_repository import (
+    TIMESERIES_COLLECTION,
+    TIMESERIES_INDEX_KEYS,
+    TIMESERIES_INDEX_NAME,
+)
+from infrastructure.persistence.mongodb.meal_repository import (
+    DAILY_ROLLUPS_COLLECTION,
+    SEARCH_TEXT_INDEX_KEYS,
+    SEARCH_TEXT_INDEX_OPTIONS,
+)
+
+# Default threshold for docs examined / returned before flagging a shape
+DEFAULT_MAX_EXAMINED_RATIO = 10.0
+
+
+@dataclass(frozen=True)
+class IndexSpec:
+    """Index definition required by one or more query shapes."""
+
+    collection: str
+    keys: Tuple[Tuple[str, Any], ...]
+    name: str
+    unique: bool = False
+    options: Dict[str, Any] = field(default_factory=dict, compare=False)
+
+    def _key_pattern(self) -> List[Tuple[str, Any]]:
+        """Key pattern as reported by list_indexes (text fields -> _fts/_ftsx)."""
+        pattern: List[Tuple[str, Any]] = []
+        for key, value in self.keys:
+            if value == "text":
+                if ("_fts", "text") not in pattern:
+                    pattern += [("_fts", "text"), ("_ftsx", 1)]
+            else:
+                pattern.append((key, value))
+        return pattern
+
+    def matches(self, index_key: Dict[str, Any]) -> bool:
+        """Check if an existing index key pattern starts with this spec."""
+        pattern = self._key_pattern()
+        existing = list(index_key.items())[: len(pattern)]
+        return [(k, v if isinstance(v, str) else int(v)) for k, v in existing] == pattern
+
+
+@dataclass(frozen=True)
+class QueryShape:
+    """A query issued by a repository, replayable through explain.
+
+    Attributes:
+        name: Stable identifier used in reports
+        collection: Target collection
+        kind: "find" | "count" | "aggregate"
+        sources: Repository methods issuing this shape
+        filter: Filter (find/count) with sample values
+        sort: Sort specification (find only)
+        limit: Limit (find only)
+        pipeline: Pipeline (aggregate only)
+        index: Index expected to serve the shape (None = _id index)
+        allow_sort: Blocking SORT is expected (e.g. by text score)
+    """
+
+    name: str
+    collection: str
+    kind: str
+    sources: Tuple[str, ...]
+    filter: Dict[str, Any] = field(default_factory=dict)
+    sort: Optional[Dict[str, Any]] = None
+    limit: Optional[int] = None
+    pipeline: Optional[List[Dict[str, Any]]] = None
+    index: Optional[IndexSpec] = None
+    allow_sort: bool = False
+
+    def explain_command(self) -> Dict[str, Any]:
+        """Build the explain command for this shape."""
+        if self.kind == "find":
+            command: Dict[str, Any] = {"find": self.collection, "filter": self.filter}
+            if self.sort:
+                command["sort"] = self.sort
+            if self.limit:
+                command["limit"] = self.limit
+        elif self.kind == "count":
+            command = {"count": self.collection, "query": self.filter}
+        elif self.kind == "aggregate":
+            command = {"aggregate": self.collection, "pipeline": self.pipeline, "cursor": {}}
+        else:
+            raise ValueError(f"Unsupported query kind: {self.kind}")
+
+        return {"explain": command, "verbosity": "executionStats"}
+
+
+@dataclass
+class ShapeReport:
+    """Explain analysis for a single query shape."""
+
+    shape: QueryShape
+    indexes_used: List[str] = field(default_factory=list)
+    collscan: bool = False
+    in_memory_sort: bool = False
+    keys_examined: int = 0
+    docs_examined: int = 0
+    n_returned: int = 0
+    error: Optional[str] = None
+    max_examined_ratio: float = DEFAULT_MAX_EXAMINED_RATIO
+
+    @property
+    def examined_ratio(self) -> float:
+        """Docs examined per document returned."""
+        return self.docs_examined / max(self.n_returned, 1)
+
+    @property
+    def problems(self) -> List[str]:
+        """Human-readable list of detected problems."""
+        issues: List[str] = []
+        if self.error:
+            issues.append(f"explain failed: {self.error}")
+        if self.collscan:
+            issues.append("COLLSCAN")
+        if self.in_memory_sort and not self.shape.allow_sort:
+            issues.append("in-memory SORT")
+        if self.docs_examined > self.n_returned and self.examined_ratio > self.max_examined_ratio:
+            issues.append(f"examined/returned ratio {self.examined_ratio:.1f}")
+        return issues
+
+    @property
+    def ok(self) -> bool:
+        """True if no problem was detected."""
+        return not self.problems
+
+
+# ============================================================
+# Index definitions
+# ============================================================
+
+MEALS_USER_TIMESTAMP_ID = IndexSpec(
+    "meals", (("user_id", 1), ("timestamp", -1), ("_id", -1)), "idx_user_timestamp_id"
+)
+MEALS_USER_TEXT = IndexSpec(
+    "meals",
+    tuple(SEARCH_TEXT_INDEX_KEYS),
+    SEARCH_TEXT_INDEX_OPTIONS["name"],
+    options={k: v for k, v in SEARCH_TEXT_INDEX_OPTIONS.items() if k != "name"},
+)
+ROLLUPS_USER_DAY = IndexSpec(
+    DAILY_ROLLUPS_COLLECTION, (("user_id", 1), ("day", 1)), "idx_user_day", unique=True
+)
+PROFILES_USER = IndexSpec("nutritional_profiles", (("user_id", 1),), "idx_user_unique", unique=True)
+EVENTS_USER_TS = IndexSpec("activity_events", (("user_id", 1), ("ts", 1)), "idx_user_ts")
+EVENTS_TS_USER_TS = IndexSpec(
+    TIMESERIES_COLLECTION, tuple(TIMESERIES_INDEX_KEYS), TIMESERIES_INDEX_NAME
+)
+SNAPSHOTS_USER_DATE_TS = IndexSpec(
+    "health_snapshots",
+    (("user_id", 1), ("date", 1), ("timestamp", 1)),
+    "idx_user_date_ts_asc",
+)
+
+
+def build_query_shapes(
+    user_id: str = "__index_verifier__",
+    now: Optional[datetime] = None,
+    legacy_date_reads: bool = True,
+) -> List[QueryShape]:
+    """Build every repository query shape with sample parameter values.
+
+    Args:
+        user_id: User to query (use a heavy real user for realistic stats)
+        now: Reference time for date ranges (default: current UTC time)
+        legacy_date_reads: Mirror MongoMealRepository dual-read filters
+
+    Returns:
+        List of QueryShape, one per distinct filter/sort combination
+    """
+    now = now or datetime.now(timezone.utc)
+    start = now - timedelta(days=30)
+
+    date_range: Dict[str, Any] = {"$gte": start, "$lte": now}
+    meal_range: Dict[str, Any] = {"timestamp": date_range}
+    if legacy_date_reads:
+        meal_range = {
+            "$or": [
+                {"timestamp": date_range},
+                {"timestamp": {"$gte": start.isoformat(), "$lte": now.isoformat()}},
+            ]
+        }
+
+    # Keyset position halfway through the range (see _cursor_filter)
+    middle = now - timedelta(days=15)
+    cursor_id = "ffffffff-ffff-ffff-ffff-ffffffffffff"
+    cursor_branches: List[Dict[str, Any]] = [
+        {"timestamp": {"$lt": middle}},
+        {"timestamp": middle, "_id": {"$lt": cursor_id}},
+    ]
+    if legacy_date_reads:
+        cursor_branches += [
+            {"timestamp": {"$lt": middle.isoformat()}},
+            {"timestamp": middle.isoformat(), "_id": {"$lt": cursor_id}},
+        ]
+    meal_cursor: Dict[str, Any] = {"$or": cursor_branches}
+
+    day = now.strftime("%Y-%m-%d")
+    rollup_days: Dict[str, Any] = {
+        "$gte": datetime(start.year, start.month, start.day, tzinfo=timezone.utc),
+        "$lte": datetime(now.year, now.month, now.day, tzinfo=timezone.utc),
+    }
+    ts_now = now.strftime("%Y-%m-%dT%H:%M:00Z")
+    ts_start = start.strftime("%Y-%m-%dT%H:%M:00Z")
+    minute_now = now.replace(second=0, microsecond=0)
+    minute_start = start.replace(second=0, microsecond=0)
+    day_start = datetime(now.year, now.month, now.day, tzinfo=timezone.utc)
+    sample_id = "00000000-0000-0000-0000-000000000000"
+
+    return [
+        # meals (MongoMealRepository)
+        QueryShape(
+            name="meals.by_id",
+            collection="meals",
+            kind="find",
+            sources=(
+                "MongoMealRepository.get_by_id",
+                "MongoMealRepository.exists",
+                "MongoMealRepository.delete",
+                "MongoMealRepository.save",
+            ),
+            filter={"_id": sample_id, "user_id": user_id},
+        ),
+        QueryShape(
+            name="meals.by_ids",
+            collection="meals",
+            kind="find",
+            sources=("MongoMealRepository.get_by_ids",),
+            filter={"_id": {"$in": [sample_id, cursor_id]}, "user_id": user_id},
+            limit=2,
+        ),
+        QueryShape(
+            name="meals.by_user",
+            collection="meals",
+            kind="find",
+            sources=("MongoMealRepository.get_by_user",),
+            filter={"user_id": user_id},
+            sort={"timestamp": -1},
+            limit=100,
+            index=MEALS_USER_TIMESTAMP_ID,
+        ),
+        QueryShape(
+            name="meals.by_user_date_range",
+            collection="meals",
+            kind="find",
+            sources=("MongoMealRepository.get_by_user_and_date_range",),
+            filter={"user_id": user_id, **meal_range},
+            sort={"timestamp": 1},
+            index=MEALS_USER_TIMESTAMP_ID,
+        ),
+        QueryShape(
+            name="meals.history_page",
+            collection="meals",
+            kind="find",
+            sources=(
+                "MongoMealRepository.get_history_page",
+                "MongoMealRepository.get_history_page_documents",
+            ),
+            filter={
+                "user_id": user_id,
+                "meal_type": "LUNCH",
+                "$and": [meal_range, meal_cursor],
+            },
+            sort={"timestamp": -1, "_id": -1},
+            limit=21,
+            index=MEALS_USER_TIMESTAMP_ID,
+        ),
+        QueryShape(
+            name="meals.count_history",
+            collection="meals",
+            kind="count",
+            sources=("MongoMealRepository.count_history",),
+            filter={"user_id": user_id, **meal_range},
+            index=MEALS_USER_TIMESTAMP_ID,
+        ),
+        QueryShape(
+            name="meals.search",
+            collection="meals",
+            kind="find",
+            sources=("MongoMealRepository.search", "MongoMealRepository.search_documents"),
+            filter={
+                "user_id": user_id,
+                "$text": {"$search": "pasta pomod"},
+                "search_terms": {"$all": ["pasta", "pomod"]},
+            },
+            sort={"score": {"$meta": "textScore"}, "timestamp": -1},
+            limit=50,
+            index=MEALS_USER_TEXT,
+            allow_sort=True,
+        ),
+        QueryShape(
+            name="meals.aggregate_by_period",
+            collection="meals",
+            kind="aggregate",
+            sources=("MongoMealRepository.aggregate_by_period",),
+            pipeline=[
+                {"$match": {"user_id": user_id, **meal_range}},
+                {"$group": {"_id": "$meal_type", "meal_count": {"$sum": 1}}},
+            ],
+            index=MEALS_USER_TIMESTAMP_ID,
+        ),
+        QueryShape(
+            name="meals.count_by_user",
+            collection="meals",
+            kind="count",
+            sources=("MongoMealRepository.count_by_user",),
+            filter={"user_id": user_id},
+            index=MEALS_USER_TIMESTAMP_ID,
+        ),
+        QueryShape(
+            name="meals.daily_rollups",
+            collection="meals",
+            kind="aggregate",
+            sources=(
+                "MongoMealRepository.check_daily_rollups",
+                "MongoMealRepository.rebuild_daily_rollups",
+            ),
+            pipeline=[
+                {"$match": {"user_id": user_id}},
+                {"$group": {"_id": "$meal_type", "meal_count": {"$sum": 1}}},
+            ],
+            index=MEALS_USER_TIMESTAMP_ID,
+        ),
+        # daily_nutrition_rollups (MongoMealRepository)
+        QueryShape(
+            name="daily_nutrition_rollups.by_user_days",
+            collection=DAILY_ROLLUPS_COLLECTION,
+            kind="find",
+            sources=(
+                "MongoMealRepository.get_daily_totals",
+                "MongoMealRepository.check_daily_rollups",
+                "MongoMealRepository.save",
+                "MongoMealRepository.delete",
+            ),
+            filter={"user_id": user_id, "day": rollup_days},
+            index=ROLLUPS_USER_DAY,
+        ),
+        # nutritional_profiles (MongoProfileRepository)
+        QueryShape(
+            name="nutritional_profiles.by_id",
+            collection="nutritional_profiles",
+            kind="find",
+            sources=(
+                "MongoProfileRepository.find_by_id",
+                "MongoProfileRepository.save",
+                "MongoProfileRepository.delete",
+            ),
+            filter={"_id": sample_id},
+        ),
+        QueryShape(
+            name="nutritional_profiles.by_ids",
+            collection="nutritional_profiles",
+            kind="find",
+            sources=("MongoProfileRepository.find_by_ids",),
+            filter={"_id": {"$in": [sample_id, cursor_id]}},
+            limit=2,
+        ),
+        QueryShape(
+            name="nutritional_profiles.by_user",
+            collection="nutritional_profiles",
+            kind="find",
+            sources=(
+                "MongoProfileRepository.find_by_user_id",
+                "MongoProfileRepository.exists",
+            ),
+            filter={"user_id": user_id},
+            index=PROFILES_USER,
+        ),
+        QueryShape(
+            name="nutritional_profiles.by_user_ids",
+            collection="nutritional_profiles",
+            kind="find",
+            sources=("MongoProfileRepository.find_by_user_ids",),
+            filter={"user_id": {"$in": [user_id, "__index_verifier_other__"]}},
+            index=PROFILES_USER,
+        ),
+        # activity_events (MongoActivityRepository)
+        QueryShape(
+            name="activity_events.by_user_ts_range",
+            collection="activity_events",
+            kind="find",
+            sources=("MongoActivityRepository.list_events",),
+            filter={"user_id": user_id, "ts": {"$gte": ts_start, "$lt": ts_now}},
+            sort={"ts": 1},
+            limit=1000,
+            index=EVENTS_USER_TS,
+        ),
+        QueryShape(
+            name="activity_events.aggregate_by_period",
+            collection="activity_events",
+            kind="aggregate",
+            sources=("MongoActivityRepository.aggregate_by_period",),
+            pipeline=[
+                {"$match": {"user_id": user_id, "ts": {"$gte": ts_start, "$lt": ts_now}}},
+                {"$group": {"_id": None, "event_count": {"$sum": 1}}},
+            ],
+            index=EVENTS_USER_TS,
+        ),
+        QueryShape(
+            name="activity_events.count_by_day",
+            collection="activity_events",
+            kind="count",
+            sources=("MongoActivityRepository.get_daily_events_count",),
+            filter={
+                "user_id": user_id,
+                "ts": {"$gte": f"{day}T00:00:00Z", "$lte": f"{day}T23:59:59"},
+            },
+            index=EVENTS_USER_TS,
+        ),
+        # activity_ingest_batches (batch idempotency, shared by the time-series backend)
+        QueryShape(
+            name="activity_ingest_batches.by_id",
+            collection=INGEST_BATCHES_COLLECTION,
+            kind="find",
+            sources=(
+                "MongoActivityRepository.ingest_events",
+                "MongoActivityTimeSeriesRepository.ingest_events",
+            ),
+            filter={"_id": f"{user_id}:sample-idempotency-key"},
+        ),
+        # activity_events_ts (MongoActivityTimeSeriesRepository)
+        QueryShape(
+            name="activity_events_ts.by_user_ts_range",
+            collection=TIMESERIES_COLLECTION,
+            kind="find",
+            sources=("MongoActivityTimeSeriesRepository.list_events",),
+            filter={"user_id": user_id, "ts": {"$gte": minute_start, "$lt": minute_now}},
+            sort={"ts": 1},
+            limit=1000,
+            index=EVENTS_TS_USER_TS,
+        ),
+        QueryShape(
+            name="activity_events_ts.stored_minutes",
+            collection=TIMESERIES_COLLECTION,
+            kind="find",
+            sources=("MongoActivityTimeSeriesRepository.ingest_events",),
+            filter={
+                "user_id": user_id,
+                "ts": {"$in": [minute_now - timedelta(minutes=m) for m in range(60)]},
+            },
+            index=EVENTS_TS_USER_TS,
+        ),
+        QueryShape(
+            name="activity_events_ts.aggregate_by_period",
+            collection=TIMESERIES_COLLECTION,
+            kind="aggregate",
+            sources=("MongoActivityTimeSeriesRepository.aggregate_by_period",),
+            pipeline=[
+                {"$match": {"user_id": user_id, "ts": {"$gte": minute_start, "$lt": minute_now}}},
+                {"$group": {"_id": None, "event_count": {"$sum": 1}}},
+            ],
+            index=EVENTS_TS_USER_TS,
+        ),
+        QueryShape(
+            name="activity_events_ts.count_by_day",
+            collection=TIMESERIES_COLLECTION,
+            kind="count",
+            sources=("MongoActivityTimeSeriesRepository.get_daily_events_count",),
+            filter={
+                "user_id": user_id,
+                "ts": {"$gte": day_start, "$lt": day_start + timedelta(days=1)},
+            },
+            index=EVENTS_TS_USER_TS,
+        ),
+        # health_snapshots (MongoActivityRepository, shared by the time-series backend)
+        QueryShape(
+            name="health_snapshots.previous",
+            collection="health_snapshots",
+            kind="find",
+            sources=(
+                "MongoActivityRepository.record_snapshot",
+                "MongoActivityTimeSeriesRepository.record_snapshot",
+            ),
+            filter={"user_id": user_id, "date": day, "timestamp": {"$lt": ts_now}},
+            sort={"timestamp": -1},
+            limit=1,
+            index=SNAPSHOTS_USER_DATE_TS,
+        ),
+        QueryShape(
+            name="health_snapshots.deltas",
+            collection="health_snapshots",
+            kind="find",
+            sources=(
+                "MongoActivityRepository.list_deltas",
+                "MongoActivityTimeSeriesRepository.list_deltas",
+            ),
+            filter={"user_id": user_id, "date": day, "timestamp": {"$gt": ts_start}},
+            sort={"timestamp": 1},
+            limit=100,
+            index=SNAPSHOTS_USER_DATE_TS,
+        ),
+        QueryShape(
+            name="health_snapshots.latest",
+            collection="health_snapshots",
+            kind="find",
+            sources=(
+                "MongoActivityRepository.get_daily_totals",
+                "MongoActivityTimeSeriesRepository.get_daily_totals",
+            ),
+            filter={"user_id": user_id, "date": day},
+            sort={"timestamp": -1},
+            limit=1,
+            index=SNAPSHOTS_USER_DATE_TS,
+        ),
+        # health_daily_totals (last totals per user and day)
+        QueryShape(
+            name="health_daily_totals.by_id",
+            collection=DAILY_TOTALS_COLLECTION,
+            kind="find",
+            sources=(
+                "MongoActivityRepository.record_snapshot",
+                "MongoActivityTimeSeriesRepository.record_snapshot",
+                "MongoActivityRepository.get_daily_totals",
+                "MongoActivityTimeSeriesRepository.get_daily_totals",
+            ),
+            filter={"_id": f"{user_id}_{day}"},
+        ),
+    ]
+
+
+# ============================================================
+# Explain analysis
+# ============================================================
+
+
+def _walk_plan(stage: Any, report: ShapeReport) -> None:
+    """Collect stage information from a (winning) plan tree."""
+    if isinstance(stage, list):
+        for item in stage:
+            _walk_plan(item, report)
+        return
+    if not isinstance(stage, dict):
+        return
+
+    stage_name = stage.get("stage")
+    if stage_name == "COLLSCAN":
+        report.collscan = True
+    elif stage_name == "SORT":
+        report.in_memory_sort = True
+    elif stage_name in ("IXSCAN", "COUNT_SCAN", "DISTINCT_SCAN", "IDHACK", "EXPRESS_IXSCAN"):
+        index_name = stage.get("indexName", "_id_")
+        if index_name not in report.indexes_used:
+            report.indexes_used.append(index_name)
+
+    for key in ("inputStage", "inputStages", "queryPlan", "winningPlan", "shards"):
+        if key in stage:
+            _walk_plan(stage[key], report)
+
+
+def _find_sections(explain: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Return explain sections holding queryPlanner/executionStats.
+
+    find/count put them at top level; aggregate may nest them in the
+    first stage ($cursor) depending on the server version.
+    """
+    if "queryPlanner" in explain:
+        return [explain]
+    sections: List[Dict[str, Any]] = []
+    for stage in explain.get("stages", []):
+        cursor = stage.get("$cursor")
+        if isinstance(cursor, dict) and "queryPlanner" in cursor:
+            sections.append(cursor)
+    return sections
+
+
+def analyze_explain(
+    shape: QueryShape,
+    explain: Dict[str, Any],
+    max_examined_ratio: float = DEFAULT_MAX_EXAMINED_RATIO,
+) -> ShapeReport:
+    """Analyze an explain (executionStats) result for a query shape.
+
+    Args:
+        shape: Explained shape
+        explain: Raw explain command output
+        max_examined_ratio: Threshold for the examined/returned ratio
+
+    Returns:
+        ShapeReport with detected stages and counters
+    """
+    report = ShapeReport(shape=shape, max_examined_ratio=max_examined_ratio)
+
+    for section in _find_sections(explain):
+        _walk_plan(section["queryPlanner"].get("winningPlan", {}), report)
+        stats = section.get("executionStats", {})
+        report.keys_examined += int(stats.get("totalKeysExamined", 0))
+        report.docs_examined += int(stats.get("totalDocsExamined", 0))
+        report.n_returned += int(stats.get("nReturned", 0))
+
+    return report
+
+
+async def verify_shape(
+    db: AsyncIOMotorDatabase[Dict[str, Any]],
+    shape: QueryShape,
+    max_examined_ratio: float = DEFAULT_MAX_EXAMINED_RATIO,
+) -> ShapeReport:
+    """Run explain for one shape and analyze the result."""
+    try:
+        explain = await db.command(shape.explain_command())
+    except Exception as e:
+        return ShapeReport(shape=shape, error=str(e), max_examined_ratio=max_examined_ratio)
+    return analyze_explain(shape, explain, max_examined_ratio)
+
+
+async def verify_index_coverage(
+    db: AsyncIOMotorDatabase[Dict[str, Any]],
+    shapes: List[QueryShape],
+    max_examined_ratio: float = DEFAULT_MAX_EXAMINED_RATIO,
+) -> List[ShapeReport]:
+    """Explain every shape and return one report per shape."""
+    return [await verify_shape(db, shape, max_examined_ratio) for shape in shapes]
+
+
+async def create_missing_indexes(
+    db: AsyncIOMotorDatabase[Dict[str, Any]],
+    shapes: List[QueryShape],
+) -> List[IndexSpec]:
+    """Create the indexes declared by shapes when no equivalent exists.
+
+    An index is considered present when an existing index key pattern
+    starts with the declared keys (same fields, order and direction).
+    Missing time-series collections are skipped: create_index would create
+    them as regular collections (see
+    MongoActivityTimeSeriesRepository.ensure_collection).
+
+    Returns:
+        List of created index specs
+    """
+    created: List[IndexSpec] = []
+    specs = {shape.index for shape in shapes if shape.index is not None}
+
+    existing_collections = set(await db.list_collection_names())
+
+    for spec in sorted(specs, key=lambda s: (s.collection, s.name)):
+        if spec.collection == TIMESERIES_COLLECTION and spec.collection not in existing_collections:
+            continue
+        collection = db[spec.collection]
+        existing = await collection.list_indexes().to_list(length=None)
+        if any(spec.matches(idx.get("key", {})) for idx in existing):
+            continue
+        await collection.create_index(
+            list(spec.keys), name=spec.name, unique=spec.unique, **spec.options
+        )
+        created.append(spec)
+
+    return created
+
+
+__all__ = [
+    "DEFAULT_MAX_EXAMINED_RATIO",
+    "IndexSpec",
+    "QueryShape",
+    "ShapeReport",
+    "build_query_shapes",
+    "analyze_explain",
+    "verify_shape",
+    "verify_index_coverage",
+    "create_missing_indexes",
+]
@@ -4,13 +4,87 @@ Provides persistent storage for Meal aggregates using MongoDB Atlas.
 Uses MongoBaseRepository for common patterns.
 """
 
-from typing import Optional, Dict, List, Any
-from datetime import datetime
+from typing import Optional, Dict, List, Any, Sequence, Tuple
+from datetime import date, datetime, time, timezone
 from uuid import UUID
+import logging
 
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import DeleteMany, ReplaceOne, UpdateOne
+
+from infrastructure.config import (
+    is_meal_daily_rollups_read_enabled,
+    is_meal_dates_legacy_read_enabled,
+)
 from infrastructure.persistence.mongodb.base import MongoBaseRepository
+from metrics.core import registry
 from domain.meal.core.entities.meal import Meal
 from domain.meal.core.entities.meal_entry import MealEntry
+from domain.meal.core.services.search_text import (
+    DISH_NAME_WEIGHT,
+    ENTRY_NAME_WEIGHT,
+    NOTES_WEIGHT,
+    token_prefixes,
+    tokenize,
+    weighted_tokens,
+)
+from domain.shared.ports.meal_repository import (
+    MealCursor,
+    MealPeriodTotals,
+    MealProjection,
+    rollup_day,
+)
+
+logger = logging.getLogger(__name__)
+
+# Nutrition fields summed by aggregate_by_period and daily rollups
+_TOTAL_FIELDS = (
+    "total_calories",
+    "total_protein",
+    "total_carbs",
+    "total_fat",
+    "total_fiber",
+    "total_sugar",
+    "total_sodium",
+)
+
+# Materialized per-user daily totals, keyed by (user_id, day)
+DAILY_ROLLUPS_COLLECTION = "daily_nutrition_rollups"
+
+# Meal fields read back on write to compute rollup increments
+_ROLLUP_PROJECTION: Dict[str, Any] = {
+    "_id": 0,
+    "user_id": 1,
+    "timestamp": 1,
+    "meal_type": 1,
+    **{field_name: 1 for field_name in _TOTAL_FIELDS},
+}
+
+# Tolerance of the rollup consistency check ($inc sums floats)
+ROLLUP_TOLERANCE = 1e-6
+
+# Text index definition (see scripts/setup_mongodb_indexes.py).
+# "none" disables stemming and stop words: tokens are matched exactly as
+# produced by search_text.tokenize (case and diacritic insensitive).
+SEARCH_TEXT_INDEX_KEYS: List[Tuple[str, Any]] = [
+    ("user_id", 1),
+    ("dish_name", "text"),
+    ("entries.name", "text"),
+    ("entries.display_name", "text"),
+    ("notes", "text"),
+    ("search_terms", "text"),
+]
+SEARCH_TEXT_INDEX_OPTIONS: Dict[str, Any] = {
+    "name": "idx_user_text",
+    "default_language": "none",
+    "weights": {
+        "dish_name": int(DISH_NAME_WEIGHT),
+        "entries.name": int(ENTRY_NAME_WEIGHT),
+        "entries.display_name": int(ENTRY_NAME_WEIGHT),
+        "notes": int(NOTES_WEIGHT),
+        "search_terms": 1,
+    },
+}
 
 
 class MongoMealRepository(MongoBaseRepository[Meal]):
@@ -21,13 +95,19 @@ class MongoMealRepository(MongoBaseRepository[Meal]):
     - Each Meal is a single MongoDB document
     - MealEntry objects are embedded as array of subdocuments
     - UUID fields stored as strings
-    - Datetime fields stored as ISO 8601 strings (timezone-aware)
+    - Datetime fields stored as native BSON dates (UTC)
+
+    Date migration (dual-read, single-write):
+    - Writes always store BSON dates
+    - Reads accept both BSON dates and legacy ISO 8601 strings
+    - While legacy reads are enabled, range filters match both types;
+      disable them once scripts/migrate_meal_dates.py has run
 
     Document Schema:
     {
         "_id": "uuid-string",           # Meal ID
         "user_id": "string",
-        "timestamp": "2025-11-12T10:00:00Z",
+        "timestamp": ISODate("2025-11-12T10:00:00Z"),
         "meal_type": "LUNCH",
         "dish_name": "Pasta",
         "image_url": "https://...",
@@ -49,15 +129,53 @@ class MongoMealRepository(MongoBaseRepository[Meal]):
         ...
         "analysis_id": "optional-string",
         "notes": "optional-string",
-        "created_at": "2025-11-12T10:00:00Z",
-        "updated_at": "2025-11-12T10:00:00Z"
+        "search_terms": ["pa", "pas", "past", "pasta", ...],
+        "created_at": ISODate("2025-11-12T10:00:00Z"),
+        "updated_at": ISODate("2025-11-12T10:00:00Z")
     }
 
+    search_terms holds every prefix of the normalized search tokens, so
+    prefix queries are answered by the text index (scripts/
+    backfill_meal_search_terms.py fills it for older documents).
+
+    Daily rollups (daily_nutrition_rollups, one document per user and
+    UTC day) hold meal_count, the totals, breakdown_by_type and
+    meal_count_by_type. save and delete read the previous meal version
+    back atomically (find_one_and_update / find_one_and_delete) and $inc
+    the difference, so summaries read one small document per day.
+
     Indexes:
-    - (user_id, timestamp): For user meal list queries
+    - (user_id, timestamp, _id): User meal lists, history keyset pages
+    - (user_id, text): Full-text search (idx_user_text)
     - _id: Unique index (automatic)
+    - daily_nutrition_rollups (user_id, day): Unique (idx_user_day)
     """
 
+    def __init__(
+        self,
+        client: Optional[AsyncIOMotorClient[Dict[str, Any]]] = None,
+        legacy_date_reads: Optional[bool] = None,
+        daily_rollup_reads: Optional[bool] = None,
+    ):
+        """
+        Initialize repository.
+
+        Args:
+            client: Motor client (if None, creates new one from config)
+            legacy_date_reads: Also match legacy ISO string dates in range
+                queries (if None, read from MONGODB_MEAL_DATES_LEGACY_READ)
+            daily_rollup_reads: Serve get_daily_totals from the rollups
+                (if None, read from MONGODB_MEAL_DAILY_ROLLUPS_READ)
+        """
+        super().__init__(client)
+        if legacy_date_reads is None:
+            legacy_date_reads = is_meal_dates_legacy_read_enabled()
+        if daily_rollup_reads is None:
+            daily_rollup_reads = is_meal_daily_rollups_read_enabled()
+        self._legacy_date_reads = legacy_date_reads
+        self._daily_rollup_reads = daily_rollup_reads
+        self._rollups = self._db[DAILY_ROLLUPS_COLLECTION]
+
     @property
     def collection_name(self) -> str:
         """MongoDB collection name."""
@@ -78,10 +196,12 @@ class MongoMealRepository(MongoBaseRepository[Meal]):
             MongoDB document dict
         """
         meal = entity
-        return {
+        document: Dict[str, Any] = {
             "_id": self.uuid_to_str(meal.id),
             "user_id": meal.user_id,
-            "timestamp": self.datetime_to_iso(meal.timestamp),
+            "timestamp": self.datetime_to_bson(meal.timestamp),
+            # BSON dates are UTC: the client offset is restored on read
+            "timestamp_offset": self.utc_offset_minutes(meal.timestamp),
             "meal_type": meal.meal_type,
             "dish_name": meal.dish_name,
             "image_url": meal.image_url,
@@ -97,9 +217,29 @@ class MongoMealRepository(MongoBaseRepository[Meal]):
             "total_sodium": meal.total_sodium,
             "analysis_id": meal.analysis_id,
             "notes": meal.notes,
-            "created_at": self.datetime_to_iso(meal.created_at),
-            "updated_at": self.datetime_to_iso(meal.updated_at),
+            "created_at": self.datetime_to_bson(meal.created_at),
+            "updated_at": self.datetime_to_bson(meal.updated_at),
         }
+        document["search_terms"] = self.search_terms_from_document(document)
+        return document
+
+    @staticmethod
+    def search_terms_from_document(doc: Dict[str, Any]) -> List[str]:
+        """
+        Compute search_terms (token prefixes) from a meal document.
+
+        Args:
+            doc: Meal document (dish_name, entries, notes are read)
+
+        Returns:
+            All prefixes of the normalized tokens of searchable fields
+        """
+        fields: List[Tuple[float, Optional[str]]] = [(DISH_NAME_WEIGHT, doc.get("dish_name"))]
+        for entry in doc.get("entries") or []:
+            fields.append((ENTRY_NAME_WEIGHT, entry.get("name")))
+            fields.append((ENTRY_NAME_WEIGHT, entry.get("display_name")))
+        fields.append((NOTES_WEIGHT, doc.get("notes")))
+        return token_prefixes(weighted_tokens(fields))
 
     def from_document(self, doc: Dict[str, Any]) -> Meal:
         """
@@ -120,7 +260,7 @@ class MongoMealRepository(MongoBaseRepository[Meal]):
             meal = Meal(
                 id=self.str_to_uuid(doc["_id"]),
                 user_id=doc["user_id"],
-                timestamp=self.iso_to_datetime(doc["timestamp"]),
+                timestamp=self.bson_to_datetime(doc["timestamp"], doc.get("timestamp_offset")),
                 meal_type=doc["meal_type"],
                 dish_name=doc.get("dish_name", "Meal"),
                 image_url=doc.get("image_url"),
@@ -136,8 +276,8 @@ class MongoMealRepository(MongoBaseRepository[Meal]):
                 total_sodium=doc.get("total_sodium", 0.0),
                 analysis_id=doc.get("analysis_id"),
                 notes=doc.get("notes"),
-                created_at=self.iso_to_datetime(doc["created_at"]),
-                updated_at=self.iso_to_datetime(doc["updated_at"]),
+                created_at=self.bson_to_datetime(doc["created_at"]),
+                updated_at=self.bson_to_datetime(doc["updated_at"]),
             )
 
             return meal
@@ -168,7 +308,7 @@ class MongoMealRepository(MongoBaseRepository[Meal]):
             "category": entry.category,
             "barcode": entry.barcode,
             "image_url": entry.image_url,
-            "created_at": self.datetime_to_iso(entry.created_at),
+            "created_at": self.datetime_to_bson(entry.created_at),
         }
 
     def _dict_to_entry(self, entry_dict: Dict[str, Any]) -> MealEntry:
@@ -191,9 +331,92 @@ class MongoMealRepository(MongoBaseRepository[Meal]):
             category=entry_dict.get("category"),
             barcode=entry_dict.get("barcode"),
             image_url=entry_dict.get("image_url"),
-            created_at=self.iso_to_datetime(entry_dict["created_at"]),
+            created_at=self.bson_to_datetime(entry_dict["created_at"]),
         )
 
+    @staticmethod
+    def _projection(projection: Optional[MealProjection]) -> Dict[str, Any]:
+        """
+        Build MongoDB projection for a read.
+
+        Full reads only drop search_terms (never mapped to the entity);
+        partial reads load the requested fields plus the ones required to
+        build a Meal, so entries are not transferred unless selected.
+        """
+        if projection is None:
+            return {"search_terms": 0}
+        fields = {"_id" if name == "id" else name: 1 for name in sorted(projection.loaded_fields)}
+        if "timestamp" in fields:
+            fields["timestamp_offset"] = 1
+        return fields
+
+    def _timestamp_range_filter(
+        self, start_date: Optional[datetime], end_date: Optional[datetime]
+    ) -> Dict[str, Any]:
+        """
+        Build timestamp range filter (inclusive bounds, each optional).
+
+        Matches native BSON dates; while legacy reads are enabled, also
+        matches documents that still store ISO strings. Both branches
+        use the (user_id, timestamp) index.
+        """
+        date_range: Dict[str, Any] = {}
+        iso_range: Dict[str, Any] = {}
+        if start_date is not None:
+            date_range["$gte"] = self.datetime_to_bson(start_date)
+            iso_range["$gte"] = self.datetime_to_iso(start_date)
+        if end_date is not None:
+            date_range["$lte"] = self.datetime_to_bson(end_date)
+            iso_range["$lte"] = self.datetime_to_iso(end_date)
+
+        if not self._legacy_date_reads:
+            return {"timestamp": date_range}
+        return {"$or": [{"timestamp": date_range}, {"timestamp": iso_range}]}
+
+    def _cursor_filter(self, after: MealCursor) -> Dict[str, Any]:
+        """
+        Build keyset filter for meals strictly after a cursor.
+
+        History is sorted by (timestamp, _id) descending, so "after" means
+        an older timestamp, or the same timestamp with a lower _id.
+        """
+        meal_id = self.uuid_to_str(after.meal_id)
+        timestamps: List[Any] = [self.datetime_to_bson(after.timestamp)]
+        if self._legacy_date_reads:
+            timestamps.append(self.datetime_to_iso(after.timestamp))
+
+        branches: List[Dict[str, Any]] = []
+        for ts in timestamps:
+            branches.append({"timestamp": {"$lt": ts}})
+            branches.append({"timestamp": ts, "_id": {"$lt": meal_id}})
+        return {"$or": branches}
+
+    def _history_filter(
+        self,
+        user_id: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        meal_type: Optional[str] = None,
+        after: Optional[MealCursor] = None,
+    ) -> Dict[str, Any]:
+        """Build meal history filter with every condition pushed to MongoDB."""
+        filter_dict: Dict[str, Any] = {"user_id": user_id}
+        if meal_type is not None:
+            filter_dict["meal_type"] = meal_type
+
+        # Range and cursor are both $or conditions (legacy dual-read)
+        conditions: List[Dict[str, Any]] = []
+        if start_date is not None or end_date is not None:
+            conditions.append(self._timestamp_range_filter(start_date, end_date))
+        if after is not None:
+            conditions.append(self._cursor_filter(after))
+
+        if len(conditions) == 1:
+            filter_dict.update(conditions[0])
+        elif conditions:
+            filter_dict["$and"] = conditions
+        return filter_dict
+
     # ============================================================
     # Repository Operations (IMealRepository interface)
     # ============================================================
@@ -208,41 +431,75 @@ class MongoMealRepository(MongoBaseRepository[Meal]):
         Note:
             - Uses upsert to handle both insert and update
             - Updates meal.updated_at to current UTC time
+            - Moves the meal totals between daily rollups (previous
+              version read back atomically by the same write)
         """
-        from datetime import timezone
-
         meal.updated_at = datetime.now(timezone.utc)
 
         document = self.to_document(meal)
         filter_dict = {"_id": document["_id"]}
         update_dict = {"$set": document}
 
-        await self._update_one(filter_dict, update_dict, upsert=True)
+        previous = await self._find_one_and_update(
+            filter_dict, update_dict, upsert=True, projection=_ROLLUP_PROJECTION
+        )
+        await self._apply_rollup_changes(previous, document)
 
-    async def get_by_id(self, meal_id: UUID, user_id: str) -> Optional[Meal]:
+    async def get_by_id(
+        self, meal_id: UUID, user_id: str, projection: Optional[MealProjection] = None
+    ) -> Optional[Meal]:
         """
         Retrieve meal by ID for a specific user.
 
         Args:
             meal_id: Unique meal identifier
             user_id: User identifier (for authorization)
+            projection: Fields to load (default: full meal)
 
         Returns:
             Meal if found and belongs to user, None otherwise
         """
         filter_dict = {"_id": self.uuid_to_str(meal_id), "user_id": user_id}
 
-        doc = await self._find_one(filter_dict)
+        doc = await self._find_one(filter_dict, projection=self._projection(projection))
         if doc is None:
             return None
 
         return self.from_document(doc)
 
+    async def get_by_ids(
+        self,
+        meal_ids: Sequence[UUID],
+        user_id: str,
+        projection: Optional[MealProjection] = None,
+    ) -> List[Meal]:
+        """
+        Retrieve several meals of a user with a single $in query.
+
+        Args:
+            meal_ids: Meal identifiers (duplicates allowed)
+            user_id: User identifier (for authorization)
+            projection: Fields to load (default: full meal)
+
+        Returns:
+            Meals found and belonging to user, in no particular order
+        """
+        ids = list(dict.fromkeys(self.uuid_to_str(meal_id) for meal_id in meal_ids))
+        if not ids:
+            return []
+
+        filter_dict = {"_id": {"$in": ids}, "user_id": user_id}
+        docs = await self._find_many(
+            filter_dict, limit=len(ids), projection=self._projection(projection)
+        )
+        return [self.from_document(doc) for doc in docs]
+
     async def get_by_user(
         self,
         user_id: str,
         limit: int = 100,
         offset: int = 0,
+        projection: Optional[MealProjection] = None,
     ) -> List[Meal]:
         """
         Get meals for a user with pagination.
@@ -251,14 +508,21 @@ class MongoMealRepository(MongoBaseRepository[Meal]):
             user_id: User identifier
             limit: Maximum number of meals to return
             offset: Number of meals to skip
+            projection: Fields to load (default: full meals)
 
         Returns:
             List of meals ordered by timestamp descending (newest first)
         """
         filter_dict = {"user_id": user_id}
-        sort = [("timestamp", -1)]  # Descending (newest first)
+        sort: List[Tuple[str, Any]] = [("timestamp", -1)]  # Descending (newest first)
 
-        docs = await self._find_many(filter_dict, sort=sort, limit=limit, skip=offset)
+        docs = await self._find_many(
+            filter_dict,
+            sort=sort,
+            limit=limit,
+            skip=offset,
+            projection=self._projection(projection),
+        )
 
         return [self.from_document(doc) for doc in docs]
 
@@ -279,20 +543,576 @@ class MongoMealRepository(MongoBaseRepository[Meal]):
         Returns:
             List of meals ordered by timestamp ascending (oldest first)
         """
-        # Convert to ISO strings for MongoDB comparison
-        start_iso = self.datetime_to_iso(start_date)
-        end_iso = self.datetime_to_iso(end_date)
-
         filter_dict = {
             "user_id": user_id,
-            "timestamp": {"$gte": start_iso, "$lte": end_iso},
+            **self._timestamp_range_filter(start_date, end_date),
         }
-        sort = [("timestamp", 1)]  # Ascending (oldest first)
+        sort: List[Tuple[str, Any]] = [("timestamp", 1)]  # Ascending (oldest first)
+
+        docs = await self._find_many(filter_dict, sort=sort, projection=self._projection(None))
 
-        docs = await self._find_many(filter_dict, sort=sort)
+        return [self.from_document(doc) for doc in docs]
 
+    async def get_history_page(
+        self,
+        user_id: str,
+        limit: int,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        meal_type: Optional[str] = None,
+        after: Optional[MealCursor] = None,
+        offset: int = 0,
+        projection: Optional[MealProjection] = None,
+    ) -> List[Meal]:
+        """
+        Get one page of meal history with filters applied in the query.
+
+        Served by the (user_id, timestamp, _id) index: with a keyset
+        cursor MongoDB seeks straight to the page instead of skipping.
+
+        Args:
+            user_id: User identifier
+            limit: Maximum number of meals to return
+            start_date: Start of date range (inclusive, optional)
+            end_date: End of date range (inclusive, optional)
+            meal_type: Only meals of this type (optional)
+            after: Keyset cursor, return meals strictly after it (optional)
+            offset: Number of meals to skip (after the cursor, if any)
+            projection: Fields to load (default: full meals)
+
+        Returns:
+            List of meals ordered by (timestamp, _id) descending
+        """
+        docs = await self.get_history_page_documents(
+            user_id, limit, start_date, end_date, meal_type, after, offset, projection
+        )
         return [self.from_document(doc) for doc in docs]
 
+    async def get_history_page_documents(
+        self,
+        user_id: str,
+        limit: int,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        meal_type: Optional[str] = None,
+        after: Optional[MealCursor] = None,
+        offset: int = 0,
+        projection: Optional[MealProjection] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Same query as get_history_page, returning the raw documents.
+
+        For read-only callers that map documents themselves (GraphQL)
+        instead of building Meal aggregates.
+
+        Returns:
+            List of (projected) meal documents ordered by (timestamp, _id) descending
+        """
+        filter_dict = self._history_filter(user_id, start_date, end_date, meal_type, after)
+        sort: List[Tuple[str, Any]] = [("timestamp", -1), ("_id", -1)]
+
+        return await self._find_many(
+            filter_dict,
+            sort=sort,
+            limit=limit,
+            skip=offset,
+            projection=self._projection(projection),
+        )
+
+    async def count_history(
+        self,
+        user_id: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        meal_type: Optional[str] = None,
+    ) -> int:
+        """
+        Count meals matching history filters (count_documents, no fetch).
+
+        Args:
+            user_id: User identifier
+            start_date: Start of date range (inclusive, optional)
+            end_date: End of date range (inclusive, optional)
+            meal_type: Only meals of this type (optional)
+
+        Returns:
+            Number of matching meals
+        """
+        filter_dict = self._history_filter(user_id, start_date, end_date, meal_type)
+        return await self._count(filter_dict)
+
+    async def aggregate_by_period(
+        self,
+        user_id: str,
+        periods: List[Tuple[datetime, datetime]],
+    ) -> Dict[int, MealPeriodTotals]:
+        """
+        Aggregate meal totals per period with a single pipeline.
+
+        The period index of each meal is the number of period starts
+        lower than or equal to its timestamp, minus one, compared as BSON
+        dates (or as ISO strings for legacy documents). Meals are then
+        grouped by (period, meal_type) so that the breakdown comes back
+        in the same round trip; the few rows per period are folded here.
+
+        Args:
+            user_id: User identifier
+            periods: Sorted, contiguous (period_start, period_end) tuples
+
+        Returns:
+            Mapping period index -> totals (only periods with meals)
+        """
+        if not periods:
+            return {}
+
+        starts: Any = [self.datetime_to_bson(start) for start, _ in periods]
+        if self._legacy_date_reads:
+            starts = {
+                "$cond": [
+                    {"$eq": [{"$type": "$timestamp"}, "date"]},
+                    starts,
+                    [self.datetime_to_iso(start) for start, _ in periods],
+                ]
+            }
+
+        group_stage: Dict[str, Any] = {
+            "_id": {
+                "period": {
+                    "$subtract": [
+                        {
+                            "$size": {
+                                "$filter": {
+                                    "input": starts,
+                                    "as": "start",
+                                    "cond": {"$lte": ["$$start", "$timestamp"]},
+                                }
+                            }
+                        },
+                        1,
+                    ]
+                },
+                "meal_type": "$meal_type",
+            },
+            "meal_count": {"$sum": 1},
+        }
+        for field_name in _TOTAL_FIELDS:
+            group_stage[field_name] = {"$sum": f"${field_name}"}
+
+        pipeline: List[Dict[str, Any]] = [
+            {
+                "$match": {
+                    "user_id": user_id,
+                    **self._timestamp_range_filter(periods[0][0], periods[-1][1]),
+                }
+            },
+            {"$group": group_stage},
+        ]
+
+        rows = await self._aggregate(pipeline)
+
+        results: Dict[int, MealPeriodTotals] = {}
+        for row in rows:
+            index = int(row["_id"]["period"])
+            totals = results.setdefault(index, MealPeriodTotals())
+            totals.total_calories += row.get("total_calories") or 0
+            totals.total_protein += row.get("total_protein") or 0.0
+            totals.total_carbs += row.get("total_carbs") or 0.0
+            totals.total_fat += row.get("total_fat") or 0.0
+            totals.total_fiber += row.get("total_fiber") or 0.0
+            totals.total_sugar += row.get("total_sugar") or 0.0
+            totals.total_sodium += row.get("total_sodium") or 0.0
+            totals.meal_count += int(row.get("meal_count", 0))
+
+            meal_type = row["_id"].get("meal_type")
+            if meal_type is not None:
+                totals.breakdown_by_type[meal_type] = totals.breakdown_by_type.get(
+                    meal_type, 0.0
+                ) + float(row.get("total_calories") or 0)
+
+        return results
+
+    # ============================================================
+    # Daily Nutrition Rollups
+    # ============================================================
+
+    @staticmethod
+    def _day_to_bson(day: date) -> datetime:
+        """Rollup key of a day: its midnight as UTC BSON date."""
+        return datetime.combine(day, time.min, tzinfo=timezone.utc)
+
+    @classmethod
+    def rollup_increments(cls, doc: Dict[str, Any], sign: int) -> Tuple[date, Dict[str, Any]]:
+        """
+        Compute the $inc of a meal document on its daily rollup.
+
+        Args:
+            doc: Meal document (timestamp, meal_type and totals are read)
+            sign: 1 to add the meal, -1 to remove it
+
+        Returns:
+            (UTC day, {rollup field: increment})
+        """
+        meal_type = doc.get("meal_type")
+        increments: Dict[str, Any] = {
+            "meal_count": sign,
+            f"meal_count_by_type.{meal_type}": sign,
+            f"breakdown_by_type.{meal_type}": sign * float(doc.get("total_calories") or 0),
+        }
+        for field_name in _TOTAL_FIELDS:
+            increments[field_name] = sign * (doc.get(field_name) or 0)
+        return rollup_day(cls.bson_to_datetime(doc["timestamp"])), increments
+
+    def _rollup_updates(
+        self, previous: Optional[Dict[str, Any]], current: Optional[Dict[str, Any]]
+    ) -> Dict[Tuple[str, date], UpdateOne]:
+        """Build the rollup upserts, per (user_id, day), moving a meal from previous to current."""
+        increments: Dict[Tuple[str, date], Dict[str, Any]] = {}
+        for doc, sign in ((previous, -1), (current, 1)):
+            if doc is None:
+                continue
+            day, doc_increments = self.rollup_increments(doc, sign)
+            merged = increments.setdefault((doc["user_id"], day), {})
+            for key, value in doc_increments.items():
+                merged[key] = merged.get(key, 0) + value
+
+        updates: Dict[Tuple[str, date], UpdateOne] = {}
+        for (user_id, day), merged in increments.items():
+            # Edits not touching day, type or totals (e.g. notes) cancel out
+            changes = {key: value for key, value in merged.items() if value}
+            if not changes:
+                continue
+            updates[(user_id, day)] = UpdateOne(
+                {"user_id": user_id, "day": self._day_to_bson(day)},
+                {"$inc": changes, "$currentDate": {"updated_at": True}},
+                upsert=True,
+            )
+        return updates
+
+    async def _apply_rollup_changes(
+        self, previous: Optional[Dict[str, Any]], current: Optional[Dict[str, Any]]
+    ) -> None:
+        """
+        Apply a meal write to the daily rollups.
+
+        The meal write has already succeeded and rollups are a derived read
+        model, so a failure is not raised: it is counted in
+        meal_rollup_write_errors and the affected days are marked dirty, so
+        get_daily_totals falls back to summing meals until
+        scripts/rebuild_daily_rollups.py rebuilds them.
+        """
+        updates = self._rollup_updates(previous, current)
+        if not updates:
+            return
+        try:
+            await self._rollups.bulk_write(list(updates.values()), ordered=False)
+        except Exception as e:
+            registry.counter("meal_rollup_write_errors").inc()
+            user_id = (current or previous or {}).get("user_id")
+            logger.error(
+                f"Error updating {DAILY_ROLLUPS_COLLECTION}: user_id={user_id}, error={e} "
+                "(run scripts/rebuild_daily_rollups.py --check)"
+            )
+            await self._mark_rollups_dirty(list(updates))
+
+    async def _mark_rollups_dirty(self, days: List[Tuple[str, date]]) -> None:
+        """Flag rollup days whose increments may not have been applied."""
+        operations = [
+            UpdateOne(
+                {"user_id": user_id, "day": self._day_to_bson(day)},
+                {"$set": {"dirty": True}},
+                upsert=True,
+            )
+            for user_id, day in days
+        ]
+        try:
+            await self._rollups.bulk_write(operations, ordered=False)
+        except Exception as e:
+            logger.error(f"Error marking {DAILY_ROLLUPS_COLLECTION} days dirty: {days}, error={e}")
+
+    @staticmethod
+    def rollup_from_document(doc: Dict[str, Any]) -> MealPeriodTotals:
+        """
+        Convert a rollup document to period totals.
+
+        Meal types whose meals were all removed keep a zero count in the
+        document and are left out of the breakdown.
+        """
+        counts = doc.get("meal_count_by_type") or {}
+        breakdown = doc.get("breakdown_by_type") or {}
+        return MealPeriodTotals(
+            total_calories=doc.get("total_calories") or 0,
+            total_protein=doc.get("total_protein") or 0.0,
+            total_carbs=doc.get("total_carbs") or 0.0,
+            total_fat=doc.get("total_fat") or 0.0,
+            total_fiber=doc.get("total_fiber") or 0.0,
+            total_sugar=doc.get("total_sugar") or 0.0,
+            total_sodium=doc.get("total_sodium") or 0.0,
+            meal_count=int(doc.get("meal_count") or 0),
+            breakdown_by_type={
+                meal_type: float(calories)
+                for meal_type, calories in breakdown.items()
+                if counts.get(meal_type, 0) > 0
+            },
+        )
+
+    async def _find_rollups(
+        self, user_id: str, start_day: Optional[date] = None, end_day: Optional[date] = None
+    ) -> Dict[date, Dict[str, Any]]:
+        """Read rollup documents of a user, optionally within [start_day, end_day]."""
+        filter_dict: Dict[str, Any] = {"user_id": user_id}
+        if start_day is not None and end_day is not None:
+            filter_dict["day"] = {
+                "$gte": self._day_to_bson(start_day),
+                "$lte": self._day_to_bson(end_day),
+            }
+        try:
+            docs = await self._rollups.find(filter_dict, {"_id": 0}).to_list(length=None)
+        except Exception as e:
+            logger.error(
+                f"Error in find: collection={DAILY_ROLLUPS_COLLECTION}, "
+                f"filter={filter_dict}, error={e}"
+            )
+            raise
+        return {rollup_day(self.bson_to_datetime(doc["day"])): doc for doc in docs}
+
+    async def get_daily_totals(
+        self,
+        user_id: str,
+        start_day: date,
+        end_day: date,
+    ) -> Optional[Dict[date, MealPeriodTotals]]:
+        """
+        Read per-day totals from the daily_nutrition_rollups collection.
+
+        Args:
+            user_id: User identifier
+            start_day: First UTC day (inclusive)
+            end_day: Last UTC day (inclusive)
+
+        Returns:
+            Mapping day -> totals (only days with meals), or None while
+            rollup reads are disabled (MONGODB_MEAL_DAILY_ROLLUPS_READ) or
+            a day of the range is dirty (failed rollup write)
+        """
+        if not self._daily_rollup_reads:
+            return None
+
+        docs = await self._find_rollups(user_id, start_day, end_day)
+        if any(doc.get("dirty") for doc in docs.values()):
+            return None
+        results: Dict[date, MealPeriodTotals] = {}
+        for day, doc in docs.items():
+            totals = self.rollup_from_document(doc)
+            if totals.meal_count > 0:
+                results[day] = totals
+        return results
+
+    @staticmethod
+    def daily_rollups_pipeline(user_id: str) -> List[Dict[str, Any]]:
+        """
+        Build the pipeline recomputing the rollup documents of a user from meals.
+
+        Meals are grouped by (UTC day, meal_type), then folded per day so
+        that breakdown and counts by type come back in the same documents.
+        $toDate also converts legacy ISO string timestamps.
+        """
+        timestamp = {"$toDate": "$timestamp"}
+        day = {
+            "$dateFromParts": {
+                "year": {"$year": timestamp},
+                "month": {"$month": timestamp},
+                "day": {"$dayOfMonth": timestamp},
+            }
+        }
+        by_type: Dict[str, Any] = {
+            "_id": {"day": day, "meal_type": "$meal_type"},
+            "meal_count": {"$sum": 1},
+        }
+        by_day: Dict[str, Any] = {
+            "_id": "$_id.day",
+            "meal_count": {"$sum": "$meal_count"},
+            "breakdown": {"$push": {"k": "$_id.meal_type", "v": "$total_calories"}},
+            "counts": {"$push": {"k": "$_id.meal_type", "v": "$meal_count"}},
+        }
+        for field_name in _TOTAL_FIELDS:
+            by_type[field_name] = {"$sum": f"${field_name}"}
+            by_day[field_name] = {"$sum": f"${field_name}"}
+
+        return [
+            {"$match": {"user_id": user_id}},
+            {"$group": by_type},
+            {"$group": by_day},
+            {
+                "$project": {
+                    "_id": 0,
+                    "user_id": user_id,
+                    "day": "$_id",
+                    "meal_count": 1,
+                    **{field_name: 1 for field_name in _TOTAL_FIELDS},
+                    "breakdown_by_type": {"$arrayToObject": "$breakdown"},
+                    "meal_count_by_type": {"$arrayToObject": "$counts"},
+                }
+            },
+        ]
+
+    @classmethod
+    def rollup_mismatches(
+        cls,
+        expected: Dict[date, Dict[str, Any]],
+        stored: Dict[date, Dict[str, Any]],
+        tolerance: float = ROLLUP_TOLERANCE,
+    ) -> List[date]:
+        """
+        Compare recomputed rollups with the stored ones.
+
+        Stored days without meals (count 0) are equivalent to missing days;
+        dirty days always mismatch.
+
+        Returns:
+            Sorted days whose stored totals differ from the recomputed ones
+        """
+        empty = MealPeriodTotals()
+        mismatches: List[date] = []
+        for day in sorted(set(expected) | set(stored)):
+            want = cls.rollup_from_document(expected[day]) if day in expected else empty
+            if stored.get(day, {}).get("dirty"):
+                mismatches.append(day)
+                continue
+            have = cls.rollup_from_document(stored[day]) if day in stored else empty
+            if want.meal_count != have.meal_count or set(want.breakdown_by_type) != set(
+                have.breakdown_by_type
+            ):
+                mismatches.append(day)
+                continue
+            values = [(getattr(want, f), getattr(have, f)) for f in _TOTAL_FIELDS] + [
+                (calories, have.breakdown_by_type[meal_type])
+                for meal_type, calories in want.breakdown_by_type.items()
+            ]
+            if any(abs(a - b) > tolerance * max(1.0, abs(a)) for a, b in values):
+                mismatches.append(day)
+        return mismatches
+
+    async def _expected_rollups(self, user_id: str) -> Dict[date, Dict[str, Any]]:
+        """Recompute the rollup documents of a user from meals."""
+        docs = await self._aggregate(self.daily_rollups_pipeline(user_id))
+        return {rollup_day(self.bson_to_datetime(doc["day"])): doc for doc in docs}
+
+    async def check_daily_rollups(self, user_id: str) -> List[date]:
+        """
+        Check the stored rollups of a user against their meals.
+
+        Args:
+            user_id: User identifier
+
+        Returns:
+            Days whose rollup is wrong or missing (empty if consistent)
+        """
+        expected = await self._expected_rollups(user_id)
+        stored = await self._find_rollups(user_id)
+        return self.rollup_mismatches(expected, stored)
+
+    async def rebuild_daily_rollups(self, user_id: str) -> int:
+        """
+        Recompute the rollups of a user from meals and replace the stored ones.
+
+        Meal writes landing while the rebuild runs may be lost or counted
+        twice for that user: run it off-peak and re-check afterwards.
+
+        Args:
+            user_id: User identifier
+
+        Returns:
+            Number of days with meals written
+        """
+        expected = await self._expected_rollups(user_id)
+        now = datetime.now(timezone.utc)
+        operations: List[Any] = [
+            ReplaceOne(
+                {"user_id": user_id, "day": doc["day"]},
+                {**doc, "updated_at": now},
+                upsert=True,
+            )
+            for doc in expected.values()
+        ]
+        # Days without meals anymore
+        operations.append(
+            DeleteMany(
+                {
+                    "user_id": user_id,
+                    "day": {"$nin": [self._day_to_bson(day) for day in expected]},
+                }
+            )
+        )
+        try:
+            await self._rollups.bulk_write(operations, ordered=False)
+        except Exception as e:
+            logger.error(
+                f"Error in bulk_write: collection={DAILY_ROLLUPS_COLLECTION}, "
+                f"user_id={user_id}, error={e}"
+            )
+            raise
+        return len(expected)
+
+    async def search(
+        self,
+        user_id: str,
+        query_text: str,
+        limit: int = 50,
+        offset: int = 0,
+        projection: Optional[MealProjection] = None,
+    ) -> List[Meal]:
+        """
+        Search meals of a user through the text index.
+
+        $text ranks documents by weighted field matches (search_terms
+        makes prefixes match too); $all on search_terms requires every
+        term to match. Ranking, offset and limit run in MongoDB.
+
+        Args:
+            user_id: User identifier
+            query_text: Free text
+            limit: Maximum number of meals to return
+            offset: Number of ranked meals to skip
+            projection: Fields to load (default: full meals)
+
+        Returns:
+            Matching meals, most relevant first (newest first on ties)
+        """
+        docs = await self.search_documents(user_id, query_text, limit, offset, projection)
+        return [self.from_document(doc) for doc in docs]
+
+    async def search_documents(
+        self,
+        user_id: str,
+        query_text: str,
+        limit: int = 50,
+        offset: int = 0,
+        projection: Optional[MealProjection] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Same query as search, returning the raw documents.
+
+        Returns:
+            Matching (projected) meal documents with their text score,
+            most relevant first (newest first on ties)
+        """
+        terms = tokenize(query_text)
+        if not terms:
+            return []
+
+        filter_dict = {
+            "user_id": user_id,
+            "$text": {"$search": " ".join(terms)},
+            "search_terms": {"$all": terms},
+        }
+        fields: Dict[str, Any] = self._projection(projection)
+        fields["score"] = {"$meta": "textScore"}
+        sort: List[Tuple[str, Any]] = [("score", {"$meta": "textScore"}), ("timestamp", -1)]
+
+        return await self._find_many(
+            filter_dict, sort=sort, limit=limit, skip=offset, projection=fields
+        )
+
     async def delete(self, meal_id: UUID, user_id: str) -> bool:
         """
         Delete a meal from MongoDB.
@@ -306,8 +1126,12 @@ class MongoMealRepository(MongoBaseRepository[Meal]):
         """
         filter_dict = {"_id": self.uuid_to_str(meal_id), "user_id": user_id}
 
-        deleted_count = await self._delete_one(filter_dict)
-        return deleted_count > 0
+        deleted = await self._find_one_and_delete(filter_dict, projection=_ROLLUP_PROJECTION)
+        if deleted is None:
+            return False
+
+        await self._apply_rollup_changes(deleted, None)
+        return True
 
     async def exists(self, meal_id: UUID, user_id: str) -> bool:
         """
@@ -1,7 +1,7 @@
 """MongoDB implementation of IProfileRepository."""
 
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, List, Sequence
 from uuid import UUID
 
 from domain.nutritional_profile.core.entities.nutritional_profile import (
@@ -160,6 +160,24 @@ class MongoProfileRepository(
 
         return self.from_document(doc)
 
+    async def find_by_ids(self, profile_ids: Sequence[ProfileId]) -> List[NutritionalProfile]:
+        """Find several profiles by ID with a single $in query."""
+        ids = list(dict.fromkeys(str(profile_id.value) for profile_id in profile_ids))
+        if not ids:
+            return []
+
+        docs = await self._find_many({"_id": {"$in": ids}}, limit=len(ids))
+        return [self.from_document(doc) for doc in docs]
+
+    async def find_by_user_ids(self, user_ids: Sequence[str]) -> List[NutritionalProfile]:
+        """Find the profiles of several users with a single $in query."""
+        ids = list(dict.fromkeys(user_ids))
+        if not ids:
+            return []
+
+        docs = await self._find_many({"user_id": {"$in": ids}})
+        return [self.from_document(doc) for doc in docs]
+
     async def delete(self, profile_id: ProfileId) -> None:
         """Delete profile (soft delete)."""
         filter_dict = {"_id": str(profile_id.value)}
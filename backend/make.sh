@@ -335,6 +335,7 @@ Targets disponibili:
   docker-ps         Mostra stato containers
   docker-logs-all   Segui log di tutti i servizi
   docker-mongo-shell Apri shell MongoDB
+  mongo-indexes-verify Verifica copertura indici query repository (CREATE=1 crea mancanti)
   docker-redis-cli  Apri Redis CLI
 
   # Utility
@@ -1162,6 +1163,15 @@ EOF
     fi
     ;;
 
+  mongo-indexes-verify)
+    header "MongoDB Index Coverage"
+    if [ "${CREATE:-0}" = "1" ]; then
+      uv run python scripts/verify_mongodb_indexes.py --create-missing
+    else
+      uv run python scripts/verify_mongodb_indexes.py
+    fi
+    ;;
+
   preflight-config)
     header "Preflight Configuration"
     if [ -f scripts/preflight_config.sh ]; then
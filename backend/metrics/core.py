@@ -2,6 +2,7 @@
 
 Obiettivi:
 * Fornire counters e histogram basilari per pipeline AI Meal Photo.
+* Gauge per valori istantanei (es. dimensione stato in-memory).
 * Snapshot leggibile nei test.
 * Niente esposizione HTTP/GraphQL (aggiungibile più avanti).
 """
@@ -37,6 +38,22 @@ class Counter:
             return self._value
 
 
+@dataclass
+class Gauge:
+    name: str
+    tags: Dict[str, str]
+    _value: float = 0.0
+    _lock: Lock = field(default_factory=Lock, repr=False)
+
+    def set(self, value: float) -> None:
+        with self._lock:
+            self._value = value
+
+    def value(self) -> float:
+        with self._lock:
+            return self._value
+
+
 @dataclass
 class Histogram:
     name: str
@@ -82,6 +99,12 @@ class CounterSnap(TypedDict):
     value: int
 
 
+class GaugeSnap(TypedDict):
+    name: str
+    tags: Dict[str, str]
+    value: float
+
+
 class HistogramSnap(TypedDict):
     name: str
     tags: Dict[str, str]
@@ -94,6 +117,7 @@ class HistogramSnap(TypedDict):
 
 class RegistrySnapshot(TypedDict):
     counters: List[CounterSnap]
+    gauges: List[GaugeSnap]
     histograms: List[HistogramSnap]
     generatedAt: float
 
@@ -101,6 +125,7 @@ class RegistrySnapshot(TypedDict):
 class MetricsRegistry:
     def __init__(self) -> None:
         self._counters: Dict[TagKey, Counter] = {}
+        self._gauges: Dict[TagKey, Gauge] = {}
         self._histograms: Dict[TagKey, Histogram] = {}
         self._lock = Lock()
 
@@ -113,6 +138,15 @@ class MetricsRegistry:
                 self._counters[key] = ctr
             return ctr
 
+    def gauge(self, name: str, **tags: str) -> Gauge:
+        key = _tag_key(name, tags)
+        with self._lock:
+            g = self._gauges.get(key)
+            if g is None:
+                g = Gauge(name=name, tags=tags)
+                self._gauges[key] = g
+            return g
+
     def histogram(self, name: str, **tags: str) -> Histogram:
         key = _tag_key(name, tags)
         with self._lock:
@@ -126,12 +160,14 @@ class MetricsRegistry:
         # Rappresentazione serializzabile per test
         data: RegistrySnapshot = {
             "counters": [],
+            "gauges": [],
             "histograms": [],
             "generatedAt": time.time(),
         }
         # copy references under lock, read values outside to limit contention
         with self._lock:
             counters = list(self._counters.values())
+            gauges = list(self._gauges.values())
             histograms = list(self._histograms.values())
         for c in counters:
             counter_snap: CounterSnap = {
@@ -140,6 +176,13 @@ class MetricsRegistry:
                 "value": c.value(),
             }
             data["counters"].append(counter_snap)
+        for g in gauges:
+            gauge_snap: GaugeSnap = {
+                "name": g.name,
+                "tags": g.tags,
+                "value": g.value(),
+            }
+            data["gauges"].append(gauge_snap)
         for h in histograms:
             snap = h.snapshot()
             hist: HistogramSnap = {
@@ -158,6 +201,7 @@ class MetricsRegistry:
         """Reset completo (solo per test)."""
         with self._lock:
             self._counters.clear()
+            self._gauges.clear()
             self._histograms.clear()
 
 
@@ -6,10 +6,26 @@ Obiettivo: gestione eventi activity minuto + aggregazioni future.
 from __future__ import annotations
 from dataclasses import dataclass
 from typing import List, Optional, Dict, Any, Tuple
-import bisect
 import datetime
 from enum import Enum
 
+import numpy as np
+import numpy.typing as npt
+
+from repository.activity_series import (
+    HAS_CALORIES,
+    HAS_HR,
+    HAS_STEPS,
+    MAX_STEPS,
+    MINUTES_PER_DAY,
+    RangeColumns,
+    UserSeries,
+    ceil_minute_of,
+    format_minutes,
+    minutes_of,
+    rolling_sum,
+)
+
 
 class ActivitySource(str, Enum):
     """Enum per sorgenti activity (duplicazione locale del GraphQL enum)."""
@@ -37,6 +53,36 @@ class ActivityEventRecord:
         return (self.user_id, self.ts)
 
 
+_SOURCES: List[ActivitySource] = list(ActivitySource)
+# Codice uint8 della sorgente nelle colonne (indice in _SOURCES)
+_SOURCE_CODES: Dict[ActivitySource, int] = {source: code for code, source in enumerate(_SOURCES)}
+_NO_SOURCE = -1
+
+
+def _numeric_column(
+    values: List[Any],
+) -> Tuple[npt.NDArray[np.float64], npt.NDArray[np.bool_], npt.NDArray[np.bool_]]:
+    """Colonna float64 di un campo opzionale: (valori con 0 per None, presenti, non numerici).
+
+    Conversione in blocco; solo se fallisce si individuano i valori non
+    convertibili uno per uno.
+    """
+    present = np.array([value is not None for value in values], dtype=np.bool_)
+    filled = [0.0 if value is None else value for value in values]
+    try:
+        return np.array(filled, dtype=np.float64), present, np.zeros(len(values), dtype=np.bool_)
+    except (TypeError, ValueError):
+        pass
+    column = np.zeros(len(values), dtype=np.float64)
+    invalid = np.zeros(len(values), dtype=np.bool_)
+    for i, value in enumerate(filled):
+        try:
+            column[i] = float(value)
+        except (TypeError, ValueError):
+            invalid[i] = True
+    return column, present, invalid
+
+
 class ActivityRepository:
     """Interfaccia minima futura (per DB adapter).
 
@@ -68,11 +114,9 @@ class InMemoryActivityRepository(ActivityRepository):
     """Implementazione in-memory del repository activity."""
 
     def __init__(self) -> None:
-        # Storing events sorted by timestamp for efficient range queries
-        # Key: user_id, Value: List[ActivityEventRecord] (sorted by ts)
-        self._events_by_user: Dict[str, List[ActivityEventRecord]] = {}
-        # Track duplicates by composite key for idempotency
-        self._duplicate_keys: Dict[Tuple[str, str], ActivityEventRecord] = {}
+        # Storage colonnare: user_id -> colonne NumPy per giorno UTC.
+        # Gli ActivityEventRecord sono materializzati solo in lettura.
+        self._events_by_user: Dict[str, UserSeries] = {}
         # Batch idempotency map: (user_id, key) -> (signature, cached_result)
         self._batch_idempo: Dict[Tuple[str, str], Tuple[str, Dict[str, Any]]] = {}
 
@@ -104,53 +148,92 @@ class InMemoryActivityRepository(ActivityRepository):
     ) -> Tuple[int, int, List[Tuple[int, str]]]:
         """Ingest batch di eventi activity con deduplication e normalizzazione.
 
+        Validazione vettoriale: il batch diventa colonne NumPy, i range check
+        sono maschere e ogni evento riceve il primo reason code nell'ordine
+        dei controlli (steps, calorie, HR, campi obbligatori, timestamp).
+        Duplicati e conflitti sono confrontati in blocco con gli eventi
+        salvati (UserSeries.lookup) o con la prima occorrenza nel batch.
+
         Ritorna: (accepted, duplicates, [(index, reason_code), ...])
         """
+        if not events:
+            return 0, 0, []
+
+        steps, has_steps, bad_steps = _numeric_column([ev.steps for ev in events])
+        calories, has_calories, bad_calories = _numeric_column([ev.calories_out for ev in events])
+        hr, has_hr, bad_hr = _numeric_column([ev.hr_avg for ev in events])
+        hr = np.round(hr)  # come int(round(hr)): half-even
+        source = np.array(
+            [_SOURCE_CODES.get(ev.source, _NO_SOURCE) for ev in events], dtype=np.int16
+        )
+        missing = np.array([not ev.user_id or not ev.ts for ev in events], dtype=np.bool_)
+        minutes, ts_valid = minutes_of([ev.ts for ev in events])
+
+        checks = (
+            (bad_steps | (has_steps & ~(np.abs(steps) <= MAX_STEPS)), self.INVALID_EVENT),
+            (has_steps & (steps < 0), self.NEGATIVE_VALUE),
+            (bad_calories | (has_calories & ~np.isfinite(calories)), self.INVALID_EVENT),
+            (has_calories & (calories < 0), self.NEGATIVE_VALUE),
+            (bad_hr | (has_hr & ~np.isfinite(hr)), self.INVALID_EVENT),
+            (has_hr & ((hr < 25) | (hr > 240)), self.OUT_OF_RANGE_HR),
+            (missing | (source == _NO_SOURCE), self.INVALID_EVENT),
+            (~ts_valid, self.NORMALIZATION_FAILED),
+        )
+        codes = [""] + [code for _, code in checks]
+        # 0 = valido, altrimenti 1 + indice del primo controllo fallito
+        reason = np.select([mask for mask, _ in checks], np.arange(1, len(codes)), 0)
+
+        # Come il loop per-evento: HR arrotondato se i controlli HR passano,
+        # ts normalizzato se l'evento è valido
+        for i in np.flatnonzero(has_hr & ((reason == 0) | (reason > 6))).tolist():
+            events[i].hr_avg = float(hr[i])
+        ok = np.flatnonzero(reason == 0)
+        for i, ts in zip(ok.tolist(), format_minutes(minutes[ok])):
+            events[i].ts = ts
+
+        batch = RangeColumns.of(
+            minutes,
+            steps,
+            calories,
+            hr,
+            source,
+            (has_steps * HAS_STEPS) | (has_calories * HAS_CALORIES) | (has_hr * HAS_HR),
+        )
         accepted = 0
         duplicates = 0
-        rejected: List[Tuple[int, str]] = []
-
-        for i, ev in enumerate(events):
-            # Valori negativi
-            if ev.steps is not None and ev.steps < 0:
-                rejected.append((i, self.NEGATIVE_VALUE))
-                continue
-            if ev.calories_out is not None and ev.calories_out < 0:
-                rejected.append((i, self.NEGATIVE_VALUE))
-                continue
-            if ev.hr_avg is not None:
-                try:
-                    hr = int(round(float(ev.hr_avg)))
-                except (TypeError, ValueError):
-                    rejected.append((i, self.INVALID_EVENT))
-                    continue
-                if hr < 25 or hr > 240:
-                    rejected.append((i, self.OUT_OF_RANGE_HR))
-                    continue
-                ev.hr_avg = float(hr)
-
-            if not ev.user_id or not ev.ts:
-                rejected.append((i, self.INVALID_EVENT))
-                continue
-
-            norm = self.normalize_minute_iso(ev.ts)
-            if not norm:
-                rejected.append((i, self.NORMALIZATION_FAILED))
-                continue
-            ev.ts = norm
-
-            key = ev.duplicate_key()
-            existing = self._duplicate_keys.get(key)
-            if existing:
-                if self._events_identical(existing, ev):
-                    duplicates += 1
-                    continue
-                rejected.append((i, self.CONFLICT_DIFFERENT_DATA))
-                continue
-
-            self._add_event(ev)
-            accepted += 1
-
+        conflict = np.zeros(len(events), dtype=np.bool_)
+        by_user: Dict[str, List[int]] = {}
+        for i in ok.tolist():
+            by_user.setdefault(events[i].user_id, []).append(i)
+
+        for user_id, user_indexes in by_user.items():
+            indexes = np.asarray(user_indexes)
+            rows = batch.take(indexes)
+            # Prima occorrenza di ogni minuto nel batch (riferimento dei ripetuti)
+            _, first, inverse = np.unique(rows.minutes, return_index=True, return_inverse=True)
+            first = first[inverse]
+            same = rows.take(first).same_values(rows)
+            found = np.zeros(len(indexes), dtype=np.bool_)
+            series = self._events_by_user.get(user_id)
+            if series is not None:
+                # Minuto già salvato: il riferimento è l'evento salvato
+                found, stored = series.lookup(rows.minutes)
+                same = np.where(found, stored.same_values(rows), same)
+
+            new = ~found & (first == np.arange(len(indexes)))
+            accepted += int(np.count_nonzero(new))
+            duplicates += int(np.count_nonzero(~new & same))
+            conflict[indexes[~new & ~same]] = True
+            if new.any():
+                self._add_events(user_id, rows.take(np.flatnonzero(new)))
+
+        rejected = [
+            (i, codes[code] if code else self.CONFLICT_DIFFERENT_DATA)
+            for i, code in zip(
+                np.flatnonzero((reason > 0) | conflict).tolist(),
+                reason[(reason > 0) | conflict].tolist(),
+            )
+        ]
         return accepted, duplicates, rejected
 
     def get_daily_stats(self, user_id: str, date: str) -> Dict[str, Any]:
@@ -158,29 +241,21 @@ class InMemoryActivityRepository(ActivityRepository):
         if user_id not in self._events_by_user:
             return {"total_steps": 0, "total_calories_out": 0.0, "events_count": 0}
 
-        # Parse date and create range
+        # Parse date: inizio del giorno (nel fuso della data, UTC se naive)
         try:
             dt = datetime.datetime.fromisoformat(date.replace("Z", "+00:00"))
-            start_of_day = dt.replace(hour=0, minute=0, second=0, microsecond=0)
-            end_of_day = start_of_day + datetime.timedelta(days=1)
-
-            start_ts = start_of_day.isoformat().replace("+00:00", "Z")
-            end_ts = end_of_day.isoformat().replace("+00:00", "Z")
         except ValueError:
             return {"total_steps": 0, "total_calories_out": 0.0, "events_count": 0}
+        start_of_day = dt.replace(hour=0, minute=0, second=0, microsecond=0)
+        lo = ceil_minute_of(start_of_day.isoformat())
+        if lo is None:
+            return {"total_steps": 0, "total_calories_out": 0.0, "events_count": 0}
 
-        events = self.list(user_id, start_ts, end_ts, limit=10000)
-        total_steps = 0
-        total_calories_out = 0.0
-        for event in events:
-            if event.steps:
-                total_steps += event.steps
-            if event.calories_out:
-                total_calories_out += event.calories_out
+        totals = self._events_by_user[user_id].columns(lo, lo + MINUTES_PER_DAY).totals()
         return {
-            "total_steps": total_steps,
-            "total_calories_out": round(total_calories_out, 2),
-            "events_count": len(events),
+            "total_steps": int(totals["total_steps"]),
+            "total_calories_out": round(totals["total_calories_out"], 2),
+            "events_count": int(totals["event_count"]),
         }
 
     def list(
@@ -188,21 +263,21 @@ class InMemoryActivityRepository(ActivityRepository):
         user_id: str,
         start_ts: Optional[str] = None,
         end_ts: Optional[str] = None,
-        limit: int = 100,
+        limit: Optional[int] = 100,
     ) -> List[ActivityEventRecord]:
-        data = self._events_by_user.get(user_id)
-        if not data:
+        """Eventi con start_ts <= ts < end_ts (ordine ascendente, max limit).
+
+        Bisect sui giorni e sui minuti: si materializzano solo i record
+        restituiti. limit=None restituisce tutto l'intervallo.
+        """
+        series = self._events_by_user.get(user_id)
+        if not series or (limit is not None and limit <= 0):
+            return []
+        lo = ceil_minute_of(start_ts) if start_ts else None
+        hi = ceil_minute_of(end_ts) if end_ts else None
+        if (start_ts and lo is None) or (end_ts and hi is None):
             return []
-        res: List[ActivityEventRecord] = []
-        for ev in data:
-            if start_ts and ev.ts < start_ts:
-                continue
-            if end_ts and ev.ts >= end_ts:
-                continue
-            res.append(ev)
-            if len(res) >= limit:
-                break
-        return res
+        return self._records(user_id, series.columns(lo, hi, limit))
 
     def list_events(
         self,
@@ -218,7 +293,43 @@ class InMemoryActivityRepository(ActivityRepository):
         return self.list(user_id, start_ts, end_ts, limit)
 
     def list_all(self, user_id: str) -> List[ActivityEventRecord]:
-        return list(self._events_by_user.get(user_id, []))
+        series = self._events_by_user.get(user_id)
+        return self._records(user_id, series.columns(None, None)) if series else []
+
+    def aggregate_periods(
+        self, user_id: str, starts: List[str], end_ts: str
+    ) -> Dict[int, Dict[str, float]]:
+        """Totali per periodo (starts ordinati, ultimo periodo fino a end_ts).
+
+        Una sola lettura colonnare dell'intervallo e riduzioni vettoriali
+        (bincount) per periodo; le chiavi sono gli indici dei periodi con
+        almeno un evento.
+        """
+        series = self._events_by_user.get(user_id)
+        bounds = [ceil_minute_of(ts) for ts in starts]
+        hi = ceil_minute_of(end_ts)
+        if not series or not bounds or hi is None or None in bounds:
+            return {}
+        minutes = np.asarray(bounds, dtype=np.int64)
+        return series.columns(int(minutes[0]), hi).totals_by_bucket(minutes)
+
+    def rolling_steps(self, user_id: str, date: str, window_minutes: int) -> List[int]:
+        """Steps nella finestra mobile che termina a ogni minuto del giorno UTC.
+
+        Ritorna 1440 valori (minuti senza eventi contano 0).
+        """
+        lo = ceil_minute_of(date[:10])
+        series = self._events_by_user.get(user_id)
+        if lo is None or series is None:
+            return [0] * MINUTES_PER_DAY
+        columns = series.columns(lo, lo + MINUTES_PER_DAY)
+        dense = np.zeros(MINUTES_PER_DAY, dtype=np.int64)
+        dense[columns.minutes - lo] = columns.steps
+        return [int(value) for value in rolling_sum(dense, window_minutes).tolist()]
+
+    def memory_by_user(self) -> Dict[str, int]:
+        """Byte occupati dagli array activity per utente."""
+        return {user_id: series.nbytes for user_id, series in self._events_by_user.items()}
 
     def _validate_event(self, event: ActivityEventRecord) -> bool:
         """Valida i dati di un evento activity."""
@@ -239,30 +350,41 @@ class InMemoryActivityRepository(ActivityRepository):
 
         return True
 
-    def _events_identical(self, a: ActivityEventRecord, b: ActivityEventRecord) -> bool:
-        """Verifica se due eventi sono identici (per deduplication)."""
-        return (
-            a.user_id == b.user_id
-            and a.ts == b.ts
-            and a.steps == b.steps
-            and a.calories_out == b.calories_out
-            and a.hr_avg == b.hr_avg
-            and a.source == b.source
-        )
-
-    def _add_event(self, event: ActivityEventRecord) -> None:
-        """Aggiunge un evento mantenendo l'ordinamento per timestamp."""
-        user_id = event.user_id
-
-        if user_id not in self._events_by_user:
-            self._events_by_user[user_id] = []
+    def _add_events(self, user_id: str, rows: RangeColumns) -> None:
+        """Scrive gli eventi accettati nelle colonne, un merge per giorno."""
+        series = self._events_by_user.setdefault(user_id, UserSeries())
+        days = rows.minutes // MINUTES_PER_DAY
+        for day in np.unique(days).tolist():
+            part = rows.take(np.flatnonzero(days == day))
+            series.day(day).merge(
+                offsets=part.minutes - day * MINUTES_PER_DAY,
+                steps=part.steps,
+                calories_out=part.calories_out,
+                hr_avg=part.hr_avg,
+                source=part.source,
+                valid=part.valid,
+            )
 
-        # Insert in sorted order (by timestamp)
-        events = self._events_by_user[user_id]
-        bisect.insort(events, event, key=lambda e: e.sort_key())
-
-        # Track for duplicates
-        self._duplicate_keys[event.duplicate_key()] = event
+    @staticmethod
+    def _records(user_id: str, columns: RangeColumns) -> List[ActivityEventRecord]:
+        """Materializza le colonne come ActivityEventRecord (None dove il bit manca)."""
+        timestamps = format_minutes(columns.minutes)
+        steps = columns.steps.tolist()
+        calories_out = columns.calories_out.tolist()
+        hr_avg = columns.hr_avg.tolist()
+        sources = columns.source.tolist()
+        valid = columns.valid.tolist()
+        return [
+            ActivityEventRecord(
+                user_id=user_id,
+                ts=timestamps[k],
+                steps=steps[k] if valid[k] & HAS_STEPS else None,
+                calories_out=calories_out[k] if valid[k] & HAS_CALORIES else None,
+                hr_avg=hr_avg[k] if valid[k] & HAS_HR else None,
+                source=_SOURCES[sources[k]],
+            )
+            for k in range(len(timestamps))
+        ]
 
     def get_idempotency(self, key: str) -> Optional[str]:
         """Recupera la signature cached per una chiave di idempotenza.
@@ -291,6 +413,26 @@ class InMemoryActivityRepository(ActivityRepository):
         # Salviamo signature e un dict vuoto come result placeholder
         self._batch_idempo[user_key] = (signature, {})
 
+    def get_batch(self, user_id: str, key: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """Recupera signature e risultato di un batch ingerito con chiave.
+
+        Returns:
+            (signature, result) se la chiave è già stata usata dall'utente,
+            None altrimenti
+        """
+        return self._batch_idempo.get((user_id, key))
+
+    def store_batch(self, user_id: str, key: str, signature: str, result: Dict[str, Any]) -> None:
+        """Lega (user_id, key) alla signature del payload e al suo risultato.
+
+        Args:
+            user_id: utente del batch
+            key: chiave di idempotenza
+            signature: signature del payload normalizzato
+            result: contatori del primo ingest (accepted, duplicates)
+        """
+        self._batch_idempo[(user_id, key)] = (signature, result)
+
 
 # Global instance (singleton pattern come meal_repo)
 activity_repo = InMemoryActivityRepository()
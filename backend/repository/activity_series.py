@@ -0,0 +1,451 @@
+"""Storage colonnare (NumPy) delle serie activity minuto.
+
+Ogni giorno UTC di un utente è un DaySeries: array paralleli ordinati per
+minuto, cioè offset int32 dalla mezzanotte, steps int64, calories_out e
+hr_avg float64 (stessi valori dei float Python: calorie distinte non
+diventano duplicati), sorgente uint8 e una maschera di validità (un bit per
+campo presente, così None resta distinguibile da 0).
+
+Un anno-utente di eventi minuto occupa pochi MB invece di ~500k oggetti
+Python, e le riduzioni (somme, medie HR, minuti attivi, finestre mobili)
+sono vettoriali. Il repository in-memory espone gli eventi come viste
+(ActivityEventRecord materializzati solo quando richiesti).
+"""
+
+from __future__ import annotations
+
+import bisect
+import datetime
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+MINUTES_PER_DAY = 1440
+
+# Steps massimi accettati: in ingest passano per una colonna float64, che
+# oltre 2**53 non rappresenta più tutti gli interi
+MAX_STEPS = 2**53
+
+# Bit della maschera di validità
+HAS_STEPS = 1
+HAS_CALORIES = 2
+HAS_HR = 4
+
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+
+IntArray = npt.NDArray[np.int64]
+BoolArray = npt.NDArray[np.bool_]
+
+
+def _parse_utc(ts: str) -> Optional[datetime.datetime]:
+    """Parse ISO8601 (Z, offset o naive = UTC); None se non valido."""
+    try:
+        dt = datetime.datetime.fromisoformat(ts.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=datetime.timezone.utc)
+    return dt
+
+
+def minute_of(ts: str) -> Optional[int]:
+    """Minuto assoluto (da epoch UTC) di un timestamp, troncato al minuto."""
+    dt = _parse_utc(ts)
+    if dt is None:
+        return None
+    delta = dt - _EPOCH
+    return (delta.days * 86400 + delta.seconds) // 60
+
+
+def ceil_minute_of(ts: str) -> Optional[int]:
+    """Primo minuto assoluto >= ts (bound di intervallo su eventi al minuto).
+
+    Gli eventi hanno ts ``HH:MM:00Z``: ``start <= ts`` equivale a
+    ``minuto >= ceil(start)`` e ``ts < end`` a ``minuto < ceil(end)``.
+    """
+    dt = _parse_utc(ts)
+    if dt is None:
+        return None
+    delta = dt - _EPOCH
+    seconds = delta.days * 86400 + delta.seconds
+    minute = seconds // 60
+    if seconds % 60 or delta.microseconds:
+        minute += 1
+    return minute
+
+
+def _is_canonical(ts: str) -> bool:
+    """True per ts ASCII nella forma ``YYYY-MM-DDTHH:MM[:SS]Z`` (quella dei client)."""
+    size = len(ts)
+    if size == 20:
+        if ts[16] != ":" or not ts[17:19].isdigit() or ts[17] > "5":
+            return False
+    elif size != 17:
+        return False
+    return (
+        ts[-1] == "Z"
+        and ts[4] == "-"
+        and ts[7] == "-"
+        and ts[10] == "T"
+        and ts[13] == ":"
+        and ts.isascii()
+        and not ts.startswith("0000")  # anno 0: valido per NumPy, non per datetime
+    )
+
+
+def minutes_of(timestamps: Sequence[Any]) -> Tuple[IntArray, BoolArray]:
+    """Minuti assoluti di un batch di ts e maschera dei ts validi.
+
+    Fast path: i ts canonici sono convertiti in blocco da NumPy
+    (``datetime64[m]`` valida mese, giorno, ore e minuti); gli altri (offset,
+    frazioni di secondo, naive) e qualunque batch con un canonico non valido
+    passano da minute_of, con lo stesso risultato.
+    """
+    minutes = np.zeros(len(timestamps), dtype=np.int64)
+    valid = np.zeros(len(timestamps), dtype=np.bool_)
+    canonical = [i for i, ts in enumerate(timestamps) if isinstance(ts, str) and _is_canonical(ts)]
+    if canonical:
+        try:
+            parsed = np.array([timestamps[i][:16] for i in canonical], dtype="datetime64[m]")
+        except ValueError:
+            pass
+        else:
+            minutes[canonical] = parsed.astype(np.int64)
+            valid[canonical] = True
+    for i in np.flatnonzero(~valid).tolist():
+        ts = timestamps[i]
+        minute = minute_of(ts) if isinstance(ts, str) else None
+        if minute is not None:
+            minutes[i] = minute
+            valid[i] = True
+    return minutes, valid
+
+
+def format_minutes(minutes: IntArray) -> List[str]:
+    """Minuti assoluti -> ts normalizzati ``YYYY-MM-DDTHH:MM:00Z``."""
+    as_dates = minutes.astype("datetime64[m]")
+    return [ts + "Z" for ts in np.datetime_as_string(as_dates, unit="s").tolist()]
+
+
+class DaySeries:
+    """Eventi di un utente in un giorno UTC, in colonne ordinate per minuto."""
+
+    __slots__ = ("offsets", "steps", "calories_out", "hr_avg", "source", "valid")
+
+    def __init__(self) -> None:
+        self.offsets = np.empty(0, dtype=np.int32)
+        self.steps = np.empty(0, dtype=np.int64)
+        self.calories_out = np.empty(0, dtype=np.float64)
+        self.hr_avg = np.empty(0, dtype=np.float64)
+        self.source = np.empty(0, dtype=np.uint8)
+        self.valid = np.empty(0, dtype=np.uint8)
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    @property
+    def nbytes(self) -> int:
+        """Byte occupati dagli array."""
+        return sum(getattr(self, name).nbytes for name in self.__slots__)
+
+    def find(self, offset: int) -> int:
+        """Indice dell'evento al minuto offset, -1 se assente."""
+        index = int(np.searchsorted(self.offsets, offset))
+        if index < len(self.offsets) and self.offsets[index] == offset:
+            return index
+        return -1
+
+    def same_values(
+        self,
+        index: int,
+        steps: Optional[int],
+        calories_out: Optional[float],
+        hr_avg: Optional[float],
+        source: int,
+    ) -> bool:
+        """True se l'evento index ha gli stessi valori."""
+        valid = int(self.valid[index])
+        return (
+            ((valid & HAS_STEPS) != 0) == (steps is not None)
+            and (steps is None or int(self.steps[index]) == steps)
+            and ((valid & HAS_CALORIES) != 0) == (calories_out is not None)
+            and (calories_out is None or self.calories_out[index] == calories_out)
+            and ((valid & HAS_HR) != 0) == (hr_avg is not None)
+            and (hr_avg is None or self.hr_avg[index] == hr_avg)
+            and int(self.source[index]) == source
+        )
+
+    def merge(
+        self,
+        offsets: npt.ArrayLike,
+        steps: npt.ArrayLike,
+        calories_out: npt.ArrayLike,
+        hr_avg: npt.ArrayLike,
+        source: npt.ArrayLike,
+        valid: npt.ArrayLike,
+    ) -> None:
+        """Append di un batch (minuti non presenti) e un solo riordino."""
+        new_offsets = np.asarray(offsets, dtype=np.int32)
+        columns: Tuple[npt.NDArray[Any], ...] = (
+            np.concatenate((self.offsets, new_offsets)),
+            np.concatenate((self.steps, np.asarray(steps, dtype=np.int64))),
+            np.concatenate((self.calories_out, np.asarray(calories_out, dtype=np.float64))),
+            np.concatenate((self.hr_avg, np.asarray(hr_avg, dtype=np.float64))),
+            np.concatenate((self.source, np.asarray(source, dtype=np.uint8))),
+            np.concatenate((self.valid, np.asarray(valid, dtype=np.uint8))),
+        )
+        merged = columns[0]
+        if np.any(merged[1:] < merged[:-1]):
+            order = np.argsort(merged, kind="stable")
+            columns = tuple(column[order] for column in columns)
+        (
+            self.offsets,
+            self.steps,
+            self.calories_out,
+            self.hr_avg,
+            self.source,
+            self.valid,
+        ) = columns
+
+    def bounds(self, lo_offset: int, hi_offset: int) -> Tuple[int, int]:
+        """Indici [i, j) degli eventi con lo_offset <= minuto < hi_offset."""
+        return (
+            int(np.searchsorted(self.offsets, lo_offset)),
+            int(np.searchsorted(self.offsets, hi_offset)),
+        )
+
+
+class RangeColumns:
+    """Colonne degli eventi di un intervallo (concatenate tra i giorni)."""
+
+    __slots__ = ("minutes", "steps", "calories_out", "hr_avg", "source", "valid")
+
+    def __init__(self, parts: List[Tuple[int, DaySeries, int, int]]) -> None:
+        if not parts:
+            self.minutes: IntArray = np.empty(0, dtype=np.int64)
+            self.steps = np.empty(0, dtype=np.int64)
+            self.calories_out = np.empty(0, dtype=np.float64)
+            self.hr_avg = np.empty(0, dtype=np.float64)
+            self.source = np.empty(0, dtype=np.uint8)
+            self.valid = np.empty(0, dtype=np.uint8)
+            return
+        self.minutes = np.concatenate(
+            [
+                series.offsets[i:j].astype(np.int64) + day * MINUTES_PER_DAY
+                for day, series, i, j in parts
+            ]
+        )
+        self.steps = np.concatenate([series.steps[i:j] for _, series, i, j in parts])
+        self.calories_out = np.concatenate([series.calories_out[i:j] for _, series, i, j in parts])
+        self.hr_avg = np.concatenate([series.hr_avg[i:j] for _, series, i, j in parts])
+        self.source = np.concatenate([series.source[i:j] for _, series, i, j in parts])
+        self.valid = np.concatenate([series.valid[i:j] for _, series, i, j in parts])
+
+    @classmethod
+    def of(
+        cls,
+        minutes: IntArray,
+        steps: npt.NDArray[Any],
+        calories_out: npt.NDArray[Any],
+        hr_avg: npt.NDArray[Any],
+        source: npt.NDArray[Any],
+        valid: npt.NDArray[Any],
+    ) -> "RangeColumns":
+        """Colonne da array già allineati (es. un batch in ingest)."""
+        columns = cls([])
+        columns.minutes = minutes
+        columns.steps = steps
+        columns.calories_out = calories_out
+        columns.hr_avg = hr_avg
+        columns.source = source
+        columns.valid = valid
+        return columns
+
+    def __len__(self) -> int:
+        return len(self.minutes)
+
+    def take(self, indexes: IntArray) -> "RangeColumns":
+        """Sottoinsieme (o riordino) delle righe."""
+        return RangeColumns.of(
+            self.minutes[indexes],
+            self.steps[indexes],
+            self.calories_out[indexes],
+            self.hr_avg[indexes],
+            self.source[indexes],
+            self.valid[indexes],
+        )
+
+    def same_values(self, other: "RangeColumns") -> BoolArray:
+        """Per riga: True se other ha gli stessi valori (e gli stessi campi presenti)."""
+        same: BoolArray = (self.valid == other.valid) & (self.source == other.source)
+        for bit, mine, theirs in (
+            (HAS_STEPS, self.steps, other.steps),
+            (HAS_CALORIES, self.calories_out, other.calories_out),
+            (HAS_HR, self.hr_avg, other.hr_avg),
+        ):
+            same &= ((self.valid & bit) == 0) | (mine == theirs.astype(mine.dtype))
+        return same
+
+    def totals(self) -> Dict[str, float]:
+        """Riduzioni vettoriali sull'intero intervallo."""
+        hr_mask = (self.valid & HAS_HR) != 0
+        return {
+            "total_steps": int(self.steps.sum(dtype=np.int64)),
+            "total_calories_out": float(self.calories_out.sum()),
+            "active_minutes": int(np.count_nonzero(self.steps > 0)),
+            "heart_rate_sum": float(self.hr_avg[hr_mask].sum(dtype=np.float64)),
+            "heart_rate_samples": int(np.count_nonzero(hr_mask)),
+            "event_count": len(self.minutes),
+        }
+
+    def totals_by_bucket(self, starts: IntArray) -> Dict[int, Dict[str, float]]:
+        """Riduzioni per bucket: bucket = numero di start <= minuto, meno uno."""
+        if not len(self.minutes):
+            return {}
+        bucket = np.searchsorted(starts, self.minutes, side="right") - 1
+        size = len(starts)
+        hr_mask = (self.valid & HAS_HR) != 0
+        columns = {
+            "total_steps": np.bincount(bucket, weights=self.steps, minlength=size),
+            "total_calories_out": np.bincount(bucket, weights=self.calories_out, minlength=size),
+            "active_minutes": np.bincount(bucket, weights=self.steps > 0, minlength=size),
+            "heart_rate_sum": np.bincount(
+                bucket, weights=np.where(hr_mask, self.hr_avg, 0.0), minlength=size
+            ),
+            "heart_rate_samples": np.bincount(bucket, weights=hr_mask, minlength=size),
+            "event_count": np.bincount(bucket, minlength=size),
+        }
+        results: Dict[int, Dict[str, float]] = {}
+        for index in np.flatnonzero(columns["event_count"]).tolist():
+            results[index] = {name: float(values[index]) for name, values in columns.items()}
+        return results
+
+
+class UserSeries:
+    """Serie activity di un utente: DaySeries per giorno (numero giorno da epoch)."""
+
+    __slots__ = ("days", "_day_keys")
+
+    def __init__(self) -> None:
+        self.days: Dict[int, DaySeries] = {}
+        self._day_keys: List[int] = []  # ordinati
+
+    def day(self, day: int) -> DaySeries:
+        """DaySeries del giorno (creato se assente)."""
+        series = self.days.get(day)
+        if series is None:
+            series = self.days[day] = DaySeries()
+            bisect.insort(self._day_keys, day)
+        return series
+
+    def find(self, minute: int) -> Tuple[Optional[DaySeries], int]:
+        """(serie, indice) dell'evento al minuto assoluto, indice -1 se assente."""
+        series = self.days.get(minute // MINUTES_PER_DAY)
+        if series is None:
+            return None, -1
+        return series, series.find(minute % MINUTES_PER_DAY)
+
+    def lookup(self, minutes: IntArray) -> Tuple[BoolArray, RangeColumns]:
+        """Eventi salvati ai minuti dati: maschera dei presenti e colonne allineate.
+
+        Un searchsorted per giorno coinvolto; le righe assenti hanno valori 0.
+        """
+        found = np.zeros(len(minutes), dtype=np.bool_)
+        columns = RangeColumns.of(
+            minutes,
+            np.zeros(len(minutes), dtype=np.int64),
+            np.zeros(len(minutes), dtype=np.float64),
+            np.zeros(len(minutes), dtype=np.float64),
+            np.zeros(len(minutes), dtype=np.uint8),
+            np.zeros(len(minutes), dtype=np.uint8),
+        )
+        days = minutes // MINUTES_PER_DAY
+        for day in np.unique(days).tolist():
+            series = self.days.get(day)
+            if series is None or not len(series):
+                continue
+            rows = np.flatnonzero(days == day)
+            offsets = minutes[rows] - day * MINUTES_PER_DAY
+            index = np.minimum(np.searchsorted(series.offsets, offsets), len(series) - 1)
+            hit = series.offsets[index] == offsets
+            rows, index = rows[hit], index[hit]
+            found[rows] = True
+            columns.steps[rows] = series.steps[index]
+            columns.calories_out[rows] = series.calories_out[index]
+            columns.hr_avg[rows] = series.hr_avg[index]
+            columns.source[rows] = series.source[index]
+            columns.valid[rows] = series.valid[index]
+        return found, columns
+
+    def parts(
+        self, lo_minute: Optional[int], hi_minute: Optional[int]
+    ) -> Iterator[Tuple[int, DaySeries, int, int]]:
+        """(giorno, serie, i, j) dei giorni con eventi in [lo_minute, hi_minute)."""
+        keys = self._day_keys
+        first = 0 if lo_minute is None else bisect.bisect_left(keys, lo_minute // MINUTES_PER_DAY)
+        last = (
+            len(keys)
+            if hi_minute is None
+            else bisect.bisect_right(keys, (hi_minute - 1) // MINUTES_PER_DAY)
+        )
+        for day in keys[first:last]:
+            series = self.days[day]
+            base = day * MINUTES_PER_DAY
+            lo = 0 if lo_minute is None else max(lo_minute - base, 0)
+            hi = MINUTES_PER_DAY if hi_minute is None else min(hi_minute - base, MINUTES_PER_DAY)
+            i, j = series.bounds(lo, hi)
+            if i < j:
+                yield day, series, i, j
+
+    def columns(
+        self,
+        lo_minute: Optional[int],
+        hi_minute: Optional[int],
+        limit: Optional[int] = None,
+    ) -> RangeColumns:
+        """Colonne dei primi limit eventi in [lo_minute, hi_minute) (None = tutti)."""
+        parts: List[Tuple[int, DaySeries, int, int]] = []
+        remaining = limit
+        for day, series, i, j in self.parts(lo_minute, hi_minute):
+            if remaining is not None:
+                j = min(j, i + remaining)
+                remaining -= j - i
+            parts.append((day, series, i, j))
+            if remaining == 0:
+                break
+        return RangeColumns(parts)
+
+    @property
+    def nbytes(self) -> int:
+        """Byte occupati dagli array dei giorni."""
+        return sum(series.nbytes for series in self.days.values())
+
+    def __len__(self) -> int:
+        return sum(len(series) for series in self.days.values())
+
+
+def rolling_sum(values: npt.NDArray[np.int64], window: int) -> npt.NDArray[np.int64]:
+    """Somma mobile (finestra che termina a ogni posizione) via cumsum."""
+    if window <= 0:
+        raise ValueError("window must be positive")
+    cumulative = np.cumsum(values, dtype=np.int64)
+    shifted = np.concatenate((np.zeros(window, dtype=np.int64), cumulative[:-window]))
+    return cumulative - shifted[: len(cumulative)]
+
+
+__all__ = [
+    "MINUTES_PER_DAY",
+    "MAX_STEPS",
+    "HAS_STEPS",
+    "HAS_CALORIES",
+    "HAS_HR",
+    "DaySeries",
+    "RangeColumns",
+    "UserSeries",
+    "ceil_minute_of",
+    "format_minutes",
+    "minute_of",
+    "minutes_of",
+    "rolling_sum",
+]
@@ -6,17 +6,33 @@ Responsabilità:
 * Rilevare duplicate (snapshot identico) e reset (contatori diminuiti)
 * Idempotenza via chiave opzionale (auto se assente)
 * Esporre elenco delta per query `syncEntries`
+* Limitare la memoria: firme idempotenza con TTL + LRU, delta e ultimi
+  totali conservati solo per gli ultimi `retention_days` giorni (sweep
+  periodico avviato dal lifespan FastAPI, gauge nel metrics registry)
 
 Nota: hr_avg_session è escluso dalla firma idempotenza.
 """
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Callable, Dict, List, Optional, Tuple, Any
+import asyncio
+import datetime
 import hashlib
+import logging
+import time
 import uuid
 
+from metrics.core import registry
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_IDEMPOTENCY_TTL_SECONDS = 86400.0
+DEFAULT_MAX_IDEMPOTENCY_KEYS = 100_000
+DEFAULT_RETENTION_DAYS = 7
+
 
 @dataclass(slots=True)
 class HealthTotalsDeltaRecord:
@@ -32,13 +48,52 @@ class HealthTotalsDeltaRecord:
 
 
 class HealthTotalsRepository:
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        *,
+        idempotency_ttl_seconds: float = DEFAULT_IDEMPOTENCY_TTL_SECONDS,
+        max_idempotency_keys: int = DEFAULT_MAX_IDEMPOTENCY_KEYS,
+        retention_days: int = DEFAULT_RETENTION_DAYS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
         # (user_id, date) -> lista ordinata di delta
         self._deltas: Dict[Tuple[str, str], List[HealthTotalsDeltaRecord]] = {}
         # Ultimo snapshot totale per (user_id, date)
         self._last_totals: Dict[Tuple[str, str], Tuple[int, float, Optional[float], str]] = {}
-        # Idempotency: (user_id, key) -> signature
-        self._idemp: Dict[Tuple[str, str], str] = {}
+        # Idempotency: (user_id, key) -> (signature, scadenza), ordine LRU
+        self._idemp: "OrderedDict[Tuple[str, str], Tuple[str, float]]" = OrderedDict()
+        self._clock = clock
+        self.configure(
+            idempotency_ttl_seconds=idempotency_ttl_seconds,
+            max_idempotency_keys=max_idempotency_keys,
+            retention_days=retention_days,
+        )
+
+    def configure(
+        self,
+        *,
+        idempotency_ttl_seconds: float,
+        max_idempotency_keys: int,
+        retention_days: int,
+    ) -> None:
+        """Imposta i limiti di memoria (validi dalla prossima scrittura/sweep).
+
+        Args:
+            idempotency_ttl_seconds: durata di una firma idempotenza
+            max_idempotency_keys: firme conservate (oltre: esce la meno usata)
+            retention_days: giorni conservati oltre a oggi (UTC)
+        """
+        if idempotency_ttl_seconds <= 0:
+            raise ValueError(
+                f"idempotency_ttl_seconds must be positive, got {idempotency_ttl_seconds}"
+            )
+        if max_idempotency_keys <= 0:
+            raise ValueError(f"max_idempotency_keys must be positive, got {max_idempotency_keys}")
+        if retention_days < 0:
+            raise ValueError(f"retention_days must not be negative, got {retention_days}")
+        self._idemp_ttl = idempotency_ttl_seconds
+        self._max_idemp = max_idempotency_keys
+        self._retention_days = retention_days
 
     # ----------------- API pubblica -----------------
     def record_snapshot(
@@ -75,7 +130,7 @@ class HealthTotalsRepository:
             auto_key = "auto-" + signature[:16]
             idempotency_key = auto_key
         key_tuple = (user_id, idempotency_key)
-        existing_sig = self._idemp.get(key_tuple)
+        existing_sig = self._get_signature(key_tuple)
         if existing_sig is not None and existing_sig != signature:
             # Conflitto: chiave riusata con payload diverso
             return {
@@ -88,7 +143,7 @@ class HealthTotalsRepository:
             }
         if existing_sig is None:
             # Registra la signature (anche se poi duplicate) per coerenza
-            self._idemp[key_tuple] = signature
+            self._store_signature(key_tuple, signature)
 
         # Duplicate detection: confronto con ultimo snapshot valori
         last_key = (user_id, date)
@@ -189,6 +244,80 @@ class HealthTotalsRepository:
         calories_out = round(sum(d.calories_out_delta for d in deltas), 4)
         return steps, calories_out
 
+    # ----------------- Limiti di memoria -----------------
+    def _get_signature(self, key: Tuple[str, str]) -> Optional[str]:
+        entry = self._idemp.get(key)
+        if entry is None:
+            return None
+        signature, expires_at = entry
+        if expires_at <= self._clock():
+            del self._idemp[key]
+            self._evicted("expired")
+            return None
+        self._idemp.move_to_end(key)
+        return signature
+
+    def _store_signature(self, key: Tuple[str, str], signature: str) -> None:
+        self._idemp[key] = (signature, self._clock() + self._idemp_ttl)
+        self._idemp.move_to_end(key)
+        while len(self._idemp) > self._max_idemp:
+            self._idemp.popitem(last=False)
+            self._evicted("capacity")
+
+    def sweep(self) -> Dict[str, int]:
+        """Rimuove firme scadute e giorni oltre la retention, aggiorna i gauge.
+
+        I giorni sono confrontati per data (YYYY-MM-DD) con oggi UTC meno
+        `retention_days`: uno snapshot di un giorno più vecchio resta
+        leggibile solo fino allo sweep successivo.
+
+        Returns:
+            Conteggio rimossi: {'idempotency_keys': n, 'days': n}
+        """
+        now = self._clock()
+        expired = [key for key, (_, expires_at) in self._idemp.items() if expires_at <= now]
+        for key in expired:
+            del self._idemp[key]
+            self._evicted("expired")
+
+        today = datetime.datetime.fromtimestamp(now, tz=datetime.timezone.utc).date()
+        cutoff = (today - datetime.timedelta(days=self._retention_days)).isoformat()
+        old_days = {key for key in (*self._deltas, *self._last_totals) if key[1] < cutoff}
+        for key in old_days:
+            self._deltas.pop(key, None)
+            self._last_totals.pop(key, None)
+
+        self.report_memory()
+        return {"idempotency_keys": len(expired), "days": len(old_days)}
+
+    def memory_stats(self) -> Dict[str, int]:
+        """Dimensione dello stato in-memory (numero di voci)."""
+        return {
+            "idempotency_keys": len(self._idemp),
+            "days": len(self._last_totals),
+            "deltas": sum(len(deltas) for deltas in self._deltas.values()),
+        }
+
+    def report_memory(self) -> None:
+        """Pubblica memory_stats come gauge health_totals_entries (tag kind)."""
+        for kind, value in self.memory_stats().items():
+            registry.gauge("health_totals_entries", kind=kind).set(value)
+
+    async def run_sweeper(self, interval_seconds: float) -> None:
+        """Esegue sweep ogni `interval_seconds` fino alla cancellazione del task."""
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                removed = self.sweep()
+            except Exception:  # pragma: no cover - il task non deve morire
+                logger.exception("health_totals.sweep_failed")
+                continue
+            logger.debug("health_totals.sweep", extra=removed)
+
+    @staticmethod
+    def _evicted(reason: str) -> None:
+        registry.counter("health_totals_idempotency_evictions", reason=reason).inc()
+
 
 # Istanza globale
 health_totals_repo = HealthTotalsRepository()
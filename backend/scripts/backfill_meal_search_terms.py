@@ -0,0 +1,153 @@
+"""Backfill search_terms on meal documents for full-text search.
+
+MongoMealRepository writes search_terms (prefixes of the normalized
+search tokens) on every save; MongoMealRepository.search requires it to
+match prefixes and to enforce that every query term matches. This script
+computes it for documents written before search was index-backed.
+
+The backfill is online and idempotent:
+- Documents without search_terms are processed in _id order, in batches
+- Each update is conditional on the original updated_at value, so a
+  meal re-saved in the meantime keeps the terms written by the app
+
+Usage:
+    uv run python scripts/backfill_meal_search_terms.py [--dry-run] [--batch-size 500]
+
+Environment Variables:
+    MONGODB_URI: MongoDB connection string (required)
+    MONGODB_DATABASE: Database name (default: nutrifit)
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from dotenv import load_dotenv
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorCollection
+from pymongo import UpdateOne
+
+from infrastructure.config import get_mongodb_uri, get_mongodb_database
+from infrastructure.persistence.mongodb.meal_repository import MongoMealRepository
+
+# Load environment variables from .env file
+env_path = Path(__file__).parent.parent / ".env"
+if env_path.exists():
+    load_dotenv(env_path)
+
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+MISSING_FILTER: Dict[str, Any] = {"search_terms": {"$exists": False}}
+
+
+def build_search_terms_update(doc: Dict[str, Any]) -> UpdateOne:
+    """Build conditional update setting search_terms of one meal."""
+    filter_dict = {"_id": doc["_id"], "updated_at": doc.get("updated_at")}
+    terms = MongoMealRepository.search_terms_from_document(doc)
+    return UpdateOne(filter_dict, {"$set": {"search_terms": terms}})
+
+
+async def backfill_batch(
+    collection: AsyncIOMotorCollection[Dict[str, Any]],
+    last_id: Optional[str],
+    batch_size: int,
+    dry_run: bool,
+) -> tuple[int, int, Optional[str]]:
+    """Backfill one batch of meal documents.
+
+    Returns:
+        (documents scanned, documents modified, last _id of batch)
+    """
+    filter_dict: Dict[str, Any] = dict(MISSING_FILTER)
+    if last_id is not None:
+        filter_dict["_id"] = {"$gt": last_id}
+
+    projection = {
+        "dish_name": 1,
+        "entries.name": 1,
+        "entries.display_name": 1,
+        "notes": 1,
+        "updated_at": 1,
+    }
+    cursor = collection.find(filter_dict, projection).sort("_id", 1).limit(batch_size)
+    docs = await cursor.to_list(length=batch_size)
+    if not docs:
+        return 0, 0, None
+
+    modified = 0
+    if not dry_run:
+        operations = [build_search_terms_update(doc) for doc in docs]
+        result = await collection.bulk_write(operations, ordered=False)
+        modified = result.modified_count
+
+    return len(docs), modified, docs[-1]["_id"]
+
+
+async def backfill_search_terms(batch_size: int, dry_run: bool) -> None:
+    """Backfill all meal documents missing search_terms."""
+    uri = get_mongodb_uri()
+    if not uri:
+        logger.error("MONGODB_URI not configured!")
+        sys.exit(1)
+
+    database_name = get_mongodb_database()
+    client: AsyncIOMotorClient[Dict[str, Any]] = AsyncIOMotorClient(uri)
+    collection = client[database_name]["meals"]
+
+    try:
+        await client.admin.command("ping")
+        pending = await collection.count_documents(MISSING_FILTER)
+        logger.info(f"✓ Connected to {database_name}: {pending} meals without search_terms")
+
+        scanned_total = 0
+        modified_total = 0
+        last_id: Optional[str] = None
+        while True:
+            scanned, modified, last_id = await backfill_batch(
+                collection, last_id, batch_size, dry_run
+            )
+            if scanned == 0:
+                break
+            scanned_total += scanned
+            modified_total += modified
+            logger.info(f"  • scanned={scanned_total} modified={modified_total}")
+
+        remaining = await collection.count_documents(MISSING_FILTER)
+        mode = "DRY RUN - " if dry_run else ""
+        logger.info(
+            f"\n✅ {mode}scanned={scanned_total} modified={modified_total} "
+            f"remaining={remaining}"
+        )
+        if remaining and not dry_run:
+            logger.info("Some meals changed during the run: re-run to backfill them")
+
+    finally:
+        client.close()
+
+
+def main() -> None:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(backfill_search_terms(batch_size=args.batch_size, dry_run=args.dry_run))
+    except KeyboardInterrupt:
+        logger.info("\n\n⚠️  Interrupted by user (safe to re-run)")
+        sys.exit(130)
+    except Exception as e:
+        logger.error(f"\n❌ Fatal error: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
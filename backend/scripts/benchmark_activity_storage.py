@@ -0,0 +1,126 @@
+"""Memory and aggregation benchmark of the in-memory activity storage.
+
+Compares, on one synthetic user-year of minute events, the two ways the
+legacy in-memory repository can hold activity series:
+- objects: one ActivityEventRecord per minute in a sorted list (the
+  previous layout), aggregated with a Python loop
+- columnar: per-day NumPy columns (repository.activity_series), aggregated
+  with vectorized reductions
+
+Memory is measured with tracemalloc; aggregation time is a daily
+aggregateRange over the whole year (365 periods).
+
+Usage:
+    uv run python scripts/benchmark_activity_storage.py [--days 365] [--number 5]
+"""
+
+import argparse
+import datetime
+import random
+import timeit
+import tracemalloc
+from typing import Callable, Dict, List, Tuple, TypeVar
+
+from repository.activities import ActivityEventRecord, InMemoryActivityRepository
+
+T = TypeVar("T")
+
+START = datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def make_events(days: int) -> List[ActivityEventRecord]:
+    """Minute events with steps, calories and heart rate for every minute."""
+    rng = random.Random(42)
+    events = []
+    for minute in range(days * 1440):
+        ts = (START + datetime.timedelta(minutes=minute)).isoformat().replace("+00:00", "Z")
+        events.append(
+            ActivityEventRecord(
+                user_id="benchmark-user",
+                ts=ts,
+                steps=rng.choice((0, 0, 0, rng.randint(1, 120))),
+                calories_out=round(rng.uniform(0.8, 6.0), 2),
+                hr_avg=float(rng.randint(55, 150)),
+            )
+        )
+    return events
+
+
+def period_starts(days: int) -> Tuple[List[str], str]:
+    """Daily period starts and the exclusive end of the range."""
+    starts = [
+        (START + datetime.timedelta(days=day)).isoformat().replace("+00:00", "Z")
+        for day in range(days)
+    ]
+    end = (START + datetime.timedelta(days=days)).isoformat().replace("+00:00", "Z")
+    return starts, end
+
+
+def loop_aggregate(
+    events: List[ActivityEventRecord], starts: List[str], end: str
+) -> Dict[int, Dict[str, float]]:
+    """Previous aggregation: one pass over the record objects."""
+    results: Dict[int, Dict[str, float]] = {}
+    index = -1
+    for record in events:
+        if record.ts >= end:
+            break
+        while index + 1 < len(starts) and record.ts >= starts[index + 1]:
+            index += 1
+        totals = results.setdefault(
+            index, {"total_steps": 0, "total_calories_out": 0.0, "event_count": 0}
+        )
+        totals["total_steps"] += record.steps or 0
+        totals["total_calories_out"] += record.calories_out or 0.0
+        totals["event_count"] += 1
+    return results
+
+
+def traced(build: Callable[[], T]) -> Tuple[T, int]:
+    """Build a structure and return it with the bytes it keeps allocated."""
+    tracemalloc.start()
+    value = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return value, size
+
+
+def main() -> None:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--days", type=int, default=365, help="Days of minute events")
+    parser.add_argument("--number", type=int, default=5, help="Aggregations per repeat")
+    args = parser.parse_args()
+
+    starts, end = period_starts(args.days)
+
+    def build_columnar() -> InMemoryActivityRepository:
+        repo = InMemoryActivityRepository()
+        repo.ingest_batch(make_events(args.days))
+        return repo
+
+    events, objects_bytes = traced(lambda: make_events(args.days))
+    repo, columnar_bytes = traced(build_columnar)
+
+    def run_loop() -> None:
+        loop_aggregate(events, starts, end)
+
+    def run_columnar() -> None:
+        repo.aggregate_periods("benchmark-user", starts, end)
+
+    loop_ms = min(timeit.repeat(run_loop, number=args.number, repeat=3)) / args.number * 1e3
+    columnar_ms = min(timeit.repeat(run_columnar, number=args.number, repeat=3)) / args.number * 1e3
+
+    print(f"{len(events)} minute events ({args.days} days, one user)")
+    print(
+        f"  memory       objects {objects_bytes / 2**20:8.1f} MiB   "
+        f"columnar {columnar_bytes / 2**20:8.1f} MiB   ({objects_bytes / columnar_bytes:.0f}x)"
+    )
+    print(
+        f"  daily range  objects {loop_ms:8.1f} ms    "
+        f"columnar {columnar_ms:8.1f} ms    ({loop_ms / columnar_ms:.0f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""Storage and aggregateRange benchmark of the two Mongo activity backends.
+
+Loads the same synthetic minute events for one user into both backends,
+then reports:
+- storage: collStats storageSize and totalIndexSize of activity_events
+  (one document per minute) and activity_events_ts (time-series buckets)
+- latency: aggregate_by_period for a daily aggregateRange over the whole
+  range and a weekly one over the last 28 days (best of --repeat runs)
+
+Runs against a separate database (default nutrifit_benchmark) whose
+activity collections are dropped at the end unless --keep is given.
+
+Usage:
+    uv run python scripts/benchmark_activity_timeseries.py [--days 90] [--repeat 5]
+        [--database nutrifit_benchmark] [--keep]
+
+Environment Variables:
+    MONGODB_URI: MongoDB connection string (required)
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from dotenv import load_dotenv
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from domain.activity.model import ActivityEvent, ActivitySource
+from infrastructure.config import get_mongodb_uri
+from infrastructure.persistence.mongodb.activity_repository import MongoActivityRepository
+from infrastructure.persistence.mongodb.activity_timeseries_repository import (
+    MongoActivityTimeSeriesRepository,
+)
+
+# Load environment variables from .env file
+env_path = Path(__file__).parent.parent / ".env"
+if env_path.exists():
+    load_dotenv(env_path)
+
+
+logging.basicConfig(level=logging.WARNING)
+
+USER_ID = "benchmark-user"
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def make_day(day: int, rng: random.Random) -> List[ActivityEvent]:
+    """One day of minute events with steps, calories and heart rate."""
+    day_start = START + timedelta(days=day)
+    return [
+        ActivityEvent(
+            user_id=USER_ID,
+            ts=(day_start + timedelta(minutes=minute)).isoformat().replace("+00:00", "Z"),
+            steps=rng.choice((0, 0, 0, rng.randint(1, 120))),
+            calories_out=round(rng.uniform(0.8, 6.0), 2),
+            hr_avg=float(rng.randint(55, 150)),
+            source=ActivitySource.APPLE_HEALTH,
+        )
+        for minute in range(1440)
+    ]
+
+
+def periods(days: int, span: int, step: int) -> List[Tuple[datetime, datetime]]:
+    """Contiguous periods of `step` days covering the last `span` of `days` loaded days."""
+    first = START + timedelta(days=days - span)
+    return [
+        (first + timedelta(days=offset), first + timedelta(days=offset + step))
+        for offset in range(0, span, step)
+    ]
+
+
+async def storage(repository: MongoActivityRepository) -> Dict[str, Any]:
+    """collStats of the repository events collection."""
+    stats: Dict[str, Any] = await repository._db.command("collStats", repository.collection_name)
+    return stats
+
+
+async def best_latency_ms(
+    repository: MongoActivityRepository, ranges: List[Tuple[datetime, datetime]], repeat: int
+) -> float:
+    """Best aggregate_by_period latency over `repeat` runs (ms)."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await repository.aggregate_by_period(USER_ID, ranges)
+        timings.append((time.perf_counter() - started) * 1e3)
+    return min(timings)
+
+
+async def run_benchmark(days: int, repeat: int, keep: bool) -> None:
+    """Load both backends, then compare storage and aggregation latency."""
+    uri = get_mongodb_uri()
+    if not uri:
+        print("❌ MONGODB_URI not configured")
+        sys.exit(1)
+
+    client: AsyncIOMotorClient[Dict[str, Any]] = AsyncIOMotorClient(uri)
+    regular = MongoActivityRepository(client)
+    timeseries = MongoActivityTimeSeriesRepository(client)
+    backends = [("collection", regular), ("time-series", timeseries)]
+
+    try:
+        await regular.collection.drop()
+        await timeseries.collection.drop()
+        await regular.collection.create_index([("user_id", 1), ("ts", 1)], name="idx_user_ts")
+        await timeseries.ensure_collection()
+
+        print(f"Loading {days * 1440} minute events ({days} days) into both backends...")
+        for label, repository in backends:
+            rng = random.Random(42)
+            started = time.perf_counter()
+            for day in range(days):
+                await repository.ingest_events(make_day(day, rng))  # one ingest per day
+            print(f"  {label:<12} ingest {time.perf_counter() - started:7.1f} s")
+
+        print("\nStorage (collStats)")
+        for label, repository in backends:
+            stats = await storage(repository)
+            print(
+                f"  {label:<12} storage {stats.get('storageSize', 0) / 2**20:8.2f} MiB   "
+                f"indexes {stats.get('totalIndexSize', 0) / 2**20:8.2f} MiB"
+            )
+
+        print(f"\naggregateRange latency (best of {repeat})")
+        scenarios = [
+            (f"daily x{days}", periods(days, days, 1)),
+            ("weekly x4", periods(days, min(days, 28), 7)),
+        ]
+        for scenario, ranges in scenarios:
+            timings = [
+                f"{label} {await best_latency_ms(repository, ranges, repeat):8.1f} ms"
+                for label, repository in backends
+            ]
+            print(f"  {scenario:<12} " + "   ".join(timings))
+
+    finally:
+        if not keep:
+            await regular.collection.drop()
+            await timeseries.collection.drop()
+        client.close()
+
+
+def main() -> None:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--days", type=int, default=90, help="Days of minute events")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per latency scenario")
+    parser.add_argument("--database", default="nutrifit_benchmark", help="Scratch database")
+    parser.add_argument("--keep", action="store_true", help="Keep the loaded collections")
+    args = parser.parse_args()
+
+    # Read by MongoBaseRepository when the repositories are created
+    os.environ["MONGODB_DATABASE"] = args.database
+    asyncio.run(run_benchmark(days=args.days, repeat=args.repeat, keep=args.keep))
+
+
+if __name__ == "__main__":
+    main()
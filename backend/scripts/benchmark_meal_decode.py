@@ -0,0 +1,111 @@
+"""Microbenchmark of per-meal decode cost for read-only meal queries.
+
+Compares, on the same synthetic MongoDB documents (projected on the
+GraphQL selection of each scenario), the cost of turning one document
+into a resolved GraphQL meal through:
+- domain: MongoMealRepository.from_document + map_meal_to_graphql
+- raw: map_meal_document_to_graphql (no Meal aggregate, no UUID or entry
+  date parsing, no invariant checks)
+
+Both sides read the same projected document, so the projection gain is
+not part of the comparison.
+
+No database connection is opened.
+
+Usage:
+    uv run python scripts/benchmark_meal_decode.py [--entries 4] [--number 20000]
+"""
+
+import argparse
+import timeit
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Tuple
+from uuid import uuid4
+
+from domain.meal.core.entities.meal import Meal
+from domain.meal.core.entities.meal_entry import MealEntry
+from domain.shared.ports.meal_repository import MealProjection
+from graphql.resolvers.meal.aggregate_queries import (
+    map_meal_document_to_graphql,
+    map_meal_to_graphql,
+)
+from infrastructure.persistence.mongodb.meal_repository import MongoMealRepository
+
+# (label, domain projection fields of the GraphQL selection)
+SCENARIOS: List[Tuple[str, frozenset[str]]] = [
+    ("history list (no entries)", frozenset({"timestamp", "meal_type", "total_calories"})),
+    (
+        "meal detail (with entries)",
+        frozenset({"timestamp", "meal_type", "total_calories", "entries"}),
+    ),
+]
+
+
+def make_document(repository: MongoMealRepository, entries: int) -> Dict[str, Any]:
+    """Build a stored meal document with the given number of entries."""
+    meal_id = uuid4()
+    timestamp = datetime(2025, 10, 25, 12, 30, tzinfo=timezone.utc)
+    meal = Meal(
+        id=meal_id,
+        user_id="benchmark-user",
+        timestamp=timestamp,
+        meal_type="LUNCH",
+        notes="Benchmark meal",
+    )
+    for index in range(entries):
+        meal.add_entry(
+            MealEntry(
+                id=uuid4(),
+                meal_id=meal_id,
+                name=f"food_{index}",
+                display_name=f"Food {index}",
+                quantity_g=100.0,
+                calories=150,
+                protein=10.0,
+                carbs=15.0,
+                fat=5.0,
+                fiber=2.0,
+                sugar=3.0,
+                sodium=50.0,
+                created_at=timestamp + timedelta(seconds=index),
+            )
+        )
+    return repository.to_document(meal)
+
+
+def measure(func: Callable[[], None], number: int) -> float:
+    """Best per-call time in microseconds over 5 repeats."""
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+
+
+def main() -> None:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=4, help="Entries per meal")
+    parser.add_argument("--number", type=int, default=20000, help="Decodes per repeat")
+    args = parser.parse_args()
+
+    repository = MongoMealRepository.__new__(MongoMealRepository)
+    doc = make_document(repository, args.entries)
+
+    print(f"Per-meal decode cost ({args.entries} entries, best of 5)")
+    for label, fields in SCENARIOS:
+        keys = MongoMealRepository._projection(MealProjection(fields=fields))
+        partial = {key: doc[key] for key in keys if key in doc}
+
+        def domain() -> None:
+            map_meal_to_graphql(repository.from_document(partial))
+
+        def raw() -> None:
+            map_meal_document_to_graphql(partial)
+
+        before = measure(domain, args.number)
+        after = measure(raw, args.number)
+        print(
+            f"  {label:<28} domain {before:7.2f} µs   raw {after:7.2f} µs"
+            f"   ({before / after:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
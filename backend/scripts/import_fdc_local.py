@@ -0,0 +1,104 @@
+"""Import FoodData Central JSON downloads into the local nutrition index.
+
+Builds the memory-mapped index read by NUTRITION_PROVIDER=usda_local
+(infrastructure/external_apis/usda/local_index.py) from the Foundation
+and/or SR Legacy JSON downloads of https://fdc.nal.usda.gov/download-datasets
+(same data set as the USDAClient search: dataType "Foundation,SR Legacy").
+
+The index is written next to the target directory and swapped in with a
+rename: running workers keep the previous index until restarted.
+
+Usage:
+    uv run python scripts/import_fdc_local.py \\
+        FoodData_Central_foundation_food_json_*.json \\
+        FoodData_Central_sr_legacy_food_json_*.json [--output .cache/fdc_local]
+
+Exit codes:
+    0 success
+    1 unreadable or unsupported input file
+
+Environment Variables:
+    USDA_LOCAL_INDEX_PATH: default --output (default: .cache/fdc_local)
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Iterator, List
+
+from dotenv import load_dotenv
+
+from infrastructure.config import get_usda_local_index_path
+from infrastructure.external_apis.usda.local_index import (
+    FDCFood,
+    iter_fdc_json_foods,
+    write_local_index,
+)
+from infrastructure.external_apis.usda.local_provider import USDALocalProvider
+
+# Load environment variables from .env file
+env_path = Path(__file__).parent.parent / ".env"
+if env_path.exists():
+    load_dotenv(env_path)
+
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+# Labels looked up after the import (sanity check)
+SAMPLE_LABELS = ("chicken breast", "banana", "potatoes", "eggs", "rice")
+
+
+def read_foods(files: List[str]) -> Iterator[FDCFood]:
+    """Foods of all input files, in order."""
+    for path in files:
+        count = 0
+        for food in iter_fdc_json_foods(path):
+            count += 1
+            yield food
+        logger.info(f"  • {os.path.basename(path)}: {count} foods")
+
+
+async def sample_lookups(output: str) -> None:
+    """Look up SAMPLE_LABELS with the provider, timing each lookup."""
+    async with USDALocalProvider(output) as provider:
+        for label in SAMPLE_LABELS:
+            started = time.perf_counter()
+            profile = await provider.get_nutrients(label, 100.0)
+            elapsed_ms = (time.perf_counter() - started) * 1e3
+            kcal = f"{profile.calories} kcal" if profile else "no result"
+            logger.info(f"  • {label:<16} {kcal:<12} {elapsed_ms:6.2f} ms")
+
+
+def main() -> None:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("files", nargs="+", help="FoodData Central JSON downloads")
+    parser.add_argument("--output", default=get_usda_local_index_path())
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    logger.info(f"📥 Importing {len(args.files)} file(s) into {args.output}")
+    try:
+        count = write_local_index(
+            args.output,
+            read_foods(args.files),
+            sources=[os.path.basename(path) for path in args.files],
+        )
+    except (OSError, ValueError) as e:
+        logger.error(f"\n❌ Import failed: {e}")
+        sys.exit(1)
+
+    logger.info(f"\n✅ {count} foods indexed in {time.perf_counter() - started:.1f} s")
+    asyncio.run(sample_lookups(args.output))
+
+
+if __name__ == "__main__":
+    main()
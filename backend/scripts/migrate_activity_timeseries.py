@@ -0,0 +1,177 @@
+"""Copy activity events into the MongoDB time-series collection.
+
+MongoActivityTimeSeriesRepository (MONGODB_ACTIVITY_TIMESERIES=1) reads
+and writes activity_events_ts: user_id as metaField, ts as BSON date
+timeField. This script creates that collection if missing and copies the
+documents of the regular activity_events collection into it.
+
+The migration is online and idempotent:
+- Source documents are read in _id order, in batches
+- Each batch goes through MongoActivityTimeSeriesRepository.ingest_events,
+  so minutes already present in the target are counted as duplicates
+  and never written twice
+- Re-running the script (or resuming with --after-id) only copies the
+  missing minutes; events ingested during the run are picked up by a
+  second run before switching
+
+The source collection is left untouched: drop it once the application
+runs with MONGODB_ACTIVITY_TIMESERIES=1 and the counts match.
+
+Usage:
+    uv run python scripts/migrate_activity_timeseries.py [--dry-run] [--batch-size 5000]
+        [--after-id ID]
+
+Environment Variables:
+    MONGODB_URI: MongoDB connection string (required)
+    MONGODB_DATABASE: Database name (default: nutrifit)
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from dotenv import load_dotenv
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from infrastructure.config import get_mongodb_uri, get_mongodb_database
+from infrastructure.persistence.mongodb.activity_repository import MongoActivityRepository
+from infrastructure.persistence.mongodb.activity_timeseries_repository import (
+    MongoActivityTimeSeriesRepository,
+)
+
+# Load environment variables from .env file
+env_path = Path(__file__).parent.parent / ".env"
+if env_path.exists():
+    load_dotenv(env_path)
+
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+
+async def migrate_batch(
+    source: MongoActivityRepository,
+    target: MongoActivityTimeSeriesRepository,
+    last_id: Optional[str],
+    batch_size: int,
+    dry_run: bool,
+) -> Tuple[int, int, int, List[Tuple[int, str]], Optional[str]]:
+    """Copy one batch of activity events.
+
+    Args:
+        source: Repository on the regular activity_events collection
+        target: Repository on the time-series collection
+        last_id: Resume after this _id (None for first batch)
+        batch_size: Max documents per batch
+        dry_run: Only read, do not write
+
+    Returns:
+        (documents read, inserted, duplicates, rejected, last _id of batch)
+    """
+    filter_dict: Dict[str, Any] = {} if last_id is None else {"_id": {"$gt": last_id}}
+    cursor = source.collection.find(filter_dict).sort("_id", 1).limit(batch_size)
+    docs = await cursor.to_list(length=batch_size)
+    if not docs:
+        return 0, 0, 0, [], None
+
+    if dry_run:
+        return len(docs), 0, 0, [], docs[-1]["_id"]
+
+    events = [source.from_document(doc) for doc in docs]
+    inserted, duplicates, rejected = await target.ingest_events(events)
+    return len(docs), inserted, duplicates, rejected, docs[-1]["_id"]
+
+
+async def migrate_activity_timeseries(
+    batch_size: int, dry_run: bool, after_id: Optional[str]
+) -> None:
+    """Copy all activity_events documents into activity_events_ts."""
+    uri = get_mongodb_uri()
+    if not uri:
+        logger.error("MONGODB_URI not configured!")
+        sys.exit(1)
+
+    database_name = get_mongodb_database()
+    client: AsyncIOMotorClient[Dict[str, Any]] = AsyncIOMotorClient(uri)
+    source = MongoActivityRepository(client)
+    target = MongoActivityTimeSeriesRepository(client)
+
+    try:
+        await client.admin.command("ping")
+        total = await source.collection.estimated_document_count()
+        logger.info(f"✓ Connected to {database_name}: ~{total} events in {source.collection_name}")
+
+        if not dry_run:
+            await target.ensure_collection()
+
+        read_total = inserted_total = duplicates_total = rejected_total = 0
+        last_id = after_id
+        while True:
+            read, inserted, duplicates, rejected, batch_last_id = await migrate_batch(
+                source, target, last_id, batch_size, dry_run
+            )
+            if read == 0:
+                break
+            last_id = batch_last_id
+            read_total += read
+            inserted_total += inserted
+            duplicates_total += duplicates
+            rejected_total += len(rejected)
+            for index, reason in rejected[:5]:
+                logger.warning(f"  ⚠️  rejected (batch index {index}): {reason[:100]}")
+            logger.info(
+                f"  • read={read_total} inserted={inserted_total} "
+                f"duplicates={duplicates_total} rejected={rejected_total} "
+                f"(resume with --after-id {last_id})"
+            )
+
+        mode = "DRY RUN - " if dry_run else ""
+        logger.info(
+            f"\n✅ {mode}read={read_total} inserted={inserted_total} "
+            f"duplicates={duplicates_total} rejected={rejected_total}"
+        )
+        if not dry_run:
+            copied = await target.collection.count_documents({})
+            source_count = await source.collection.count_documents({})
+            logger.info(
+                f"{source.collection_name}={source_count} {target.collection_name}={copied}"
+            )
+            if copied >= source_count and rejected_total == 0:
+                logger.info("All events copied: set MONGODB_ACTIVITY_TIMESERIES=1")
+            else:
+                logger.info("Counts differ: re-run to copy events ingested during the run")
+
+    finally:
+        client.close()
+
+
+def main() -> None:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--dry-run", action="store_true")
+    parser.add_argument("--after-id", default=None, help="Resume after this source _id")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(
+            migrate_activity_timeseries(
+                batch_size=args.batch_size, dry_run=args.dry_run, after_id=args.after_id
+            )
+        )
+    except KeyboardInterrupt:
+        logger.info("\n\n⚠️  Interrupted by user (safe to re-run)")
+        sys.exit(130)
+    except Exception as e:
+        logger.error(f"\n❌ Fatal error: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
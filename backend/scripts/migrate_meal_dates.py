@@ -0,0 +1,207 @@
+"""Backfill meal datetimes from ISO strings to native BSON dates.
+
+MongoMealRepository writes timestamp, created_at, updated_at and
+entries[].created_at as BSON dates, and reads both formats (dual-read).
+This script converts the documents still holding ISO 8601 strings so
+that range filters and grouping work on dates only.
+
+The migration is online and idempotent:
+- Documents are processed in _id order, in batches
+- Each update is conditional on the original updated_at value, so a
+  meal re-saved by the application in the meantime (already written
+  with BSON dates) is never overwritten with stale data
+- Re-running the script only touches documents still holding strings
+
+Once the remaining count is zero, set MONGODB_MEAL_DATES_LEGACY_READ=0
+to drop the legacy string branch from range queries.
+
+Usage:
+    uv run python scripts/migrate_meal_dates.py [--dry-run] [--batch-size 500]
+
+Environment Variables:
+    MONGODB_URI: MongoDB connection string (required)
+    MONGODB_DATABASE: Database name (default: nutrifit)
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from dotenv import load_dotenv
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorCollection
+from pymongo import UpdateOne
+
+from infrastructure.config import get_mongodb_uri, get_mongodb_database
+
+# Load environment variables from .env file
+env_path = Path(__file__).parent.parent / ".env"
+if env_path.exists():
+    load_dotenv(env_path)
+
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+DATE_FIELDS = ("timestamp", "created_at", "updated_at")
+
+# Documents with at least one top-level date still stored as string
+LEGACY_FILTER: Dict[str, Any] = {
+    "$or": [{field: {"$type": "string"}} for field in DATE_FIELDS]
+    + [{"entries.created_at": {"$type": "string"}}]
+}
+
+
+def _to_date(value: Any) -> Any:
+    """Convert ISO string to UTC datetime, leave other values untouched."""
+    if not isinstance(value, str):
+        return value
+    dt = datetime.fromisoformat(value)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
+
+def _offset_minutes(value: str) -> int:
+    """UTC offset of an ISO string, in minutes (0 if naive)."""
+    offset = datetime.fromisoformat(value).utcoffset()
+    return int(offset.total_seconds() // 60) if offset is not None else 0
+
+
+def build_date_update(doc: Dict[str, Any]) -> Optional[UpdateOne]:
+    """Build conditional update converting string dates of one meal.
+
+    Args:
+        doc: Meal document (projected on date fields and entries)
+
+    Returns:
+        UpdateOne operation, or None if nothing to convert
+    """
+    updates: Dict[str, Any] = {}
+    for field in DATE_FIELDS:
+        if isinstance(doc.get(field), str):
+            updates[field] = _to_date(doc[field])
+    if isinstance(doc.get("timestamp"), str):
+        # Offset of the legacy string, restored on read
+        updates["timestamp_offset"] = _offset_minutes(doc["timestamp"])
+
+    entries: List[Dict[str, Any]] = doc.get("entries") or []
+    if any(isinstance(entry.get("created_at"), str) for entry in entries):
+        updates["entries"] = [
+            {**entry, "created_at": _to_date(entry.get("created_at"))} for entry in entries
+        ]
+
+    if not updates:
+        return None
+
+    # Optimistic concurrency: skip if the meal changed since it was read
+    filter_dict = {"_id": doc["_id"], "updated_at": doc.get("updated_at")}
+    return UpdateOne(filter_dict, {"$set": updates})
+
+
+async def migrate_batch(
+    collection: AsyncIOMotorCollection[Dict[str, Any]],
+    last_id: Optional[str],
+    batch_size: int,
+    dry_run: bool,
+) -> tuple[int, int, Optional[str]]:
+    """Convert one batch of legacy meal documents.
+
+    Args:
+        collection: meals collection
+        last_id: Resume after this _id (None for first batch)
+        batch_size: Max documents per batch
+        dry_run: Only count, do not write
+
+    Returns:
+        (documents scanned, documents modified, last _id of batch)
+    """
+    filter_dict: Dict[str, Any] = dict(LEGACY_FILTER)
+    if last_id is not None:
+        filter_dict = {"$and": [LEGACY_FILTER, {"_id": {"$gt": last_id}}]}
+
+    projection = {field: 1 for field in DATE_FIELDS}
+    projection["entries"] = 1
+    cursor = collection.find(filter_dict, projection).sort("_id", 1).limit(batch_size)
+    docs = await cursor.to_list(length=batch_size)
+    if not docs:
+        return 0, 0, None
+
+    operations = [op for op in (build_date_update(doc) for doc in docs) if op is not None]
+    modified = 0
+    if operations and not dry_run:
+        result = await collection.bulk_write(operations, ordered=False)
+        modified = result.modified_count
+
+    return len(docs), modified, docs[-1]["_id"]
+
+
+async def migrate_meal_dates(batch_size: int, dry_run: bool) -> None:
+    """Backfill all meal documents still storing ISO string dates."""
+    uri = get_mongodb_uri()
+    if not uri:
+        logger.error("MONGODB_URI not configured!")
+        sys.exit(1)
+
+    database_name = get_mongodb_database()
+    client: AsyncIOMotorClient[Dict[str, Any]] = AsyncIOMotorClient(uri)
+    collection = client[database_name]["meals"]
+
+    try:
+        await client.admin.command("ping")
+        pending = await collection.count_documents(LEGACY_FILTER)
+        logger.info(f"✓ Connected to {database_name}: {pending} meals with string dates")
+
+        scanned_total = 0
+        modified_total = 0
+        last_id: Optional[str] = None
+        while True:
+            scanned, modified, last_id = await migrate_batch(
+                collection, last_id, batch_size, dry_run
+            )
+            if scanned == 0:
+                break
+            scanned_total += scanned
+            modified_total += modified
+            logger.info(f"  • scanned={scanned_total} modified={modified_total}")
+
+        remaining = await collection.count_documents(LEGACY_FILTER)
+        mode = "DRY RUN - " if dry_run else ""
+        logger.info(
+            f"\n✅ {mode}scanned={scanned_total} modified={modified_total} "
+            f"remaining={remaining}"
+        )
+        if remaining == 0 and not dry_run:
+            logger.info("All meal dates migrated: set MONGODB_MEAL_DATES_LEGACY_READ=0")
+        elif remaining and not dry_run:
+            logger.info("Some meals changed during the run: re-run to convert them")
+
+    finally:
+        client.close()
+
+
+def main() -> None:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(migrate_meal_dates(batch_size=args.batch_size, dry_run=args.dry_run))
+    except KeyboardInterrupt:
+        logger.info("\n\n⚠️  Interrupted by user (safe to re-run)")
+        sys.exit(130)
+    except Exception as e:
+        logger.error(f"\n❌ Fatal error: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
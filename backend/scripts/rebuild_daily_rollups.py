@@ -0,0 +1,143 @@
+"""Rebuild and check the daily nutrition rollups of meals.
+
+MongoMealRepository maintains daily_nutrition_rollups incrementally ($inc
+on every meal save and delete). This script:
+- rebuild: recomputes the rollups from meals (backfill of days written
+  before rollups existed, repair after drift)
+- check: compares stored rollups with meals and reports mismatching days
+  (--fix rebuilds the users with mismatches)
+
+Users are processed one at a time. Meal writes landing while a user is
+rebuilt may be lost or counted twice for that user: run off-peak, then
+check again.
+
+Usage:
+    uv run python scripts/rebuild_daily_rollups.py rebuild [--user-id <user_id>]
+    uv run python scripts/rebuild_daily_rollups.py check [--user-id <user_id>] [--fix]
+
+Exit codes:
+    0 success (check: all rollups consistent)
+    1 configuration / connection error
+    2 check found mismatches (and --fix was not given)
+
+Environment Variables:
+    MONGODB_URI: MongoDB connection string (required)
+    MONGODB_DATABASE: Database name (default: nutrifit)
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from dotenv import load_dotenv
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+
+from infrastructure.config import get_mongodb_uri, get_mongodb_database
+from infrastructure.persistence.mongodb.meal_repository import (
+    DAILY_ROLLUPS_COLLECTION,
+    MongoMealRepository,
+)
+
+# Load environment variables from .env file
+env_path = Path(__file__).parent.parent / ".env"
+if env_path.exists():
+    load_dotenv(env_path)
+
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+
+async def list_user_ids(db: AsyncIOMotorDatabase[Dict[str, Any]]) -> List[str]:
+    """List users having meals or rollups (rollups may outlive meals)."""
+    meal_users = await db["meals"].distinct("user_id")
+    rollup_users = await db[DAILY_ROLLUPS_COLLECTION].distinct("user_id")
+    return sorted(set(meal_users) | set(rollup_users))
+
+
+async def run(command: str, user_id: Optional[str], fix: bool) -> int:
+    """Rebuild or check rollups.
+
+    Returns:
+        Process exit code
+    """
+    uri = get_mongodb_uri()
+    if not uri:
+        logger.error("MONGODB_URI not configured!")
+        return 1
+
+    database_name = get_mongodb_database()
+    client: AsyncIOMotorClient[Dict[str, Any]] = AsyncIOMotorClient(uri)
+    repository = MongoMealRepository(client=client)
+
+    try:
+        await client.admin.command("ping")
+        user_ids = [user_id] if user_id else await list_user_ids(client[database_name])
+        logger.info(f"✓ Connected to {database_name}: {command} for {len(user_ids)} users")
+
+        if command == "rebuild":
+            days_total = 0
+            for index, uid in enumerate(user_ids, start=1):
+                days_total += await repository.rebuild_daily_rollups(uid)
+                if index % 100 == 0:
+                    logger.info(f"  • users={index} days={days_total}")
+            logger.info(f"\n✅ Rebuilt {days_total} days for {len(user_ids)} users")
+            return 0
+
+        inconsistent: List[str] = []
+        for uid in user_ids:
+            mismatches = await repository.check_daily_rollups(uid)
+            if not mismatches:
+                continue
+            inconsistent.append(uid)
+            days = ", ".join(day.isoformat() for day in mismatches[:10])
+            more = f" (+{len(mismatches) - 10})" if len(mismatches) > 10 else ""
+            logger.warning(f"  ✗ {uid}: {len(mismatches)} days differ: {days}{more}")
+            if fix:
+                await repository.rebuild_daily_rollups(uid)
+                logger.info(f"    ✓ Rebuilt rollups of {uid}")
+
+        if not inconsistent:
+            logger.info(f"\n✅ Rollups consistent for {len(user_ids)} users")
+            return 0
+        if fix:
+            logger.info(f"\n✅ Rebuilt {len(inconsistent)} users: run check again")
+            return 0
+        logger.error(f"\n❌ {len(inconsistent)}/{len(user_ids)} users have inconsistent rollups")
+        return 2
+
+    except Exception as e:
+        logger.error(f"❌ Error during {command}: {e}")
+        return 1
+
+    finally:
+        client.close()
+
+
+def main() -> None:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("command", choices=["rebuild", "check"])
+    parser.add_argument("--user-id", help="Only this user (default: every user)")
+    parser.add_argument(
+        "--fix",
+        action="store_true",
+        help="check: rebuild the rollups of users with mismatches",
+    )
+    args = parser.parse_args()
+
+    try:
+        sys.exit(asyncio.run(run(args.command, args.user_id, args.fix)))
+    except KeyboardInterrupt:
+        logger.info("\n\n⚠️  Interrupted by user (safe to re-run)")
+        sys.exit(130)
+
+
+if __name__ == "__main__":
+    main()
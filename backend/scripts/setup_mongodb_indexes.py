@@ -5,13 +5,18 @@ used by the Nutrifit backend persistence layer.
 
 Collections:
 - meals: Meal domain documents
+- daily_nutrition_rollups: Per-user daily meal totals
 - nutritional_profiles: NutritionalProfile domain documents
 - activity_events: ActivityEvent minute-level documents
+- activity_ingest_batches: ingest_events idempotency records (TTL)
 - health_snapshots: HealthSnapshot cumulative documents
 
 Usage:
     uv run python scripts/setup_mongodb_indexes.py
 
+Verify coverage of the repository queries with
+scripts/verify_mongodb_indexes.py.
+
 Environment Variables:
     MONGODB_URI: MongoDB connection string (required)
     MONGODB_DATABASE: Database name (default: nutrifit)
@@ -27,6 +32,16 @@ from dotenv import load_dotenv
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 
 from infrastructure.config import get_mongodb_uri, get_mongodb_database
+from infrastructure.persistence.mongodb.activity_repository import (
+    INGEST_BATCHES_COLLECTION,
+    INGEST_BATCH_TTL_INDEX_NAME,
+    INGEST_BATCH_TTL_SECONDS,
+)
+from infrastructure.persistence.mongodb.meal_repository import (
+    DAILY_ROLLUPS_COLLECTION,
+    SEARCH_TEXT_INDEX_KEYS,
+    SEARCH_TEXT_INDEX_OPTIONS,
+)
 
 # Load environment variables from .env file
 env_path = Path(__file__).parent.parent / ".env"
@@ -47,35 +62,48 @@ async def create_meal_indexes(db: AsyncIOMotorDatabase[Dict[str, Any]]) -> None:
 
     Indexes:
     - _id: unique (automatic)
-    - user_id + created_at: list meals by user with date sorting
-    - user_id + meal_date: query meals for specific dates
+    - user_id + timestamp + _id: list meals by user (newest first), history
+      keyset pages (sorted on timestamp, _id), date range queries and
+      summary aggregations
+    - user_id + text: full-text meal search (dish name, entry names, notes,
+      search_terms prefixes)
     """
     collection = db["meals"]
     logger.info("Creating indexes for 'meals' collection...")
 
-    # Compound index for listing meals by user (most common query)
+    # Compound index serving every user-scoped meal query
     await collection.create_index(
-        [("user_id", 1), ("created_at", -1)],
-        name="idx_user_created",
+        [("user_id", 1), ("timestamp", -1), ("_id", -1)],
+        name="idx_user_timestamp_id",
         background=True,
     )
-    logger.info("  ✓ Created index: user_id + created_at (descending)")
+    logger.info("  ✓ Created index: user_id + timestamp + _id (descending)")
 
-    # Index for date-based queries
+    # Text index for meal search (one per collection)
     await collection.create_index(
-        [("user_id", 1), ("meal_date", 1)],
-        name="idx_user_date",
-        background=True,
+        SEARCH_TEXT_INDEX_KEYS, background=True, **SEARCH_TEXT_INDEX_OPTIONS
     )
-    logger.info("  ✓ Created index: user_id + meal_date")
+    logger.info("  ✓ Created index: user_id + text (search)")
+
+
+async def create_daily_rollup_indexes(db: AsyncIOMotorDatabase[Dict[str, Any]]) -> None:
+    """Create indexes for daily_nutrition_rollups collection.
+
+    Indexes:
+    - _id: unique (automatic)
+    - user_id + day: unique, one rollup per user and UTC day (upsert key of
+      the $inc updates, range reads of daily and range summaries)
+    """
+    collection = db[DAILY_ROLLUPS_COLLECTION]
+    logger.info(f"Creating indexes for '{DAILY_ROLLUPS_COLLECTION}' collection...")
 
-    # Index for meal_date range queries
     await collection.create_index(
-        [("meal_date", 1)],
-        name="idx_meal_date",
+        [("user_id", 1), ("day", 1)],
+        name="idx_user_day",
+        unique=True,
         background=True,
     )
-    logger.info("  ✓ Created index: meal_date")
+    logger.info("  ✓ Created unique index: user_id + day")
 
 
 async def create_profile_indexes(db: AsyncIOMotorDatabase[Dict[str, Any]]) -> None:
@@ -135,6 +163,25 @@ async def create_activity_event_indexes(db: AsyncIOMotorDatabase[Dict[str, Any]]
     logger.info("  ✓ Created index: user_id")
 
 
+async def create_ingest_batch_indexes(db: AsyncIOMotorDatabase[Dict[str, Any]]) -> None:
+    """Create indexes for activity_ingest_batches collection.
+
+    Indexes:
+    - _id: user_id + idempotency key (automatic, replay lookup)
+    - created_at: TTL, records expire after INGEST_BATCH_TTL_SECONDS
+    """
+    collection = db[INGEST_BATCHES_COLLECTION]
+    logger.info(f"Creating indexes for '{INGEST_BATCHES_COLLECTION}' collection...")
+
+    await collection.create_index(
+        [("created_at", 1)],
+        name=INGEST_BATCH_TTL_INDEX_NAME,
+        expireAfterSeconds=INGEST_BATCH_TTL_SECONDS,
+        background=True,
+    )
+    logger.info(f"  ✓ Created TTL index: created_at ({INGEST_BATCH_TTL_SECONDS // 3600}h)")
+
+
 async def create_health_snapshot_indexes(db: AsyncIOMotorDatabase[Dict[str, Any]]) -> None:
     """Create indexes for health_snapshots collection.
 
@@ -183,8 +230,10 @@ async def list_existing_indexes(db: AsyncIOMotorDatabase[Dict[str, Any]]) -> Non
 
     collections = [
         "meals",
+        DAILY_ROLLUPS_COLLECTION,
         "nutritional_profiles",
         "activity_events",
+        INGEST_BATCHES_COLLECTION,
         "health_snapshots",
     ]
 
@@ -227,8 +276,10 @@ async def setup_all_indexes() -> None:
 
         # Create indexes for each collection
         await create_meal_indexes(db)
+        await create_daily_rollup_indexes(db)
         await create_profile_indexes(db)
         await create_activity_event_indexes(db)
+        await create_ingest_batch_indexes(db)
         await create_health_snapshot_indexes(db)
 
         logger.info("\n✅ All indexes created successfully!")
@@ -0,0 +1,161 @@
+"""Verify MongoDB index coverage of every repository query shape.
+
+Replays the queries issued by the Mongo repositories (meals,
+nutritional_profiles, activity_events, health_snapshots) through
+explain() and reports COLLSCAN, in-memory SORT and docs examined /
+returned ratios. Meant to run at deploy time: exits non-zero when a
+shape is not covered, so index drift is caught before it shows up as
+p99 latency.
+
+Usage:
+    uv run python scripts/verify_mongodb_indexes.py
+    uv run python scripts/verify_mongodb_indexes.py --create-missing
+    uv run python scripts/verify_mongodb_indexes.py --user-id <heavy-user>
+
+Exit codes:
+    0 all shapes covered
+    1 configuration / connection error
+    2 at least one shape has problems
+
+Environment Variables:
+    REPOSITORY_BACKEND: Verification runs only when "mongodb"
+    MONGODB_URI: MongoDB connection string (required)
+    MONGODB_DATABASE: Database name (default: nutrifit)
+    MONGODB_MEAL_DATES_LEGACY_READ: Mirror meal dual-read filters (default: 1)
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+from dotenv import load_dotenv
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from infrastructure.config import (
+    get_mongodb_uri,
+    get_mongodb_database,
+    is_meal_dates_legacy_read_enabled,
+)
+from infrastructure.persistence.mongodb.index_coverage import (
+    DEFAULT_MAX_EXAMINED_RATIO,
+    ShapeReport,
+    build_query_shapes,
+    create_missing_indexes,
+    verify_index_coverage,
+)
+
+# Load environment variables from .env file
+env_path = Path(__file__).parent.parent / ".env"
+if env_path.exists():
+    load_dotenv(env_path)
+
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+
+def log_reports(reports: List[ShapeReport]) -> None:
+    """Log one line per query shape."""
+    for report in reports:
+        status = "✓" if report.ok else "✗"
+        indexes = ", ".join(report.indexes_used) or "-"
+        logger.info(
+            f"  {status} {report.shape.name}: index=[{indexes}] "
+            f"keys={report.keys_examined} docs={report.docs_examined} "
+            f"returned={report.n_returned}"
+        )
+        for problem in report.problems:
+            logger.warning(f"      ⚠️  {problem} ({', '.join(report.shape.sources)})")
+
+
+async def verify(user_id: str, create_missing: bool, max_ratio: float) -> int:
+    """Verify index coverage, optionally creating missing indexes.
+
+    Returns:
+        Process exit code
+    """
+    if os.getenv("REPOSITORY_BACKEND", "inmemory").lower() != "mongodb":
+        logger.info("REPOSITORY_BACKEND is not mongodb: index verification skipped")
+        return 0
+
+    uri = get_mongodb_uri()
+    if not uri:
+        logger.error("MONGODB_URI not configured!")
+        return 1
+
+    database_name = get_mongodb_database()
+    client: AsyncIOMotorClient[Dict[str, Any]] = AsyncIOMotorClient(uri)
+    db = client[database_name]
+    shapes = build_query_shapes(
+        user_id=user_id, legacy_date_reads=is_meal_dates_legacy_read_enabled()
+    )
+
+    try:
+        await client.admin.command("ping")
+        logger.info(f"✓ Connected to {database_name}: verifying {len(shapes)} query shapes")
+
+        reports = await verify_index_coverage(db, shapes, max_ratio)
+        failing = [report for report in reports if not report.ok]
+
+        if failing and create_missing:
+            created = await create_missing_indexes(db, [report.shape for report in failing])
+            for spec in created:
+                keys = ", ".join(f"{k}:{v}" for k, v in spec.keys)
+                logger.info(f"  ✓ Created index {spec.collection}.{spec.name}: [{keys}]")
+            reports = await verify_index_coverage(db, shapes, max_ratio)
+            failing = [report for report in reports if not report.ok]
+
+        log_reports(reports)
+
+        if failing:
+            logger.error(f"\n❌ {len(failing)}/{len(reports)} query shapes not covered")
+            return 2
+
+        logger.info(f"\n✅ All {len(reports)} query shapes covered by indexes")
+        return 0
+
+    except Exception as e:
+        logger.error(f"❌ Error verifying indexes: {e}")
+        return 1
+
+    finally:
+        client.close()
+
+
+def main() -> None:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--user-id",
+        default="__index_verifier__",
+        help="User to replay queries for (a heavy user gives realistic ratios)",
+    )
+    parser.add_argument(
+        "--create-missing",
+        action="store_true",
+        help="Create the indexes declared by failing shapes, then re-verify",
+    )
+    parser.add_argument(
+        "--max-ratio",
+        type=float,
+        default=DEFAULT_MAX_EXAMINED_RATIO,
+        help="Max docs examined per returned document",
+    )
+    args = parser.parse_args()
+
+    try:
+        sys.exit(asyncio.run(verify(args.user_id, args.create_missing, args.max_ratio)))
+    except KeyboardInterrupt:
+        logger.info("\n\n⚠️  Interrupted by user")
+        sys.exit(130)
+
+
+if __name__ == "__main__":
+    main()
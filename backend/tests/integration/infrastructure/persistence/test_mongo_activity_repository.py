@@ -22,6 +22,9 @@ from domain.activity.model import (
 from infrastructure.persistence.mongodb.activity_repository import (
     MongoActivityRepository,
 )
+from infrastructure.persistence.mongodb.activity_timeseries_repository import (
+    MongoActivityTimeSeriesRepository,
+)
 
 
 pytestmark = pytest.mark.skipif(
@@ -38,6 +41,17 @@ async def mongo_repo():
     # Cleanup: delete all test data
     await repo.collection.delete_many({"user_id": {"$regex": "^test_user_"}})
     await repo.snapshots_collection.delete_many({"user_id": {"$regex": "^test_user_"}})
+    await repo.batches_collection.delete_many({"user_id": {"$regex": "^test_user_"}})
+    await repo.totals_collection.delete_many({"user_id": {"$regex": "^test_user_"}})
+
+
+@pytest_asyncio.fixture
+async def timeseries_repo():
+    """Create a MongoActivityTimeSeriesRepository for testing."""
+    repo = MongoActivityTimeSeriesRepository()
+    await repo.ensure_collection()
+    yield repo
+    await repo.collection.delete_many({"user_id": {"$regex": "^test_user_"}})
 
 
 @pytest.mark.asyncio
@@ -129,6 +143,27 @@ class TestMongoActivityRepositoryEventIngestion:
         assert accepted2 == 1  # Only event2 inserted
         assert duplicates2 == 1  # event1 duplicate
 
+    async def test_ingest_events_idempotent_replay(self, mongo_repo):
+        """Should return the stored result for a replayed key, conflict on new payload."""
+        base_time = datetime(2025, 11, 13, 10, 0, 0, tzinfo=timezone.utc)
+        events = [
+            ActivityEvent(
+                user_id="test_user_001",
+                ts=(base_time + timedelta(minutes=i)).isoformat().replace("+00:00", "Z"),
+                steps=100 + i,
+                source=ActivitySource.APPLE_HEALTH,
+            )
+            for i in range(2)
+        ]
+
+        assert await mongo_repo.ingest_events(events, idempotency_key="retry-1") == (2, 0, [])
+        # Replay: first result, no duplicate key errors
+        assert await mongo_repo.ingest_events(events, idempotency_key="retry-1") == (2, 0, [])
+
+        changed = [events[0], ActivityEvent(user_id="test_user_001", ts=events[1].ts, steps=1)]
+        _, _, rejected = await mongo_repo.ingest_events(changed, idempotency_key="retry-1")
+        assert [reason for _, reason in rejected] == ["IDEMPOTENCY_CONFLICT"] * 2
+
 
 @pytest.mark.asyncio
 class TestMongoActivityRepositorySnapshotRecording:
@@ -284,6 +319,39 @@ class TestMongoActivityRepositoryTemporalQueries:
 
         assert events == []
 
+    async def test_aggregate_by_period_groups_in_one_pipeline(self, mongo_repo):
+        """Should bucket events by period with HR averaged over samples."""
+        base_time = datetime(2025, 11, 13, 23, 58, 0, tzinfo=timezone.utc)
+        events = [
+            ActivityEvent(
+                user_id="test_user_001",
+                ts=(base_time + timedelta(minutes=i)).isoformat().replace("+00:00", "Z"),
+                steps=100 * i,
+                calories_out=4.5,
+                hr_avg=80.0 if i % 2 else None,
+                source=ActivitySource.APPLE_HEALTH,
+            )
+            for i in range(4)  # 23:58, 23:59, 00:00, 00:01
+        ]
+        await mongo_repo.ingest_events(events)
+
+        day = datetime(2025, 11, 13)
+        totals = await mongo_repo.aggregate_by_period(
+            "test_user_001",
+            [
+                (day, day + timedelta(days=1, microseconds=-1)),
+                (day + timedelta(days=1), day + timedelta(days=2, microseconds=-1)),
+            ],
+        )
+
+        assert totals[0].event_count == 2
+        assert totals[0].total_steps == 100
+        assert totals[0].active_minutes == 1
+        assert totals[0].avg_heart_rate == 80.0
+        assert totals[1].event_count == 2
+        assert totals[1].total_steps == 500
+        assert totals[1].heart_rate_samples == 1
+
 
 @pytest.mark.asyncio
 class TestMongoActivityRepositoryDailyTotals:
@@ -386,6 +454,28 @@ class TestMongoActivityRepositoryListDeltas:
         assert len(bootstrap_deltas) >= 2  # One per day
         assert len(increment_deltas) >= 2  # One per day
 
+    async def test_list_deltas_after_ts_returns_stored_delta(self, mongo_repo):
+        """Deltas after a cursor should keep their write-time values."""
+        for hour, steps in ((8, 1000), (12, 4000), (18, 3500)):
+            await mongo_repo.record_snapshot(
+                HealthSnapshot(
+                    user_id="test_user_001",
+                    date="2025-11-13",
+                    timestamp=f"2025-11-13T{hour:02d}:00:00Z",
+                    steps_total=steps,
+                    calories_out_total=steps / 20,
+                )
+            )
+
+        deltas = await mongo_repo.list_deltas(
+            user_id="test_user_001",
+            date="2025-11-13",
+            after_ts="2025-11-13T08:00:00Z",
+        )
+
+        assert [(d.steps_delta, d.reset) for d in deltas] == [(3000, False), (3500, True)]
+        assert await mongo_repo.get_daily_totals("test_user_001", "2025-11-13") == (3500, 175.0)
+
     async def test_list_deltas_empty_range(self, mongo_repo):
         """Should return empty list for date with no snapshots."""
         deltas = await mongo_repo.list_deltas(
@@ -394,3 +484,58 @@ class TestMongoActivityRepositoryListDeltas:
         )
 
         assert deltas == []
+
+
+@pytest.mark.asyncio
+class TestMongoActivityTimeSeriesRepository:
+    """Test the time-series collection backend against the same contract."""
+
+    async def test_replay_counts_duplicates(self, timeseries_repo):
+        """Should skip minutes already stored, as the unique _id does."""
+        base_time = datetime(2025, 11, 13, 10, 0, 0, tzinfo=timezone.utc)
+        events = [
+            ActivityEvent(
+                user_id="test_user_ts",
+                ts=(base_time + timedelta(minutes=i)).isoformat().replace("+00:00", "Z"),
+                steps=100 + i,
+                source=ActivitySource.APPLE_HEALTH,
+            )
+            for i in range(3)
+        ]
+
+        assert await timeseries_repo.ingest_events(events[:2]) == (2, 0, [])
+        assert await timeseries_repo.ingest_events(events) == (1, 2, [])
+
+        stored = await timeseries_repo.list_events(
+            "test_user_ts", "2025-11-13T10:00:00Z", "2025-11-13T11:00:00Z"
+        )
+        assert [event.ts for event in stored] == [event.ts for event in events]
+        assert await timeseries_repo.get_daily_events_count("test_user_ts", "2025-11-13") == 3
+
+    async def test_aggregate_by_period(self, timeseries_repo):
+        """Should bucket events by period over BSON dates."""
+        base_time = datetime(2025, 11, 13, 23, 59, 0, tzinfo=timezone.utc)
+        await timeseries_repo.ingest_events(
+            [
+                ActivityEvent(
+                    user_id="test_user_ts",
+                    ts=(base_time + timedelta(minutes=i)).isoformat().replace("+00:00", "Z"),
+                    steps=10,
+                    hr_avg=70.0,
+                    source=ActivitySource.APPLE_HEALTH,
+                )
+                for i in range(2)  # 23:59, 00:00
+            ]
+        )
+
+        day = datetime(2025, 11, 13)
+        totals = await timeseries_repo.aggregate_by_period(
+            "test_user_ts",
+            [
+                (day, day + timedelta(days=1, microseconds=-1)),
+                (day + timedelta(days=1), day + timedelta(days=2, microseconds=-1)),
+            ],
+        )
+
+        assert (totals[0].event_count, totals[1].event_count) == (1, 1)
+        assert totals[1].avg_heart_rate == 70.0
@@ -241,3 +241,46 @@ class TestMongoMealRepositorySearch:
 
         meals = await mongo_repo.get_by_user("test_user_count")
         assert len(meals) == 3
+
+
+@pytest.mark.asyncio
+class TestMongoMealRepositoryDates:
+    """Test BSON date storage and dual-read of legacy ISO strings."""
+
+    async def test_save_stores_bson_dates(self, mongo_repo, sample_meal):
+        """Should store datetimes as native BSON dates."""
+        await mongo_repo.save(sample_meal)
+
+        doc = await mongo_repo.collection.find_one({"_id": str(sample_meal.id)})
+        assert isinstance(doc["timestamp"], datetime)
+        assert isinstance(doc["created_at"], datetime)
+        assert isinstance(doc["entries"][0]["created_at"], datetime)
+
+    async def test_legacy_string_dates_are_readable(self, mongo_repo, sample_meal):
+        """Should read and range-match documents still holding ISO strings."""
+        legacy_doc = mongo_repo.to_document(sample_meal)
+        for field in ("timestamp", "created_at", "updated_at"):
+            legacy_doc[field] = legacy_doc[field].isoformat()
+        for entry in legacy_doc["entries"]:
+            entry["created_at"] = entry["created_at"].isoformat()
+        await mongo_repo.collection.insert_one(legacy_doc)
+
+        new_meal = Meal(
+            id=uuid4(),
+            user_id=sample_meal.user_id,
+            timestamp=datetime(2025, 11, 12, 19, 0, 0, tzinfo=timezone.utc),
+            meal_type="DINNER",
+        )
+        await mongo_repo.save(new_meal)
+
+        retrieved = await mongo_repo.get_by_id(sample_meal.id, sample_meal.user_id)
+        assert retrieved is not None
+        assert retrieved.timestamp == sample_meal.timestamp
+
+        start = datetime(2025, 11, 12, 0, 0, 0, tzinfo=timezone.utc)
+        end = datetime(2025, 11, 12, 23, 59, 59, tzinfo=timezone.utc)
+        meals = await mongo_repo.get_by_user_and_date_range(sample_meal.user_id, start, end)
+        assert {m.id for m in meals} == {sample_meal.id, new_meal.id}
+
+        totals = await mongo_repo.aggregate_by_period(sample_meal.user_id, [(start, end)])
+        assert totals[0].meal_count == 2
@@ -1,6 +1,10 @@
 import pytest
 from typing import Any, Dict, List
+from unittest.mock import AsyncMock
 from httpx import AsyncClient, Response
+from domain.activity.model import ActivityEvent
+from graphql.resolvers.activity import mutations as activity_mutations
+from graphql.resolvers.activity import queries as activity_queries
 from repository.activities import activity_repo
 
 
@@ -25,8 +29,7 @@ async def test_activity_ingest_happy_path(
     client: AsyncClient,
 ) -> None:
     _reset_activity_repo()
-    mutation = _q(
-        """
+    mutation = _q("""
         mutation {
           activity {
             syncActivityEvents(
@@ -43,8 +46,7 @@ async def test_activity_ingest_happy_path(
             }
           }
         }
-        """
-    )
+        """)
     resp: Response = await client.post("/graphql", json={"query": mutation})
     data: Dict[str, Any] | None = resp.json()["data"]["activity"]["syncActivityEvents"]
     assert data is not None, resp.json()
@@ -58,8 +60,7 @@ async def test_activity_ingest_duplicates_second_batch(
     client: AsyncClient,
 ) -> None:
     _reset_activity_repo()
-    m1 = _q(
-        """
+    m1 = _q("""
         mutation {
           activity {
             syncActivityEvents(
@@ -73,10 +74,8 @@ async def test_activity_ingest_duplicates_second_batch(
             }
           }
         }
-        """
-    )
-    m2 = _q(
-        """
+        """)
+    m2 = _q("""
         mutation {
           activity {
             syncActivityEvents(
@@ -90,8 +89,7 @@ async def test_activity_ingest_duplicates_second_batch(
             }
           }
         }
-        """
-    )
+        """)
     r1: Response = await client.post("/graphql", json={"query": m1})
     d1: Dict[str, Any] = r1.json()["data"]["activity"]["syncActivityEvents"]
     assert d1["accepted"] == 1 and d1["duplicates"] == 0
@@ -105,8 +103,7 @@ async def test_activity_ingest_duplicates_second_batch(
 @pytest.mark.asyncio
 async def test_activity_ingest_conflict(client: AsyncClient) -> None:
     _reset_activity_repo()
-    first = _q(
-        """
+    first = _q("""
         mutation {
           activity {
             syncActivityEvents(
@@ -120,10 +117,8 @@ async def test_activity_ingest_conflict(client: AsyncClient) -> None:
             }
           }
         }
-        """
-    )
-    second_conflict = _q(
-        """
+        """)
+    second_conflict = _q("""
         mutation {
           activity {
             syncActivityEvents(
@@ -137,8 +132,7 @@ async def test_activity_ingest_conflict(client: AsyncClient) -> None:
             }
           }
         }
-        """
-    )
+        """)
     await client.post("/graphql", json={"query": first})
     r2: Response = await client.post("/graphql", json={"query": second_conflict})
     d2: Dict[str, Any] = r2.json()["data"]["activity"]["syncActivityEvents"]
@@ -152,8 +146,7 @@ async def test_activity_ingest_normalization_duplicate_via_seconds(
     client: AsyncClient,
 ) -> None:
     _reset_activity_repo()
-    m1 = _q(
-        """
+    m1 = _q("""
         mutation {
           activity {
             syncActivityEvents(
@@ -167,10 +160,8 @@ async def test_activity_ingest_normalization_duplicate_via_seconds(
             }
           }
         }
-        """
-    )
-    m2 = _q(
-        """
+        """)
+    m2 = _q("""
         mutation {
           activity {
             syncActivityEvents(
@@ -184,8 +175,7 @@ async def test_activity_ingest_normalization_duplicate_via_seconds(
             }
           }
         }
-        """
-    )
+        """)
     r1: Response = await client.post("/graphql", json={"query": m1})
     assert r1.json()["data"]["activity"]["syncActivityEvents"]["accepted"] == 1
     r2: Response = await client.post("/graphql", json={"query": m2})
@@ -196,8 +186,7 @@ async def test_activity_ingest_normalization_duplicate_via_seconds(
 @pytest.mark.asyncio
 async def test_activity_ingest_invalid_values(client: AsyncClient) -> None:
     _reset_activity_repo()
-    m = _q(
-        """
+    m = _q("""
         mutation {
           activity {
             syncActivityEvents(
@@ -215,8 +204,7 @@ async def test_activity_ingest_invalid_values(client: AsyncClient) -> None:
             }
           }
         }
-        """
-    )
+        """)
     r: Response = await client.post("/graphql", json={"query": m})
     d: Dict[str, Any] = r.json()["data"]["activity"]["syncActivityEvents"]
     assert d["accepted"] == 0
@@ -233,8 +221,7 @@ async def test_activity_ingest_idempotency_cache_and_conflict(
     client: AsyncClient,
 ) -> None:
     _reset_activity_repo()
-    batch1 = _q(
-        """
+    batch1 = _q("""
         mutation {
           activity {
             syncActivityEvents(
@@ -248,10 +235,8 @@ async def test_activity_ingest_idempotency_cache_and_conflict(
             }
           }
         }
-        """
-    )
-    batch1_repeat_same = _q(
-        """
+        """)
+    batch1_repeat_same = _q("""
         mutation {
           activity {
             syncActivityEvents(
@@ -265,10 +250,8 @@ async def test_activity_ingest_idempotency_cache_and_conflict(
             }
           }
         }
-        """
-    )
-    batch_conflict = _q(
-        """
+        """)
+    batch_conflict = _q("""
         mutation {
           activity {
             syncActivityEvents(
@@ -282,8 +265,7 @@ async def test_activity_ingest_idempotency_cache_and_conflict(
             }
           }
         }
-        """
-    )
+        """)
     r1: Response = await client.post("/graphql", json={"query": batch1})
     d1: Dict[str, Any] = r1.json()["data"]["activity"]["syncActivityEvents"]
     assert d1["accepted"] == 1
@@ -301,8 +283,7 @@ async def test_activity_ingest_auto_idempotency_key(
 ) -> None:
     """Auto-generate e riuso deterministico della chiave idempotenza."""
     _reset_activity_repo()
-    mutation_first = _q(
-        """
+    mutation_first = _q("""
         mutation {
           activity {
             syncActivityEvents(
@@ -319,11 +300,9 @@ async def test_activity_ingest_auto_idempotency_key(
             }
           }
         }
-        """
-    )
+        """)
     mutation_second_same = mutation_first
-    mutation_changed = _q(
-        """
+    mutation_changed = _q("""
         mutation {
           activity {
             syncActivityEvents(
@@ -340,8 +319,7 @@ async def test_activity_ingest_auto_idempotency_key(
             }
           }
         }
-        """
-    )
+        """)
     r1: Response = await client.post("/graphql", json={"query": mutation_first})
     d1: Dict[str, Any] = r1.json()["data"]["activity"]["syncActivityEvents"]
     assert d1["accepted"] == 2 and d1["duplicates"] == 0
@@ -364,3 +342,55 @@ async def test_activity_ingest_auto_idempotency_key(
     assert "CONFLICT_DIFFERENT_DATA" in reasons
     assert d5["idempotencyKeyUsed"].startswith("auto-")
     assert d5["idempotencyKeyUsed"] != auto_key
+
+
+@pytest.mark.asyncio
+async def test_activity_sync_and_entries_use_repository_port(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Mutation ed entries passano dal backend REPOSITORY_BACKEND."""
+    repo = AsyncMock()
+    repo.ingest_events.return_value = (1, 0, [])
+    repo.list_events.return_value = [
+        ActivityEvent(user_id="u1", ts="2025-01-08T08:00:00Z", steps=7)
+    ]
+    monkeypatch.setattr(activity_mutations, "create_activity_repository", lambda: repo)
+    monkeypatch.setattr(activity_queries, "create_activity_repository", lambda: repo)
+    mutation = _q("""
+        mutation {
+          activity {
+            syncActivityEvents(
+              userId: "u1"
+              idempotencyKey: "k-port"
+              input:[
+                { ts:"2025-01-08T08:00:30Z" steps:7 source:MANUAL }
+                { ts:"2025-01-08T08:01:00Z" steps:-1 source:MANUAL }
+              ]
+            ) {
+              accepted
+              duplicates
+              rejected { index reason }
+            }
+          }
+        }
+        """)
+    query = _q("""
+        query {
+          activity {
+            entries(userId: "u1") { ts steps source }
+          }
+        }
+        """)
+
+    r1: Response = await client.post("/graphql", json={"query": mutation})
+    d1: Dict[str, Any] = r1.json()["data"]["activity"]["syncActivityEvents"]
+    assert d1["accepted"] == 1
+    assert d1["rejected"] == [{"index": 1, "reason": "NEGATIVE_VALUE"}]
+    # Only valid events reach the port, without key (batch not replayable)
+    events, key = repo.ingest_events.await_args.args
+    assert [e.ts for e in events] == ["2025-01-08T08:00:00Z"]
+    assert key is None
+
+    r2: Response = await client.post("/graphql", json={"query": query})
+    entries: List[Dict[str, Any]] = r2.json()["data"]["activity"]["entries"]
+    assert entries == [{"ts": "2025-01-08T08:00:00Z", "steps": 7, "source": "MANUAL"}]
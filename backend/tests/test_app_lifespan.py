@@ -102,6 +102,70 @@ class TestLifespanContextManager:
                 # but we verified __aenter__ was called which means assignment happened
                 pass
 
+    @pytest.mark.asyncio
+    async def test_lifespan_runs_health_totals_sweeper(
+        self,
+        mock_vision_client,
+        mock_nutrition_client,
+        mock_barcode_client,
+    ):
+        """Test that lifespan sweeps health totals state until shutdown.
+
+        GIVEN: A short sweep interval
+        WHEN: Lifespan context is entered and exited
+        THEN: The repository is swept and the sweeper task is cancelled
+        """
+        import asyncio
+
+        with (
+            patch("app.create_vision_provider", return_value=mock_vision_client),
+            patch("app.create_nutrition_provider", return_value=mock_nutrition_client),
+            patch("app.create_barcode_provider", return_value=mock_barcode_client),
+            patch("app._logging.getLogger"),
+            patch("app.get_health_totals_sweep_interval_seconds", return_value=0.01),
+            patch("app.health_totals_repo.sweep") as sweep,
+        ):
+            async with lifespan(MagicMock()):
+                await asyncio.sleep(0.05)
+            swept = sweep.call_count
+            await asyncio.sleep(0.05)
+
+        assert swept >= 1
+        assert sweep.call_count == swept
+
+    @pytest.mark.asyncio
+    async def test_lifespan_cancels_sweeper_on_exception(
+        self,
+        mock_vision_client,
+        mock_nutrition_client,
+        mock_barcode_client,
+    ):
+        """Test that the sweeper task is cancelled even if app crashes.
+
+        GIVEN: A running health totals sweeper
+        WHEN: An exception occurs during app runtime
+        THEN: The sweeper stops sweeping after the lifespan exits
+        """
+        import asyncio
+
+        with (
+            patch("app.create_vision_provider", return_value=mock_vision_client),
+            patch("app.create_nutrition_provider", return_value=mock_nutrition_client),
+            patch("app.create_barcode_provider", return_value=mock_barcode_client),
+            patch("app._logging.getLogger"),
+            patch("app.get_health_totals_sweep_interval_seconds", return_value=0.01),
+            patch("app.health_totals_repo.sweep") as sweep,
+        ):
+            with pytest.raises(RuntimeError):
+                async with lifespan(MagicMock()):
+                    await asyncio.sleep(0.05)
+                    raise RuntimeError("Simulated app crash")
+            swept = sweep.call_count
+            await asyncio.sleep(0.05)
+
+        assert swept >= 1
+        assert sweep.call_count == swept
+
     @pytest.mark.asyncio
     async def test_lifespan_logs_startup_info(
         self,
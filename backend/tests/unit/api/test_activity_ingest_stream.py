@@ -0,0 +1,234 @@
+"""Unit tests for activity events streaming ingest REST endpoint."""
+
+import gzip
+import json
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from api.activity_ingest import (
+    MAX_LINE_BYTES,
+    decompressed,
+    ingest_ndjson_stream,
+    ndjson_lines,
+    parse_event,
+    router,
+)
+from domain.activity.model import ActivityEvent, ActivitySource
+from infrastructure.persistence.inmemory.activity_repository import InMemoryActivityRepository
+from repository.activities import activity_repo
+
+
+async def _stream(data: bytes, size: int = 7) -> AsyncIterator[bytes]:
+    for start in range(0, len(data), size):
+        yield data[start : start + size]
+
+
+async def _collect(chunks: AsyncIterator[bytes]) -> bytes:
+    return b"".join([chunk async for chunk in chunks])
+
+
+def _ndjson(*events: Dict[str, Any]) -> bytes:
+    return b"".join(json.dumps(event).encode() + b"\n" for event in events)
+
+
+@pytest.fixture
+def repository() -> InMemoryActivityRepository:
+    activity_repo._events_by_user.clear()
+    activity_repo._batch_idempo.clear()
+    return InMemoryActivityRepository()
+
+
+class _RecordingRepository(InMemoryActivityRepository):
+    """In-memory repository recording the size of each ingest_events call."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches: List[int] = []
+
+    async def ingest_events(
+        self, events: List[ActivityEvent], idempotency_key: Optional[str] = None
+    ) -> Tuple[int, int, List[Tuple[int, str]]]:
+        self.batches.append(len(events))
+        return await super().ingest_events(events, idempotency_key)
+
+
+@pytest.mark.asyncio
+async def test_decompressed_gunzips_small_chunks():
+    """Gzip body split in tiny chunks (and two members) is decoded incrementally."""
+    data = _ndjson({"ts": "2025-11-13T10:00:00Z"}) * 50
+    body = gzip.compress(data[:300]) + gzip.compress(data[300:])
+
+    assert await _collect(decompressed(_stream(body), gzipped=True)) == data
+
+
+@pytest.mark.asyncio
+async def test_decompressed_rejects_truncated_gzip():
+    """Truncated gzip body is a 400."""
+    body = gzip.compress(_ndjson({"ts": "2025-11-13T10:00:00Z"}) * 10)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await _collect(decompressed(_stream(body[:-10]), gzipped=True))
+
+    assert exc_info.value.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_ndjson_lines_marks_oversized_line():
+    """Lines over MAX_LINE_BYTES are yielded as None without buffering them."""
+    data = b"a\n" + b"x" * (MAX_LINE_BYTES * 3) + b"\nb"
+
+    lines = [line async for line in ndjson_lines(_stream(data, size=4096))]
+
+    assert lines == [b"a", None, b"b"]
+
+
+@pytest.mark.asyncio
+async def test_ndjson_lines_splits_large_chunk_in_one_pass():
+    """Many lines in one chunk keep their order, blank lines and oversized marks."""
+    data = b"".join(b"%d\n" % index for index in range(100_000))
+    data += b"\n" + b"x" * (MAX_LINE_BYTES + 1) + b"\nlast"
+
+    async def one_chunk() -> AsyncIterator[bytes]:
+        yield data
+
+    lines = [line async for line in ndjson_lines(one_chunk())]
+
+    assert lines[:100_000] == [b"%d" % index for index in range(100_000)]
+    assert lines[100_000:] == [b"", None, b"last"]
+
+
+@pytest.mark.asyncio
+async def test_ndjson_lines_joins_line_across_chunks():
+    """A line split over many chunks is yielded whole, at its index."""
+    data = b"\n" + b"y" * 1000 + b"\nz\n"
+
+    lines = [line async for line in ndjson_lines(_stream(data, size=3))]
+
+    assert lines == [b"", b"y" * 1000, b"z"]
+
+
+def test_parse_event_normalizes_like_graphql_input():
+    """camelCase fields, default steps and HR rounding match syncActivityEvents."""
+    event = parse_event(
+        b'{"ts": "2025-11-13T10:00:42+01:00", "caloriesOut": 1.5, "hrAvg": 80.4,'
+        b' "source": "GOOGLE_FIT"}',
+        "user123",
+    )
+
+    assert event == ActivityEvent(
+        user_id="user123",
+        ts="2025-11-13T09:00:00Z",
+        steps=0,
+        calories_out=1.5,
+        hr_avg=80.0,
+        source=ActivitySource.GOOGLE_FIT,
+    )
+
+
+@pytest.mark.parametrize(
+    "line,reason",
+    [
+        (b"{not json", "INVALID_EVENT"),
+        (b'{"steps": 5}', "INVALID_EVENT"),
+        (b'{"ts": "2025-11-13T10:00:00Z", "steps": "5"}', "INVALID_EVENT"),
+        (b'{"ts": "2025-11-13T10:00:00Z", "source": "FITBIT"}', "INVALID_EVENT"),
+        (b'{"ts": "2025-11-13T10:00:00Z", "steps": -1}', "NEGATIVE_VALUE"),
+        (b'{"ts": "2025-11-13T10:00:00Z", "hrAvg": 300}', "OUT_OF_RANGE_HR"),
+        (b'{"ts": "2025-11-13T10:00:00Z", "hrAvg": NaN}', "INVALID_EVENT"),
+        (b'{"ts": "2025-11-13T10:00:00Z", "steps": NaN}', "INVALID_EVENT"),
+        (b'{"ts": "2025-11-13T10:00:00Z", "steps": 1e20}', "INVALID_EVENT"),
+        (b'{"ts": "2025-11-13T10:00:00Z", "caloriesOut": Infinity}', "INVALID_EVENT"),
+        (b'{"ts": "yesterday"}', "NORMALIZATION_FAILED"),
+    ],
+)
+def test_parse_event_rejections(line: bytes, reason: str) -> None:
+    """Invalid lines map to the legacy reason codes."""
+    assert parse_event(line, "user123") == reason
+
+
+@pytest.mark.asyncio
+async def test_ingest_stream_flushes_chunks_and_maps_line_indexes(repository):
+    """Events are written per chunk; rejections keep their payload line index."""
+    events = [{"ts": f"2025-11-13T10:{minute:02d}:00Z", "steps": 1} for minute in range(5)]
+    data = _ndjson(events[0], {"ts": "2025-11-13T10:00:00Z", "steps": -1}, *events[1:])
+    data += b"\n" + _ndjson(events[0])  # blank line, then a replayed minute
+
+    result = await ingest_ndjson_stream(
+        repository,
+        "user456",
+        ndjson_lines(decompressed(_stream(gzip.compress(data)), gzipped=True)),
+        chunk_size=2,
+    )
+
+    assert (result.lines, result.accepted, result.duplicates) == (8, 5, 1)
+    assert result.rejected == [(1, "NEGATIVE_VALUE")]
+    assert result.rejected_count == 1
+    assert len(await repository.list_events("user456", limit=100)) == 5
+
+
+@pytest.mark.asyncio
+async def test_ingest_stream_bounds_batch_size(repository):
+    """No ingest_events call exceeds chunk_size events."""
+    recording = _RecordingRepository()
+    data = _ndjson(
+        *({"ts": f"2025-11-13T{minute // 60:02d}:{minute % 60:02d}:00Z"} for minute in range(25))
+    )
+
+    result = await ingest_ndjson_stream(
+        recording, "user123", ndjson_lines(_stream(data)), chunk_size=10
+    )
+
+    assert recording.batches == [10, 10, 5]
+    assert (result.accepted, result.duplicates, result.rejected_count) == (25, 0, 0)
+
+
+def test_endpoint_accepts_gzip_ndjson(repository):
+    """POST with Content-Encoding gzip returns the ingest accounting."""
+    app = FastAPI()
+    app.include_router(router)
+    body = gzip.compress(_ndjson({"ts": "2025-11-13T10:00:00Z", "steps": 3}, {"ts": "bad"}))
+
+    with patch("api.activity_ingest.create_activity_repository", return_value=repository):
+        response = TestClient(app).post(
+            "/api/v1/activity-events/user789/ndjson",
+            content=body,
+            headers={"Content-Type": "application/x-ndjson", "Content-Encoding": "gzip"},
+        )
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "lines": 2,
+        "accepted": 1,
+        "duplicates": 0,
+        "rejected_count": 1,
+        "rejected": [{"index": 1, "reason": "NORMALIZATION_FAILED"}],
+    }
+
+
+@pytest.mark.asyncio
+async def test_ingest_stream_derives_chunk_idempotency_keys(repository):
+    """Each chunk is ingested with "<key>:<chunk number>"."""
+    keys: List[Optional[str]] = []
+
+    class _KeyRecordingRepository(InMemoryActivityRepository):
+        async def ingest_events(
+            self, events: List[ActivityEvent], idempotency_key: Optional[str] = None
+        ) -> Tuple[int, int, List[Tuple[int, str]]]:
+            keys.append(idempotency_key)
+            return await super().ingest_events(events, idempotency_key)
+
+    data = _ndjson(*({"ts": f"2025-11-13T10:{minute:02d}:00Z"} for minute in range(5)))
+
+    await ingest_ndjson_stream(
+        _KeyRecordingRepository(),
+        "user123",
+        ndjson_lines(_stream(data)),
+        chunk_size=2,
+        idempotency_key="upload-1",
+    )
+
+    assert keys == ["upload-1:0", "upload-1:1", "upload-1:2"]
@@ -1,6 +1,7 @@
 """Unit tests for AnalyzeMealBarcodeCommand and handler."""
 
 import pytest
+from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
@@ -47,6 +48,7 @@ def sample_barcode_meal():
     meal = MagicMock(spec=Meal)
     meal.id = uuid4()
     meal.user_id = "user123"
+    meal.timestamp = datetime.now(timezone.utc)
 
     entry = MagicMock()
     entry.display_name = "Nutella 350g"
@@ -1,6 +1,7 @@
 """Unit tests for AnalyzeMealTextCommand and handler."""
 
 import pytest
+from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
@@ -47,6 +48,7 @@ def sample_analyzed_meal():
     meal = MagicMock(spec=Meal)
     meal.id = uuid4()
     meal.user_id = "user123"
+    meal.timestamp = datetime.now(timezone.utc)
     meal.entries = [MagicMock(), MagicMock()]  # 2 entries
     meal.total_calories = 450
     meal.average_confidence = MagicMock(return_value=0.80)
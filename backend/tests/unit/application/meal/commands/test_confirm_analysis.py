@@ -1,6 +1,7 @@
 """Unit tests for ConfirmAnalysisCommand and handler."""
 
 import pytest
+from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
@@ -33,6 +34,7 @@ def sample_meal_with_entries():
     meal = MagicMock(spec=Meal)
     meal.id = uuid4()
     meal.user_id = "user123"
+    meal.timestamp = datetime.now(timezone.utc)
     meal.updated_at = MagicMock()
     meal.total_calories = 500
 
@@ -125,6 +127,7 @@ class TestConfirmAnalysisCommandHandler:
         meal = MagicMock(spec=Meal)
         meal.id = uuid4()
         meal.user_id = "user123"
+        meal.timestamp = datetime.now(timezone.utc)
         meal.updated_at = MagicMock()
         meal.total_calories = 300
 
@@ -8,6 +8,7 @@ Tests focus on:
 """
 
 import pytest
+from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
@@ -47,6 +48,7 @@ def sample_meal():
     meal = MagicMock(spec=Meal)
     meal.id = meal_id
     meal.user_id = user_id
+    meal.timestamp = datetime.now(timezone.utc)
 
     return meal
 
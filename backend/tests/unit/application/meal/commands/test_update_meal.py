@@ -1,6 +1,7 @@
 """Unit tests for UpdateMealCommand and handler."""
 
 import pytest
+from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
@@ -33,6 +34,7 @@ def sample_meal():
     meal = MagicMock(spec=Meal)
     meal.id = uuid4()
     meal.user_id = "user123"
+    meal.timestamp = datetime.now(timezone.utc)
     meal.meal_type = "SNACK"
     meal.notes = None
     meal.validate_invariants = MagicMock()
@@ -7,6 +7,8 @@ Tests focus on:
 - Strategy pattern for photo vs text analysis
 """
 
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 
@@ -17,6 +19,7 @@ from application.meal.orchestrators.photo_orchestrator import (
 from domain.meal.core.entities.meal import Meal
 from domain.meal.recognition.entities.recognized_food import RecognizedFood, FoodRecognitionResult
 from domain.meal.nutrition.entities.nutrient_profile import NutrientProfile
+from metrics.core import registry
 
 
 @pytest.fixture
@@ -235,3 +238,48 @@ class TestMealAnalysisOrchestrator:
 
         # Should be same class as MealAnalysisOrchestrator
         assert isinstance(old_orchestrator, MealAnalysisOrchestrator)
+
+    @pytest.mark.asyncio
+    async def test_enriches_items_concurrently_in_order(
+        self,
+        orchestrator,
+        mock_recognition_service,
+        mock_nutrition_service,
+        mock_meal_factory,
+        sample_recognition_result,
+        sample_meal,
+    ):
+        """Items are enriched concurrently; factory items keep recognition order."""
+        in_flight = 0
+        max_in_flight = 0
+
+        async def enrich(label, quantity_g, category=None):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            # First item finishes last
+            await asyncio.sleep(0.02 if label == "pasta" else 0.0)
+            in_flight -= 1
+            return NutrientProfile(
+                calories=int(quantity_g), protein=1.0, carbs=1.0, fat=1.0, quantity_g=quantity_g
+            )
+
+        mock_recognition_service.recognize_from_photo.return_value = sample_recognition_result
+        mock_nutrition_service.enrich.side_effect = enrich
+        mock_meal_factory.create_from_analysis.return_value = sample_meal
+        registry.reset()
+
+        await orchestrator.analyze_from_photo(
+            user_id="user123", photo_url="https://example.com/pasta.jpg"
+        )
+
+        assert max_in_flight == 2
+        items = mock_meal_factory.create_from_analysis.call_args.kwargs["items"]
+        assert [food["label"] for food, _ in items] == ["pasta", "tomato_sauce"]
+        assert [nutrients["calories"] for _, nutrients in items] == [150, 100]
+
+        histograms = {
+            (h["name"], h["tags"]["source"]): h["count"] for h in registry.snapshot()["histograms"]
+        }
+        assert histograms[("meal_analysis_latency_ms", "PHOTO")] == 1
+        assert histograms[("meal_enrichment_latency_ms", "PHOTO")] == 1
@@ -0,0 +1,213 @@
+"""Unit tests for DailySummaryCache."""
+
+import pytest
+from unittest.mock import AsyncMock
+from uuid import uuid4
+from datetime import datetime, timedelta, timezone
+
+from application.meal.queries.daily_summary_cache import DailySummaryCache
+from application.meal.queries.get_daily_summary import (
+    DailySummary,
+    GetDailySummaryQuery,
+    GetDailySummaryQueryHandler,
+)
+from domain.meal.core.events import MealDeleted, MealUpdated
+from infrastructure.events.in_memory_bus import InMemoryEventBus
+from metrics.core import registry
+
+DAY = datetime(2025, 10, 25, tzinfo=timezone.utc)
+DAY_END = DAY.replace(hour=23, minute=59, second=59, microsecond=999999)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _summary(calories: float = 500.0, date: datetime = DAY) -> DailySummary:
+    return DailySummary(
+        date=date,
+        total_calories=calories,
+        total_protein=20.0,
+        total_carbs=50.0,
+        total_fat=10.0,
+        total_fiber=5.0,
+        total_sugar=10.0,
+        total_sodium=300.0,
+        meal_count=1,
+        breakdown_by_type={"LUNCH": calories},
+    )
+
+
+def _counter(name: str, **tags: str) -> int:
+    return registry.counter(name, **tags).value()
+
+
+@pytest.fixture(autouse=True)
+def reset_registry():
+    registry.reset()
+    yield
+    registry.reset()
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock):
+    return DailySummaryCache(ttl_seconds=60, max_entries=2, clock=clock)
+
+
+class TestDailySummaryCache:
+    """Test cache storage, expiry and eviction."""
+
+    def test_miss_then_hit(self, cache):
+        assert cache.get("user123", DAY) is None
+
+        assert cache.put("user123", DAY, DAY_END, _summary(), cache.generation)
+        cached = cache.get("user123", DAY)
+
+        assert cached == _summary()
+        assert _counter("daily_summary_cache_misses") == 1
+        assert _counter("daily_summary_cache_hits") == 1
+
+    def test_hit_returns_copy(self, cache):
+        cache.put("user123", DAY, DAY_END, _summary(), cache.generation)
+
+        cache.get("user123", DAY).breakdown_by_type["LUNCH"] = 0.0
+
+        assert cache.get("user123", DAY).breakdown_by_type["LUNCH"] == 500.0
+
+    def test_entry_expires_after_ttl(self, cache, clock):
+        cache.put("user123", DAY, DAY_END, _summary(), cache.generation)
+
+        clock.now = 61.0
+
+        assert cache.get("user123", DAY) is None
+        assert len(cache) == 0
+        assert _counter("daily_summary_cache_evictions", reason="expired") == 1
+
+    def test_evicts_least_recently_used(self, cache):
+        day2 = DAY + timedelta(days=1)
+        day3 = DAY + timedelta(days=2)
+        cache.put("user123", DAY, DAY_END, _summary(), cache.generation)
+        cache.put("user123", day2, day2 + timedelta(hours=23), _summary(), 0)
+        cache.get("user123", DAY)  # DAY becomes most recently used
+
+        cache.put("user123", day3, day3 + timedelta(hours=23), _summary(), 0)
+
+        assert cache.get("user123", day2) is None
+        assert cache.get("user123", DAY) is not None
+        assert _counter("daily_summary_cache_evictions", reason="capacity") == 1
+
+    def test_put_skipped_after_concurrent_invalidation(self, cache):
+        generation = cache.generation
+        cache.invalidate("user123", [DAY])
+
+        assert not cache.put("user123", DAY, DAY_END, _summary(), generation)
+        assert len(cache) == 0
+
+    def test_invalid_configuration(self):
+        with pytest.raises(ValueError):
+            DailySummaryCache(ttl_seconds=0)
+        with pytest.raises(ValueError):
+            DailySummaryCache(max_entries=0)
+
+
+class TestDailySummaryCacheInvalidation:
+    """Test event-driven invalidation."""
+
+    def test_invalidates_only_affected_day(self, cache):
+        day2 = DAY + timedelta(days=1)
+        cache.put("user123", DAY, DAY_END, _summary(), cache.generation)
+        cache.put("user123", day2, day2 + timedelta(hours=23), _summary(), 0)
+
+        dropped = cache.invalidate("user123", [DAY + timedelta(hours=12)])
+
+        assert dropped == 1
+        assert cache.get("user123", DAY) is None
+        assert cache.get("user123", day2) is not None
+        assert _counter("daily_summary_cache_evictions", reason="invalidated") == 1
+
+    def test_invalidation_is_per_user(self, cache):
+        cache.put("user123", DAY, DAY_END, _summary(), cache.generation)
+        cache.put("other", DAY, DAY_END, _summary(), cache.generation)
+
+        cache.invalidate("other", [DAY])
+
+        assert cache.get("user123", DAY) is not None
+
+    def test_invalidation_skips_evicted_and_other_users_days(self, cache, clock):
+        day2 = DAY + timedelta(days=1)
+        cache.put("user123", DAY, DAY_END, _summary(), cache.generation)
+        cache.put("other", DAY, DAY_END, _summary(), cache.generation)
+        cache.put("other", day2, day2 + timedelta(hours=23), _summary(), cache.generation)
+
+        assert cache.invalidate("user123") == 0  # evicted for capacity
+        clock.now = 61.0
+        assert cache.get("other", DAY) is None  # expired
+        assert cache.invalidate("other") == 1
+        assert len(cache) == 0
+
+    def test_invalidate_without_timestamps_drops_all_user_days(self, cache):
+        cache.put("user123", DAY, DAY_END, _summary(), cache.generation)
+
+        assert cache.invalidate("user123") == 1
+
+    @pytest.mark.asyncio
+    async def test_meal_events_on_bus_invalidate(self, cache):
+        bus = InMemoryEventBus()
+        cache.subscribe(bus)
+        cache.put("user123", DAY, DAY_END, _summary(), cache.generation)
+
+        await bus.publish(
+            MealDeleted.create(
+                meal_id=uuid4(),
+                user_id="user123",
+                meal_timestamps=[DAY + timedelta(hours=8)],
+            )
+        )
+
+        assert cache.get("user123", DAY) is None
+
+    @pytest.mark.asyncio
+    async def test_updated_meal_invalidates_old_and_new_day(self, cache):
+        day2 = DAY + timedelta(days=1)
+        bus = InMemoryEventBus()
+        cache.subscribe(bus)
+        cache.put("user123", DAY, DAY_END, _summary(), cache.generation)
+        cache.put("user123", day2, day2 + timedelta(hours=23), _summary(), 0)
+
+        await bus.publish(
+            MealUpdated.create(
+                meal_id=uuid4(),
+                user_id="user123",
+                updated_fields=["timestamp"],
+                meal_timestamps=[DAY + timedelta(hours=8), day2 + timedelta(hours=8)],
+            )
+        )
+
+        assert len(cache) == 0
+
+
+class TestGetDailySummaryWithCache:
+    """Test the handler reading through the cache."""
+
+    @pytest.mark.asyncio
+    async def test_second_query_served_from_cache(self, cache):
+        repository = AsyncMock()
+        repository.get_daily_totals.return_value = None
+        repository.get_by_user_and_date_range.return_value = []
+        handler = GetDailySummaryQueryHandler(repository=repository, cache=cache)
+        query = GetDailySummaryQuery(user_id="user123", date=DAY)
+
+        first = await handler.handle(query)
+        second = await handler.handle(query)
+
+        assert first == second
+        assert repository.get_by_user_and_date_range.await_count == 1
@@ -3,7 +3,7 @@
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
-from datetime import datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 
 from application.meal.queries.get_daily_summary import (
     GetDailySummaryQuery,
@@ -11,11 +11,15 @@ from application.meal.queries.get_daily_summary import (
     DailySummary,
 )
 from domain.meal.core.entities.meal import Meal
+from domain.shared.ports.meal_repository import MealPeriodTotals
 
 
 @pytest.fixture
 def mock_repository():
-    return AsyncMock()
+    repository = AsyncMock()
+    # Rollups unavailable: totals are aggregated from the day's meals
+    repository.get_daily_totals.return_value = None
+    return repository
 
 
 @pytest.fixture
@@ -178,3 +182,49 @@ class TestGetDailySummaryQueryHandler:
         assert end_date.hour == 23
         assert end_date.minute == 59
         assert end_date.second == 59
+
+    @pytest.mark.asyncio
+    async def test_get_daily_summary_reads_daily_rollup(self, handler, mock_repository):
+        """Test UTC days are served by the daily rollup, without loading meals."""
+        query = GetDailySummaryQuery(
+            user_id="user123", date=datetime(2025, 10, 24, 15, 30, tzinfo=timezone.utc)
+        )
+        mock_repository.get_daily_totals.return_value = {
+            date(2025, 10, 24): MealPeriodTotals(
+                total_calories=1000,
+                total_protein=50.0,
+                meal_count=2,
+                breakdown_by_type={"LUNCH": 600.0, "DINNER": 400.0},
+            )
+        }
+
+        result = await handler.handle(query)
+
+        mock_repository.get_daily_totals.assert_awaited_once_with(
+            user_id="user123", start_day=date(2025, 10, 24), end_day=date(2025, 10, 24)
+        )
+        mock_repository.get_by_user_and_date_range.assert_not_called()
+        assert result.total_calories == 1000
+        assert result.meal_count == 2
+        assert result.breakdown_by_type == {
+            "BREAKFAST": 0.0,
+            "LUNCH": 600.0,
+            "DINNER": 400.0,
+            "SNACK": 0.0,
+        }
+
+    @pytest.mark.asyncio
+    async def test_get_daily_summary_non_utc_day_aggregates_meals(
+        self, handler, mock_repository, sample_daily_meals
+    ):
+        """Test days not aligned on UTC midnight are aggregated from meals."""
+        rome = timezone(timedelta(hours=2))
+        query = GetDailySummaryQuery(
+            user_id="user123", date=datetime(2025, 10, 24, 15, 30, tzinfo=rome)
+        )
+        mock_repository.get_by_user_and_date_range.return_value = sample_daily_meals
+
+        result = await handler.handle(query)
+
+        mock_repository.get_daily_totals.assert_not_called()
+        assert result.total_calories == 1700.0
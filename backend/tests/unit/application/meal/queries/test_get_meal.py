@@ -44,7 +44,9 @@ class TestGetMealQueryHandler:
         result = await handler.handle(query)
 
         assert result == sample_meal
-        mock_repository.get_by_id.assert_called_once_with(sample_meal.id, "user123")
+        mock_repository.get_by_id.assert_called_once_with(
+            sample_meal.id, "user123", projection=None
+        )
 
     @pytest.mark.asyncio
     async def test_get_meal_not_found(self, handler, mock_repository):
@@ -57,7 +59,7 @@ class TestGetMealQueryHandler:
         result = await handler.handle(query)
 
         assert result is None
-        mock_repository.get_by_id.assert_called_once_with(meal_id, "user123")
+        mock_repository.get_by_id.assert_called_once_with(meal_id, "user123", projection=None)
 
     @pytest.mark.asyncio
     async def test_get_meal_authorization(self, handler, mock_repository, sample_meal):
@@ -70,4 +72,6 @@ class TestGetMealQueryHandler:
         result = await handler.handle(query)
 
         assert result is None
-        mock_repository.get_by_id.assert_called_once_with(sample_meal.id, "different_user")
+        mock_repository.get_by_id.assert_called_once_with(
+            sample_meal.id, "different_user", projection=None
+        )
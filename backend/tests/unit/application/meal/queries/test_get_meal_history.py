@@ -10,6 +10,7 @@ from application.meal.queries.get_meal_history import (
     GetMealHistoryQueryHandler,
 )
 from domain.meal.core.entities.meal import Meal
+from domain.shared.ports.meal_repository import MealCursor
 
 
 @pytest.fixture
@@ -47,86 +48,104 @@ class TestGetMealHistoryQueryHandler:
         """Test getting meal history without filters."""
         query = GetMealHistoryQuery(user_id="user123")
 
-        mock_repository.get_by_user.return_value = sample_meals
+        mock_repository.get_history_page.return_value = sample_meals
 
         result = await handler.handle(query)
 
-        assert len(result) == 5
-        assert result == sample_meals
-        mock_repository.get_by_user.assert_called_once_with(user_id="user123", limit=100, offset=0)
+        assert result.meals == sample_meals
+        assert result.has_more is False
+        assert result.next_cursor is None
+        assert result.total_count is None
+        mock_repository.get_history_page.assert_called_once_with(
+            user_id="user123",
+            limit=101,
+            start_date=None,
+            end_date=None,
+            meal_type=None,
+            after=None,
+            offset=0,
+            projection=None,
+        )
+        mock_repository.count_history.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_get_meal_history_with_date_range(self, handler, mock_repository, sample_meals):
-        """Test filtering by date range."""
+    async def test_filters_pushed_to_repository(self, handler, mock_repository, sample_meals):
+        """Test date range and meal type are passed to the repository query."""
         today = datetime.now(timezone.utc)
         yesterday = today - timedelta(days=1)
+        lunches = [m for m in sample_meals if m.meal_type == "LUNCH"]
 
-        query = GetMealHistoryQuery(user_id="user123", start_date=yesterday, end_date=today)
+        query = GetMealHistoryQuery(
+            user_id="user123",
+            start_date=yesterday,
+            end_date=today,
+            meal_type="LUNCH",
+            limit=10,
+        )
 
-        mock_repository.get_by_user_and_date_range.return_value = sample_meals
+        mock_repository.get_history_page.return_value = lunches
 
         result = await handler.handle(query)
 
-        assert len(result) == 5
-        mock_repository.get_by_user_and_date_range.assert_called_once_with(
-            user_id="user123", start_date=yesterday, end_date=today
-        )
+        assert result.meals == lunches
+        kwargs = mock_repository.get_history_page.call_args.kwargs
+        assert kwargs["start_date"] == yesterday
+        assert kwargs["end_date"] == today
+        assert kwargs["meal_type"] == "LUNCH"
 
     @pytest.mark.asyncio
-    async def test_get_meal_history_with_meal_type_filter(
-        self, handler, mock_repository, sample_meals
-    ):
-        """Test filtering by meal type."""
-        query = GetMealHistoryQuery(user_id="user123", meal_type="LUNCH")
+    async def test_has_more_from_extra_meal(self, handler, mock_repository, sample_meals):
+        """Test limit+1 fetch sets has_more and the next cursor."""
+        query = GetMealHistoryQuery(user_id="user123", limit=4)
 
-        mock_repository.get_by_user.return_value = sample_meals
+        mock_repository.get_history_page.return_value = sample_meals
 
         result = await handler.handle(query)
 
-        # Should only return LUNCH meals (2 out of 5)
-        assert len(result) == 2
-        assert all(m.meal_type == "LUNCH" for m in result)
+        assert result.meals == sample_meals[:4]
+        assert result.has_more is True
+        assert result.next_cursor == MealCursor(
+            timestamp=sample_meals[3].timestamp, meal_id=sample_meals[3].id
+        )
+        assert mock_repository.get_history_page.call_args.kwargs["limit"] == 5
 
     @pytest.mark.asyncio
-    async def test_get_meal_history_with_pagination(self, handler, mock_repository, sample_meals):
-        """Test pagination."""
-        query = GetMealHistoryQuery(user_id="user123", limit=2, offset=1)
+    async def test_cursor_and_offset_forwarded(self, handler, mock_repository):
+        """Test pagination parameters."""
+        cursor = MealCursor(timestamp=datetime.now(timezone.utc), meal_id=uuid4())
+        query = GetMealHistoryQuery(user_id="user123", limit=2, offset=1, after=cursor)
 
-        mock_repository.get_by_user.return_value = sample_meals
+        mock_repository.get_history_page.return_value = []
 
         await handler.handle(query)
 
-        mock_repository.get_by_user.assert_called_once_with(user_id="user123", limit=2, offset=1)
+        kwargs = mock_repository.get_history_page.call_args.kwargs
+        assert kwargs["after"] == cursor
+        assert kwargs["offset"] == 1
 
     @pytest.mark.asyncio
     async def test_get_meal_history_empty_result(self, handler, mock_repository):
         """Test empty result."""
         query = GetMealHistoryQuery(user_id="user123")
 
-        mock_repository.get_by_user.return_value = []
+        mock_repository.get_history_page.return_value = []
 
-        meals = await handler.handle(query)
+        result = await handler.handle(query)
 
-        assert meals == []
+        assert result.meals == []
+        assert result.has_more is False
 
     @pytest.mark.asyncio
-    async def test_get_meal_history_combined_filters(self, handler, mock_repository, sample_meals):
-        """Test combining date range and meal type filters."""
-        today = datetime.now(timezone.utc)
-        yesterday = today - timedelta(days=1)
-
-        query = GetMealHistoryQuery(
-            user_id="user123",
-            start_date=yesterday,
-            end_date=today,
-            meal_type="LUNCH",
-            limit=10,
-            offset=0,
-        )
+    async def test_total_count_only_when_requested(self, handler, mock_repository, sample_meals):
+        """Test count_history runs with the same filters when include_total."""
+        query = GetMealHistoryQuery(user_id="user123", meal_type="LUNCH", include_total=True)
 
-        mock_repository.get_by_user_and_date_range.return_value = sample_meals
+        mock_repository.get_history_page.return_value = sample_meals[1:3]
+        mock_repository.count_history.return_value = 42
 
         result = await handler.handle(query)
 
-        # Should filter by meal type after fetching
-        assert all(m.meal_type == "LUNCH" for m in result)
+        assert result.total_count == 42
+        mock_repository.count_history.assert_called_once_with(
+            user_id="user123", start_date=None, end_date=None, meal_type="LUNCH"
+        )
@@ -1,8 +1,11 @@
 """Unit tests for GetSummaryRangeQuery and handler."""
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock
-from datetime import datetime, timezone, timedelta
+import pytest_asyncio
+from unittest.mock import AsyncMock
+from datetime import date, datetime, timezone, timedelta
+from typing import Tuple
+from uuid import uuid4
 
 from application.meal.queries.get_summary_range import (
     GetSummaryRangeQuery,
@@ -10,20 +13,40 @@ from application.meal.queries.get_summary_range import (
     GroupByPeriod,
 )
 from domain.meal.core.entities.meal import Meal
+from domain.shared.ports.meal_repository import MealPeriodTotals
+from infrastructure.persistence.in_memory.meal_repository import (
+    InMemoryMealRepository,
+)
 
 
-@pytest.fixture
-def mock_repository():
-    return AsyncMock()
+def _make_meal(timestamp, meal_type, calories, protein, carbs, fat, fiber, sugar, sodium):
+    return Meal(
+        id=uuid4(),
+        user_id="user123",
+        timestamp=timestamp,
+        meal_type=meal_type,
+        total_calories=calories,
+        total_protein=protein,
+        total_carbs=carbs,
+        total_fat=fat,
+        total_fiber=fiber,
+        total_sugar=sugar,
+        total_sodium=sodium,
+    )
 
 
 @pytest.fixture
-def handler(mock_repository):
-    return GetSummaryRangeQueryHandler(repository=mock_repository)
+def repository():
+    return InMemoryMealRepository()
 
 
 @pytest.fixture
-def sample_meals():
+def handler(repository):
+    return GetSummaryRangeQueryHandler(repository=repository)
+
+
+@pytest_asyncio.fixture
+async def sample_meals(repository):
     """Create sample meals over a week."""
     meals = []
     base_date = datetime(2025, 10, 21, 12, 0, 0, tzinfo=timezone.utc)
@@ -32,32 +55,12 @@ def sample_meals():
         timestamp = base_date + timedelta(days=day)
 
         # Breakfast
-        breakfast = MagicMock(spec=Meal)
-        breakfast.user_id = "user123"
-        breakfast.timestamp = timestamp.replace(hour=8)
-        breakfast.meal_type = "BREAKFAST"
-        breakfast.total_calories = 300
-        breakfast.total_protein = 10
-        breakfast.total_carbs = 50
-        breakfast.total_fat = 5
-        breakfast.total_fiber = 8
-        breakfast.total_sugar = 10
-        breakfast.total_sodium = 100
-        meals.append(breakfast)
-
+        meals.append(_make_meal(timestamp.replace(hour=8), "BREAKFAST", 300, 10, 50, 5, 8, 10, 100))
         # Lunch
-        lunch = MagicMock(spec=Meal)
-        lunch.user_id = "user123"
-        lunch.timestamp = timestamp.replace(hour=13)
-        lunch.meal_type = "LUNCH"
-        lunch.total_calories = 450
-        lunch.total_protein = 35
-        lunch.total_carbs = 30
-        lunch.total_fat = 20
-        lunch.total_fiber = 10
-        lunch.total_sugar = 5
-        lunch.total_sodium = 600
-        meals.append(lunch)
+        meals.append(_make_meal(timestamp.replace(hour=13), "LUNCH", 450, 35, 30, 20, 10, 5, 600))
+
+    for meal in meals:
+        await repository.save(meal)
 
     return meals
 
@@ -66,7 +69,7 @@ class TestGetSummaryRangeQueryHandler:
     """Test GetSummaryRangeQueryHandler."""
 
     @pytest.mark.asyncio
-    async def test_summary_range_by_day(self, handler, mock_repository, sample_meals):
+    async def test_summary_range_by_day(self, handler, sample_meals):
         """Test getting summary range grouped by day."""
         start_date = datetime(2025, 10, 21, 0, 0, 0)
         end_date = datetime(2025, 10, 27, 23, 59, 59)
@@ -78,23 +81,6 @@ class TestGetSummaryRangeQueryHandler:
             group_by=GroupByPeriod.DAY,
         )
 
-        # Mock che filtra correttamente per date range
-        # Accetta datetime objects come parametri keyword
-        def get_meals_for_range(user_id, start_date, end_date):
-            # Converti datetimes naive per confronto
-            if start_date.tzinfo is None:
-                start_dt = start_date.replace(tzinfo=timezone.utc)
-            else:
-                start_dt = start_date
-            if end_date.tzinfo is None:
-                end_dt = end_date.replace(tzinfo=timezone.utc)
-            else:
-                end_dt = end_date
-
-            return [m for m in sample_meals if start_dt <= m.timestamp <= end_dt]
-
-        mock_repository.get_by_user_and_date_range.side_effect = get_meals_for_range
-
         results = await handler.handle(query)
 
         # Should return 7 periods (one per day)
@@ -112,7 +98,7 @@ class TestGetSummaryRangeQueryHandler:
         assert first_day.breakdown_by_type["LUNCH"] == 450
 
     @pytest.mark.asyncio
-    async def test_summary_range_by_week(self, handler, mock_repository, sample_meals):
+    async def test_summary_range_by_week(self, handler, sample_meals):
         """Test getting summary range grouped by week."""
         # Week starting Monday 20 Oct through Sunday 26 Oct (ISO week 43)
         start_date = datetime(2025, 10, 20, 0, 0, 0)
@@ -125,21 +111,6 @@ class TestGetSummaryRangeQueryHandler:
             group_by=GroupByPeriod.WEEK,
         )
 
-        def get_meals_for_range(user_id, start_date, end_date):
-            # Converti per confronto timezone-aware
-            if start_date.tzinfo is None:
-                start_dt = start_date.replace(tzinfo=timezone.utc)
-            else:
-                start_dt = start_date
-            if end_date.tzinfo is None:
-                end_dt = end_date.replace(tzinfo=timezone.utc)
-            else:
-                end_dt = end_date
-
-            return [m for m in sample_meals if start_dt <= m.timestamp <= end_dt]
-
-        mock_repository.get_by_user_and_date_range.side_effect = get_meals_for_range
-
         results = await handler.handle(query)
 
         # Should return 1 period (entire week 43)
@@ -147,12 +118,12 @@ class TestGetSummaryRangeQueryHandler:
 
         week_summary = results[0]
         assert week_summary.period == "2025-W43"
-        # 6 days (21-26) * 1 meal/day * 750 calories
-        assert week_summary.total_calories >= 4500
-        assert week_summary.meal_count >= 6
+        # 6 days (21-26) * 750 calories
+        assert week_summary.total_calories == 4500
+        assert week_summary.meal_count == 12
 
     @pytest.mark.asyncio
-    async def test_summary_range_by_month(self, handler, mock_repository, sample_meals):
+    async def test_summary_range_by_month(self, handler, sample_meals):
         """Test getting summary range grouped by month."""
         start_date = datetime(2025, 10, 1, 0, 0, 0)
         end_date = datetime(2025, 10, 31, 23, 59, 59)
@@ -164,22 +135,6 @@ class TestGetSummaryRangeQueryHandler:
             group_by=GroupByPeriod.MONTH,
         )
 
-        # Mock che filtra per date range
-        def get_meals_for_range(user_id, start_date, end_date):
-            # Converti per confronto timezone-aware
-            if start_date.tzinfo is None:
-                start_dt = start_date.replace(tzinfo=timezone.utc)
-            else:
-                start_dt = start_date
-            if end_date.tzinfo is None:
-                end_dt = end_date.replace(tzinfo=timezone.utc)
-            else:
-                end_dt = end_date
-
-            return [m for m in sample_meals if start_dt <= m.timestamp <= end_dt]
-
-        mock_repository.get_by_user_and_date_range.side_effect = get_meals_for_range
-
         results = await handler.handle(query)
 
         # Should return 1 period (entire month)
@@ -191,7 +146,7 @@ class TestGetSummaryRangeQueryHandler:
         assert month_summary.meal_count == 14
 
     @pytest.mark.asyncio
-    async def test_summary_range_empty_result(self, handler, mock_repository):
+    async def test_summary_range_empty_result(self, handler):
         """Test getting summary range with no meals."""
         start_date = datetime(2025, 10, 21, 0, 0, 0)
         end_date = datetime(2025, 10, 27, 23, 59, 59)
@@ -203,9 +158,6 @@ class TestGetSummaryRangeQueryHandler:
             group_by=GroupByPeriod.DAY,
         )
 
-        # Mock che restituisce sempre lista vuota
-        mock_repository.get_by_user_and_date_range.side_effect = lambda *args, **kwargs: []
-
         results = await handler.handle(query)
 
         # Should return 7 periods with zero values
@@ -216,24 +168,14 @@ class TestGetSummaryRangeQueryHandler:
             assert result.breakdown_by_type == {}
 
     @pytest.mark.asyncio
-    async def test_summary_range_partial_data(self, handler, mock_repository):
+    async def test_summary_range_partial_data(self, handler, repository):
         """Test getting summary range with partial data."""
         start_date = datetime(2025, 10, 21, 0, 0, 0)
         end_date = datetime(2025, 10, 27, 23, 59, 59)
 
         # Only 1 meal on first day
-        base_date = datetime(2025, 10, 21, 12, 0, 0, tzinfo=timezone.utc)
-        breakfast = MagicMock(spec=Meal)
-        breakfast.user_id = "user123"
-        breakfast.timestamp = base_date.replace(hour=8)
-        breakfast.meal_type = "BREAKFAST"
-        breakfast.total_calories = 300
-        breakfast.total_protein = 10
-        breakfast.total_carbs = 50
-        breakfast.total_fat = 5
-        breakfast.total_fiber = 8
-        breakfast.total_sugar = 10
-        breakfast.total_sodium = 100
+        base_date = datetime(2025, 10, 21, 8, 0, 0, tzinfo=timezone.utc)
+        await repository.save(_make_meal(base_date, "BREAKFAST", 300, 10, 50, 5, 8, 10, 100))
 
         query = GetSummaryRangeQuery(
             user_id="user123",
@@ -242,13 +184,6 @@ class TestGetSummaryRangeQueryHandler:
             group_by=GroupByPeriod.DAY,
         )
 
-        def get_meals_for_range(user_id, start_date, end_date):
-            if start_date.day == 21:
-                return [breakfast]
-            return []
-
-        mock_repository.get_by_user_and_date_range.side_effect = get_meals_for_range
-
         results = await handler.handle(query)
 
         # Should return 7 periods
@@ -264,9 +199,7 @@ class TestGetSummaryRangeQueryHandler:
             assert results[i].meal_count == 0
 
     @pytest.mark.asyncio
-    async def test_summary_range_respects_date_boundaries(
-        self, handler, mock_repository, sample_meals
-    ):
+    async def test_summary_range_respects_date_boundaries(self, handler, sample_meals):
         """Test that date boundaries are respected."""
         # Query only 3 days
         start_date = datetime(2025, 10, 21, 0, 0, 0)
@@ -279,22 +212,6 @@ class TestGetSummaryRangeQueryHandler:
             group_by=GroupByPeriod.DAY,
         )
 
-        # Mock che filtra per date range
-        def get_meals_for_range(user_id, start_date, end_date):
-            # Converti per confronto timezone-aware
-            if start_date.tzinfo is None:
-                start_dt = start_date.replace(tzinfo=timezone.utc)
-            else:
-                start_dt = start_date
-            if end_date.tzinfo is None:
-                end_dt = end_date.replace(tzinfo=timezone.utc)
-            else:
-                end_dt = end_date
-
-            return [m for m in sample_meals if start_dt <= m.timestamp <= end_dt]
-
-        mock_repository.get_by_user_and_date_range.side_effect = get_meals_for_range
-
         results = await handler.handle(query)
 
         # Should return only 3 periods
@@ -302,3 +219,121 @@ class TestGetSummaryRangeQueryHandler:
         assert results[0].period == "2025-10-21"
         assert results[1].period == "2025-10-22"
         assert results[2].period == "2025-10-23"
+        assert sum(r.meal_count for r in results) == 6
+
+    @pytest.mark.asyncio
+    async def test_summary_range_single_repository_call(self):
+        """Test that the whole range is aggregated with one repository call."""
+        repository = AsyncMock()
+        repository.get_daily_totals.return_value = None  # Rollups unavailable
+        repository.aggregate_by_period.return_value = {
+            2: MealPeriodTotals(
+                total_calories=500,
+                meal_count=1,
+                breakdown_by_type={"DINNER": 500.0},
+            )
+        }
+        handler = GetSummaryRangeQueryHandler(repository=repository)
+
+        query = GetSummaryRangeQuery(
+            user_id="user123",
+            start_date=datetime(2025, 10, 1, tzinfo=timezone.utc),
+            end_date=datetime(2025, 12, 29, 23, 59, 59, tzinfo=timezone.utc),
+            group_by=GroupByPeriod.DAY,
+        )
+
+        results = await handler.handle(query)
+
+        assert len(results) == 90
+        repository.aggregate_by_period.assert_awaited_once()
+        repository.get_by_user_and_date_range.assert_not_called()
+
+        # Missing periods are zero-filled
+        assert results[2].total_calories == 500
+        assert results[2].breakdown_by_type == {"DINNER": 500.0}
+        assert all(r.meal_count == 0 for i, r in enumerate(results) if i != 2)
+
+    @pytest.mark.asyncio
+    async def test_summary_range_sums_daily_rollups(self):
+        """Test UTC-aligned periods are summed from daily rollups, without scanning meals."""
+        repository = AsyncMock()
+        repository.get_daily_totals.return_value = {
+            date(2025, 10, 20): MealPeriodTotals(
+                total_calories=500, meal_count=1, breakdown_by_type={"LUNCH": 500.0}
+            ),
+            date(2025, 10, 26): MealPeriodTotals(
+                total_calories=300, meal_count=1, breakdown_by_type={"DINNER": 300.0}
+            ),
+            date(2025, 10, 27): MealPeriodTotals(
+                total_calories=200, meal_count=2, breakdown_by_type={"LUNCH": 200.0}
+            ),
+        }
+        handler = GetSummaryRangeQueryHandler(repository=repository)
+
+        query = GetSummaryRangeQuery(
+            user_id="user123",
+            start_date=datetime(2025, 10, 20, tzinfo=timezone.utc),
+            end_date=datetime(2025, 11, 2, 23, 59, 59, tzinfo=timezone.utc),
+            group_by=GroupByPeriod.WEEK,
+        )
+
+        results = await handler.handle(query)
+
+        repository.get_daily_totals.assert_awaited_once_with(
+            user_id="user123", start_day=date(2025, 10, 20), end_day=date(2025, 11, 2)
+        )
+        repository.aggregate_by_period.assert_not_called()
+        assert [r.meal_count for r in results] == [2, 2]
+        assert results[0].total_calories == 800
+        assert results[0].breakdown_by_type == {"LUNCH": 500.0, "DINNER": 300.0}
+        assert results[1].total_calories == 200
+
+    @pytest.mark.asyncio
+    async def test_rollup_days_matched_to_unsorted_periods_with_gaps(self):
+        """Test each rollup day lands in its period (or none) whatever the period order."""
+        repository = AsyncMock()
+        repository.get_daily_totals.return_value = {
+            date(2025, 10, day): MealPeriodTotals(total_calories=day, meal_count=1)
+            for day in (1, 3, 5, 10, 12, 20)
+        }
+        handler = GetSummaryRangeQueryHandler(repository=repository)
+
+        def utc_days(first: int, last: int) -> Tuple[datetime, datetime]:
+            return (
+                datetime(2025, 10, first, tzinfo=timezone.utc),
+                datetime(2025, 10, last, 23, 59, 59, tzinfo=timezone.utc),
+            )
+
+        results = await handler._totals_from_rollups(
+            "user123", [utc_days(10, 12), utc_days(1, 3), utc_days(20, 20)]
+        )
+
+        repository.get_daily_totals.assert_awaited_once_with(
+            user_id="user123", start_day=date(2025, 10, 1), end_day=date(2025, 10, 20)
+        )
+        assert results is not None
+        assert {index: totals.total_calories for index, totals in results.items()} == {
+            0: 22,
+            1: 4,
+            2: 20,
+        }
+
+    @pytest.mark.asyncio
+    async def test_summary_range_non_utc_periods_aggregate_meals(self):
+        """Test periods not made of whole UTC days fall back to aggregate_by_period."""
+        repository = AsyncMock()
+        repository.aggregate_by_period.return_value = {}
+        handler = GetSummaryRangeQueryHandler(repository=repository)
+        rome = timezone(timedelta(hours=1))
+
+        query = GetSummaryRangeQuery(
+            user_id="user123",
+            start_date=datetime(2025, 10, 20, tzinfo=rome),
+            end_date=datetime(2025, 10, 22, 23, 59, 59, tzinfo=rome),
+            group_by=GroupByPeriod.DAY,
+        )
+
+        await handler.handle(query)
+
+        repository.get_daily_totals.assert_not_called()
+        repository.aggregate_by_period.assert_awaited_once()
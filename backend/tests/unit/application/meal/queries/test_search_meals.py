@@ -1,7 +1,14 @@
-"""Unit tests for SearchMealsQuery and handler."""
+"""Unit tests for SearchMealsQuery and handler.
+
+Uses InMemoryMealRepository (IMealSearch implementation) so that the
+matching rules are exercised end to end.
+"""
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+import pytest_asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from unittest.mock import AsyncMock
 from uuid import uuid4
 
 from application.meal.queries.search_meals import (
@@ -9,72 +16,67 @@ from application.meal.queries.search_meals import (
     SearchMealsQueryHandler,
 )
 from domain.meal.core.entities.meal import Meal
+from domain.meal.core.entities.meal_entry import MealEntry
+from infrastructure.persistence.in_memory.meal_repository import InMemoryMealRepository
+
+
+def _make_meal(
+    name: str,
+    display_name: str,
+    notes: Optional[str] = None,
+    dish_name: str = "Meal",
+    hours_ago: int = 0,
+) -> Meal:
+    meal_id = uuid4()
+    entry = MealEntry(
+        id=uuid4(),
+        meal_id=meal_id,
+        name=name,
+        display_name=display_name,
+        quantity_g=100.0,
+        calories=100,
+        protein=5.0,
+        carbs=10.0,
+        fat=2.0,
+    )
+    return Meal(
+        id=meal_id,
+        user_id="user123",
+        timestamp=datetime(2025, 10, 25, 20, tzinfo=timezone.utc) - timedelta(hours=hours_ago),
+        meal_type="LUNCH",
+        dish_name=dish_name,
+        entries=[entry],
+        notes=notes,
+    )
+
+
+@pytest_asyncio.fixture
+async def repository():
+    """Repository with 3 meals: pasta, chicken, salad."""
+    repository = InMemoryMealRepository()
+    await repository.save(_make_meal("pasta", "Spaghetti", dish_name="Pasta al pomodoro"))
+    await repository.save(
+        _make_meal("chicken", "Chicken Breast", notes="Grilled with vegetables", hours_ago=1)
+    )
+    await repository.save(
+        _make_meal("salad", "Mixed Salad", notes="Fresh salad with chicken", hours_ago=2)
+    )
+    return repository
 
 
 @pytest.fixture
-def mock_repository():
-    return AsyncMock()
-
-
-@pytest.fixture
-def handler(mock_repository):
-    return SearchMealsQueryHandler(repository=mock_repository)
-
-
-@pytest.fixture
-def sample_meals_for_search():
-    """Create meals with different entry names for search testing."""
-    meals = []
-
-    # Meal 1: Pasta
-    meal1 = MagicMock(spec=Meal)
-    meal1.id = uuid4()
-    meal1.user_id = "user123"
-    meal1.meal_type = "LUNCH"
-    meal1.notes = None
-    entry1 = MagicMock()
-    entry1.name = "pasta"
-    entry1.display_name = "Spaghetti"
-    meal1.entries = [entry1]
-    meals.append(meal1)
-
-    # Meal 2: Chicken
-    meal2 = MagicMock(spec=Meal)
-    meal2.id = uuid4()
-    meal2.user_id = "user123"
-    meal2.meal_type = "DINNER"
-    meal2.notes = "Grilled with vegetables"
-    entry2 = MagicMock()
-    entry2.name = "chicken"
-    entry2.display_name = "Chicken Breast"
-    meal2.entries = [entry2]
-    meals.append(meal2)
-
-    # Meal 3: Salad
-    meal3 = MagicMock(spec=Meal)
-    meal3.id = uuid4()
-    meal3.user_id = "user123"
-    meal3.meal_type = "LUNCH"
-    meal3.notes = "Fresh salad with chicken"
-    entry3 = MagicMock()
-    entry3.name = "salad"
-    entry3.display_name = "Mixed Salad"
-    meal3.entries = [entry3]
-    meals.append(meal3)
-
-    return meals
+def handler(repository):
+    return SearchMealsQueryHandler(repository=repository)
 
 
 class TestSearchMealsQueryHandler:
     """Test SearchMealsQueryHandler."""
 
     @pytest.mark.asyncio
-    async def test_search_by_entry_name(self, handler, mock_repository, sample_meals_for_search):
+    async def test_search_by_entry_name(self, handler):
         """Test searching by entry name."""
         query = SearchMealsQuery(user_id="user123", query_text="pasta")
 
-        mock_repository.get_by_user.return_value = sample_meals_for_search
-
         result = await handler.handle(query)
 
         # Should find 1 meal with pasta
@@ -82,24 +84,22 @@ class TestSearchMealsQueryHandler:
         assert "pasta" in result[0].entries[0].name.lower()
 
     @pytest.mark.asyncio
-    async def test_search_by_display_name(self, handler, mock_repository, sample_meals_for_search):
+    async def test_search_by_display_name(self, handler):
         """Test searching by display name."""
         query = SearchMealsQuery(user_id="user123", query_text="chicken")
 
-        mock_repository.get_by_user.return_value = sample_meals_for_search
-
         result = await handler.handle(query)
 
         # Should find 2 meals (one with "chicken" entry, one with "chicken" in notes)
         assert len(result) == 2
+        # Entry name match ranks above notes match
+        assert result[0].entries[0].name == "chicken"
 
     @pytest.mark.asyncio
-    async def test_search_by_notes(self, handler, mock_repository, sample_meals_for_search):
+    async def test_search_by_notes(self, handler):
         """Test searching in meal notes."""
         query = SearchMealsQuery(user_id="user123", query_text="grilled")
 
-        mock_repository.get_by_user.return_value = sample_meals_for_search
-
         result = await handler.handle(query)
 
         # Should find 1 meal with "grilled" in notes
@@ -107,36 +107,53 @@ class TestSearchMealsQueryHandler:
         assert "grilled" in result[0].notes.lower()
 
     @pytest.mark.asyncio
-    async def test_search_case_insensitive(self, handler, mock_repository, sample_meals_for_search):
+    async def test_search_case_insensitive(self, handler):
         """Test case-insensitive search."""
         query = SearchMealsQuery(user_id="user123", query_text="PASTA")
 
-        mock_repository.get_by_user.return_value = sample_meals_for_search
-
         result = await handler.handle(query)
 
         # Should find pasta meal despite uppercase query
         assert len(result) == 1
 
     @pytest.mark.asyncio
-    async def test_search_no_results(self, handler, mock_repository, sample_meals_for_search):
+    async def test_search_prefix_and_all_terms(self, handler):
+        """Test prefix matching with every term required."""
+        result = await handler.handle(SearchMealsQuery(user_id="user123", query_text="spag pomo"))
+        assert len(result) == 1
+
+        result = await handler.handle(SearchMealsQuery(user_id="user123", query_text="spag pollo"))
+        assert result == []
+
+    @pytest.mark.asyncio
+    async def test_search_no_results(self, handler):
         """Test search with no matching results."""
         query = SearchMealsQuery(user_id="user123", query_text="pizza")
 
-        mock_repository.get_by_user.return_value = sample_meals_for_search
-
         result = await handler.handle(query)
 
         assert len(result) == 0
 
     @pytest.mark.asyncio
-    async def test_search_with_pagination(self, handler, mock_repository, sample_meals_for_search):
+    async def test_search_with_pagination(self, handler):
         """Test search with pagination."""
-        query = SearchMealsQuery(user_id="user123", query_text="chicken", limit=1, offset=0)
-
-        mock_repository.get_by_user.return_value = sample_meals_for_search
+        query = SearchMealsQuery(user_id="user123", query_text="chicken", limit=1, offset=1)
 
         result = await handler.handle(query)
 
-        # Should return only 1 result due to limit
+        # Should return only the second (notes) match due to limit/offset
         assert len(result) == 1
+        assert result[0].entries[0].name == "salad"
+
+    @pytest.mark.asyncio
+    async def test_search_delegates_to_port(self):
+        """Test handler passes query parameters to the search port."""
+        search = AsyncMock()
+        search.search.return_value = []
+        handler = SearchMealsQueryHandler(repository=search)
+
+        await handler.handle(SearchMealsQuery(user_id="u1", query_text="riso", limit=5, offset=10))
+
+        search.search.assert_called_once_with(
+            user_id="u1", query_text="riso", limit=5, offset=10, projection=None
+        )
@@ -21,7 +21,8 @@ from domain.shared.types import GroupByPeriod
 def mock_repository():
     """Create mock meal repository."""
     repository = AsyncMock()
-    repository.get_by_user_and_date_range = AsyncMock(return_value=[])
+    repository.aggregate_by_period = AsyncMock(return_value={})
+    repository.get_daily_totals = AsyncMock(return_value=None)
     return repository
 
 
@@ -51,14 +52,13 @@ class TestTimezonePreservation:
         # Execute query
         await handler.handle(query)
 
-        # Verify repository was called for each day with timezone-aware dates
-        assert mock_repository.get_by_user_and_date_range.call_count == 3
+        # Verify repository was called once with 3 timezone-aware periods
+        assert mock_repository.aggregate_by_period.call_count == 1
+        _, kwargs = mock_repository.aggregate_by_period.call_args
+        assert len(kwargs["periods"]) == 3
 
-        # Check each call has timezone-aware datetimes
-        for call in mock_repository.get_by_user_and_date_range.call_args_list:
-            _, kwargs = call
-            period_start = kwargs["start_date"]
-            period_end = kwargs["end_date"]
+        # Check each period has timezone-aware datetimes
+        for period_start, period_end in kwargs["periods"]:
 
             # Critical: Both must be timezone-aware (MongoDB requirement)
             assert period_start.tzinfo is not None, f"period_start lost timezone: {period_start}"
@@ -83,11 +83,9 @@ class TestTimezonePreservation:
         # Execute query
         await handler.handle(query)
 
-        # Verify all calls have timezone-aware datetimes
-        for call in mock_repository.get_by_user_and_date_range.call_args_list:
-            _, kwargs = call
-            period_start = kwargs["start_date"]
-            period_end = kwargs["end_date"]
+        # Verify all periods have timezone-aware datetimes
+        _, kwargs = mock_repository.aggregate_by_period.call_args
+        for period_start, period_end in kwargs["periods"]:
 
             # Critical: Must preserve timezone
             assert period_start.tzinfo is not None, f"period_start lost timezone: {period_start}"
@@ -112,11 +110,9 @@ class TestTimezonePreservation:
         # Execute query
         await handler.handle(query)
 
-        # Verify all calls have timezone-aware datetimes
-        for call in mock_repository.get_by_user_and_date_range.call_args_list:
-            _, kwargs = call
-            period_start = kwargs["start_date"]
-            period_end = kwargs["end_date"]
+        # Verify all periods have timezone-aware datetimes
+        _, kwargs = mock_repository.aggregate_by_period.call_args
+        for period_start, period_end in kwargs["periods"]:
 
             # Critical: Must preserve timezone
             assert period_start.tzinfo is not None, f"period_start lost timezone: {period_start}"
@@ -150,13 +146,14 @@ class TestTimezonePreservation:
         await handler.handle(query)
 
         # Verify repository was called with timezone-aware datetimes
-        call_args = mock_repository.get_by_user_and_date_range.call_args
+        call_args = mock_repository.aggregate_by_period.call_args
         _, kwargs = call_args
+        period_start, period_end = kwargs["periods"][0]
 
         # MongoDB datetime_to_iso() would raise ValueError if tzinfo is None
         # This verifies the fix prevents that error
-        assert kwargs["start_date"].tzinfo is not None
-        assert kwargs["end_date"].tzinfo is not None
+        assert period_start.tzinfo is not None
+        assert period_end.tzinfo is not None
 
     def test_split_periods_returns_aware_datetimes(self, handler):
         """Test _split_range_into_periods returns timezone-aware tuples."""
@@ -1,6 +1,7 @@
 """Unit tests for GetAggregateRangeQuery and handler."""
 
 import pytest
+import pytest_asyncio
 from datetime import datetime, timezone, timedelta
 
 from domain.activity.application.get_aggregate_range import (
@@ -8,7 +9,10 @@ from domain.activity.application.get_aggregate_range import (
     GetAggregateRangeQueryHandler,
     GroupByPeriod,
 )
-from repository.activities import ActivityEventRecord, ActivitySource
+from domain.activity.model import ActivityEvent, ActivitySource
+from infrastructure.persistence.inmemory.activity_repository import (
+    InMemoryActivityRepository,
+)
 
 
 @pytest.fixture
@@ -21,7 +25,7 @@ def sample_activity_events():
         timestamp = base_date + timedelta(days=day)
 
         # Morning activity
-        morning = ActivityEventRecord(
+        morning = ActivityEvent(
             user_id="user123",
             ts=timestamp.replace(hour=9).isoformat().replace("+00:00", "Z"),
             steps=1000,
@@ -32,7 +36,7 @@ def sample_activity_events():
         events.append(morning)
 
         # Afternoon activity
-        afternoon = ActivityEventRecord(
+        afternoon = ActivityEvent(
             user_id="user123",
             ts=timestamp.replace(hour=15).isoformat().replace("+00:00", "Z"),
             steps=1500,
@@ -46,42 +50,28 @@ def sample_activity_events():
 
 
 @pytest.fixture
-def mock_activity_repo(monkeypatch, sample_activity_events):
-    """Mock activity_repo with proper filtering."""
-
-    def list_events(user_id, start_ts=None, end_ts=None, limit=10000):
-        # Filtra eventi per date range
-        if not start_ts or not end_ts:
-            return sample_activity_events
-
-        # Parse timestamps - handle both naive and aware
-        start_dt = datetime.fromisoformat(start_ts)
-        if start_dt.tzinfo is None:
-            start_dt = start_dt.replace(tzinfo=timezone.utc)
-
-        end_dt = datetime.fromisoformat(end_ts)
-        if end_dt.tzinfo is None:
-            end_dt = end_dt.replace(tzinfo=timezone.utc)
-
-        filtered = []
-        for event in sample_activity_events:
-            event_dt = datetime.fromisoformat(event.ts.replace("Z", "+00:00"))
-            if start_dt <= event_dt <= end_dt:
-                filtered.append(event)
-        return filtered
-
-    # Mock il metodo list_events di activity_repo
+def activity_repository(monkeypatch):
+    """In-memory activity repository over a fresh legacy store."""
     import repository.activities
 
-    monkeypatch.setattr(repository.activities.activity_repo, "list_events", list_events)
+    monkeypatch.setattr(
+        repository.activities, "activity_repo", repository.activities.InMemoryActivityRepository()
+    )
+    return InMemoryActivityRepository()
+
 
-    return repository.activities.activity_repo
+@pytest_asyncio.fixture
+async def handler(activity_repository, sample_activity_events):
+    """Handler over a repository holding the sample events."""
+    await activity_repository.ingest_events(sample_activity_events)
+    return GetAggregateRangeQueryHandler(activity_repository)
 
 
+@pytest.mark.asyncio
 class TestGetAggregateRangeQueryHandler:
     """Test GetAggregateRangeQueryHandler."""
 
-    def test_aggregate_range_by_day(self, mock_activity_repo):
+    async def test_aggregate_range_by_day(self, handler):
         """Test getting aggregate range grouped by day."""
         start_date = datetime(2025, 10, 21, 0, 0, 0)
         end_date = datetime(2025, 10, 27, 23, 59, 59)
@@ -93,8 +83,7 @@ class TestGetAggregateRangeQueryHandler:
             group_by=GroupByPeriod.DAY,
         )
 
-        handler = GetAggregateRangeQueryHandler()
-        results = handler.handle(query)
+        results = await handler.handle(query)
 
         # Should return 7 periods (one per day)
         assert len(results) == 7
@@ -107,7 +96,7 @@ class TestGetAggregateRangeQueryHandler:
         assert first_day.event_count == 2
         assert first_day.avg_heart_rate == 127.5  # (120 + 135) / 2
 
-    def test_aggregate_range_by_week(self, mock_activity_repo):
+    async def test_aggregate_range_by_week(self, handler):
         """Test getting aggregate range grouped by week."""
         # Week starting Monday 20 Oct through Sunday 26 Oct
         start_date = datetime(2025, 10, 20, 0, 0, 0)
@@ -120,8 +109,7 @@ class TestGetAggregateRangeQueryHandler:
             group_by=GroupByPeriod.WEEK,
         )
 
-        handler = GetAggregateRangeQueryHandler()
-        results = handler.handle(query)
+        results = await handler.handle(query)
 
         # Should return 1 period (entire week)
         assert len(results) == 1
@@ -133,7 +121,7 @@ class TestGetAggregateRangeQueryHandler:
         assert week_summary.total_steps == 15000  # Actually 6 days worth
         assert week_summary.event_count == 12
 
-    def test_aggregate_range_by_month(self, mock_activity_repo):
+    async def test_aggregate_range_by_month(self, handler):
         """Test getting aggregate range grouped by month."""
         start_date = datetime(2025, 10, 1, 0, 0, 0)
         end_date = datetime(2025, 10, 31, 23, 59, 59)
@@ -145,8 +133,7 @@ class TestGetAggregateRangeQueryHandler:
             group_by=GroupByPeriod.MONTH,
         )
 
-        handler = GetAggregateRangeQueryHandler()
-        results = handler.handle(query)
+        results = await handler.handle(query)
 
         # Should return 1 period (entire month)
         assert len(results) == 1
@@ -158,18 +145,11 @@ class TestGetAggregateRangeQueryHandler:
         assert month_summary.total_calories_out == 875.0
         assert month_summary.event_count == 14
 
-    def test_aggregate_range_empty_result(self, mock_activity_repo, monkeypatch):
+    async def test_aggregate_range_empty_result(self, handler):
         """Test getting aggregate range with no activity."""
         start_date = datetime(2025, 11, 1, 0, 0, 0)
         end_date = datetime(2025, 11, 7, 23, 59, 59)
 
-        # Mock per restituire lista vuota
-        import repository.activities
-
-        monkeypatch.setattr(
-            repository.activities.activity_repo, "list_events", lambda *args, **kwargs: []
-        )
-
         query = GetAggregateRangeQuery(
             user_id="user123",
             start_date=start_date,
@@ -177,8 +157,7 @@ class TestGetAggregateRangeQueryHandler:
             group_by=GroupByPeriod.DAY,
         )
 
-        handler = GetAggregateRangeQueryHandler()
-        results = handler.handle(query)
+        results = await handler.handle(query)
 
         # Should return 7 periods with zero values
         assert len(results) == 7
@@ -188,7 +167,7 @@ class TestGetAggregateRangeQueryHandler:
             assert result.event_count == 0
             assert result.avg_heart_rate is None
 
-    def test_aggregate_range_respects_date_boundaries(self, mock_activity_repo):
+    async def test_aggregate_range_respects_date_boundaries(self, handler):
         """Test that date boundaries are respected."""
         # Query only 3 days
         start_date = datetime(2025, 10, 21, 0, 0, 0)
@@ -201,8 +180,7 @@ class TestGetAggregateRangeQueryHandler:
             group_by=GroupByPeriod.DAY,
         )
 
-        handler = GetAggregateRangeQueryHandler()
-        results = handler.handle(query)
+        results = await handler.handle(query)
 
         # Should return only 3 periods
         assert len(results) == 3
@@ -210,43 +188,25 @@ class TestGetAggregateRangeQueryHandler:
         assert results[1].period == "2025-10-22"
         assert results[2].period == "2025-10-23"
 
-    def test_aggregate_range_handles_partial_data(self, mock_activity_repo, monkeypatch):
+    async def test_aggregate_range_handles_partial_data(self, activity_repository):
         """Test getting aggregate range with partial data."""
         start_date = datetime(2025, 10, 21, 0, 0, 0)
         end_date = datetime(2025, 10, 27, 23, 59, 59)
 
         # Solo 1 evento sul primo giorno
-        single_event = ActivityEventRecord(
-            user_id="user123",
-            ts="2025-10-21T10:00:00Z",
-            steps=5000,
-            calories_out=250.0,
-            hr_avg=150.0,
-            source=ActivitySource.MANUAL,
+        await activity_repository.ingest_events(
+            [
+                ActivityEvent(
+                    user_id="user123",
+                    ts="2025-10-21T10:00:00Z",
+                    steps=5000,
+                    calories_out=250.0,
+                    hr_avg=150.0,
+                    source=ActivitySource.MANUAL,
+                )
+            ]
         )
-
-        def list_events(user_id, start_ts=None, end_ts=None, limit=10000):
-            if not start_ts or not end_ts:
-                return [single_event]
-
-            # Parse timestamps - handle both naive and aware
-            start_dt = datetime.fromisoformat(start_ts)
-            if start_dt.tzinfo is None:
-                start_dt = start_dt.replace(tzinfo=timezone.utc)
-
-            end_dt = datetime.fromisoformat(end_ts)
-            if end_dt.tzinfo is None:
-                end_dt = end_dt.replace(tzinfo=timezone.utc)
-
-            event_dt = datetime.fromisoformat(single_event.ts.replace("Z", "+00:00"))
-
-            if start_dt <= event_dt <= end_dt:
-                return [single_event]
-            return []
-
-        import repository.activities
-
-        monkeypatch.setattr(repository.activities.activity_repo, "list_events", list_events)
+        handler = GetAggregateRangeQueryHandler(activity_repository)
 
         query = GetAggregateRangeQuery(
             user_id="user123",
@@ -255,8 +215,7 @@ class TestGetAggregateRangeQueryHandler:
             group_by=GroupByPeriod.DAY,
         )
 
-        handler = GetAggregateRangeQueryHandler()
-        results = handler.handle(query)
+        results = await handler.handle(query)
 
         # Should return 7 periods
         assert len(results) == 7
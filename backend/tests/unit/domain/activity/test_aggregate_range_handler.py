@@ -1,7 +1,7 @@
 """Unit tests for GetAggregateRangeQuery and handler."""
 
 import pytest
-from unittest.mock import MagicMock
+import pytest_asyncio
 from datetime import datetime, timedelta
 
 from domain.activity.application.get_aggregate_range import (
@@ -9,7 +9,10 @@ from domain.activity.application.get_aggregate_range import (
     GetAggregateRangeQueryHandler,
     GroupByPeriod,
 )
-from repository.activities import ActivityEventRecord
+from domain.activity.model import ActivityEvent
+from infrastructure.persistence.inmemory.activity_repository import (
+    InMemoryActivityRepository,
+)
 
 
 @pytest.fixture
@@ -21,29 +24,43 @@ def sample_activity_events():
     for day in range(7):  # 7 days
         for hour in range(8, 20):  # 12 hours per day
             timestamp = base_date + timedelta(days=day, hours=hour - 12)
-            event = MagicMock(spec=ActivityEventRecord)
-            event.user_id = "user123"
-            event.ts = timestamp.isoformat() + "Z"
-            event.steps = 100 if hour % 2 == 0 else 50  # Vary steps
-            event.calories_out = 5.0
-            event.hr_avg = 75.0 if hour % 3 == 0 else None
-            events.append(event)
+            events.append(
+                ActivityEvent(
+                    user_id="user123",
+                    ts=timestamp.isoformat() + "Z",
+                    steps=100 if hour % 2 == 0 else 50,  # Vary steps
+                    calories_out=5.0,
+                    hr_avg=75.0 if hour % 3 == 0 else None,
+                )
+            )
 
     return events
 
 
+@pytest.fixture
+def activity_repository(monkeypatch):
+    """In-memory activity repository over a fresh legacy store."""
+    import repository.activities
+
+    monkeypatch.setattr(
+        repository.activities, "activity_repo", repository.activities.InMemoryActivityRepository()
+    )
+    return InMemoryActivityRepository()
+
+
+@pytest_asyncio.fixture
+async def handler(activity_repository, sample_activity_events):
+    """Handler over a repository holding the sample events."""
+    await activity_repository.ingest_events(sample_activity_events)
+    return GetAggregateRangeQueryHandler(activity_repository)
+
+
+@pytest.mark.asyncio
 class TestGetAggregateRangeQueryHandler:
     """Test GetAggregateRangeQueryHandler."""
 
-    def test_aggregate_range_by_day(self, sample_activity_events, monkeypatch):
+    async def test_aggregate_range_by_day(self, handler):
         """Test getting aggregate range grouped by day."""
-        # Mock activity_repo
-        mock_list_events = MagicMock(return_value=sample_activity_events[:12])
-        monkeypatch.setattr(
-            "domain.activity.application.get_aggregate_range.activity_repo",
-            MagicMock(list_events=mock_list_events),
-        )
-
         start_date = datetime(2025, 10, 21, 0, 0, 0)
         end_date = datetime(2025, 10, 21, 23, 59, 59)
 
@@ -54,8 +71,7 @@ class TestGetAggregateRangeQueryHandler:
             group_by=GroupByPeriod.DAY,
         )
 
-        handler = GetAggregateRangeQueryHandler()
-        results = handler.handle(query)
+        results = await handler.handle(query)
 
         # Should return 1 period (single day)
         assert len(results) == 1
@@ -70,15 +86,8 @@ class TestGetAggregateRangeQueryHandler:
         assert day_summary.total_active_minutes == 12
         assert day_summary.event_count == 12
 
-    def test_aggregate_range_by_week(self, sample_activity_events, monkeypatch):
+    async def test_aggregate_range_by_week(self, handler):
         """Test getting aggregate range grouped by week."""
-        # Mock activity_repo
-        mock_list_events = MagicMock(return_value=sample_activity_events)
-        monkeypatch.setattr(
-            "domain.activity.application.get_aggregate_range.activity_repo",
-            MagicMock(list_events=mock_list_events),
-        )
-
         start_date = datetime(2025, 10, 21, 0, 0, 0)
         end_date = datetime(2025, 10, 27, 23, 59, 59)
 
@@ -89,29 +98,22 @@ class TestGetAggregateRangeQueryHandler:
             group_by=GroupByPeriod.WEEK,
         )
 
-        handler = GetAggregateRangeQueryHandler()
-        results = handler.handle(query)
+        results = await handler.handle(query)
 
-        # Should return 1 period (entire week)
-        assert len(results) == 1
+        # Tuesday to Monday: rest of W43 plus the first day of W44
+        assert [r.period for r in results] == ["2025-W43", "2025-W44"]
 
         week_summary = results[0]
-        assert week_summary.period == "2025-W43"
-        # 7 days * 12 hours * (100+50)/2 average = 6300 steps
-        assert week_summary.total_steps == 6300
-        # 7 days * 12 hours * 5 calories = 420
-        assert week_summary.total_calories_out == 420.0
-        assert week_summary.event_count == 84
-
-    def test_aggregate_range_by_month(self, sample_activity_events, monkeypatch):
+        # 6 days * 12 hours * (100+50)/2 average = 5400 steps
+        assert week_summary.total_steps == 5400
+        # 6 days * 12 hours * 5 calories = 360
+        assert week_summary.total_calories_out == 360.0
+        assert week_summary.event_count == 72
+        assert results[1].event_count == 12
+        assert sum(r.total_steps for r in results) == 6300
+
+    async def test_aggregate_range_by_month(self, handler):
         """Test getting aggregate range grouped by month."""
-        # Mock activity_repo
-        mock_list_events = MagicMock(return_value=sample_activity_events)
-        monkeypatch.setattr(
-            "domain.activity.application.get_aggregate_range.activity_repo",
-            MagicMock(list_events=mock_list_events),
-        )
-
         start_date = datetime(2025, 10, 1, 0, 0, 0)
         end_date = datetime(2025, 10, 31, 23, 59, 59)
 
@@ -122,8 +124,7 @@ class TestGetAggregateRangeQueryHandler:
             group_by=GroupByPeriod.MONTH,
         )
 
-        handler = GetAggregateRangeQueryHandler()
-        results = handler.handle(query)
+        results = await handler.handle(query)
 
         # Should return 1 period (entire month)
         assert len(results) == 1
@@ -133,15 +134,8 @@ class TestGetAggregateRangeQueryHandler:
         assert month_summary.total_steps == 6300
         assert month_summary.total_calories_out == 420.0
 
-    def test_aggregate_range_empty_result(self, monkeypatch):
+    async def test_aggregate_range_empty_result(self, activity_repository):
         """Test getting aggregate range with no events."""
-        # Mock empty result
-        mock_list_events = MagicMock(return_value=[])
-        monkeypatch.setattr(
-            "domain.activity.application.get_aggregate_range.activity_repo",
-            MagicMock(list_events=mock_list_events),
-        )
-
         start_date = datetime(2025, 10, 21, 0, 0, 0)
         end_date = datetime(2025, 10, 27, 23, 59, 59)
 
@@ -152,8 +146,7 @@ class TestGetAggregateRangeQueryHandler:
             group_by=GroupByPeriod.DAY,
         )
 
-        handler = GetAggregateRangeQueryHandler()
-        results = handler.handle(query)
+        results = await GetAggregateRangeQueryHandler(activity_repository).handle(query)
 
         # Should return 7 periods with zero values
         assert len(results) == 7
@@ -163,15 +156,8 @@ class TestGetAggregateRangeQueryHandler:
             assert result.total_active_minutes == 0
             assert result.event_count == 0
 
-    def test_aggregate_range_avg_heart_rate(self, sample_activity_events, monkeypatch):
+    async def test_aggregate_range_avg_heart_rate(self, handler):
         """Test heart rate averaging."""
-        # Mock activity_repo
-        mock_list_events = MagicMock(return_value=sample_activity_events[:12])
-        monkeypatch.setattr(
-            "domain.activity.application.get_aggregate_range.activity_repo",
-            MagicMock(list_events=mock_list_events),
-        )
-
         start_date = datetime(2025, 10, 21, 0, 0, 0)
         end_date = datetime(2025, 10, 21, 23, 59, 59)
 
@@ -182,23 +168,17 @@ class TestGetAggregateRangeQueryHandler:
             group_by=GroupByPeriod.DAY,
         )
 
-        handler = GetAggregateRangeQueryHandler()
-        results = handler.handle(query)
+        results = await handler.handle(query)
 
         day_summary = results[0]
         # Should have avg HR (some events have 75.0, others None)
         assert day_summary.avg_heart_rate is not None
         assert day_summary.avg_heart_rate == 75.0
+        # Hours 9, 12, 15, 18 report a heart rate
+        assert day_summary.heart_rate_samples == 4
 
-    def test_aggregate_range_respects_date_boundaries(self, sample_activity_events, monkeypatch):
+    async def test_aggregate_range_respects_date_boundaries(self, handler):
         """Test that date boundaries are respected."""
-        # Mock activity_repo
-        mock_list_events = MagicMock(return_value=sample_activity_events[:36])
-        monkeypatch.setattr(
-            "domain.activity.application.get_aggregate_range.activity_repo",
-            MagicMock(list_events=mock_list_events),
-        )
-
         # Query only 3 days
         start_date = datetime(2025, 10, 21, 0, 0, 0)
         end_date = datetime(2025, 10, 23, 23, 59, 59)
@@ -210,11 +190,36 @@ class TestGetAggregateRangeQueryHandler:
             group_by=GroupByPeriod.DAY,
         )
 
-        handler = GetAggregateRangeQueryHandler()
-        results = handler.handle(query)
+        results = await handler.handle(query)
 
         # Should return only 3 periods
         assert len(results) == 3
         assert results[0].period == "2025-10-21"
         assert results[1].period == "2025-10-22"
         assert results[2].period == "2025-10-23"
+        assert sum(r.event_count for r in results) == 36
+
+    async def test_aggregate_range_not_truncated(self, activity_repository):
+        """Test periods longer than 10k minutes are fully aggregated."""
+        start = datetime(2025, 10, 1, 0, 0, 0)
+        events = [
+            ActivityEvent(
+                user_id="user123",
+                ts=(start + timedelta(minutes=minute)).isoformat() + "Z",
+                steps=1,
+            )
+            for minute in range(12000)
+        ]
+        await activity_repository.ingest_events(events)
+
+        query = GetAggregateRangeQuery(
+            user_id="user123",
+            start_date=start,
+            end_date=datetime(2025, 10, 31, 23, 59, 59),
+            group_by=GroupByPeriod.MONTH,
+        )
+
+        results = await GetAggregateRangeQueryHandler(activity_repository).handle(query)
+
+        assert results[0].event_count == 12000
+        assert results[0].total_steps == 12000
@@ -0,0 +1,42 @@
+"""Unit tests for meal search text normalization."""
+
+from domain.meal.core.services.search_text import (
+    DISH_NAME_WEIGHT,
+    NOTES_WEIGHT,
+    normalize_text,
+    token_prefixes,
+    tokenize,
+    weighted_tokens,
+)
+
+
+class TestTokenize:
+    """Test tokenization rules shared by search backends."""
+
+    def test_accents_and_case_removed(self) -> None:
+        assert normalize_text("Caffè LATTE, Perché") == "caffe latte, perche"
+
+    def test_apostrophes_split_and_short_tokens_dropped(self) -> None:
+        assert tokenize("Pasta all'Amatriciana e pecorino") == [
+            "pasta",
+            "all",
+            "amatriciana",
+            "pecorino",
+        ]
+
+    def test_duplicates_and_empty(self) -> None:
+        assert tokenize("riso riso RISO") == ["riso"]
+        assert tokenize(None) == []
+        assert tokenize("  ,, ") == []
+
+
+class TestPrefixesAndWeights:
+    """Test prefix expansion and field weighting."""
+
+    def test_token_prefixes(self) -> None:
+        assert token_prefixes(["riso", "ri"]) == ["ri", "ris", "riso"]
+
+    def test_highest_field_weight_wins(self) -> None:
+        weights = weighted_tokens([(NOTES_WEIGHT, "pane fresco"), (DISH_NAME_WEIGHT, "Pane")])
+
+        assert weights == {"pane": DISH_NAME_WEIGHT, "fresco": NOTES_WEIGHT}
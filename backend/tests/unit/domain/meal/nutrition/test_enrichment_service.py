@@ -3,6 +3,8 @@
 Tests the cascade strategy with mocked providers.
 """
 
+import asyncio
+
 import pytest
 from typing import Optional
 
@@ -387,3 +389,74 @@ class TestEnrichBatch:
         assert results[0].quantity_g == 100.0
         assert results[1].quantity_g == 200.0
         assert results[2].quantity_g == 150.0
+
+
+class TestEnrichmentConcurrency:
+    """Test suite for bounded concurrent enrichment."""
+
+    @pytest.mark.asyncio
+    async def test_batch_respects_provider_concurrency(self) -> None:
+        """Test that concurrent USDA calls never exceed the configured bound."""
+
+        class SlowUSDAProvider:
+            def __init__(self) -> None:
+                self.in_flight = 0
+                self.max_in_flight = 0
+
+            async def get_nutrients(
+                self, identifier: str, quantity_g: float
+            ) -> Optional[NutrientProfile]:
+                self.in_flight += 1
+                self.max_in_flight = max(self.max_in_flight, self.in_flight)
+                await asyncio.sleep(0.01)
+                self.in_flight -= 1
+                return NutrientProfile(
+                    calories=100, protein=1.0, carbs=1.0, fat=1.0, source="USDA", quantity_g=100.0
+                )
+
+        usda = SlowUSDAProvider()
+        service = NutritionEnrichmentService(
+            usda, MockCategoryProvider(), MockFallbackProvider(), usda_concurrency=2
+        )
+
+        items: list[tuple[str, float, Optional[str]]] = [
+            (f"food_{i}", 100.0 + i, None) for i in range(6)
+        ]
+        results = await service.enrich_batch(items)
+
+        assert usda.max_in_flight == 2
+        assert [r.quantity_g for r in results] == [100.0 + i for i in range(6)]
+
+    @pytest.mark.asyncio
+    async def test_batch_isolates_item_failures(self) -> None:
+        """Test that a failing provider for one item does not fail the batch."""
+
+        class FlakyProvider:
+            async def get_nutrients(
+                self, identifier: str, quantity_g: float
+            ) -> Optional[NutrientProfile]:
+                if identifier in ("bad", "generic"):
+                    raise Exception("provider error")
+                return NutrientProfile(
+                    calories=200, protein=1.0, carbs=1.0, fat=1.0, source="USDA", quantity_g=100.0
+                )
+
+        provider = FlakyProvider()
+        service = NutritionEnrichmentService(provider, provider, provider)
+
+        results = await service.enrich_batch([("good", 100.0, None), ("bad", 100.0, None)])
+
+        assert results[0].source == "USDA"
+        # Every tier failed: minimal estimate
+        assert results[1].source == "AI_ESTIMATE"
+        assert results[1].calories == 100
+
+    def test_rejects_non_positive_concurrency(self) -> None:
+        """Test that a non-positive bound is rejected."""
+        with pytest.raises(ValueError, match="concurrency must be positive"):
+            NutritionEnrichmentService(
+                MockUSDAProvider(),
+                MockCategoryProvider(),
+                MockFallbackProvider(),
+                category_concurrency=0,
+            )
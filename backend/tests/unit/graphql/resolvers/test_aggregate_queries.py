@@ -10,15 +10,24 @@ Note: dailySummary tests moved to test_global_queries.py
 """
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock
-from typing import Any
-from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+from typing import Any, Dict
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
 from uuid import uuid4
 
-from graphql.resolvers.meal.aggregate_queries import AggregateQueries
+from graphql.resolvers.meal.aggregate_queries import (
+    AggregateQueries,
+    decode_meal_cursor,
+    map_meal_document_to_graphql,
+    map_meal_to_graphql,
+    meal_projection_from_selection,
+)
 from domain.meal.core.entities.meal import Meal as DomainMeal
 from domain.meal.core.entities.meal_entry import MealEntry as DomainMealEntry
 from domain.meal.core.value_objects.meal_id import MealId
+from domain.shared.ports.meal_repository import MealCursor, MealProjection
+from infrastructure.persistence.mongodb.meal_repository import MongoMealRepository
 
 
 @pytest.fixture
@@ -163,15 +172,23 @@ async def test_meal_repository_not_available(aggregate_queries: AggregateQueries
 # ============================================
 
 
+def _select(info: Any, *names: str) -> None:
+    """Set the fields selected on the resolver result."""
+    info.selected_fields = [
+        MagicMock(selections=[SimpleNamespace(name=name, selections=[]) for name in names])
+    ]
+
+
 @pytest.mark.asyncio
 async def test_meal_history_success(
     aggregate_queries: AggregateQueries, mock_info: Any, sample_meal: DomainMeal
 ) -> None:
     """Test mealHistory query with basic filters."""
     # Arrange
+    _select(mock_info, "meals", "totalCount", "hasMore")
     repository = mock_info.context.get("meal_repository")
-    repository.get_by_user.return_value = [sample_meal]
-    repository.count_by_user.return_value = 1  # Mock total count
+    repository.get_history_page.return_value = [sample_meal]
+    repository.count_history.return_value = 1  # Mock total count
 
     # Act
     result = await aggregate_queries.meal_history(  # type: ignore[misc,call-arg]
@@ -187,6 +204,7 @@ async def test_meal_history_success(
     assert result.meals[0].id == str(sample_meal.id)
     assert result.total_count == 1
     assert result.has_more is False
+    assert result.next_cursor is None
 
 
 @pytest.mark.asyncio
@@ -198,8 +216,10 @@ async def test_meal_history_with_date_range(
     start_date = datetime(2025, 10, 25, 0, 0, 0, tzinfo=timezone.utc)
     end_date = datetime(2025, 10, 25, 23, 59, 59, tzinfo=timezone.utc)
 
+    _select(mock_info, "meals", "totalCount")
     repository = mock_info.context.get("meal_repository")
-    repository.get_by_user_and_date_range.return_value = [sample_meal]
+    repository.get_history_page.return_value = [sample_meal]
+    repository.count_history.return_value = 1
 
     # Act
     result = await aggregate_queries.meal_history(  # type: ignore[misc,call-arg]
@@ -207,29 +227,96 @@ async def test_meal_history_with_date_range(
         user_id="user123",
         start_date=start_date,
         end_date=end_date,
+        meal_type="LUNCH",
         limit=20,
         offset=0,
     )
 
-    # Assert
+    # Assert: one page fetch and one native count, no full reload
     assert len(result.meals) == 1
-    # Note: Resolver calls repository twice for date range queries
-    # 1st call: Fetch paginated results
-    # 2nd call: Calculate total count
-    assert repository.get_by_user_and_date_range.call_count == 2
+    assert result.total_count == 1
+    repository.get_history_page.assert_called_once()
+    repository.count_history.assert_called_once_with(
+        user_id="user123", start_date=start_date, end_date=end_date, meal_type="LUNCH"
+    )
+
+
+@pytest.mark.asyncio
+async def test_meal_history_total_count_not_selected(
+    aggregate_queries: AggregateQueries, mock_info: Any, sample_meal: DomainMeal
+) -> None:
+    """Test mealHistory skips counting when totalCount is not selected."""
+    # Arrange
+    _select(mock_info, "meals", "hasMore")
+    repository = mock_info.context.get("meal_repository")
+    repository.get_history_page.return_value = [sample_meal]
+
+    # Act
+    await aggregate_queries.meal_history(  # type: ignore[misc,call-arg]
+        info=mock_info,
+        user_id="user123",
+    )
+
+    # Assert
+    repository.count_history.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_meal_history_loads_only_selected_meal_fields(
+    aggregate_queries: AggregateQueries, mock_info: Any, sample_meal: DomainMeal
+) -> None:
+    """Test mealHistory projects meals on the fields selected under meals."""
+    # Arrange: mealHistory { meals { id totalCalories } hasMore }
+    mock_info.selected_fields = [
+        MagicMock(
+            selections=[
+                SimpleNamespace(
+                    name="meals",
+                    selections=[
+                        SimpleNamespace(name="id", selections=[]),
+                        SimpleNamespace(name="totalCalories", selections=[]),
+                    ],
+                ),
+                SimpleNamespace(name="hasMore", selections=[]),
+            ]
+        )
+    ]
+    repository = mock_info.context.get("meal_repository")
+    repository.get_history_page.return_value = [sample_meal]
+
+    # Act
+    await aggregate_queries.meal_history(  # type: ignore[misc,call-arg]
+        info=mock_info,
+        user_id="user123",
+    )
+
+    # Assert
+    projection = repository.get_history_page.call_args.kwargs["projection"]
+    assert projection == MealProjection(fields=frozenset({"id", "total_calories"}))
+    assert not projection.includes_entries
+
+
+def test_meal_projection_from_selection() -> None:
+    """Test GraphQL field names map to domain fields (full load if unknown)."""
+    projection = meal_projection_from_selection({"dishName", "entryCount", "__typename"})
+    assert projection is not None
+    assert projection.fields == frozenset({"dish_name", "entries"})
+
+    assert meal_projection_from_selection(set()) is None
+    assert meal_projection_from_selection({"id", "unknownField"}) is None
 
 
 @pytest.mark.asyncio
 async def test_meal_history_pagination(aggregate_queries: AggregateQueries, mock_info: Any) -> None:
-    """Test mealHistory query with pagination (has_more flag)."""
+    """Test mealHistory query with keyset pagination (has_more, next_cursor)."""
     # Arrange
     meals = []
-    for i in range(20):
+    for i in range(21):
         meal_id = MealId.generate()
         meal = DomainMeal(
             id=meal_id.value,
             user_id="user123",
-            timestamp=datetime(2025, 10, 25, i, 0, 0, tzinfo=timezone.utc),
+            timestamp=datetime(2025, 10, 25, 23, 0, 0, tzinfo=timezone.utc) - timedelta(hours=i),
             meal_type="LUNCH",
             entries=[
                 DomainMealEntry(
@@ -257,9 +344,9 @@ async def test_meal_history_pagination(aggregate_queries: AggregateQueries, mock
         )
         meals.append(meal)
 
+    _select(mock_info, "meals", "hasMore", "nextCursor")
     repository = mock_info.context.get("meal_repository")
-    repository.get_by_user.return_value = meals
-    repository.count_by_user.return_value = 20  # Mock total count
+    repository.get_history_page.return_value = meals  # limit + 1 meals
 
     # Act
     result = await aggregate_queries.meal_history(  # type: ignore[misc,call-arg]
@@ -271,17 +358,45 @@ async def test_meal_history_pagination(aggregate_queries: AggregateQueries, mock
 
     # Assert
     assert len(result.meals) == 20
-    assert result.total_count == 20
-    assert result.has_more is False  # No more when offset + len == total
+    assert result.has_more is True
+    assert result.next_cursor is not None
+    cursor = decode_meal_cursor(result.next_cursor)
+    assert cursor == MealCursor(timestamp=meals[19].timestamp, meal_id=meals[19].id)
+
+    # Next page uses the decoded cursor
+    repository.get_history_page.return_value = meals[20:]
+    next_page = await aggregate_queries.meal_history(  # type: ignore[misc,call-arg]
+        info=mock_info,
+        user_id="user123",
+        limit=20,
+        after=result.next_cursor,
+    )
+    assert repository.get_history_page.call_args.kwargs["after"] == cursor
+    assert len(next_page.meals) == 1
+    assert next_page.has_more is False
+
+
+@pytest.mark.asyncio
+async def test_meal_history_invalid_cursor(
+    aggregate_queries: AggregateQueries, mock_info: Any
+) -> None:
+    """Test mealHistory rejects malformed cursors."""
+    with pytest.raises(ValueError, match="Invalid mealHistory cursor"):
+        await aggregate_queries.meal_history(  # type: ignore[misc,call-arg]
+            info=mock_info,
+            user_id="user123",
+            after="not-a-cursor",
+        )
 
 
 @pytest.mark.asyncio
 async def test_meal_history_empty(aggregate_queries: AggregateQueries, mock_info: Any) -> None:
     """Test mealHistory query with no results."""
     # Arrange
+    _select(mock_info, "meals", "totalCount", "hasMore")
     repository = mock_info.context.get("meal_repository")
-    repository.get_by_user.return_value = []
-    repository.count_by_user.return_value = 0  # Mock total count
+    repository.get_history_page.return_value = []
+    repository.count_history.return_value = 0  # Mock total count
 
     # Act
     result = await aggregate_queries.meal_history(  # type: ignore[misc,call-arg]
@@ -309,7 +424,7 @@ async def test_search_by_entry_name(
     """Test searchMeals query matching entry name."""
     # Arrange
     repository = mock_info.context.get("meal_repository")
-    repository.get_by_user.return_value = [sample_meal]
+    repository.search.return_value = [sample_meal]
 
     # Act
     result = await aggregate_queries.search(  # type: ignore[misc,call-arg]
@@ -333,7 +448,7 @@ async def test_search_by_notes(
     """Test searchMeals query matching notes."""
     # Arrange
     repository = mock_info.context.get("meal_repository")
-    repository.get_by_user.return_value = [sample_meal]
+    repository.search.return_value = [sample_meal]
 
     # Act
     result = await aggregate_queries.search(  # type: ignore[misc,call-arg]
@@ -352,10 +467,10 @@ async def test_search_by_notes(
 async def test_search_case_insensitive(
     aggregate_queries: AggregateQueries, mock_info: Any, sample_meal: DomainMeal
 ) -> None:
-    """Test searchMeals query is case-insensitive."""
+    """Test searchMeals query text is passed as-is (matching is done by the port)."""
     # Arrange
     repository = mock_info.context.get("meal_repository")
-    repository.get_by_user.return_value = [sample_meal]
+    repository.search.return_value = [sample_meal]
 
     # Act
     result = await aggregate_queries.search(  # type: ignore[misc,call-arg]
@@ -368,6 +483,9 @@ async def test_search_case_insensitive(
 
     # Assert
     assert len(result.meals) == 1
+    repository.search.assert_called_once_with(
+        user_id="user123", query_text="CHICKEN", limit=20, offset=0, projection=None
+    )
 
 
 @pytest.mark.asyncio
@@ -377,7 +495,7 @@ async def test_search_no_match(
     """Test searchMeals query with no matching results."""
     # Arrange
     repository = mock_info.context.get("meal_repository")
-    repository.get_by_user.return_value = [sample_meal]
+    repository.search.return_value = []
 
     # Act
     result = await aggregate_queries.search(  # type: ignore[misc,call-arg]
@@ -393,6 +511,120 @@ async def test_search_no_match(
     assert result.total_count == 0
 
 
+# ============================================
+# Raw document path (MongoMealRepository)
+# ============================================
+
+
+def _mongo_repository() -> MongoMealRepository:
+    """MongoMealRepository with no client (only document mapping is used)."""
+    return MongoMealRepository.__new__(MongoMealRepository)
+
+
+def _stored_document(meal: DomainMeal) -> Dict[str, Any]:
+    """Document as read back from MongoDB (search_terms excluded)."""
+    doc = _mongo_repository().to_document(meal)
+    doc.pop("search_terms")
+    return doc
+
+
+@pytest.mark.parametrize(
+    "fields",
+    [
+        None,
+        frozenset({"total_calories"}),
+        frozenset({"dish_name", "entries", "notes"}),
+    ],
+)
+def test_map_meal_document_matches_domain_mapping(sample_meal: DomainMeal, fields: Any) -> None:
+    """Test raw mapping gives the same GraphQL Meal as from_document + map_meal_to_graphql."""
+    # Arrange: client offset to restore, optional fields set
+    sample_meal.timestamp = datetime(2025, 10, 25, 12, 30, tzinfo=timezone(timedelta(hours=2)))
+    sample_meal.analysis_id = "analysis-1"
+    sample_meal.entries[0].barcode = "8001234567890"
+    doc = _stored_document(sample_meal)
+    if fields is not None:
+        keys = MongoMealRepository._projection(MealProjection(fields=fields))
+        doc = {key: doc[key] for key in keys if key in doc}
+
+    # Act
+    raw = map_meal_document_to_graphql(doc)
+
+    # Assert
+    assert raw == map_meal_to_graphql(_mongo_repository().from_document(doc))
+    assert raw.timestamp == sample_meal.timestamp
+    assert raw.timestamp.utcoffset() == timedelta(hours=2)
+
+
+@pytest.mark.asyncio
+async def test_meal_history_maps_mongo_documents(
+    aggregate_queries: AggregateQueries, mock_info: Any
+) -> None:
+    """Test mealHistory on MongoDB maps documents without building Meal aggregates."""
+    # Arrange: limit + 1 stored meals
+    meals = [
+        DomainMeal(
+            id=uuid4(),
+            user_id="user123",
+            timestamp=datetime(2025, 10, 25, 23, 0, tzinfo=timezone.utc) - timedelta(hours=i),
+            meal_type="DINNER",
+            total_calories=100 * i,
+        )
+        for i in range(3)
+    ]
+    repository = _mongo_repository()
+    repository.get_history_page_documents = AsyncMock(  # type: ignore[method-assign]
+        return_value=[_stored_document(meal) for meal in meals]
+    )
+    repository.count_history = AsyncMock(return_value=7)  # type: ignore[method-assign]
+    mock_info.context.get.side_effect = lambda key: (
+        repository if key == "meal_repository" else None
+    )
+    _select(mock_info, "meals", "totalCount", "hasMore", "nextCursor")
+
+    # Act
+    with patch.object(MongoMealRepository, "from_document") as from_document:
+        result = await aggregate_queries.meal_history(  # type: ignore[misc,call-arg]
+            info=mock_info, user_id="user123", limit=2
+        )
+
+    # Assert
+    from_document.assert_not_called()
+    assert repository.get_history_page_documents.call_args.kwargs["limit"] == 3
+    assert [meal.id for meal in result.meals] == [str(meal.id) for meal in meals[:2]]
+    assert [meal.total_calories for meal in result.meals] == [0, 100]
+    assert result.has_more is True
+    assert result.total_count == 7
+    assert result.next_cursor is not None
+    assert decode_meal_cursor(result.next_cursor) == MealCursor.from_meal(meals[1])
+
+
+@pytest.mark.asyncio
+async def test_search_maps_mongo_documents(
+    aggregate_queries: AggregateQueries, mock_info: Any, sample_meal: DomainMeal
+) -> None:
+    """Test search on MongoDB maps the ranked documents (text score ignored)."""
+    # Arrange
+    doc = {**_stored_document(sample_meal), "score": 1.5}
+    repository = _mongo_repository()
+    repository.search_documents = AsyncMock(return_value=[doc])  # type: ignore[method-assign]
+    mock_info.context.get.side_effect = lambda key: (
+        repository if key == "meal_repository" else None
+    )
+
+    # Act
+    result = await aggregate_queries.search(  # type: ignore[misc,call-arg]
+        info=mock_info, user_id="user123", query_text="chicken"
+    )
+
+    # Assert
+    assert result.meals == [map_meal_to_graphql(sample_meal)]
+    assert result.total_count == 1
+    repository.search_documents.assert_called_once_with(
+        user_id="user123", query_text="chicken", limit=20, offset=0, projection=None
+    )
+
+
 # ============================================
 # Note: dailySummary tests moved to test_global_queries.py
 # dailySummary is now a root-level query, not part of AggregateQueries
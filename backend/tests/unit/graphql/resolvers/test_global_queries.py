@@ -19,8 +19,10 @@ from domain.meal.core.value_objects.meal_id import MealId
 @pytest.fixture
 def mock_context() -> Any:
     """Create mock Strawberry context with meal repository."""
+    repository = AsyncMock()
+    repository.get_daily_totals.return_value = None  # Summaries aggregate meals
     mocks = {
-        "meal_repository": AsyncMock(),
+        "meal_repository": repository,
     }
 
     context = MagicMock()
@@ -0,0 +1,133 @@
+"""Unit tests for request-scoped GraphQL loaders."""
+
+import asyncio
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from graphql.loaders import GraphQLLoaders
+from domain.meal.core.entities.meal import Meal
+from domain.nutritional_profile.core.value_objects.profile_id import ProfileId
+from domain.shared.ports.meal_repository import MealProjection
+
+
+def _meal(user_id: str = "user123") -> Meal:
+    return Meal(
+        id=uuid4(),
+        user_id=user_id,
+        timestamp=datetime(2025, 10, 25, 12, 30, tzinfo=timezone.utc),
+        meal_type="LUNCH",
+    )
+
+
+def _profile(user_id: str = "user123") -> MagicMock:
+    profile = MagicMock()
+    profile.profile_id = ProfileId.generate()
+    profile.user_id = user_id
+    return profile
+
+
+@pytest.fixture
+def meal_repository() -> AsyncMock:
+    return AsyncMock()
+
+
+@pytest.fixture
+def profile_repository() -> AsyncMock:
+    return AsyncMock()
+
+
+@pytest.fixture
+def loaders(meal_repository: AsyncMock, profile_repository: AsyncMock) -> GraphQLLoaders:
+    return GraphQLLoaders(meal_repository, profile_repository)
+
+
+@pytest.mark.asyncio
+async def test_meals_in_same_tick_are_batched(
+    loaders: GraphQLLoaders, meal_repository: AsyncMock
+) -> None:
+    """Concurrent meal lookups become one get_by_ids call."""
+    first, second = _meal(), _meal()
+    meal_repository.get_by_ids.return_value = [second, first]
+
+    results = await asyncio.gather(
+        loaders.load_meal(first.id, "user123"),
+        loaders.load_meal(second.id, "user123"),
+        loaders.load_meal(uuid4(), "user123"),
+    )
+
+    assert list(results) == [first, second, None]
+    meal_repository.get_by_ids.assert_awaited_once()
+    meal_repository.get_by_id.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_meals_grouped_by_user_and_projection(
+    loaders: GraphQLLoaders, meal_repository: AsyncMock
+) -> None:
+    """Each (user, projection) group is fetched with its own query."""
+    projection = MealProjection(fields=frozenset({"total_calories"}))
+    meal_repository.get_by_ids.return_value = []
+
+    await asyncio.gather(
+        loaders.load_meal(uuid4(), "user123"),
+        loaders.load_meal(uuid4(), "user123", projection),
+        loaders.load_meal(uuid4(), "user456"),
+    )
+
+    calls = {(c.args[1], c.args[2]) for c in meal_repository.get_by_ids.await_args_list}
+    assert calls == {("user123", None), ("user123", projection), ("user456", None)}
+
+
+@pytest.mark.asyncio
+async def test_meal_results_memoized_for_request(
+    loaders: GraphQLLoaders, meal_repository: AsyncMock
+) -> None:
+    """A meal already loaded in the request is not fetched again."""
+    meal = _meal()
+    meal_repository.get_by_ids.return_value = [meal]
+
+    await loaders.load_meal(meal.id, "user123")
+    again = await loaders.load_meal(meal.id, "user123")
+
+    assert again is meal
+    assert meal_repository.get_by_ids.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_profile_loaders_batch_and_share_results(
+    loaders: GraphQLLoaders, profile_repository: AsyncMock
+) -> None:
+    """Profile loaded by user is reused for a lookup by its ID."""
+    profile = _profile()
+    profile_repository.find_by_user_ids.return_value = [profile]
+
+    by_user, missing = await asyncio.gather(
+        loaders.load_profile_for_user("user123"),
+        loaders.load_profile_for_user("nobody"),
+    )
+    by_id = await loaders.load_profile(profile.profile_id)
+
+    assert by_user is profile
+    assert missing is None
+    assert by_id is profile
+    profile_repository.find_by_user_ids.assert_awaited_once()
+    profile_repository.find_by_ids.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_profiles_by_id_batched(
+    loaders: GraphQLLoaders, profile_repository: AsyncMock
+) -> None:
+    """Concurrent profile lookups by ID become one find_by_ids call."""
+    first, second = _profile("a"), _profile("b")
+    profile_repository.find_by_ids.return_value = [first, second]
+
+    results = await asyncio.gather(
+        loaders.load_profile(second.profile_id),
+        loaders.load_profile(first.profile_id),
+    )
+
+    assert list(results) == [second, first]
+    profile_repository.find_by_ids.assert_awaited_once()
@@ -17,8 +17,14 @@ from infrastructure.meal.providers.factory import (
 from infrastructure.meal.providers.stub_vision_provider import StubVisionProvider
 from infrastructure.meal.providers.stub_nutrition_provider import StubNutritionProvider
 from infrastructure.meal.providers.stub_barcode_provider import StubBarcodeProvider
+from infrastructure.meal.providers.single_flight import (
+    SingleFlightBarcodeProvider,
+    SingleFlightNutritionProvider,
+)
 from infrastructure.ai.openai.client import OpenAIVisionClient
 from infrastructure.external_apis.usda.client import USDAClient
+from infrastructure.external_apis.usda.local_index import FDCFood, write_local_index
+from infrastructure.external_apis.usda.local_provider import USDALocalProvider
 from infrastructure.external_apis.openfoodfacts.client import OpenFoodFactsClient
 
 
@@ -84,7 +90,50 @@ class TestNutritionProviderFactory:
         monkeypatch.setenv("NUTRITION_PROVIDER", "usda")
         monkeypatch.setenv("AI_USDA_API_KEY", "test-usda-key")
         provider = create_nutrition_provider()
-        assert isinstance(provider, USDAClient)
+        assert isinstance(provider, SingleFlightNutritionProvider)
+        assert isinstance(provider.inner, USDAClient)
+
+    def test_usda_provider_cache_can_be_disabled(self, monkeypatch):
+        """Should attach the nutrient cache unless USDA_CACHE_ENABLED=0."""
+        monkeypatch.setenv("NUTRITION_PROVIDER", "usda")
+        monkeypatch.setenv("AI_USDA_API_KEY", "test-usda-key")
+        provider = create_nutrition_provider()
+        assert isinstance(provider, SingleFlightNutritionProvider)
+        assert isinstance(provider.inner, USDAClient)
+        assert provider.inner._cache is not None
+
+        monkeypatch.setenv("USDA_CACHE_ENABLED", "0")
+        provider = create_nutrition_provider()
+        assert isinstance(provider, SingleFlightNutritionProvider)
+        assert isinstance(provider.inner, USDAClient)
+        assert provider.inner._cache is None
+
+    def test_single_flight_can_be_disabled(self, monkeypatch):
+        """Should return the bare clients when PROVIDER_SINGLE_FLIGHT_ENABLED=0."""
+        monkeypatch.setenv("NUTRITION_PROVIDER", "usda")
+        monkeypatch.setenv("AI_USDA_API_KEY", "test-usda-key")
+        monkeypatch.setenv("BARCODE_PROVIDER", "openfoodfacts")
+        monkeypatch.setenv("PROVIDER_SINGLE_FLIGHT_ENABLED", "0")
+
+        assert isinstance(create_nutrition_provider(), USDAClient)
+        assert isinstance(create_barcode_provider(), OpenFoodFactsClient)
+
+    def test_usda_local_provider(self, monkeypatch, tmp_path):
+        """Should return the offline provider when NUTRITION_PROVIDER=usda_local."""
+        path = str(tmp_path / "fdc_local")
+        write_local_index(path, [FDCFood(173944, "Bananas, raw", {"calories": 89.0})])
+        monkeypatch.setenv("NUTRITION_PROVIDER", "usda_local")
+        monkeypatch.setenv("USDA_LOCAL_INDEX_PATH", path)
+
+        assert isinstance(create_nutrition_provider(), USDALocalProvider)
+
+    def test_usda_local_provider_without_index_raises_error(self, monkeypatch, tmp_path):
+        """Should raise ValueError when the local index was not imported."""
+        monkeypatch.setenv("NUTRITION_PROVIDER", "usda_local")
+        monkeypatch.setenv("USDA_LOCAL_INDEX_PATH", str(tmp_path / "missing"))
+
+        with pytest.raises(ValueError, match="import_fdc_local.py"):
+            create_nutrition_provider()
 
     def test_usda_provider_without_api_key_raises_error(self, monkeypatch):
         """Should raise ValueError when NUTRITION_PROVIDER=usda but no API key."""
@@ -99,7 +148,8 @@ class TestNutritionProviderFactory:
         monkeypatch.setenv("NUTRITION_PROVIDER", "USDA")
         monkeypatch.setenv("AI_USDA_API_KEY", "test-key")
         provider = create_nutrition_provider()
-        assert isinstance(provider, USDAClient)
+        assert isinstance(provider, SingleFlightNutritionProvider)
+        assert isinstance(provider.inner, USDAClient)
 
 
 class TestBarcodeProviderFactory:
@@ -121,7 +171,8 @@ class TestBarcodeProviderFactory:
         """Should return OpenFoodFacts provider when BARCODE_PROVIDER=openfoodfacts."""
         monkeypatch.setenv("BARCODE_PROVIDER", "openfoodfacts")
         provider = create_barcode_provider()
-        assert isinstance(provider, OpenFoodFactsClient)
+        assert isinstance(provider, SingleFlightBarcodeProvider)
+        assert isinstance(provider.inner, OpenFoodFactsClient)
 
     def test_openfoodfacts_no_api_key_required(self, monkeypatch):
         """OpenFoodFacts provider should work without API key (public API)."""
@@ -130,13 +181,15 @@ class TestBarcodeProviderFactory:
 
         # Should not raise
         provider = create_barcode_provider()
-        assert isinstance(provider, OpenFoodFactsClient)
+        assert isinstance(provider, SingleFlightBarcodeProvider)
+        assert isinstance(provider.inner, OpenFoodFactsClient)
 
     def test_case_insensitive_provider_selection(self, monkeypatch):
         """Should handle case-insensitive provider names."""
         monkeypatch.setenv("BARCODE_PROVIDER", "OpenFoodFacts")
         provider = create_barcode_provider()
-        assert isinstance(provider, OpenFoodFactsClient)
+        assert isinstance(provider, SingleFlightBarcodeProvider)
+        assert isinstance(provider.inner, OpenFoodFactsClient)
 
 
 class TestSingletonGetters:
@@ -237,7 +290,8 @@ class TestFactoryIntegration:
 
         assert isinstance(vision, OpenAIVisionClient)
         assert isinstance(nutrition, StubNutritionProvider)
-        assert isinstance(barcode, OpenFoodFactsClient)
+        assert isinstance(barcode, SingleFlightBarcodeProvider)
+        assert isinstance(barcode.inner, OpenFoodFactsClient)
 
     def test_env_test_configuration(self, monkeypatch):
         """Test configuration from .env.test (all stubs)."""
@@ -266,5 +320,7 @@ class TestFactoryIntegration:
         barcode = create_barcode_provider()
 
         assert isinstance(vision, OpenAIVisionClient)
-        assert isinstance(nutrition, USDAClient)
-        assert isinstance(barcode, OpenFoodFactsClient)
+        assert isinstance(nutrition, SingleFlightNutritionProvider)
+        assert isinstance(nutrition.inner, USDAClient)
+        assert isinstance(barcode, SingleFlightBarcodeProvider)
+        assert isinstance(barcode.inner, OpenFoodFactsClient)
@@ -0,0 +1,195 @@
+"""Unit tests for single-flight provider coalescing."""
+
+import asyncio
+from typing import List, Optional
+
+import pytest
+
+from domain.meal.barcode.entities.barcode_product import BarcodeProduct
+from domain.meal.nutrition.entities.nutrient_profile import NutrientProfile
+from infrastructure.meal.providers.single_flight import (
+    SingleFlight,
+    SingleFlightBarcodeProvider,
+    SingleFlightNutritionProvider,
+)
+from metrics.core import registry
+
+
+class SlowNutritionProvider:
+    """Nutrition provider answering after a gate is opened."""
+
+    def __init__(self, error: Optional[Exception] = None) -> None:
+        self.calls: List[str] = []
+        self.gate = asyncio.Event()
+        self.error = error
+        self.entered = False
+        self.exited = False
+
+    async def __aenter__(self) -> "SlowNutritionProvider":
+        self.entered = True
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        self.exited = True
+
+    async def get_nutrients(self, identifier: str, quantity_g: float) -> Optional[NutrientProfile]:
+        self.calls.append(identifier)
+        await self.gate.wait()
+        if self.error is not None:
+            raise self.error
+        return NutrientProfile(calories=131, protein=5.0, carbs=25.0, fat=1.1, quantity_g=100.0)
+
+
+class SlowBarcodeProvider:
+    """Barcode provider answering after a gate is opened."""
+
+    def __init__(self) -> None:
+        self.calls: List[str] = []
+        self.gate = asyncio.Event()
+
+    async def lookup_barcode(self, barcode: str) -> Optional[BarcodeProduct]:
+        self.calls.append(barcode)
+        await self.gate.wait()
+        return BarcodeProduct(
+            barcode=barcode,
+            name="Nutella",
+            brand="Ferrero",
+            nutrients=NutrientProfile(calories=539, protein=6.3, carbs=57.5, fat=30.9),
+        )
+
+
+async def _settle() -> None:
+    """Let the started tasks reach the provider."""
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_lookups_share_one_call() -> None:
+    inner = SlowNutritionProvider()
+    provider = SingleFlightNutritionProvider(inner)
+
+    tasks = [asyncio.create_task(provider.get_nutrients("pasta", 100.0)) for _ in range(5)]
+    await _settle()
+    inner.gate.set()
+    profiles = await asyncio.gather(*tasks)
+
+    assert inner.calls == ["pasta"]
+    assert all(p is not None and p.calories == 131 for p in profiles)
+    # Each caller owns its copy
+    assert len({id(p) for p in profiles}) == 5
+    assert provider.flight.stats() == {
+        "calls": 5,
+        "coalesced": 4,
+        "coalescing_rate": 0.8,
+        "in_flight": 0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_different_keys_are_not_coalesced() -> None:
+    inner = SlowNutritionProvider()
+    provider = SingleFlightNutritionProvider(inner)
+
+    tasks = [
+        asyncio.create_task(provider.get_nutrients("pasta", 100.0)),
+        asyncio.create_task(provider.get_nutrients("rice", 100.0)),
+        asyncio.create_task(provider.get_nutrients("pasta", 50.0)),
+    ]
+    await _settle()
+    inner.gate.set()
+    await asyncio.gather(*tasks)
+
+    assert inner.calls == ["pasta", "rice", "pasta"]
+
+
+@pytest.mark.asyncio
+async def test_sequential_lookups_are_not_coalesced() -> None:
+    inner = SlowNutritionProvider()
+    inner.gate.set()
+    provider = SingleFlightNutritionProvider(inner)
+
+    await provider.get_nutrients("pasta", 100.0)
+    await provider.get_nutrients("pasta", 100.0)
+
+    assert inner.calls == ["pasta", "pasta"]
+
+
+@pytest.mark.asyncio
+async def test_error_is_raised_to_every_caller_and_key_released() -> None:
+    inner = SlowNutritionProvider(error=RuntimeError("USDA down"))
+    provider = SingleFlightNutritionProvider(inner)
+
+    tasks = [asyncio.create_task(provider.get_nutrients("pasta", 100.0)) for _ in range(3)]
+    await _settle()
+    inner.gate.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert inner.calls == ["pasta"]
+    assert all(isinstance(r, RuntimeError) and str(r) == "USDA down" for r in results)
+
+    # Next lookup is a new upstream call
+    inner.error = None
+    assert await provider.get_nutrients("pasta", 100.0) is not None
+    assert inner.calls == ["pasta", "pasta"]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_call() -> None:
+    inner = SlowBarcodeProvider()
+    provider = SingleFlightBarcodeProvider(inner)
+
+    first = asyncio.create_task(provider.lookup_barcode("8001505005707"))
+    second = asyncio.create_task(provider.lookup_barcode("8001505005707"))
+    await _settle()
+    first.cancel()
+    await _settle()
+    inner.gate.set()
+
+    product = await second
+    assert first.cancelled()
+    assert product is not None and product.barcode == "8001505005707"
+    assert inner.calls == ["8001505005707"]
+
+
+@pytest.mark.asyncio
+async def test_coalescing_metrics() -> None:
+    registry.reset()
+    flight: SingleFlight[int] = SingleFlight("test")
+    gate = asyncio.Event()
+
+    async def call() -> int:
+        await gate.wait()
+        return 1
+
+    tasks = [asyncio.create_task(flight.do("key", call)) for _ in range(4)]
+    await _settle()
+    gate.set()
+    assert await asyncio.gather(*tasks) == [1, 1, 1, 1]
+
+    snapshot = registry.snapshot()
+    counters = {
+        c["tags"]["outcome"]: c["value"]
+        for c in snapshot["counters"]
+        if c["name"] == "provider_single_flight_calls"
+    }
+    assert counters == {"leader": 1, "coalesced": 3}
+    gauge = next(
+        g for g in snapshot["gauges"] if g["name"] == "provider_single_flight_coalescing_rate"
+    )
+    assert gauge["tags"] == {"provider": "test"}
+    assert gauge["value"] == 0.75
+
+
+@pytest.mark.asyncio
+async def test_wrapper_delegates_lifecycle_and_attributes() -> None:
+    inner = SlowNutritionProvider()
+    provider = SingleFlightNutritionProvider(inner)
+
+    async with provider as entered:
+        assert entered is provider
+        assert inner.entered
+    assert inner.exited
+    assert provider.inner is inner
+    # Provider-specific attributes are forwarded
+    assert provider.calls is inner.calls
@@ -6,6 +6,7 @@ from domain.activity.model import (
     ActivityEvent,
     ActivitySource,
     HealthSnapshot,
+    IDEMPOTENCY_CONFLICT,
 )
 from infrastructure.persistence.inmemory.activity_repository import (
     InMemoryActivityRepository,
@@ -14,6 +15,7 @@ from infrastructure.persistence.activity_repository_factory import (
     create_activity_repository,
     reset_activity_repository,
 )
+from repository.activities import ActivityEventRecord
 
 
 @pytest.fixture(autouse=True)
@@ -95,6 +97,38 @@ class TestInMemoryActivityRepository:
         assert accepted2 == 0
         assert duplicates2 == 1
 
+    async def test_ingest_events_idempotency_key(self, activity_repo):
+        """Replay returns the first result, a different payload conflicts."""
+        event = ActivityEvent(
+            user_id="user_123",
+            ts="2025-11-05T10:00:00Z",
+            steps=100,
+            source=ActivitySource.APPLE_HEALTH,
+        )
+        replay = ActivityEvent(
+            user_id="user_123",
+            ts="2025-11-05T10:00:30Z",
+            steps=100,
+            source=ActivitySource.APPLE_HEALTH,
+        )
+        changed = ActivityEvent(
+            user_id="user_123",
+            ts="2025-11-05T10:00:00Z",
+            steps=101,
+            source=ActivitySource.APPLE_HEALTH,
+        )
+
+        assert await activity_repo.ingest_events([event], "k1") == (1, 0, [])
+        assert await activity_repo.ingest_events([replay], "k1") == (1, 0, [])
+        assert await activity_repo.ingest_events([changed], "k1") == (
+            0,
+            0,
+            [(0, IDEMPOTENCY_CONFLICT)],
+        )
+        # Same key, other user: independent batch
+        other = ActivityEvent(user_id="user_456", ts="2025-11-05T10:00:00Z", steps=5)
+        assert await activity_repo.ingest_events([other], "k1") == (1, 0, [])
+
     async def test_list_events(self, activity_repo):
         """Test listing events."""
         events = [
@@ -298,6 +332,20 @@ class TestActivityRepositoryFactory:
         with pytest.raises(ValueError, match="MONGODB_URI not configured"):
             create_activity_repository()
 
+    def test_create_activity_repository_mongodb_timeseries(self, monkeypatch):
+        """Test factory selects the time-series backend when enabled."""
+        from infrastructure.persistence.mongodb import MongoActivityTimeSeriesRepository
+
+        monkeypatch.setenv("REPOSITORY_BACKEND", "mongodb")
+        monkeypatch.setenv("MONGODB_URI", "mongodb://localhost:27017")
+        monkeypatch.setenv("MONGODB_ACTIVITY_TIMESERIES", "1")
+        reset_activity_repository()
+
+        repo = create_activity_repository()
+
+        assert isinstance(repo, MongoActivityTimeSeriesRepository)
+        assert repo.collection_name == "activity_events_ts"
+
     def test_create_activity_repository_invalid_backend(self, monkeypatch):
         """Test factory raises error for invalid backend."""
         monkeypatch.setenv("REPOSITORY_BACKEND", "invalid")
@@ -317,3 +365,328 @@ class TestActivityRepositoryFactory:
 
         # After reset, should be different instances
         assert repo1 is not repo2
+
+
+class TestLegacyActivityTimeline:
+    """Test sorted per-user timeline of the legacy in-memory repository."""
+
+    @staticmethod
+    def _record(ts: str, steps: int = 10, user_id: str = "user_123") -> ActivityEventRecord:
+        return ActivityEventRecord(user_id=user_id, ts=ts, steps=steps)
+
+    def test_batches_out_of_order_stay_sorted(self):
+        """Events ingested out of order are listed by timestamp."""
+        from repository.activities import InMemoryActivityRepository as LegacyRepo
+
+        repo = LegacyRepo()
+        repo.ingest_batch(
+            [self._record("2025-11-05T10:05:00Z"), self._record("2025-11-05T10:01:00Z")]
+        )
+        repo.ingest_batch(
+            [self._record("2025-11-05T10:03:00Z"), self._record("2025-11-05T10:07:00Z")]
+        )
+
+        timestamps = [ev.ts for ev in repo.list_all("user_123")]
+        assert timestamps == sorted(timestamps)
+        assert len(timestamps) == 4
+
+    def test_range_bounds_and_limit(self):
+        """Start is inclusive, end exclusive, limit keeps the earliest."""
+        from repository.activities import InMemoryActivityRepository as LegacyRepo
+
+        repo = LegacyRepo()
+        repo.ingest_batch([self._record(f"2025-11-05T10:0{m}:00Z") for m in range(6)])
+
+        events = repo.list("user_123", "2025-11-05T10:01:00Z", "2025-11-05T10:04:00Z")
+        assert [ev.ts[14:16] for ev in events] == ["01", "02", "03"]
+        limited = repo.list("user_123", "2025-11-05T10:01:00Z", limit=2)
+        assert [ev.ts[14:16] for ev in limited] == ["01", "02"]
+        assert repo.list("user_123", "2025-11-05T11:00:00Z") == []
+
+    def test_duplicate_within_batch_detected(self):
+        """Duplicates inside one batch are counted before the batch is stored."""
+        from repository.activities import InMemoryActivityRepository as LegacyRepo
+
+        repo = LegacyRepo()
+        accepted, duplicates, rejected = repo.ingest_batch(
+            [
+                self._record("2025-11-05T10:00:00Z"),
+                self._record("2025-11-05T10:00:30Z"),
+                self._record("2025-11-05T10:00:00Z", steps=99),
+            ]
+        )
+
+        assert (accepted, duplicates) == (1, 1)
+        assert rejected == [(2, LegacyRepo.CONFLICT_DIFFERENT_DATA)]
+
+    def test_daily_stats_cover_whole_day(self):
+        """Daily stats aggregate every event of the day (no list limit)."""
+        from repository.activities import InMemoryActivityRepository as LegacyRepo
+
+        repo = LegacyRepo()
+        repo.ingest_batch(
+            [
+                self._record(f"2025-11-05T{h:02d}:{m:02d}:00Z", 1)
+                for h in range(24)
+                for m in range(60)
+            ]
+        )
+        repo.ingest_batch([self._record("2025-11-06T00:00:00Z", 1000)])
+
+        stats = repo.get_daily_stats("user_123", "2025-11-05T00:00:00Z")
+        assert stats["events_count"] == 1440
+        assert stats["total_steps"] == 1440
+
+    def test_memory_reported_per_user(self):
+        """Memory estimate grows with each user's events."""
+        from repository.activities import InMemoryActivityRepository as LegacyRepo
+
+        repo = LegacyRepo()
+        repo.ingest_batch([self._record("2025-11-05T10:00:00Z", user_id="a")])
+        repo.ingest_batch(
+            [self._record(f"2025-11-05T10:{m:02d}:00Z", user_id="b") for m in range(50)]
+        )
+
+        memory = repo.memory_by_user()
+        assert set(memory) == {"a", "b"}
+        assert memory["b"] > memory["a"] > 0
+
+
+class TestLegacyColumnarStorage:
+    """Test columnar (NumPy) storage behind the legacy in-memory repository."""
+
+    @staticmethod
+    def _repo():
+        from repository.activities import InMemoryActivityRepository as LegacyRepo
+
+        return LegacyRepo()
+
+    def test_values_round_trip_with_missing_fields(self):
+        """Stored values read back as entered; absent fields stay None."""
+        from repository.activities import ActivityEventRecord, ActivitySource
+
+        repo = self._repo()
+        repo.ingest_batch(
+            [
+                ActivityEventRecord(
+                    user_id="u",
+                    ts="2025-11-05T10:00:00Z",
+                    steps=0,
+                    calories_out=5.4,
+                    hr_avg=72,
+                    source=ActivitySource.APPLE_HEALTH,
+                ),
+                ActivityEventRecord(user_id="u", ts="2025-11-05T10:01:00Z"),
+            ]
+        )
+
+        first, second = repo.list_all("u")
+        assert (first.ts, first.steps, first.calories_out, first.hr_avg) == (
+            "2025-11-05T10:00:00Z",
+            0,
+            5.4,
+            72.0,
+        )
+        assert first.source == ActivitySource.APPLE_HEALTH
+        assert (second.steps, second.calories_out, second.hr_avg) == (None, None, None)
+        assert second.source == ActivitySource.MANUAL
+
+    def test_replay_after_storage_is_duplicate(self):
+        """A replayed event matches the stored values."""
+        from repository.activities import ActivityEventRecord
+
+        repo = self._repo()
+
+        def batch():
+            return [ActivityEventRecord(user_id="u", ts="2025-11-05T10:00:00Z", calories_out=5.4)]
+
+        repo.ingest_batch(batch())
+        assert repo.ingest_batch(batch()) == (0, 1, [])
+
+    def test_large_values_stored_exactly(self):
+        """Steps beyond int32 and large calories keep their value."""
+        from repository.activities import ActivityEventRecord
+
+        repo = self._repo()
+        result = repo.ingest_batch(
+            [
+                ActivityEventRecord(user_id="u", ts="2025-11-05T10:00:00Z", steps=3_000_000_000),
+                ActivityEventRecord(user_id="u", ts="2025-11-05T10:01:00Z", calories_out=1e40),
+            ]
+        )
+
+        assert result == (2, 0, [])
+        first, second = repo.list_all("u")
+        assert first.steps == 3_000_000_000
+        assert second.calories_out == 1e40
+        assert repo.get_daily_stats("u", "2025-11-05")["total_steps"] == 3_000_000_000
+
+    def test_distinct_calories_conflict(self):
+        """Calories equal only at float32 precision are different data."""
+        from repository.activities import ActivityEventRecord
+
+        repo = self._repo()
+        repo.ingest_batch(
+            [ActivityEventRecord(user_id="u", ts="2025-11-05T10:00:00Z", calories_out=5.4)]
+        )
+
+        result = repo.ingest_batch(
+            [ActivityEventRecord(user_id="u", ts="2025-11-05T10:00:00Z", calories_out=5.4000001)]
+        )
+
+        assert result == (0, 0, [(0, "CONFLICT_DIFFERENT_DATA")])
+
+    def test_unrepresentable_values_rejected(self):
+        """Non-finite values and steps beyond MAX_STEPS are invalid events."""
+        from repository.activities import ActivityEventRecord
+        from repository.activity_series import MAX_STEPS
+
+        repo = self._repo()
+        result = repo.ingest_batch(
+            [
+                ActivityEventRecord(user_id="u", ts="2025-11-05T10:00:00Z", steps=MAX_STEPS * 2),
+                ActivityEventRecord(
+                    user_id="u", ts="2025-11-05T10:01:00Z", calories_out=float("inf")
+                ),
+                ActivityEventRecord(
+                    user_id="u", ts="2025-11-05T10:02:00Z", calories_out=float("nan")
+                ),
+            ]
+        )
+
+        assert result == (0, 0, [(0, "INVALID_EVENT"), (1, "INVALID_EVENT"), (2, "INVALID_EVENT")])
+        assert repo.list_all("u") == []
+
+    def test_events_spanning_days(self):
+        """Ranges crossing midnight read from both day series in order."""
+        from repository.activities import ActivityEventRecord
+
+        repo = self._repo()
+        repo.ingest_batch(
+            [
+                ActivityEventRecord(user_id="u", ts=ts, steps=1)
+                for ts in ("2025-11-06T00:01:00Z", "2025-11-05T23:59:00Z")
+            ]
+        )
+
+        events = repo.list("u", "2025-11-05T23:00:00Z", "2025-11-06T01:00:00Z")
+        assert [ev.ts for ev in events] == ["2025-11-05T23:59:00Z", "2025-11-06T00:01:00Z"]
+        assert repo.get_daily_stats("u", "2025-11-06")["events_count"] == 1
+
+    def test_aggregate_periods(self):
+        """Per-period totals are keyed by the index of the period."""
+        from repository.activities import ActivityEventRecord
+
+        repo = self._repo()
+        repo.ingest_batch(
+            [
+                ActivityEventRecord(user_id="u", ts="2025-11-05T10:00:00Z", steps=10, hr_avg=70),
+                ActivityEventRecord(user_id="u", ts="2025-11-05T10:01:00Z", steps=0, hr_avg=80),
+                ActivityEventRecord(
+                    user_id="u", ts="2025-11-07T08:00:00Z", steps=5, calories_out=1.1
+                ),
+            ]
+        )
+
+        totals = repo.aggregate_periods(
+            "u",
+            ["2025-11-05T00:00:00Z", "2025-11-06T00:00:00Z", "2025-11-07T00:00:00Z"],
+            "2025-11-08T00:00:00Z",
+        )
+
+        assert set(totals) == {0, 2}
+        assert totals[0]["total_steps"] == 10
+        assert totals[0]["active_minutes"] == 1
+        assert totals[0]["heart_rate_sum"] == 150
+        assert totals[0]["heart_rate_samples"] == 2
+        assert totals[2]["total_calories_out"] == 1.1
+        assert totals[2]["event_count"] == 1
+
+    def test_rolling_steps(self):
+        """Rolling window sums steps over the trailing minutes of the day."""
+        from repository.activities import ActivityEventRecord
+
+        repo = self._repo()
+        repo.ingest_batch(
+            [
+                ActivityEventRecord(user_id="u", ts=f"2025-11-05T00:0{m}:00Z", steps=m + 1)
+                for m in range(4)
+            ]
+        )
+
+        rolling = repo.rolling_steps("u", "2025-11-05", window_minutes=2)
+        assert len(rolling) == 1440
+        assert rolling[:6] == [1, 3, 5, 7, 4, 0]
+
+    def test_vectorized_validation_keeps_reason_precedence(self):
+        """Each event gets the first failing check, in the per-event order."""
+        from repository.activities import ActivityEventRecord
+
+        repo = self._repo()
+        result = repo.ingest_batch(
+            [
+                ActivityEventRecord(user_id="u", ts="bad", steps=-1, hr_avg=300),
+                ActivityEventRecord(user_id="u", ts="bad", calories_out=1.0, hr_avg=300),
+                ActivityEventRecord(user_id="", ts="bad", hr_avg=240.4),
+                ActivityEventRecord(user_id="u", ts="2025-02-30T10:00:00Z"),
+                ActivityEventRecord(user_id="u", ts="2025-11-05T11:00:30+01:00", hr_avg=71.5),
+            ]
+        )
+
+        assert result == (
+            1,
+            0,
+            [
+                (0, "NEGATIVE_VALUE"),
+                (1, "OUT_OF_RANGE_HR"),
+                (2, "INVALID_EVENT"),
+                (3, "NORMALIZATION_FAILED"),
+            ],
+        )
+        (event,) = repo.list_all("u")
+        assert (event.ts, event.hr_avg) == ("2025-11-05T10:00:00Z", 72.0)
+
+    def test_vectorized_duplicates_and_conflicts(self):
+        """Repeated minutes compare with the stored event, else the first in the batch."""
+        from repository.activities import ActivityEventRecord
+
+        repo = self._repo()
+        repo.ingest_batch([ActivityEventRecord(user_id="u", ts="2025-11-05T10:00:00Z", steps=1)])
+
+        result = repo.ingest_batch(
+            [
+                ActivityEventRecord(user_id="u", ts="2025-11-05T10:00:00Z", steps=2),
+                ActivityEventRecord(user_id="u", ts="2025-11-05T10:00:20Z", steps=1),
+                ActivityEventRecord(user_id="u", ts="2025-11-05T10:01:00Z", steps=3),
+                ActivityEventRecord(user_id="u", ts="2025-11-05T10:01Z", steps=3),
+                ActivityEventRecord(user_id="u", ts="2025-11-05T10:01:00Z", steps=4),
+                ActivityEventRecord(user_id="v", ts="2025-11-05T10:01:00Z", steps=4),
+            ]
+        )
+
+        assert result == (2, 2, [(0, "CONFLICT_DIFFERENT_DATA"), (4, "CONFLICT_DIFFERENT_DATA")])
+        assert [ev.steps for ev in repo.list_all("u")] == [1, 3]
+
+    def test_minutes_of_matches_minute_of(self):
+        """The NumPy fast path agrees with the per-string parser."""
+        from repository.activity_series import minute_of, minutes_of
+
+        timestamps = [
+            "2025-11-05T10:00:00Z",
+            "2025-11-05T10:00Z",
+            "2025-11-05T10:00:59Z",
+            "2025-11-05T10:00:00+02:00",
+            "2025-11-05T10:00:00.5Z",
+            "2025-11-05T24:00:00Z",
+            "2025-11-05T10:00:60Z",
+            "0000-01-01T00:00:00Z",
+            "yesterday",
+        ]
+
+        minutes, valid = minutes_of(timestamps)
+
+        expected = [minute_of(ts) for ts in timestamps]
+        assert valid.tolist() == [minute is not None for minute in expected]
+        assert [m for m, ok in zip(minutes.tolist(), valid) if ok] == [
+            minute for minute in expected if minute is not None
+        ]
@@ -0,0 +1,78 @@
+"""Unit tests for the legacy in-memory health totals repository."""
+
+
+class TestLegacyHealthTotalsMemory:
+    """Test bounded idempotency and day retention of the legacy health totals repository."""
+
+    @staticmethod
+    def _repo(clock, **limits):
+        from repository.health_totals import HealthTotalsRepository
+
+        return HealthTotalsRepository(clock=lambda: clock[0], **limits)
+
+    @staticmethod
+    def _record(repo, date="2025-11-05", steps=100, key=None, user_id="user_123"):
+        return repo.record_snapshot(
+            user_id=user_id,
+            date=date,
+            timestamp=f"{date}T10:00:00Z",
+            steps=steps,
+            calories_out=10.0,
+            hr_avg_session=None,
+            idempotency_key=key,
+        )
+
+    def test_idempotency_signature_expires(self):
+        """A key reused after the TTL is no longer a conflict."""
+        clock = [1_000_000.0]
+        repo = self._repo(clock, idempotency_ttl_seconds=60)
+        self._record(repo, steps=100, key="k1")
+
+        assert self._record(repo, steps=200, key="k1")["idempotency_conflict"]
+        clock[0] += 61
+        assert not self._record(repo, steps=200, key="k1")["idempotency_conflict"]
+
+    def test_least_recently_used_signature_evicted(self):
+        """Past max_idempotency_keys the least recently used key is dropped."""
+        clock = [1_000_000.0]
+        repo = self._repo(clock, max_idempotency_keys=2)
+        self._record(repo, steps=100, key="k1")
+        self._record(repo, steps=200, key="k2")
+        self._record(repo, steps=100, key="k1")  # k1 usata di recente
+        self._record(repo, steps=300, key="k3")
+
+        assert repo.memory_stats()["idempotency_keys"] == 2
+        assert self._record(repo, steps=999, key="k1")["idempotency_conflict"]
+        assert not self._record(repo, steps=999, key="k2")["idempotency_conflict"]
+
+    def test_sweep_drops_old_days_and_expired_keys(self):
+        """Days before today - retention_days go, recent days stay."""
+        from datetime import datetime, timezone
+
+        clock = [datetime(2025, 11, 10, 12, tzinfo=timezone.utc).timestamp()]
+        repo = self._repo(clock, retention_days=2, idempotency_ttl_seconds=3600)
+        self._record(repo, date="2025-11-07", key="old")
+        clock[0] += 1800
+        self._record(repo, date="2025-11-08", key="recent")
+        clock[0] += 1800
+
+        assert repo.sweep() == {"idempotency_keys": 1, "days": 1}
+        assert repo.list_deltas(user_id="user_123", date="2025-11-07") == []
+        assert len(repo.list_deltas(user_id="user_123", date="2025-11-08")) == 1
+        assert repo.memory_stats() == {"idempotency_keys": 1, "days": 1, "deltas": 1}
+
+    def test_sweep_reports_memory_gauges(self):
+        """Sweep publishes the state size in the metrics registry."""
+        from metrics.core import registry
+
+        clock = [1_000_000.0]
+        repo = self._repo(clock, retention_days=100_000)
+        self._record(repo, key="k1")
+        repo.sweep()
+
+        gauges = {
+            g["tags"]["kind"]: g["value"]
+            for g in registry.snapshot()["gauges"]
+            if g["name"] == "health_totals_entries"
+        }
+        assert gauges == {"idempotency_keys": 1, "days": 1, "deltas": 1}
@@ -185,6 +185,38 @@ class TestFindById:
         assert stored.calories_target == 2080.0
 
 
+class TestBatchFind:
+    """Test find_by_ids and find_by_user_ids methods."""
+
+    @pytest.mark.asyncio
+    async def test_find_by_ids(
+        self,
+        repository: InMemoryProfileRepository,
+        sample_profile: NutritionalProfile,  # noqa: E501
+    ) -> None:
+        """Test batch lookup by ID skips unknown IDs."""
+        await repository.save(sample_profile)
+
+        found = await repository.find_by_ids([sample_profile.profile_id, ProfileId.generate()])
+
+        assert [p.profile_id for p in found] == [sample_profile.profile_id]
+
+    @pytest.mark.asyncio
+    async def test_find_by_user_ids(
+        self,
+        repository: InMemoryProfileRepository,
+        sample_profile: NutritionalProfile,  # noqa: E501
+    ) -> None:
+        """Test batch lookup by user ID returns deep copies."""
+        await repository.save(sample_profile)
+
+        found = await repository.find_by_user_ids(["user123", "nonexistent"])
+        found[0].calories_target = 9999.0
+
+        assert [p.user_id for p in found] == ["user123"]
+        assert repository._profiles[str(sample_profile.profile_id)].calories_target == 2080.0
+
+
 class TestFindByUserId:
     """Test find_by_user_id method."""
 
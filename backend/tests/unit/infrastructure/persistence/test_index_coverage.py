@@ -0,0 +1,223 @@
+"""Unit tests for MongoDB index coverage verification.
+
+Explain outputs are canned dictionaries: no MongoDB connection needed.
+"""
+
+import inspect
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID
+
+import pytest
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from domain.shared.ports.meal_repository import MealCursor
+from infrastructure.persistence.mongodb import (
+    MongoActivityRepository,
+    MongoActivityTimeSeriesRepository,
+    MongoMealRepository,
+    MongoProfileRepository,
+)
+from infrastructure.persistence.mongodb.index_coverage import (
+    IndexSpec,
+    QueryShape,
+    analyze_explain,
+    build_query_shapes,
+    create_missing_indexes,
+)
+
+# Write-only and setup methods that never issue a query
+_NON_QUERY_METHODS = {"close", "ensure_collection"}
+
+
+def _shape(name: str) -> QueryShape:
+    return next(s for s in build_query_shapes() if s.name == name)
+
+
+class TestQueryShapes:
+    """Test query shapes stay in sync with repositories."""
+
+    @pytest.mark.parametrize(
+        "repository_cls",
+        [
+            MongoMealRepository,
+            MongoProfileRepository,
+            MongoActivityRepository,
+            MongoActivityTimeSeriesRepository,
+        ],
+    )
+    def test_every_public_query_method_has_a_shape(self, repository_cls: type) -> None:
+        sources = {source for shape in build_query_shapes() for source in shape.sources}
+        methods = {
+            name
+            for name, member in inspect.getmembers(repository_cls, inspect.iscoroutinefunction)
+            if not name.startswith("_") and name not in _NON_QUERY_METHODS
+        }
+
+        missing = {f"{repository_cls.__name__}.{m}" for m in methods} - sources
+        assert not missing, f"Query methods without index shape: {missing}"
+
+    def test_meal_range_shape_matches_repository_filter(self) -> None:
+        now = datetime(2025, 11, 12, tzinfo=timezone.utc)
+        shape = next(
+            s for s in build_query_shapes(user_id="u1", now=now) if s.name.endswith("date_range")
+        )
+        repository = MongoMealRepository(
+            client=AsyncIOMotorClient("mongodb://localhost:27017"), legacy_date_reads=True
+        )
+
+        start = shape.filter["$or"][0]["timestamp"]["$gte"]
+        expected = {"user_id": "u1", **repository._timestamp_range_filter(start, now)}
+        assert shape.filter == expected
+
+    def test_meal_history_shape_matches_repository_filter(self) -> None:
+        now = datetime(2025, 11, 12, tzinfo=timezone.utc)
+        shape = next(
+            s for s in build_query_shapes(user_id="u1", now=now) if s.name == "meals.history_page"
+        )
+        repository = MongoMealRepository(
+            client=AsyncIOMotorClient("mongodb://localhost:27017"), legacy_date_reads=True
+        )
+        cursor = MealCursor(
+            timestamp=now - timedelta(days=15),
+            meal_id=UUID("ffffffff-ffff-ffff-ffff-ffffffffffff"),
+        )
+
+        expected = repository._history_filter(
+            "u1", now - timedelta(days=30), now, "LUNCH", after=cursor
+        )
+        assert shape.filter == expected
+
+    def test_explain_command_kinds(self) -> None:
+        find = _shape("meals.by_user").explain_command()
+        count = _shape("meals.count_by_user").explain_command()
+        aggregate = _shape("meals.aggregate_by_period").explain_command()
+
+        assert find["explain"]["sort"] == {"timestamp": -1}
+        assert find["verbosity"] == "executionStats"
+        assert count["explain"]["count"] == "meals"
+        assert aggregate["explain"]["pipeline"][0]["$match"]["user_id"]
+
+
+class TestAnalyzeExplain:
+    """Test explain analysis."""
+
+    def test_collscan_and_in_memory_sort_detected(self) -> None:
+        explain = {
+            "queryPlanner": {"winningPlan": {"stage": "SORT", "inputStage": {"stage": "COLLSCAN"}}},
+            "executionStats": {"nReturned": 2, "totalKeysExamined": 0, "totalDocsExamined": 500},
+        }
+
+        report = analyze_explain(_shape("meals.by_user"), explain)
+
+        assert report.collscan
+        assert report.in_memory_sort
+        assert report.examined_ratio == 250
+        assert not report.ok
+        assert "COLLSCAN" in report.problems
+        assert "in-memory SORT" in report.problems
+
+    def test_index_scan_is_ok(self) -> None:
+        explain = {
+            "queryPlanner": {
+                "winningPlan": {
+                    "queryPlan": {
+                        "stage": "LIMIT",
+                        "inputStage": {
+                            "stage": "FETCH",
+                            "inputStage": {"stage": "IXSCAN", "indexName": "idx_user_timestamp"},
+                        },
+                    }
+                }
+            },
+            "executionStats": {"nReturned": 20, "totalKeysExamined": 20, "totalDocsExamined": 20},
+        }
+
+        report = analyze_explain(_shape("meals.by_user"), explain)
+
+        assert report.indexes_used == ["idx_user_timestamp"]
+        assert report.ok
+
+    def test_aggregate_cursor_section(self) -> None:
+        explain = {
+            "stages": [
+                {
+                    "$cursor": {
+                        "queryPlanner": {
+                            "winningPlan": {
+                                "stage": "OR",
+                                "inputStages": [
+                                    {"stage": "IXSCAN", "indexName": "idx_user_timestamp"},
+                                    {"stage": "IXSCAN", "indexName": "idx_user_timestamp"},
+                                ],
+                            }
+                        },
+                        "executionStats": {"nReturned": 1, "totalDocsExamined": 50},
+                    }
+                },
+                {"$group": {}},
+            ]
+        }
+
+        report = analyze_explain(_shape("meals.aggregate_by_period"), explain, 10.0)
+
+        assert report.indexes_used == ["idx_user_timestamp"]
+        assert not report.collscan
+        assert report.problems == ["examined/returned ratio 50.0"]
+
+
+class TestCreateMissingIndexes:
+    """Test index creation from shape definitions."""
+
+    def test_index_spec_matches_prefix(self) -> None:
+        spec = IndexSpec("meals", (("user_id", 1), ("timestamp", -1)), "idx")
+
+        assert spec.matches({"user_id": 1, "timestamp": -1, "meal_type": 1})
+        assert not spec.matches({"user_id": 1, "created_at": -1})
+        assert not spec.matches({"user_id": 1})
+
+    def test_text_index_spec_matches_fts_key(self) -> None:
+        spec = IndexSpec("meals", (("user_id", 1), ("dish_name", "text"), ("notes", "text")), "t")
+
+        assert spec.matches({"user_id": 1, "_fts": "text", "_ftsx": 1})
+        assert not spec.matches({"user_id": 1, "timestamp": -1})
+
+    @pytest.mark.asyncio
+    async def test_creates_only_missing(self) -> None:
+        collections = {}
+
+        def get_collection(name):
+            if name not in collections:
+                collection = MagicMock()
+                existing = [{"key": {"_id": 1}}]
+                if name == "activity_events":
+                    existing.append({"key": {"user_id": 1, "ts": 1}})
+                collection.list_indexes.return_value.to_list = AsyncMock(return_value=existing)
+                collection.create_index = AsyncMock()
+                collections[name] = collection
+            return collections[name]
+
+        db = MagicMock()
+        db.__getitem__.side_effect = get_collection
+        db.list_collection_names = AsyncMock(return_value=["meals", "activity_events"])
+        shapes = [_shape("meals.by_user"), _shape("activity_events.by_user_ts_range")]
+
+        created = await create_missing_indexes(db, shapes)
+
+        assert [spec.name for spec in created] == ["idx_user_timestamp_id"]
+        collections["meals"].create_index.assert_awaited_once_with(
+            [("user_id", 1), ("timestamp", -1), ("_id", -1)],
+            name="idx_user_timestamp_id",
+            unique=False,
+        )
+        collections["activity_events"].create_index.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_skips_missing_timeseries_collection(self) -> None:
+        db = MagicMock()
+        db.list_collection_names = AsyncMock(return_value=["activity_events"])
+
+        created = await create_missing_indexes(db, [_shape("activity_events_ts.by_user_ts_range")])
+
+        assert created == []
+        db.__getitem__.assert_not_called()
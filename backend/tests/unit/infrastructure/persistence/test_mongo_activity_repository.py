@@ -0,0 +1,374 @@
+"""Unit tests for MongoActivityRepository batch idempotency and snapshot deltas.
+
+No MongoDB connection is opened: the motor client is lazy, and the
+activity_ingest_batches collection, the event insert and the snapshot
+collections are mocked.
+For tests against a real database, see tests/integration/infrastructure/
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo.errors import DuplicateKeyError
+
+from domain.activity.model import ActivityEvent, ActivitySource, HealthSnapshot
+from infrastructure.persistence.mongodb.activity_repository import (
+    DAILY_TOTALS_COLLECTION,
+    IDEMPOTENCY_CONFLICT,
+    INGEST_BATCH_TTL_SECONDS,
+    MongoActivityRepository,
+)
+
+_InsertResult = Tuple[int, int, List[Tuple[int, str]]]
+
+
+def _repository(
+    stored: Optional[Dict[str, Any]] = None, inserted: _InsertResult = (2, 0, [])
+) -> Tuple[MongoActivityRepository, MagicMock, AsyncMock]:
+    """Repository with mocked batches collection and event insert."""
+    repository = MongoActivityRepository(client=AsyncIOMotorClient("mongodb://localhost:27017"))
+    batches = MagicMock()
+    batches.find_one = AsyncMock(return_value=stored)
+    batches.insert_one = AsyncMock()
+    batches.create_index = AsyncMock()
+    insert_events = AsyncMock(return_value=inserted)
+    repository._db = MagicMock()
+    repository._db.__getitem__.return_value = batches
+    setattr(repository, "_insert_events", insert_events)
+    return repository, batches, insert_events
+
+
+def _events(steps: int = 10) -> List[ActivityEvent]:
+    return [
+        ActivityEvent(user_id="user123", ts=ts, steps=steps, source=ActivitySource.APPLE_HEALTH)
+        for ts in ("2025-11-13T10:00:00Z", "2025-11-13T10:01:00Z")
+    ]
+
+
+@pytest.mark.asyncio
+class TestBatchIdempotency:
+    """Test (user_id, key) -> signature + result records."""
+
+    async def test_without_key_inserts_directly(self) -> None:
+        repository, batches, _ = _repository()
+
+        assert await repository.ingest_events(_events()) == (2, 0, [])
+        batches.find_one.assert_not_awaited()
+
+    async def test_first_ingest_stores_record_with_ttl(self) -> None:
+        repository, batches, _ = _repository()
+
+        assert await repository.ingest_events(_events(), idempotency_key="k1") == (2, 0, [])
+
+        record = batches.insert_one.await_args.args[0]
+        assert record["_id"] == "user123:k1"
+        assert (record["accepted"], record["duplicates"]) == (2, 0)
+        assert record["signature"] == MongoActivityRepository._batch_signature(_events())
+        create_index = batches.create_index.await_args
+        assert create_index.kwargs["expireAfterSeconds"] == INGEST_BATCH_TTL_SECONDS
+
+    async def test_exact_replay_returns_stored_result_without_insert(self) -> None:
+        stored = {
+            "_id": "user123:k1",
+            "signature": MongoActivityRepository._batch_signature(_events()),
+            "accepted": 2,
+            "duplicates": 0,
+        }
+        repository, _, insert_events = _repository(stored)
+
+        # Unnormalized ts (seconds) normalize to the same signature
+        replay = _events()
+        replay[0] = ActivityEvent(
+            user_id="user123",
+            ts="2025-11-13T10:00:30Z",
+            steps=10,
+            source=ActivitySource.APPLE_HEALTH,
+        )
+        assert await repository.ingest_events(replay, idempotency_key="k1") == (2, 0, [])
+        insert_events.assert_not_awaited()
+
+    async def test_key_reuse_with_different_payload_is_conflict(self) -> None:
+        stored = {
+            "_id": "user123:k1",
+            "signature": MongoActivityRepository._batch_signature(_events()),
+            "accepted": 2,
+            "duplicates": 0,
+        }
+        repository, _, insert_events = _repository(stored)
+
+        result = await repository.ingest_events(_events(steps=11), idempotency_key="k1")
+
+        assert result == (0, 0, [(0, IDEMPOTENCY_CONFLICT), (1, IDEMPOTENCY_CONFLICT)])
+        insert_events.assert_not_awaited()
+
+    async def test_rejections_are_not_stored(self) -> None:
+        repository, batches, _ = _repository(inserted=(1, 0, [(1, "write error")]))
+
+        await repository.ingest_events(_events(), idempotency_key="k1")
+
+        batches.insert_one.assert_not_awaited()
+
+    async def test_concurrent_record_is_ignored(self) -> None:
+        repository, batches, _ = _repository()
+        batches.insert_one.side_effect = DuplicateKeyError("E11000")
+
+        assert await repository.ingest_events(_events(), idempotency_key="k1") == (2, 0, [])
+
+
+def _snapshot_repository(
+    last_totals: Optional[Dict[str, Any]] = None,
+    snapshot_docs: Optional[List[Dict[str, Any]]] = None,
+) -> Tuple[MongoActivityRepository, MagicMock, MagicMock]:
+    """Repository with mocked daily totals and snapshots collections."""
+    repository = MongoActivityRepository(client=AsyncIOMotorClient("mongodb://localhost:27017"))
+    totals = MagicMock()
+    totals.find_one_and_update = AsyncMock(return_value=last_totals)
+    totals.find_one = AsyncMock(return_value=last_totals)
+    snapshots = MagicMock()
+    snapshots.insert_one = AsyncMock()
+    snapshots.find_one = AsyncMock(return_value=None)
+    snapshots.update_one = AsyncMock(return_value=MagicMock(modified_count=1))
+    snapshots.delete_one = AsyncMock()
+    cursor = MagicMock()
+    cursor.sort.return_value.limit.return_value.to_list = AsyncMock(
+        return_value=snapshot_docs or []
+    )
+    snapshots.find.return_value = cursor
+    collections = {DAILY_TOTALS_COLLECTION: totals, "health_snapshots": snapshots}
+    repository._db = MagicMock()
+    repository._db.__getitem__.side_effect = collections.__getitem__
+    return repository, totals, snapshots
+
+
+def _snapshot(timestamp: str, steps: int, calories: float) -> HealthSnapshot:
+    return HealthSnapshot(
+        user_id="user123",
+        date="2025-11-13",
+        timestamp=timestamp,
+        steps_total=steps,
+        calories_out_total=calories,
+    )
+
+
+def _totals(timestamp: str, steps: int, calories: float) -> Dict[str, Any]:
+    return {
+        "_id": "user123_2025-11-13",
+        "user_id": "user123",
+        "date": "2025-11-13",
+        "timestamp": timestamp,
+        "steps_total": steps,
+        "calories_out_total": calories,
+        "hr_avg_session": None,
+    }
+
+
+@pytest.mark.asyncio
+class TestWriteTimeDeltas:
+    """Test last totals find_one_and_update and deltas stored on snapshots."""
+
+    async def test_delta_is_stored_before_totals_are_advanced(self) -> None:
+        previous = _totals("2025-11-13T08:00:00Z", 1000, 50.0)
+        repository, totals, snapshots = _snapshot_repository(previous)
+        snapshots.find_one.return_value = previous
+        calls = MagicMock()
+        calls.attach_mock(snapshots.insert_one, "insert")
+        calls.attach_mock(totals.find_one_and_update, "totals")
+
+        result = await repository.record_snapshot(_snapshot("2025-11-13T12:00:00Z", 4000, 180.0))
+
+        assert result["status"] == "new"
+        assert (result["delta"].steps_delta, result["delta"].calories_out_delta) == (3000, 130.0)
+        assert [name for name, _, _ in calls.mock_calls] == ["insert", "totals"]
+        snapshots.find_one.assert_awaited_once()
+        snapshots.update_one.assert_not_awaited()
+        doc = snapshots.insert_one.call_args.args[0]
+        assert (doc["steps_delta"], doc["calories_out_delta"]) == (3000, 130.0)
+        assert (doc["reset"], doc["duplicate"]) == (False, False)
+        assert doc["delta_base"] == "2025-11-13T08:00:00Z"
+
+        call = totals.find_one_and_update.call_args
+        assert call.args[0] == {"_id": "user123_2025-11-13"}
+        assert call.kwargs["upsert"] is True
+
+    async def test_failed_totals_update_deletes_snapshot(self) -> None:
+        repository, totals, snapshots = _snapshot_repository()
+        totals.find_one_and_update.side_effect = ConnectionError("primary stepped down")
+
+        with pytest.raises(ConnectionError):
+            await repository.record_snapshot(_snapshot("2025-11-13T08:00:00Z", 1000, 50.0))
+
+        doc = snapshots.insert_one.await_args.args[0]
+        snapshots.delete_one.assert_awaited_once_with({"_id": doc["_id"]})
+
+    async def test_reset_and_duplicate_flags_are_stored(self) -> None:
+        previous = _totals("2025-11-13T08:00:00Z", 1000, 50.0)
+        repository, _, snapshots = _snapshot_repository(previous)
+        snapshots.find_one.return_value = previous
+
+        reset = await repository.record_snapshot(_snapshot("2025-11-13T09:00:00Z", 200, 10.0))
+        unchanged = await repository.record_snapshot(_snapshot("2025-11-13T10:00:00Z", 1000, 50.0))
+
+        assert reset["delta"].reset and reset["delta"].steps_delta == 200
+        assert unchanged["delta"].duplicate
+        docs = [c.args[0] for c in snapshots.insert_one.await_args_list]
+        assert [(d["reset"], d["duplicate"]) for d in docs] == [(True, False), (False, True)]
+
+    async def test_first_of_day_has_no_delta_base(self) -> None:
+        repository, _, snapshots = _snapshot_repository()
+
+        result = await repository.record_snapshot(_snapshot("2025-11-13T08:00:00Z", 1000, 50.0))
+
+        assert result["delta"].steps_delta == 1000
+        assert snapshots.insert_one.await_args.args[0]["delta_base"] is None
+        snapshots.find_one.assert_awaited_once()
+        snapshots.update_one.assert_not_awaited()
+
+    async def test_replayed_snapshot_is_duplicate(self) -> None:
+        repository, totals, snapshots = _snapshot_repository(
+            _totals("2025-11-13T08:00:00Z", 1000, 50.0)
+        )
+        snapshots.insert_one.side_effect = DuplicateKeyError("E11000")
+
+        result = await repository.record_snapshot(_snapshot("2025-11-13T08:00:00Z", 1000, 50.0))
+
+        assert result["status"] == "duplicate"
+        totals.find_one_and_update.assert_not_awaited()
+
+    async def test_late_snapshot_rewrites_next_delta(self) -> None:
+        """t1=100, t3=300, then t2=200 late: stored deltas still sum to 300."""
+        t1 = {**_totals("2025-11-13T08:00:00Z", 100, 10.0), "steps_delta": 100}
+        t3 = {**_totals("2025-11-13T12:00:00Z", 300, 30.0), "steps_delta": 200}
+        repository, _, snapshots = _snapshot_repository(_totals("2025-11-13T12:00:00Z", 300, 30.0))
+        snapshots.find_one.side_effect = [t1, t1, t3]
+
+        result = await repository.record_snapshot(_snapshot("2025-11-13T10:00:00Z", 200, 20.0))
+
+        assert result["delta"].steps_delta == 100
+        next_query = snapshots.find_one.await_args_list[2]
+        assert next_query.args[0]["timestamp"] == {"$gt": "2025-11-13T10:00:00Z"}
+        assert next_query.kwargs["sort"] == [("timestamp", 1)]
+        update = snapshots.update_one.await_args
+        assert update.args[0]["_id"] == t3["_id"]
+        assert {"delta_base": {"$lt": "2025-11-13T10:00:00Z"}} in update.args[0]["$or"]
+        rewritten = update.args[1]["$set"]
+        assert (rewritten["steps_delta"], rewritten["calories_out_delta"]) == (100, 10.0)
+        assert rewritten["delta_base"] == "2025-11-13T10:00:00Z"
+        stored = [t1["steps_delta"], result["delta"].steps_delta, rewritten["steps_delta"]]
+        assert sum(stored) == 300
+
+    async def test_later_snapshot_recomputed_from_concurrent_late_one(self) -> None:
+        """t3 looks up t1, then late t2 is inserted and advances totals first: t3 uses t2."""
+        t1 = _totals("2025-11-13T08:00:00Z", 100, 10.0)
+        t2 = _totals("2025-11-13T10:00:00Z", 200, 20.0)
+        repository, _, snapshots = _snapshot_repository(t2)
+        snapshots.find_one.return_value = t1
+
+        result = await repository.record_snapshot(_snapshot("2025-11-13T12:00:00Z", 300, 30.0))
+
+        assert result["delta"].steps_delta == 100
+        inserted = snapshots.insert_one.await_args.args[0]
+        assert (inserted["steps_delta"], inserted["delta_base"]) == (200, t1["timestamp"])
+        update = snapshots.update_one.await_args
+        assert update.args[0]["_id"] == inserted["_id"]
+        assert (update.args[1]["$set"]["steps_delta"], update.args[1]["$set"]["delta_base"]) == (
+            100,
+            t2["timestamp"],
+        )
+
+    async def test_late_snapshot_interleaved_with_later_one(self) -> None:
+        """Late t2 re-reads its previous snapshot after advancing totals past a later t3."""
+        t1 = _totals("2025-11-13T08:00:00Z", 100, 10.0)
+        t15 = _totals("2025-11-13T09:00:00Z", 150, 15.0)
+        t3 = {**_totals("2025-11-13T12:00:00Z", 300, 30.0), "delta_base": t1["timestamp"]}
+        repository, _, snapshots = _snapshot_repository(t3)
+        # t2 saw t1; t1.5 was inserted before the totals update
+        snapshots.find_one.side_effect = [t1, t15, t3]
+
+        result = await repository.record_snapshot(_snapshot("2025-11-13T10:00:00Z", 200, 20.0))
+
+        assert result["delta"].steps_delta == 50
+        own, following = [c.args for c in snapshots.update_one.await_args_list]
+        assert own[1]["$set"]["delta_base"] == t15["timestamp"]
+        assert following[0]["_id"] == t3["_id"]
+        assert following[1]["$set"]["steps_delta"] == 100
+
+    async def test_superseded_rewrite_is_not_logged(self) -> None:
+        """A later base already stored on the next snapshot wins over the late one."""
+        t1 = _totals("2025-11-13T08:00:00Z", 100, 10.0)
+        t3 = _totals("2025-11-13T12:00:00Z", 300, 30.0)
+        repository, _, snapshots = _snapshot_repository(t3)
+        snapshots.find_one.side_effect = [t1, t1, t3]
+        snapshots.update_one.return_value = MagicMock(modified_count=0)
+
+        with patch("infrastructure.persistence.mongodb.activity_repository.logger") as logger:
+            await repository.record_snapshot(_snapshot("2025-11-13T10:00:00Z", 200, 20.0))
+
+        messages = [c.args[0] for c in logger.info.call_args_list]
+        assert not any("recomputed" in message for message in messages)
+
+    async def test_in_order_snapshot_does_not_rewrite(self) -> None:
+        previous = _totals("2025-11-13T08:00:00Z", 100, 10.0)
+        repository, _, snapshots = _snapshot_repository(previous)
+        snapshots.find_one.return_value = previous
+
+        await repository.record_snapshot(_snapshot("2025-11-13T10:00:00Z", 200, 20.0))
+
+        snapshots.update_one.assert_not_awaited()
+
+    async def test_replayed_late_snapshot_does_not_rewrite(self) -> None:
+        repository, _, snapshots = _snapshot_repository(_totals("2025-11-13T12:00:00Z", 300, 30.0))
+        snapshots.insert_one.side_effect = DuplicateKeyError("E11000")
+
+        result = await repository.record_snapshot(_snapshot("2025-11-13T10:00:00Z", 200, 20.0))
+
+        assert result["status"] == "duplicate"
+        snapshots.update_one.assert_not_awaited()
+
+    async def test_list_deltas_reads_stored_fields(self) -> None:
+        doc = {
+            **_totals("2025-11-13T12:00:00Z", 4000, 180.0),
+            "steps_delta": 3000,
+            "calories_out_delta": 130.0,
+            "reset": False,
+            "duplicate": False,
+        }
+        repository, _, snapshots = _snapshot_repository(snapshot_docs=[doc])
+
+        deltas = await repository.list_deltas("user123", "2025-11-13", "2025-11-13T08:00:00Z")
+
+        assert [(d.steps_delta, d.steps_total) for d in deltas] == [(3000, 4000)]
+        snapshots.find_one.assert_not_awaited()
+
+    async def test_list_deltas_recomputes_delta_from_other_base(self) -> None:
+        t1 = {**_totals("2025-11-13T08:00:00Z", 1000, 50.0), "delta_base": None}
+        t2 = {
+            **_totals("2025-11-13T10:00:00Z", 2500, 100.0),
+            "delta_base": "2025-11-13T09:00:00Z",  # deleted snapshot
+        }
+        for doc, steps in ((t1, 1000), (t2, 2500)):
+            doc.update(steps_delta=steps, calories_out_delta=0.0, reset=False, duplicate=False)
+        repository, _, _ = _snapshot_repository(snapshot_docs=[t1, t2])
+
+        deltas = await repository.list_deltas("user123", "2025-11-13")
+
+        assert [d.steps_delta for d in deltas] == [1000, 1500]
+
+    async def test_list_deltas_compares_legacy_snapshots_with_previous(self) -> None:
+        repository, _, snapshots = _snapshot_repository(
+            snapshot_docs=[_totals("2025-11-13T12:00:00Z", 4000, 180.0)]
+        )
+        snapshots.find_one.return_value = _totals("2025-11-13T08:00:00Z", 1000, 50.0)
+
+        deltas = await repository.list_deltas("user123", "2025-11-13", "2025-11-13T08:00:00Z")
+
+        assert [d.steps_delta for d in deltas] == [3000]
+
+    async def test_daily_totals_read_by_id(self) -> None:
+        repository, _, snapshots = _snapshot_repository(
+            _totals("2025-11-13T12:00:00Z", 4000, 180.0)
+        )
+
+        assert await repository.get_daily_totals("user123", "2025-11-13") == (4000, 180.0)
+        snapshots.find_one.assert_not_awaited()
@@ -0,0 +1,156 @@
+"""Unit tests for MongoActivityTimeSeriesRepository.
+
+No MongoDB connection is opened: the motor client is lazy, and the
+collection calls of ingest_events are mocked.
+For tests against a real database, see tests/integration/infrastructure/
+"""
+
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from pymongo.errors import BulkWriteError
+
+from domain.activity.model import (
+    NORMALIZATION_FAILED,
+    WRITE_FAILED,
+    ActivityEvent,
+    ActivitySource,
+)
+from infrastructure.persistence.mongodb.activity_timeseries_repository import (
+    MongoActivityTimeSeriesRepository,
+)
+
+
+def _repository() -> MongoActivityTimeSeriesRepository:
+    repository = MongoActivityTimeSeriesRepository(
+        client=AsyncIOMotorClient("mongodb://localhost:27017")
+    )
+    repository._collection_ready = True
+    return repository
+
+
+def _event(ts: str, steps: int = 10, user_id: str = "user123") -> ActivityEvent:
+    return ActivityEvent(user_id=user_id, ts=ts, steps=steps, source=ActivitySource.APPLE_HEALTH)
+
+
+class TestDocumentMapping:
+    """Test time-series measurement mapping."""
+
+    def test_to_document_writes_bson_date_without_id(self) -> None:
+        doc = _repository().to_document(_event("2025-11-13T10:30:00Z"))
+
+        assert "_id" not in doc
+        assert doc["ts"] == datetime(2025, 11, 13, 10, 30, tzinfo=timezone.utc)
+        assert doc["user_id"] == "user123"
+
+    def test_from_document_restores_iso_ts(self) -> None:
+        # The driver returns naive UTC datetimes (tz_aware=False)
+        event = _repository().from_document(
+            {"user_id": "user123", "ts": datetime(2025, 11, 13, 10, 30), "steps": 5}
+        )
+
+        assert event.ts == "2025-11-13T10:30:00Z"
+        assert (event.steps, event.hr_avg, event.source) == (5, None, ActivitySource.MANUAL)
+
+    def test_period_pipeline_uses_date_bounds(self) -> None:
+        repository = _repository()
+        starts = [repository._bound_to_date(datetime(2025, 11, day)) for day in (13, 14)]
+
+        pipeline = repository._period_pipeline("user123", starts, starts[-1])
+
+        assert pipeline[0]["$match"]["ts"]["$gte"] == datetime(2025, 11, 13, tzinfo=timezone.utc)
+
+
+@pytest.mark.asyncio
+class TestIngestDeduplication:
+    """Test duplicate detection without unique indexes."""
+
+    async def test_stored_and_repeated_minutes_are_duplicates(self) -> None:
+        repository = _repository()
+        repository._find_many = AsyncMock(  # type: ignore[method-assign]
+            return_value=[{"ts": datetime(2025, 11, 13, 10, 0)}]
+        )
+        repository._collection = MagicMock()
+        repository._collection.insert_many = AsyncMock(
+            return_value=MagicMock(inserted_ids=["a", "b"])
+        )
+
+        result = await repository.ingest_events(
+            [
+                _event("2025-11-13T10:00:00Z"),  # already stored
+                _event("2025-11-13T10:01:00Z"),
+                _event("2025-11-13T10:01:30Z"),  # same minute as previous
+                _event("2025-11-13T10:02:00Z"),
+            ]
+        )
+
+        assert result == (2, 2, [])
+        inserted = repository._collection.insert_many.await_args.args[0]
+        assert [doc["ts"].minute for doc in inserted] == [1, 2]
+
+    async def test_one_lookup_per_user(self) -> None:
+        repository = _repository()
+        repository._find_many = AsyncMock(return_value=[])  # type: ignore[method-assign]
+        repository._collection = MagicMock()
+        repository._collection.insert_many = AsyncMock(
+            return_value=MagicMock(inserted_ids=["a", "b", "c"])
+        )
+
+        await repository.ingest_events(
+            [
+                _event("2025-11-13T10:00:00Z", user_id="a"),
+                _event("2025-11-13T10:01:00Z", user_id="a"),
+                _event("2025-11-13T10:00:00Z", user_id="b"),
+            ]
+        )
+
+        filters = [call.args[0] for call in repository._find_many.await_args_list]
+        assert [(f["user_id"], len(f["ts"]["$in"])) for f in filters] == [("a", 2), ("b", 1)]
+
+
+@pytest.mark.asyncio
+class TestIngestRejections:
+    """Test rejection reasons are codes, with details only in the logs."""
+
+    async def test_unparseable_ts_is_normalization_failed(self) -> None:
+        repository = _repository()
+        repository._find_many = AsyncMock(return_value=[])  # type: ignore[method-assign]
+        repository._collection = MagicMock()
+        repository._collection.insert_many = AsyncMock(return_value=MagicMock(inserted_ids=["a"]))
+
+        result = await repository.ingest_events(
+            [_event("not-a-date"), _event("2025-11-13T10:00:00Z")]
+        )
+
+        assert result == (1, 0, [(0, NORMALIZATION_FAILED)])
+
+    async def test_write_errors_are_write_failed(self) -> None:
+        repository = _repository()
+        repository._find_many = AsyncMock(return_value=[])  # type: ignore[method-assign]
+        repository._collection = MagicMock()
+        repository._collection.insert_many = AsyncMock(
+            side_effect=BulkWriteError(
+                {"nInserted": 1, "writeErrors": [{"index": 1, "errmsg": "E11000 internal"}]}
+            )
+        )
+
+        result = await repository.ingest_events(
+            [_event("2025-11-13T10:00:00Z"), _event("2025-11-13T10:01:00Z")]
+        )
+
+        assert result == (1, 0, [(1, WRITE_FAILED)])
+
+    async def test_catastrophic_failure_hides_error_details(self) -> None:
+        repository = _repository()
+        repository._find_many = AsyncMock(  # type: ignore[method-assign]
+            side_effect=RuntimeError("auth failed for mongodb://admin@db-internal")
+        )
+
+        result = await repository.ingest_events(
+            [_event("2025-11-13T10:00:00Z"), _event("2025-11-13T10:01:00Z")]
+        )
+
+        assert result == (0, 0, [(0, WRITE_FAILED), (1, WRITE_FAILED)])
@@ -0,0 +1,397 @@
+"""Unit tests for MongoMealRepository document mapping.
+
+No MongoDB connection is opened: the motor client is lazy, and these
+tests only exercise document mapping and query building.
+For tests against a real database, see tests/integration/infrastructure/
+"""
+
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from domain.meal.core.entities.meal import Meal
+from domain.meal.core.entities.meal_entry import MealEntry
+from domain.shared.ports.meal_repository import MealCursor, MealProjection
+from infrastructure.persistence.mongodb.meal_repository import MongoMealRepository
+from metrics.core import registry
+
+
+def _repository(legacy_date_reads: bool, daily_rollup_reads: bool = True) -> MongoMealRepository:
+    client: AsyncIOMotorClient[Dict[str, Any]] = AsyncIOMotorClient("mongodb://localhost:27017")
+    return MongoMealRepository(
+        client=client,
+        legacy_date_reads=legacy_date_reads,
+        daily_rollup_reads=daily_rollup_reads,
+    )
+
+
+@pytest.fixture
+def sample_meal() -> Meal:
+    meal_id = uuid4()
+    rome = timezone(timedelta(hours=1))
+    entry = MealEntry(
+        id=uuid4(),
+        meal_id=meal_id,
+        name="pasta",
+        display_name="Pasta",
+        quantity_g=100.0,
+        calories=350,
+        protein=12.0,
+        carbs=70.0,
+        fat=1.5,
+    )
+    return Meal(
+        id=meal_id,
+        user_id="user123",
+        timestamp=datetime(2025, 11, 12, 13, 0, 0, tzinfo=rome),
+        meal_type="LUNCH",
+        entries=[entry],
+    )
+
+
+class TestDocumentDates:
+    """Test BSON date write and dual-read."""
+
+    def test_to_document_writes_utc_dates(self, sample_meal: Meal) -> None:
+        doc = _repository(legacy_date_reads=False).to_document(sample_meal)
+
+        assert doc["timestamp"] == datetime(2025, 11, 12, 12, 0, 0, tzinfo=timezone.utc)
+        assert doc["timestamp"].tzinfo == timezone.utc
+        assert doc["timestamp_offset"] == 60
+        assert isinstance(doc["created_at"], datetime)
+        assert isinstance(doc["entries"][0]["created_at"], datetime)
+
+    def test_from_document_reads_naive_bson_dates(self, sample_meal: Meal) -> None:
+        repository = _repository(legacy_date_reads=False)
+        doc = repository.to_document(sample_meal)
+        # Driver returns naive UTC datetimes when the client is not tz_aware
+        for field in ("timestamp", "created_at", "updated_at"):
+            doc[field] = doc[field].replace(tzinfo=None)
+
+        meal = repository.from_document(doc)
+
+        assert meal.timestamp == sample_meal.timestamp
+        assert meal.timestamp.utcoffset() == timedelta(hours=1)
+        assert meal.created_at.tzinfo == timezone.utc
+
+    def test_from_document_reads_legacy_iso_strings(self, sample_meal: Meal) -> None:
+        repository = _repository(legacy_date_reads=True)
+        doc = repository.to_document(sample_meal)
+        doc["timestamp"] = sample_meal.timestamp.isoformat()
+        doc["created_at"] = sample_meal.created_at.isoformat()
+        doc["updated_at"] = sample_meal.updated_at.isoformat()
+        doc["entries"][0]["created_at"] = sample_meal.entries[0].created_at.isoformat()
+
+        meal = repository.from_document(doc)
+
+        assert meal.timestamp == sample_meal.timestamp
+        assert meal.entries[0].created_at == sample_meal.entries[0].created_at
+
+
+class TestTimestampRangeFilter:
+    """Test range filter construction."""
+
+    def test_date_only_filter(self) -> None:
+        start = datetime(2025, 11, 12, tzinfo=timezone.utc)
+        end = start + timedelta(days=1)
+
+        filter_dict = _repository(legacy_date_reads=False)._timestamp_range_filter(start, end)
+
+        assert filter_dict == {"timestamp": {"$gte": start, "$lte": end}}
+
+    def test_dual_read_filter_matches_strings(self) -> None:
+        start = datetime(2025, 11, 12, tzinfo=timezone.utc)
+        end = start + timedelta(days=1)
+
+        filter_dict = _repository(legacy_date_reads=True)._timestamp_range_filter(start, end)
+
+        assert filter_dict == {
+            "$or": [
+                {"timestamp": {"$gte": start, "$lte": end}},
+                {"timestamp": {"$gte": start.isoformat(), "$lte": end.isoformat()}},
+            ]
+        }
+
+    def test_naive_datetime_rejected(self) -> None:
+        with pytest.raises(ValueError, match="timezone-aware"):
+            _repository(legacy_date_reads=False)._timestamp_range_filter(
+                datetime(2025, 11, 12), datetime(2025, 11, 13)
+            )
+
+
+class TestHistoryFilter:
+    """Test meal history filter construction."""
+
+    def test_meal_type_pushed_into_query(self) -> None:
+        filter_dict = _repository(legacy_date_reads=False)._history_filter(
+            "user123", meal_type="LUNCH"
+        )
+
+        assert filter_dict == {"user_id": "user123", "meal_type": "LUNCH"}
+
+    def test_open_ended_range(self) -> None:
+        start = datetime(2025, 11, 12, tzinfo=timezone.utc)
+
+        filter_dict = _repository(legacy_date_reads=False)._history_filter(
+            "user123", start_date=start
+        )
+
+        assert filter_dict == {"user_id": "user123", "timestamp": {"$gte": start}}
+
+    def test_cursor_filter_is_keyset_on_timestamp_and_id(self) -> None:
+        cursor = MealCursor(timestamp=datetime(2025, 11, 12, tzinfo=timezone.utc), meal_id=uuid4())
+
+        filter_dict = _repository(legacy_date_reads=False)._history_filter("user123", after=cursor)
+
+        assert filter_dict == {
+            "user_id": "user123",
+            "$or": [
+                {"timestamp": {"$lt": cursor.timestamp}},
+                {"timestamp": cursor.timestamp, "_id": {"$lt": str(cursor.meal_id)}},
+            ],
+        }
+
+    def test_range_and_cursor_combined_with_and(self) -> None:
+        start = datetime(2025, 11, 1, tzinfo=timezone.utc)
+        end = datetime(2025, 11, 30, tzinfo=timezone.utc)
+        cursor = MealCursor(timestamp=datetime(2025, 11, 12, tzinfo=timezone.utc), meal_id=uuid4())
+        repository = _repository(legacy_date_reads=True)
+
+        filter_dict = repository._history_filter("user123", start, end, after=cursor)
+
+        assert filter_dict["$and"][0] == repository._timestamp_range_filter(start, end)
+        assert len(filter_dict["$and"][1]["$or"]) == 4
+        assert {"timestamp": {"$lt": cursor.timestamp.isoformat()}} in filter_dict["$and"][1]["$or"]
+
+
+class TestProjection:
+    """Test read projections."""
+
+    def test_full_read_excludes_search_terms(self) -> None:
+        assert MongoMealRepository._projection(None) == {"search_terms": 0}
+
+    def test_partial_read_includes_required_fields(self) -> None:
+        projection = MealProjection(fields=frozenset({"id", "total_calories"}))
+
+        fields = MongoMealRepository._projection(projection)
+
+        assert fields == {
+            "_id": 1,
+            "created_at": 1,
+            "meal_type": 1,
+            "timestamp": 1,
+            "timestamp_offset": 1,
+            "total_calories": 1,
+            "updated_at": 1,
+            "user_id": 1,
+        }
+
+    def test_partial_document_maps_to_meal_without_entries(self, sample_meal: Meal) -> None:
+        repository = _repository(legacy_date_reads=False)
+        doc = repository.to_document(sample_meal)
+        fields = MongoMealRepository._projection(
+            MealProjection(fields=frozenset({"total_calories"}))
+        )
+
+        meal = repository.from_document({key: doc[key] for key in fields})
+
+        assert meal.id == sample_meal.id
+        assert meal.entries == []
+        assert meal.total_calories == sample_meal.total_calories
+
+
+class TestProjectedReads:
+    """Test projected reads decode only the loaded fields."""
+
+    @pytest.mark.asyncio
+    async def test_projected_reads_decode_partial_documents(self, sample_meal: Meal) -> None:
+        repository = _repository(legacy_date_reads=False)
+        doc = repository.to_document(sample_meal)
+        projection = MealProjection(fields=frozenset({"total_calories"}))
+        partial = {key: doc[key] for key in MongoMealRepository._projection(projection)}
+
+        with patch.object(repository, "_find_many", AsyncMock(return_value=[partial])):
+            meals = await repository.get_by_user("user123", projection=projection)
+
+        assert isinstance(meals[0], Meal)
+        assert meals[0].id == sample_meal.id
+        assert meals[0].entries == []
+        assert meals[0].total_calories == sample_meal.total_calories
+        assert meals[0].timestamp.utcoffset() == timedelta(hours=1)
+
+
+class TestSearch:
+    """Test search document fields and query."""
+
+    def test_to_document_writes_search_prefixes(self, sample_meal: Meal) -> None:
+        sample_meal.dish_name = "Caffè"
+
+        doc = _repository(legacy_date_reads=False).to_document(sample_meal)
+
+        assert {"ca", "caf", "caff", "caffe", "pa", "pasta"} <= set(doc["search_terms"])
+
+    @pytest.mark.asyncio
+    async def test_search_uses_text_index_with_all_terms(self) -> None:
+        repository = _repository(legacy_date_reads=False)
+
+        with patch.object(repository, "_find_many", AsyncMock(return_value=[])) as find_many:
+            await repository.search("user123", "Spag  all'Uovo", limit=10, offset=20)
+
+        filter_dict = find_many.call_args.args[0]
+        assert filter_dict == {
+            "user_id": "user123",
+            "$text": {"$search": "spag all uovo"},
+            "search_terms": {"$all": ["spag", "all", "uovo"]},
+        }
+        assert find_many.call_args.kwargs["sort"][0] == ("score", {"$meta": "textScore"})
+        assert find_many.call_args.kwargs["skip"] == 20
+        assert find_many.call_args.kwargs["limit"] == 10
+
+    @pytest.mark.asyncio
+    async def test_search_without_terms_skips_query(self) -> None:
+        repository = _repository(legacy_date_reads=False)
+
+        with patch.object(repository, "_find_many", AsyncMock()) as find_many:
+            assert await repository.search("user123", " ? ") == []
+
+        find_many.assert_not_called()
+
+
+class TestDailyRollups:
+    """Test daily rollup increments, reads and consistency check."""
+
+    @staticmethod
+    def _mock_rollups(repository: MongoMealRepository) -> MagicMock:
+        rollups = MagicMock()
+        rollups.bulk_write = AsyncMock()
+        repository._rollups = rollups
+        return rollups
+
+    @pytest.mark.asyncio
+    async def test_save_moves_totals_between_days(self, sample_meal: Meal) -> None:
+        repository = _repository(legacy_date_reads=False)
+        rollups = self._mock_rollups(repository)
+        sample_meal._recalculate_totals()
+        previous = repository.to_document(sample_meal)
+        sample_meal.timestamp = sample_meal.timestamp + timedelta(days=1)
+
+        with patch.object(
+            repository, "_find_one_and_update", AsyncMock(return_value=previous)
+        ) as find_one_and_update:
+            await repository.save(sample_meal)
+
+        assert find_one_and_update.call_args.kwargs["upsert"] is True
+        updates = rollups.bulk_write.call_args.args[0]
+        assert [u._filter["day"].date() for u in updates] == [
+            date(2025, 11, 12),
+            date(2025, 11, 13),
+        ]
+        assert updates[0]._doc["$inc"]["meal_count"] == -1
+        assert updates[0]._doc["$inc"]["breakdown_by_type.LUNCH"] == -350.0
+        assert updates[1]._doc["$inc"]["total_calories"] == 350
+        assert updates[1]._doc["$inc"]["meal_count_by_type.LUNCH"] == 1
+
+    @pytest.mark.asyncio
+    async def test_save_without_nutrition_change_skips_rollups(self, sample_meal: Meal) -> None:
+        repository = _repository(legacy_date_reads=False)
+        rollups = self._mock_rollups(repository)
+        previous = repository.to_document(sample_meal)
+        sample_meal.notes = "Edited notes"
+
+        with patch.object(repository, "_find_one_and_update", AsyncMock(return_value=previous)):
+            await repository.save(sample_meal)
+
+        rollups.bulk_write.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_delete_subtracts_meal(self, sample_meal: Meal) -> None:
+        repository = _repository(legacy_date_reads=False)
+        rollups = self._mock_rollups(repository)
+        deleted = repository.to_document(sample_meal)
+
+        with patch.object(repository, "_find_one_and_delete", AsyncMock(return_value=deleted)):
+            assert await repository.delete(sample_meal.id, "user123") is True
+
+        (update,) = rollups.bulk_write.call_args.args[0]
+        assert update._filter == {
+            "user_id": "user123",
+            "day": datetime(2025, 11, 12, tzinfo=timezone.utc),
+        }
+        assert update._doc["$inc"]["meal_count"] == -1
+
+    @pytest.mark.asyncio
+    async def test_rollup_failure_does_not_fail_write(self, sample_meal: Meal) -> None:
+        repository = _repository(legacy_date_reads=False)
+        rollups = self._mock_rollups(repository)
+        rollups.bulk_write.side_effect = RuntimeError("connection reset")
+        registry.reset()
+
+        with patch.object(repository, "_find_one_and_update", AsyncMock(return_value=None)):
+            await repository.save(sample_meal)
+
+        assert registry.counter("meal_rollup_write_errors").value() == 1
+        increments, dirty = [c.args[0] for c in rollups.bulk_write.await_args_list]
+        assert [u._filter for u in dirty] == [u._filter for u in increments]
+        assert dirty[0]._doc == {"$set": {"dirty": True}}
+
+    @pytest.mark.asyncio
+    async def test_dirty_rollup_day_falls_back_to_meals(self) -> None:
+        repository = _repository(legacy_date_reads=False)
+        dirty = {"day": datetime(2025, 11, 2, tzinfo=timezone.utc), "dirty": True}
+
+        with patch.object(
+            repository, "_find_rollups", AsyncMock(return_value={date(2025, 11, 2): dirty})
+        ):
+            totals = await repository.get_daily_totals(
+                "user123", date(2025, 11, 1), date(2025, 11, 2)
+            )
+
+        assert totals is None
+        assert MongoMealRepository.rollup_mismatches({}, {date(2025, 11, 2): dirty}) == [
+            date(2025, 11, 2)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_get_daily_totals_disabled_returns_none(self) -> None:
+        repository = _repository(legacy_date_reads=False, daily_rollup_reads=False)
+
+        assert (
+            await repository.get_daily_totals("user123", date(2025, 11, 1), date(2025, 11, 2))
+            is None
+        )
+
+    def test_rollup_from_document_skips_emptied_types(self) -> None:
+        totals = MongoMealRepository.rollup_from_document(
+            {
+                "meal_count": 1,
+                "total_calories": 300,
+                "breakdown_by_type": {"LUNCH": 300.0, "SNACK": 0.0},
+                "meal_count_by_type": {"LUNCH": 1, "SNACK": 0},
+            }
+        )
+
+        assert totals.meal_count == 1
+        assert totals.breakdown_by_type == {"LUNCH": 300.0}
+
+    def test_rollup_mismatches(self) -> None:
+        day = date(2025, 11, 12)
+        expected = {
+            day: {
+                "meal_count": 1,
+                "total_calories": 300,
+                "total_protein": 0.1 + 0.2,
+                "breakdown_by_type": {"LUNCH": 300.0},
+                "meal_count_by_type": {"LUNCH": 1},
+            }
+        }
+        stored_ok = {day: {**expected[day], "total_protein": 0.3}}
+        emptied = {date(2025, 11, 11): {"meal_count": 0}}
+        stored_wrong = {day: {**expected[day], "total_calories": 250}}
+
+        assert MongoMealRepository.rollup_mismatches(expected, {**stored_ok, **emptied}) == []
+        assert MongoMealRepository.rollup_mismatches(expected, stored_wrong) == [day]
+        assert MongoMealRepository.rollup_mismatches(expected, {}) == [day]
@@ -14,14 +14,16 @@ For integration tests with real database, see tests/integration/infrastructure/
 """
 
 import pytest
-from datetime import datetime, timezone, timedelta
-from uuid import uuid4
+import pytest_asyncio
+from datetime import date, datetime, timezone, timedelta
+from uuid import UUID, uuid4
 
 from infrastructure.persistence.in_memory.meal_repository import (
     InMemoryMealRepository,
 )
 from domain.meal.core.entities.meal import Meal
 from domain.meal.core.entities.meal_entry import MealEntry
+from domain.shared.ports.meal_repository import MealCursor, MealProjection
 
 
 @pytest.fixture
@@ -121,6 +123,26 @@ class TestSave:
         stored = repository._storage[sample_meal.id]
         assert stored.notes != "External modification"
 
+    @pytest.mark.asyncio
+    async def test_get_by_id_with_projection_skips_entries(
+        self, repository: InMemoryMealRepository, sample_meal: Meal
+    ) -> None:
+        """Test a projection without entries returns a meal without entries."""
+        await repository.save(sample_meal)
+
+        projection = MealProjection(fields=frozenset({"total_calories"}))
+        retrieved = await repository.get_by_id(sample_meal.id, "user123", projection=projection)
+
+        assert retrieved is not None
+        assert retrieved.entries == []
+        assert retrieved.total_calories == sample_meal.total_calories
+        assert len(repository._storage[sample_meal.id].entries) == 1
+
+    def test_projection_rejects_unknown_fields(self) -> None:
+        """Test projections only accept Meal field names."""
+        with pytest.raises(ValueError, match="calories"):
+            MealProjection(fields=frozenset({"calories"}))
+
 
 class TestGetById:
     """Test get_by_id method."""
@@ -173,6 +195,38 @@ class TestGetById:
         assert stored.notes != "External modification"
 
 
+class TestGetByIds:
+    """Test get_by_ids method."""
+
+    @pytest.mark.asyncio
+    async def test_get_by_ids_filters_missing_and_foreign(
+        self, repository: InMemoryMealRepository, sample_meal: Meal
+    ) -> None:
+        """Test batch lookup returns only meals owned by the user."""
+        await repository.save(sample_meal)
+
+        meals = await repository.get_by_ids([sample_meal.id, uuid4(), sample_meal.id], "user123")
+        foreign = await repository.get_by_ids([sample_meal.id], "user456")
+
+        assert [meal.id for meal in meals] == [sample_meal.id]
+        assert foreign == []
+
+    @pytest.mark.asyncio
+    async def test_get_by_ids_with_projection(
+        self, repository: InMemoryMealRepository, sample_meal: Meal
+    ) -> None:
+        """Test batch lookup honours the projection."""
+        await repository.save(sample_meal)
+
+        meals = await repository.get_by_ids(
+            [sample_meal.id],
+            "user123",
+            projection=MealProjection(fields=frozenset({"total_calories"})),
+        )
+
+        assert meals[0].entries == []
+
+
 class TestGetByUser:
     """Test get_by_user method."""
 
@@ -343,6 +397,325 @@ class TestGetByUserAndDateRange:
         assert meals[0].timestamp < meals[1].timestamp < meals[2].timestamp
 
 
+class TestAggregateByPeriod:
+    """Test aggregate_by_period method."""
+
+    @pytest.mark.asyncio
+    async def test_aggregate_by_period_empty(self, repository: InMemoryMealRepository) -> None:
+        """Test aggregation with no meals returns no periods."""
+        day = datetime(2025, 10, 21, tzinfo=timezone.utc)
+        periods = [(day, day + timedelta(hours=23, minutes=59, seconds=59))]
+
+        assert await repository.aggregate_by_period("user123", periods) == {}
+        assert await repository.aggregate_by_period("user123", []) == {}
+
+    @pytest.mark.asyncio
+    async def test_aggregate_by_period_buckets(self, repository: InMemoryMealRepository) -> None:
+        """Test meals are bucketed into their period with per-type breakdown."""
+        day = datetime(2025, 10, 21, tzinfo=timezone.utc)
+        periods = [
+            (day + timedelta(days=i), day + timedelta(days=i, hours=23, minutes=59, seconds=59))
+            for i in range(3)
+        ]
+
+        for offset, meal_type, calories in [
+            (timedelta(hours=8), "BREAKFAST", 300),
+            (timedelta(hours=13), "LUNCH", 450),
+            (timedelta(days=2, hours=20), "DINNER", 600),
+            (timedelta(days=2, hours=21), "DINNER", 100),
+            (timedelta(days=5), "DINNER", 999),  # out of range
+        ]:
+            await repository.save(
+                Meal(
+                    id=uuid4(),
+                    user_id="user123",
+                    timestamp=day + offset,
+                    meal_type=meal_type,
+                    total_calories=calories,
+                    total_protein=10.0,
+                )
+            )
+        await repository.save(
+            Meal(
+                id=uuid4(),
+                user_id="other_user",
+                timestamp=day + timedelta(hours=9),
+                meal_type="BREAKFAST",
+                total_calories=1000,
+            )
+        )
+
+        totals = await repository.aggregate_by_period("user123", periods)
+
+        assert set(totals) == {0, 2}
+        assert totals[0].total_calories == 750
+        assert totals[0].total_protein == 20.0
+        assert totals[0].meal_count == 2
+        assert totals[0].breakdown_by_type == {"BREAKFAST": 300.0, "LUNCH": 450.0}
+        assert totals[2].total_calories == 700
+        assert totals[2].breakdown_by_type == {"DINNER": 700.0}
+
+
+class TestDailyRollups:
+    """Test daily rollups maintained on save and delete."""
+
+    @pytest.mark.asyncio
+    async def test_rollups_follow_save_update_and_delete(
+        self, repository: InMemoryMealRepository
+    ) -> None:
+        """Test rollups move with the meal and drop emptied days and types."""
+        day = datetime(2025, 10, 21, 12, 0, tzinfo=timezone.utc)
+        lunch = Meal(
+            id=uuid4(),
+            user_id="user123",
+            timestamp=day,
+            meal_type="LUNCH",
+            total_calories=500,
+            total_protein=20.0,
+        )
+        snack = Meal(
+            id=uuid4(),
+            user_id="user123",
+            timestamp=day,
+            meal_type="SNACK",
+            total_calories=100,
+        )
+        await repository.save(lunch)
+        await repository.save(snack)
+
+        totals = await repository.get_daily_totals("user123", date(2025, 10, 21), day.date())
+        assert totals is not None
+        assert totals[day.date()].meal_count == 2
+        assert totals[day.date()].total_calories == 600
+        assert totals[day.date()].breakdown_by_type == {"LUNCH": 500.0, "SNACK": 100.0}
+
+        # Re-saving moves the meal to its new day and type
+        lunch.timestamp = day + timedelta(days=1)
+        lunch.meal_type = "DINNER"
+        await repository.save(lunch)
+        totals = await repository.get_daily_totals(
+            "user123", date(2025, 10, 20), date(2025, 10, 23)
+        )
+        assert totals is not None
+        assert totals[date(2025, 10, 21)].breakdown_by_type == {"SNACK": 100.0}
+        assert totals[date(2025, 10, 22)].total_protein == 20.0
+
+        await repository.delete(snack.id, "user123")
+        totals = await repository.get_daily_totals(
+            "user123", date(2025, 10, 20), date(2025, 10, 23)
+        )
+        assert totals is not None
+        assert set(totals) == {date(2025, 10, 22)}
+        assert await repository.get_daily_totals("other_user", day.date(), day.date()) == {}
+
+    @pytest.mark.asyncio
+    async def test_rollup_day_is_utc_day(self, repository: InMemoryMealRepository) -> None:
+        """Test meals are rolled up on their UTC day, whatever their offset."""
+        rome = timezone(timedelta(hours=2))
+        await repository.save(
+            Meal(
+                id=uuid4(),
+                user_id="user123",
+                timestamp=datetime(2025, 10, 22, 1, 0, tzinfo=rome),
+                meal_type="SNACK",
+                total_calories=100,
+            )
+        )
+
+        totals = await repository.get_daily_totals(
+            "user123", date(2025, 10, 21), date(2025, 10, 22)
+        )
+
+        assert totals is not None
+        assert set(totals) == {date(2025, 10, 21)}
+
+
+class TestHistoryPage:
+    """Test get_history_page and count_history methods."""
+
+    @pytest_asyncio.fixture
+    async def history(self, repository: InMemoryMealRepository) -> list[Meal]:
+        """Save 6 meals (one per hour, alternating types) plus a foreign one."""
+        day = datetime(2025, 10, 21, 6, tzinfo=timezone.utc)
+        meals = []
+        for i in range(6):
+            meal = Meal(
+                id=uuid4(),
+                user_id="user123",
+                timestamp=day + timedelta(hours=i),
+                meal_type="LUNCH" if i % 2 else "SNACK",
+            )
+            await repository.save(meal)
+            meals.append(meal)
+        await repository.save(
+            Meal(id=uuid4(), user_id="other_user", timestamp=day, meal_type="LUNCH")
+        )
+        return meals
+
+    @pytest.mark.asyncio
+    async def test_meal_type_filtered_before_paging(
+        self, repository: InMemoryMealRepository, history: list[Meal]
+    ) -> None:
+        """Test pages are full even when filtering by meal type."""
+        page = await repository.get_history_page("user123", limit=2, meal_type="LUNCH")
+
+        assert [m.id for m in page] == [history[5].id, history[3].id]
+        assert await repository.count_history("user123", meal_type="LUNCH") == 3
+
+    @pytest.mark.asyncio
+    async def test_keyset_pages_cover_history(
+        self, repository: InMemoryMealRepository, history: list[Meal]
+    ) -> None:
+        """Test walking cursors returns every meal once, newest first."""
+        seen: list[UUID] = []
+        after: MealCursor | None = None
+        while True:
+            page = await repository.get_history_page("user123", limit=4, after=after)
+            seen.extend(m.id for m in page)
+            if len(page) < 4:
+                break
+            after = MealCursor.from_meal(page[-1])
+
+        assert seen == [m.id for m in reversed(history)]
+
+    @pytest.mark.asyncio
+    async def test_cursor_breaks_timestamp_ties_by_id(
+        self, repository: InMemoryMealRepository
+    ) -> None:
+        """Test meals sharing a timestamp are neither skipped nor repeated."""
+        ts = datetime(2025, 10, 21, 12, tzinfo=timezone.utc)
+        for _ in range(3):
+            await repository.save(
+                Meal(id=uuid4(), user_id="user123", timestamp=ts, meal_type="SNACK")
+            )
+
+        first = await repository.get_history_page("user123", limit=1)
+        rest = await repository.get_history_page(
+            "user123", limit=10, after=MealCursor.from_meal(first[0])
+        )
+
+        assert len(rest) == 2
+        assert first[0].id not in {m.id for m in rest}
+
+    @pytest.mark.asyncio
+    async def test_date_range_and_offset(
+        self, repository: InMemoryMealRepository, history: list[Meal]
+    ) -> None:
+        """Test date range bounds are inclusive and offset applies after filters."""
+        start, end = history[1].timestamp, history[4].timestamp
+
+        page = await repository.get_history_page(
+            "user123", limit=10, start_date=start, end_date=end, offset=1
+        )
+
+        assert [m.id for m in page] == [history[3].id, history[2].id, history[1].id]
+        assert await repository.count_history("user123", start_date=start, end_date=end) == 4
+
+
+class TestSearch:
+    """Test search inverted index maintenance."""
+
+    @pytest.mark.asyncio
+    async def test_accent_insensitive_prefix_search(
+        self, repository: InMemoryMealRepository
+    ) -> None:
+        """Test accented names match unaccented prefixes and vice versa."""
+        meal = Meal(
+            id=uuid4(),
+            user_id="user123",
+            timestamp=datetime.now(timezone.utc),
+            meal_type="BREAKFAST",
+            dish_name="Caffè e brioche",
+        )
+        await repository.save(meal)
+
+        assert [m.id for m in await repository.search("user123", "caff")] == [meal.id]
+        assert [m.id for m in await repository.search("user123", "CAFFÈ")] == [meal.id]
+        assert await repository.search("other_user", "caffe") == []
+        assert await repository.search("user123", "'") == []
+
+    @pytest.mark.asyncio
+    async def test_index_follows_save_and_delete(
+        self, repository: InMemoryMealRepository, sample_meal: Meal
+    ) -> None:
+        """Test re-saving replaces indexed tokens and delete removes them."""
+        await repository.save(sample_meal)
+        assert len(await repository.search("user123", "pollo")) == 1
+
+        sample_meal.dish_name = "Risotto ai funghi"
+        sample_meal.entries = []
+        await repository.save(sample_meal)
+        assert await repository.search("user123", "pollo") == []
+        assert len(await repository.search("user123", "risot")) == 1
+
+        await repository.delete(sample_meal.id, "user123")
+        assert await repository.search("user123", "risotto") == []
+        assert repository._search_tokens["user123"] == []
+
+
+class TestSortedKeys:
+    """Test per-user sorted keys backing listing, range and count queries."""
+
+    @pytest.mark.asyncio
+    async def test_keys_follow_timestamp_change_and_delete(
+        self, repository: InMemoryMealRepository, sample_meal: Meal
+    ) -> None:
+        """Test re-saving moves the meal in the order and delete drops its key."""
+        older = Meal(
+            id=uuid4(),
+            user_id="user123",
+            timestamp=sample_meal.timestamp - timedelta(hours=2),
+            meal_type="BREAKFAST",
+        )
+        await repository.save(sample_meal)
+        await repository.save(older)
+        assert [m.id for m in await repository.get_by_user("user123")] == [
+            sample_meal.id,
+            older.id,
+        ]
+
+        sample_meal.timestamp = older.timestamp - timedelta(hours=1)
+        await repository.save(sample_meal)
+        assert [m.id for m in await repository.get_by_user("user123")] == [
+            older.id,
+            sample_meal.id,
+        ]
+        assert await repository.count_by_user("user123") == 2
+        assert len(repository._user_keys["user123"]) == 2
+
+        await repository.delete(sample_meal.id, "user123")
+        await repository.delete(older.id, "user123")
+        assert await repository.count_by_user("user123") == 0
+        assert "user123" not in repository._user_keys
+
+    @pytest.mark.asyncio
+    async def test_get_by_user_offset_beyond_end(
+        self, repository: InMemoryMealRepository, sample_meal: Meal
+    ) -> None:
+        """Test pages past the last meal are empty."""
+        await repository.save(sample_meal)
+
+        assert await repository.get_by_user("user123", limit=10, offset=1) == []
+        assert await repository.get_by_user("user123", limit=0) == []
+
+    @pytest.mark.asyncio
+    async def test_returned_entries_are_isolated(
+        self, repository: InMemoryMealRepository, sample_meal: Meal
+    ) -> None:
+        """Test mutating returned entries does not touch stored entries."""
+        await repository.save(sample_meal)
+        sample_meal.entries[0].quantity_g = 999.0
+
+        retrieved = (await repository.get_by_user("user123"))[0]
+        assert retrieved.entries[0].quantity_g == 150.0
+
+        retrieved.entries[0].display_name = "Modified"
+        retrieved.entries.clear()
+        stored = repository._storage[sample_meal.id]
+        assert len(stored.entries) == 1
+        assert stored.entries[0].display_name == "Petto di pollo"
+
+
 class TestDelete:
     """Test delete method."""
 
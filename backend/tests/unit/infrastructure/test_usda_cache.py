@@ -0,0 +1,160 @@
+"""Unit tests for the two-tier USDA nutrient cache.
+
+Tests focus on:
+- Label selections, negative entries and nutrients with TTLs
+- Disk tier (SQLite) surviving a new cache instance
+- Warm USDAClient lookups without network calls
+- Hit-ratio metrics
+"""
+
+from pathlib import Path
+import threading
+from typing import Any, List
+from unittest.mock import AsyncMock
+
+import pytest
+
+from infrastructure.external_apis.usda.cache import USDANutrientCache
+from infrastructure.external_apis.usda.client import USDAClient
+from metrics.core import registry
+
+NUTRIENTS = {"calories": 131.0, "protein": 5.0, "carbs": 25.0, "fat": 1.1}
+
+
+@pytest.mark.asyncio
+class TestUSDANutrientCache:
+    """Test cache entries, TTLs and tiers."""
+
+    async def test_label_and_food_round_trip(self) -> None:
+        cache = USDANutrientCache()
+        await cache.put_label("pasta", 168927)
+        await cache.put_food(168927, NUTRIENTS)
+
+        entry = await cache.get_label("pasta")
+        assert entry is not None and entry.fdc_id == 168927
+        assert await cache.get_food(168927) == NUTRIENTS
+        assert await cache.get_label("rice") is None
+
+    async def test_negative_entry_expires_before_positive(self) -> None:
+        clock = [1000.0]
+        cache = USDANutrientCache(ttl_seconds=3600, negative_ttl_seconds=60, clock=lambda: clock[0])
+        await cache.put_label("xyzzy", None)
+        await cache.put_label("pasta", 168927)
+
+        entry = await cache.get_label("xyzzy")
+        assert entry is not None and entry.fdc_id is None
+        clock[0] += 61
+        assert await cache.get_label("xyzzy") is None
+        assert await cache.get_label("pasta") is not None
+
+    async def test_disk_tier_survives_new_instance(self, tmp_path: Path) -> None:
+        path = str(tmp_path / "usda.sqlite3")
+        cache = USDANutrientCache(path=path)
+        await cache.put_label("pasta", 168927)
+        await cache.put_food(168927, NUTRIENTS)
+        cache.close()
+
+        restarted = USDANutrientCache(path=path)
+        entry = await restarted.get_label("pasta")
+        assert entry is not None and entry.fdc_id == 168927
+        assert await restarted.get_food(168927) == NUTRIENTS
+
+    async def test_memory_tier_is_bounded(self, tmp_path: Path) -> None:
+        cache = USDANutrientCache(path=str(tmp_path / "usda.sqlite3"), max_memory_entries=2)
+        for fdc_id in (1, 2, 3):
+            await cache.put_food(fdc_id, NUTRIENTS)
+
+        assert len(cache._memory) == 2
+        assert await cache.get_food(1) == NUTRIENTS  # served by the disk tier
+
+    async def test_disk_reads_and_writes_run_off_the_event_loop(self, tmp_path: Path) -> None:
+        cache = USDANutrientCache(path=str(tmp_path / "usda.sqlite3"), max_memory_entries=1)
+        threads = []
+        connection = cache._connection
+
+        def record_thread() -> Any:
+            threads.append(threading.get_ident())
+            return connection()
+
+        cache._connection = record_thread  # type: ignore[method-assign]
+        await cache.put_foods({1: NUTRIENTS, 2: NUTRIENTS})
+        found = await cache.get_foods([1, 2, 3])
+
+        assert found == {1: NUTRIENTS, 2: NUTRIENTS}
+        assert len(threads) == 2  # one write transaction, one read for the misses
+        assert threading.get_ident() not in threads
+
+    async def test_purge_expired(self, tmp_path: Path) -> None:
+        clock = [1000.0]
+        cache = USDANutrientCache(
+            path=str(tmp_path / "usda.sqlite3"), negative_ttl_seconds=60, clock=lambda: clock[0]
+        )
+        await cache.put_label("xyzzy", None)
+        await cache.put_label("pasta", 168927)
+        clock[0] += 61
+
+        assert cache.purge_expired() == 1
+
+    async def test_hit_ratio_metrics(self) -> None:
+        cache = USDANutrientCache()
+        await cache.put_label("pasta", 168927)
+        await cache.get_label("pasta")
+        await cache.get_label("rice")
+
+        assert cache.stats()["label"] == {"lookups": 2, "hits": 1, "hit_ratio": 0.5}
+        gauges = {
+            g["tags"]["kind"]: g["value"]
+            for g in registry.snapshot()["gauges"]
+            if g["name"] == "usda_cache_hit_ratio"
+        }
+        assert gauges["label"] == 0.5
+
+
+@pytest.mark.asyncio
+class TestUSDAClientWithCache:
+    """Test USDAClient.get_nutrients cache integration."""
+
+    @staticmethod
+    def _client(cache: USDANutrientCache, foods: Any) -> USDAClient:
+        client = USDAClient(api_key="test-key", cache=cache)
+        client._session = AsyncMock()
+        client._search_foods = AsyncMock(return_value=foods)
+        details = {1: {**NUTRIENTS, "calories": 0.0}, 2: NUTRIENTS}
+        client.get_nutrients_by_ids = AsyncMock(
+            side_effect=lambda fdc_ids: {fdc_id: details[fdc_id] for fdc_id in fdc_ids}
+        )
+        client.get_nutrients_by_id = AsyncMock(side_effect=lambda fdc_id: details[fdc_id])
+        return client
+
+    async def test_warm_lookup_skips_network(self) -> None:
+        foods: List[Any] = [
+            {"fdcId": 1, "description": "Pasta, dry, enriched"},
+            {"fdcId": 2, "description": "Pasta, cooked, enriched"},
+        ]
+        client = self._client(USDANutrientCache(), foods)
+
+        cold = await client.get_nutrients("Pasta", 100.0)
+        searches = client._search_foods.await_count
+        fetches = client.get_nutrients_by_ids.await_count
+        warm = await client.get_nutrients("pasta", 100.0)
+
+        assert cold is not None and warm is not None
+        assert warm.calories == cold.calories == 131
+        assert (searches, fetches) == (1, 1)
+        assert client._search_foods.await_count == searches
+        assert client.get_nutrients_by_ids.await_count == fetches
+        assert client.get_nutrients_by_id.await_count == 0
+
+    async def test_no_valid_result_is_cached(self) -> None:
+        client = self._client(USDANutrientCache(), [])
+
+        assert await client.get_nutrients("xyzzy", 100.0) is None
+        assert await client.get_nutrients("xyzzy", 100.0) is None
+        assert client._search_foods.await_count == 1
+
+    async def test_search_error_is_not_cached(self) -> None:
+        client = self._client(USDANutrientCache(), None)
+
+        assert await client.get_nutrients("pasta", 100.0) is None
+        assert await client.get_nutrients("pasta", 100.0) is None
+        assert client._search_foods.await_count == 2
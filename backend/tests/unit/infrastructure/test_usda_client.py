@@ -242,21 +242,15 @@ class TestGetNutrients:
         search_mock.__aenter__ = AsyncMock(return_value=search_mock)
         search_mock.__aexit__ = AsyncMock(return_value=None)
 
-        # Mock detail response
+        # Mock multi-id detail response
         detail_mock = MagicMock()
         detail_mock.status = 200
-        detail_mock.json = AsyncMock(return_value=sample_usda_detail_response)
+        detail_mock.json = AsyncMock(return_value=[sample_usda_detail_response])
         detail_mock.__aenter__ = AsyncMock(return_value=detail_mock)
         detail_mock.__aexit__ = AsyncMock(return_value=None)
 
-        # Setup session to return different mocks for different endpoints
-        def mock_get(url: str, **kwargs: Any) -> Any:
-            if "search" in url:
-                return search_mock
-            else:
-                return detail_mock
-
-        usda_client._session.get = mock_get
+        usda_client._session.get = MagicMock(return_value=search_mock)
+        usda_client._session.post = MagicMock(return_value=detail_mock)
 
         # Execute
         profile = await usda_client.get_nutrients("chicken breast", 100.0)
@@ -329,14 +323,8 @@ class TestGetNutrients:
         detail_mock.__aenter__ = AsyncMock(return_value=detail_mock)
         detail_mock.__aexit__ = AsyncMock(return_value=None)
 
-        # Setup session to return different mocks
-        def mock_get(url: str, **kwargs: Any) -> Any:
-            if "search" in url:
-                return search_mock
-            else:
-                return detail_mock
-
-        usda_client._session.get = mock_get
+        usda_client._session.get = MagicMock(return_value=search_mock)
+        usda_client._session.post = MagicMock(return_value=detail_mock)
 
         # Execute
         profile = await usda_client.get_nutrients("chicken", 100.0)
@@ -357,6 +345,114 @@ class TestGetNutrients:
         assert result is None
 
 
+class TestBatchedDetails:
+    """Test candidate selection with at most one multi-id detail request."""
+
+    @staticmethod
+    def _response(status: int, payload: Any) -> MagicMock:
+        response = MagicMock()
+        response.status = status
+        response.json = AsyncMock(return_value=payload)
+        response.__aenter__ = AsyncMock(return_value=response)
+        response.__aexit__ = AsyncMock(return_value=None)
+        return response
+
+    @staticmethod
+    def _hit(fdc_id: int, description: str, calories: float) -> dict[str, Any]:
+        nutrient_ids = (1008, 1003, 1005, 1004, 1079, 1063, 1093)
+        values = (calories, 5.0, 25.0, 1.1, 1.8, 0.6, 1.0)
+        return {
+            "fdcId": fdc_id,
+            "description": description,
+            "foodNutrients": [
+                {"nutrientId": nutrient_id, "value": value}
+                for nutrient_id, value in zip(nutrient_ids, values)
+            ],
+        }
+
+    @pytest.mark.asyncio
+    async def test_complete_search_hits_skip_detail_requests(self, usda_client: USDAClient) -> None:
+        foods = [
+            self._hit(1, "Pasta, dry, enriched", 371.0),
+            self._hit(2, "Pasta, cooked, enriched", 131.0),
+        ]
+        usda_client._session.get = MagicMock(return_value=self._response(200, {"foods": foods}))
+        usda_client._session.post = MagicMock()
+
+        profile = await usda_client.get_nutrients("pasta", 100.0)
+
+        assert profile is not None
+        # "dry" is not penalized: search order wins the naturalness tie
+        assert profile.calories == 371
+        assert profile.fiber == 1.8
+        usda_client._session.post.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_incomplete_candidates_fetched_in_one_request(
+        self, usda_client: USDAClient, sample_usda_detail_response: dict[str, Any]
+    ) -> None:
+        foods = [
+            {"fdcId": 10, "description": "Chicken breast, powder"},
+            {"fdcId": 11, "description": "Chicken breast, cooked"},
+            {"fdcId": 173096, "description": "Chicken breast, raw"},
+            {"fdcId": 12, "description": "Chicken breast, roasted"},
+        ]
+        zero = {"fdcId": 11, "foodNutrients": [{"nutrient": {"id": 1008}, "amount": 0}]}
+        usda_client._session.get = MagicMock(return_value=self._response(200, {"foods": foods}))
+        usda_client._session.post = MagicMock(
+            return_value=self._response(200, [sample_usda_detail_response, zero])
+        )
+
+        profile = await usda_client.get_nutrients("chicken breast", 100.0)
+
+        assert profile is not None
+        assert profile.calories == 110
+        usda_client._session.post.assert_called_once()
+        body = usda_client._session.post.call_args.kwargs["json"]
+        # Naturalness order: raw first, the powder last
+        assert body["fdcIds"] == [173096, 11, 12, 10]
+
+    @pytest.mark.asyncio
+    async def test_only_candidates_before_first_valid_are_fetched(
+        self, usda_client: USDAClient, sample_usda_detail_response: dict[str, Any]
+    ) -> None:
+        foods = [
+            {"fdcId": 173096, "description": "Chicken breast, raw"},
+            self._hit(2, "Chicken breast, roasted", 165.0),
+            {"fdcId": 3, "description": "Chicken breast, fried"},
+        ]
+        usda_client._session.get = MagicMock(return_value=self._response(200, {"foods": foods}))
+        usda_client._session.post = MagicMock(
+            return_value=self._response(200, [sample_usda_detail_response])
+        )
+
+        profile = await usda_client.get_nutrients("chicken breast", 100.0)
+
+        assert profile is not None
+        assert profile.calories == 110
+        assert usda_client._session.post.call_args.kwargs["json"]["fdcIds"] == [173096]
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_falls_back_to_known_candidates(
+        self, usda_client: USDAClient
+    ) -> None:
+        foods = [
+            {"fdcId": 1, "description": "Rice, white, raw"},
+            self._hit(2, "Rice, white, cooked", 130.0),
+        ]
+        usda_client._session.get = MagicMock(return_value=self._response(200, {"foods": foods}))
+        usda_client._session.post = MagicMock(return_value=self._response(500, None))
+
+        profile = await usda_client.get_nutrients("rice", 100.0)
+
+        assert profile is not None
+        assert profile.calories == 130
+
+    @pytest.mark.asyncio
+    async def test_get_nutrients_by_ids_empty(self, usda_client: USDAClient) -> None:
+        assert await usda_client.get_nutrients_by_ids([]) == {}
+
+
 class TestNutrientExtraction:
     """Test _extract_nutrients method."""
 
@@ -0,0 +1,182 @@
+"""Unit tests for the local FoodData Central index and provider."""
+
+import json
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+
+from infrastructure.external_apis.usda.local_index import (
+    FDCFood,
+    FDCLocalIndex,
+    iter_fdc_json_foods,
+    trigrams,
+    write_local_index,
+)
+from infrastructure.external_apis.usda.local_provider import USDALocalProvider
+
+
+def _nutrients(calories: float, protein: float = 1.0) -> Dict[str, float]:
+    return {
+        "calories": calories,
+        "protein": protein,
+        "carbs": 10.0,
+        "fat": 0.5,
+        "fiber": 1.0,
+        "sugar": 0.5,
+        "sodium": 5.0,
+    }
+
+
+FOODS: List[FDCFood] = [
+    FDCFood(170026, "Potatoes, flesh and skin, raw", _nutrients(77, 2.05)),
+    FDCFood(170027, "Potatoes, french fried, frozen, home-prepared", _nutrients(158)),
+    FDCFood(170028, "Potato flour", _nutrients(357)),
+    FDCFood(170029, "Potatoes, mashed, dehydrated, flakes without milk", _nutrients(354)),
+    FDCFood(171287, "Egg, whole, raw, fresh", _nutrients(143, 12.6)),
+    FDCFood(172183, "Egg, white, raw, fresh", _nutrients(52, 10.9)),
+    FDCFood(171077, "Chicken, broilers or fryers, breast, meat only, raw", _nutrients(120, 22.5)),
+    FDCFood(173944, "Bananas, raw", _nutrients(89, 1.09)),
+    FDCFood(173945, "Bananas, dehydrated, or banana powder", _nutrients(346)),
+    FDCFood(171881, "Water, tap, drinking", _nutrients(0, 0.0)),
+]
+
+
+@pytest.fixture
+def index_path(tmp_path: Path) -> str:
+    path = str(tmp_path / "fdc_local")
+    write_local_index(path, FOODS, sources=["test.json"])
+    return path
+
+
+@pytest.fixture
+def provider(index_path: str) -> USDALocalProvider:
+    return USDALocalProvider(index_path)
+
+
+class TestFDCLocalIndex:
+    """Test index build, memory mapping and search."""
+
+    def test_round_trip(self, index_path: str) -> None:
+        index = FDCLocalIndex(index_path)
+
+        assert len(index) == len(FOODS)
+        assert index.meta["sources"] == ["test.json"]
+        rows = {index.fdc_id(row): row for row in range(len(index))}
+        row = rows[170026]
+        assert index.description(row) == "Potatoes, flesh and skin, raw"
+        assert index.nutrients(row)["protein"] == 2.05
+
+    def test_search_ranks_full_matches_first(self, index_path: str) -> None:
+        index = FDCLocalIndex(index_path)
+
+        rows = index.search("chicken breast raw", limit=3)
+
+        assert index.fdc_id(rows[0]) == 171077
+
+    def test_search_matches_plurals_through_trigrams(self, index_path: str) -> None:
+        index = FDCLocalIndex(index_path)
+
+        descriptions = [index.description(row) for row in index.search("banana", limit=8)]
+
+        assert "Bananas, raw" in descriptions
+
+    def test_search_without_match(self, index_path: str) -> None:
+        index = FDCLocalIndex(index_path)
+
+        assert index.search("quinoa", limit=8) == []
+        assert index.search("", limit=8) == []
+
+    def test_rebuild_replaces_index(self, index_path: str) -> None:
+        write_local_index(index_path, FOODS[:2] + [FOODS[0]])
+
+        index = FDCLocalIndex(index_path)
+        assert len(index) == 2
+        assert not Path(f"{index_path}.tmp").exists()
+        assert not Path(f"{index_path}.old").exists()
+
+    def test_missing_index(self, tmp_path: Path) -> None:
+        assert not FDCLocalIndex.exists(str(tmp_path))
+        with pytest.raises(FileNotFoundError):
+            FDCLocalIndex(str(tmp_path))
+
+    def test_trigrams(self) -> None:
+        assert trigrams("egg") == [" eg", "egg", "gg "]
+
+
+class TestImportJSON:
+    """Test parsing of FoodData Central JSON downloads."""
+
+    def test_reads_detail_format_nutrients(self, tmp_path: Path) -> None:
+        path = tmp_path / "sr_legacy.json"
+        path.write_text(
+            json.dumps(
+                {
+                    "SRLegacyFoods": [
+                        {
+                            "fdcId": 173944,
+                            "description": "Bananas, raw",
+                            "foodNutrients": [
+                                {"nutrient": {"id": 1008}, "amount": 89.0},
+                                {"nutrient": {"id": 1003}, "amount": 1.09},
+                            ],
+                        }
+                    ]
+                }
+            )
+        )
+
+        foods = list(iter_fdc_json_foods(str(path)))
+
+        assert [(f.fdc_id, f.description) for f in foods] == [(173944, "Bananas, raw")]
+        assert foods[0].nutrients["calories"] == 89.0
+        assert foods[0].nutrients["protein"] == 1.09
+
+    def test_rejects_unknown_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "other.json"
+        path.write_text(json.dumps({"BrandedFoods": []}))
+
+        with pytest.raises(ValueError, match="SRLegacyFoods"):
+            list(iter_fdc_json_foods(str(path)))
+
+
+class TestUSDALocalProvider:
+    """Test selection heuristics shared with USDAClient."""
+
+    @pytest.mark.asyncio
+    async def test_prefers_raw_simple_foods(self, provider: USDALocalProvider) -> None:
+        profile = await provider.get_nutrients("Potatoes", 100.0)
+
+        assert profile is not None
+        assert profile.calories == 77
+        assert profile.source == "USDA"
+        assert profile.confidence == 0.95
+        assert profile.quantity_g == 100.0
+
+    @pytest.mark.asyncio
+    async def test_eggs_resolve_to_whole_eggs(self, provider: USDALocalProvider) -> None:
+        profile = await provider.get_nutrients("eggs", 100.0)
+
+        assert profile is not None
+        assert profile.protein == 12.6
+
+    @pytest.mark.asyncio
+    async def test_penalizes_processed_foods(self, provider: USDALocalProvider) -> None:
+        profile = await provider.get_nutrients("banana", 100.0)
+
+        assert profile is not None
+        assert profile.calories == 89
+
+    @pytest.mark.asyncio
+    async def test_skips_foods_without_calories(self, provider: USDALocalProvider) -> None:
+        assert await provider.get_nutrients("tap water", 100.0) is None
+
+    @pytest.mark.asyncio
+    async def test_unknown_food(self, provider: USDALocalProvider) -> None:
+        assert await provider.get_nutrients("quinoa", 100.0) is None
+
+    @pytest.mark.asyncio
+    async def test_context_manager_fails_fast_without_index(self, tmp_path: Path) -> None:
+        with pytest.raises(FileNotFoundError):
+            async with USDALocalProvider(str(tmp_path / "missing")):
+                pass
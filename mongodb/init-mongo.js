@@ -35,8 +35,8 @@ db.createCollection('meals', {
           description: 'ID utente proprietario'
         },
         timestamp: {
-          bsonType: 'string',
-          description: 'ISO8601 timestamp'
+          bsonType: ['date', 'string'],
+          description: 'BSON date (ISO8601 string nei documenti legacy)'
         },
         meal_type: {
           enum: ['breakfast', 'lunch', 'dinner', 'snack'],
@@ -91,8 +91,24 @@ db.createCollection('activity_events', {
 print('✅ Collections created: meals, nutritional_profiles, activity_events');
 
 // Crea indici per performance
-db.meals.createIndex({ user_id: 1, timestamp: -1 });
+db.meals.createIndex({ user_id: 1, timestamp: -1, _id: -1 }, { name: 'idx_user_timestamp_id' });
+db.meals.createIndex(
+  {
+    user_id: 1,
+    dish_name: 'text',
+    'entries.name': 'text',
+    'entries.display_name': 'text',
+    notes: 'text',
+    search_terms: 'text'
+  },
+  {
+    name: 'idx_user_text',
+    default_language: 'none',
+    weights: { dish_name: 10, 'entries.name': 5, 'entries.display_name': 5, notes: 2, search_terms: 1 }
+  }
+);
 db.meals.createIndex({ meal_id: 1 }, { unique: true });
+db.daily_nutrition_rollups.createIndex({ user_id: 1, day: 1 }, { name: 'idx_user_day', unique: true });
 db.nutritional_profiles.createIndex({ profile_id: 1 }, { unique: true });
 db.nutritional_profiles.createIndex({ user_id: 1 });
 db.activity_events.createIndex({ user_id: 1, ts: -1 });